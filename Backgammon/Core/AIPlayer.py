@@ -0,0 +1,381 @@
+"""Clase AIPlayer: jugador automático basado en búsqueda expectiminimax."""
+import math
+import time
+from Backgammon.Core.Board import Board
+from Backgammon.Core.Dice import Dice
+from Backgammon.Core.NeuralEvaluator import NeuralEvaluator, equidad
+from Backgammon.Core.Player import Player
+
+# Las 21 tiradas distintas con su probabilidad (los no dobles salen de dos formas)
+TIRADAS_POSIBLES = [
+    (dado1, dado2, (1 if dado1 == dado2 else 2) / 36)
+    for dado1 in range(1, 7) for dado2 in range(dado1, 7)
+]
+
+# Cotas de la evaluación: ganar vale 1, perder -1, el resto queda estrictamente adentro
+VALOR_MINIMO = -1.0
+VALOR_MAXIMO = 1.0
+
+# Tipos de entrada de la tabla de transposición
+EXACTO = 0
+COTA_INFERIOR = 1
+COTA_SUPERIOR = 2
+
+
+def color_rival(color: str) -> str:
+    """Devuelve el color del oponente."""
+    return "blanco" if color == "negro" else "negro"
+
+
+def evaluar_posicion(board: Board, color: str) -> float:
+    """
+    Evalúa la posición desde el punto de vista de 'color'.
+    La evaluación es antisimétrica: evaluar(board, a) == -evaluar(board, b).
+
+    Tiene en cuenta la carrera (pips), las fichas solas, los puntos hechos
+    en la casa y las fichas en la barra.
+
+    Args:
+        board (Board): Tablero a evaluar.
+        color (str): Color desde cuyo punto de vista se evalúa.
+
+    Returns:
+        float: 1 si ganó, -1 si perdió, y un valor en (-1, 1) en otro caso.
+    """
+    rival = color_rival(color)
+    if board.ha_ganado(color):
+        return VALOR_MAXIMO
+    if board.ha_ganado(rival):
+        return VALOR_MINIMO
+
+    carrera = board.obtener_pips(rival) - board.obtener_pips(color)
+    solas = 0
+    puntos_en_casa = 0
+    for punto in range(1, 25):
+        estado = board.obtener_estado_punto(punto)
+        if estado is None or estado[0] is None:
+            continue
+        signo = 1 if estado[0] == color else -1
+        if estado[1] == 1:
+            solas += signo
+        elif _esta_en_casa(estado[0], punto):
+            puntos_en_casa += signo
+
+    barra = board.get_barra()
+    en_barra = barra.get(color, 0) - barra.get(rival, 0)
+    puntaje = 0.01 * carrera - 0.04 * solas + 0.03 * puntos_en_casa - 0.05 * en_barra
+    return math.tanh(puntaje)
+
+
+def _esta_en_casa(color: str, punto: int) -> bool:
+    """Indica si el punto pertenece al cuadrante casa del color."""
+    return punto >= 19 if color == "negro" else punto <= 6
+
+
+class _PresupuestoAgotado(Exception):
+    """Se lanza cuando la búsqueda supera el límite de tiempo o de nodos."""
+
+
+class AIPlayer(Player):
+    """
+    Jugador automático que elige su jugada con expectiminimax.
+
+    La búsqueda alterna nodos de decisión (el jugador elige la mejor jugada
+    legal) y nodos de azar (promedio ponderado sobre las 21 tiradas). Usa
+    poda Star1 y sondeo Star2 en los nodos de azar, una tabla de transposición
+    indexada por el hash Zobrist del tablero y profundización iterativa con
+    presupuesto de tiempo y/o de nodos.
+
+    Si recibe un NeuralEvaluator, las hojas se evalúan con la red y todas las
+    jugadas de un mismo nodo del último nivel se puntúan en una sola pasada.
+
+    PRINCIPIOS SOLID:
+    - OCP: Extiende Player sin modificarlo.
+    - DIP: Usa solo la interfaz pública de Board (jugadas legales, aplicar/deshacer, hash)
+      y recibe el evaluador desde afuera.
+    - SRP: Solo decide la jugada; aplicarla es responsabilidad de la interfaz.
+    """
+
+    def __init__(self, nombre: str, color: str, profundidad_maxima: int = 2,
+                 limite_tiempo: float | None = 0.05, limite_nodos: int | None = None,
+                 tamanio_tabla: int = 200_000, evaluador: NeuralEvaluator | None = None):
+        """
+        Inicializa el jugador automático.
+
+        Args:
+            nombre (str): Nombre del jugador.
+            color (str): Color de sus fichas ('blanco' o 'negro').
+            profundidad_maxima (int): Jugadas (plies) a mirar hacia adelante. 1 = solo la propia.
+            limite_tiempo (float | None): Segundos máximos por decisión (None = sin límite).
+            limite_nodos (int | None): Posiciones máximas a visitar por decisión (None = sin límite).
+            tamanio_tabla (int): Entradas máximas de la tabla de transposición.
+            evaluador (NeuralEvaluator | None): Red para evaluar hojas (None = evaluar_posicion).
+
+        Raises:
+            ValueError: Si la profundidad máxima es menor que 1.
+        """
+        super().__init__(nombre, color)
+        if profundidad_maxima < 1:
+            raise ValueError("La profundidad máxima debe ser al menos 1.")
+        self.__profundidad_maxima__ = profundidad_maxima
+        self.__limite_tiempo__ = limite_tiempo
+        self.__limite_nodos__ = limite_nodos
+        self.__tamanio_tabla__ = tamanio_tabla
+        self.__evaluador__ = evaluador
+        self.__tabla__ = {}
+        self.__tiradas__ = []
+        for dado1, dado2, probabilidad in TIRADAS_POSIBLES:
+            dados = Dice()
+            dados.set_dados_para_test(dado1, dado2)
+            self.__tiradas__.append((dados, probabilidad))
+        self.__nodos__ = 0
+        self.__limite_activo__ = False
+        self.__fin__ = None
+        self.__estadisticas__ = {}
+
+    def elegir_jugada(self, board: Board, dados: Dice) -> list[tuple[int, int]]:
+        """
+        Elige la jugada completa para la tirada actual.
+        El tablero recibido no se modifica: la búsqueda trabaja sobre una copia.
+
+        Args:
+            board (Board): Tablero con la posición actual (incluye barra y casa).
+            dados (Dice): Dados con la tirada actual.
+
+        Returns:
+            list[tuple[int, int]]: Movimientos (origen, destino) en orden; vacía si no puede mover.
+        """
+        inicio = time.perf_counter()
+        color = self.obtener_color()
+        tablero = board.copiar()
+        jugadas = tablero.obtener_jugadas_legales(color, dados)
+        self.__nodos__ = 0
+        self.__estadisticas__ = {"profundidad": 0, "nodos": 0, "aciertos_tabla": 0,
+                                 "jugadas": len(jugadas), "tiempo": 0.0}
+        if len(jugadas) <= 1:
+            self.__estadisticas__["tiempo"] = time.perf_counter() - inicio
+            return jugadas[0] if jugadas else []
+
+        if len(self.__tabla__) > self.__tamanio_tabla__:
+            self.__tabla__.clear()
+        self.__fin__ = (inicio + self.__limite_tiempo__
+                        if self.__limite_tiempo__ is not None else None)
+
+        mejor = jugadas[0]
+        for profundidad in range(1, self.__profundidad_maxima__ + 1):
+            # La primera iteración siempre termina, así siempre hay una jugada
+            self.__limite_activo__ = profundidad > 1
+            try:
+                mejor = self._buscar_raiz(tablero, jugadas, profundidad)
+            except _PresupuestoAgotado:
+                break
+            self.__estadisticas__["profundidad"] = profundidad
+            # Probar primero la mejor jugada en la siguiente iteración
+            jugadas.remove(mejor)
+            jugadas.insert(0, mejor)
+
+        self.__estadisticas__["nodos"] = self.__nodos__
+        self.__estadisticas__["tiempo"] = time.perf_counter() - inicio
+        return mejor
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Devuelve datos de la última búsqueda.
+
+        Returns:
+            dict: profundidad completada, nodos visitados, aciertos en la tabla,
+            cantidad de jugadas legales y tiempo en segundos.
+        """
+        return dict(self.__estadisticas__)
+
+    def _buscar_raiz(self, board: Board, jugadas: list, profundidad: int) -> list:
+        """
+        Busca la mejor jugada de la raíz con la profundidad indicada.
+
+        Returns:
+            list: La jugada con mayor valor (ante empate, la primera en orden).
+        """
+        rival = color_rival(self.obtener_color())
+        if profundidad == 1 and self.__evaluador__ is not None:
+            valores = self._valores_hojas(board, self.obtener_color(), jugadas)
+            return jugadas[valores.index(max(valores))]
+        mejor_jugada = jugadas[0]
+        mejor_valor = -math.inf
+        for jugada in jugadas:
+            board.aplicar_jugada(self.obtener_color(), jugada)
+            try:
+                valor = -self._valor_azar(board, rival, profundidad - 1,
+                                          -VALOR_MAXIMO, -max(mejor_valor, VALOR_MINIMO))
+            finally:
+                board.deshacer_jugada(jugada)
+            if valor > mejor_valor:
+                mejor_valor = valor
+                mejor_jugada = jugada
+        return mejor_jugada
+
+    def _valor_azar(self, board: Board, color: str, profundidad: int,
+                    alfa: float, beta: float) -> float:
+        """
+        Nodo de azar: 'color' está por tirar. Devuelve el valor esperado para 'color'.
+        Aplica Star2 (sondeo de una jugada por tirada) y Star1 (ventanas por tirada).
+
+        Args:
+            board (Board): Tablero de búsqueda.
+            color (str): Jugador que va a tirar.
+            profundidad (int): Jugadas restantes.
+            alfa (float): Cota inferior de la ventana.
+            beta (float): Cota superior de la ventana.
+
+        Returns:
+            float: Valor exacto si queda dentro de (alfa, beta), o una cota fuera de ella.
+        """
+        self._contar_nodo()
+        if board.ha_ganado(color_rival(color)):
+            # Con red, la derrota vale lo mismo que en las hojas: -0.5 simple, -1 con gammon
+            return VALOR_MINIMO if self.__evaluador__ is None else self._evaluar(board, color)
+        if profundidad == 0:
+            return self._evaluar(board, color)
+
+        clave = (board.obtener_hash(), color)
+        entrada = self.__tabla__.get(clave)
+        if entrada is not None and entrada[0] >= profundidad:
+            _, valor, tipo = entrada
+            if (tipo == EXACTO or (tipo == COTA_INFERIOR and valor >= beta)
+                    or (tipo == COTA_SUPERIOR and valor <= alfa)):
+                self.__estadisticas__["aciertos_tabla"] += 1
+                return valor
+
+        hijos = [(self._jugadas_ordenadas(board, color, dados, profundidad), probabilidad)
+                 for dados, probabilidad in self.__tiradas__]
+
+        # Star2: la primera jugada de cada tirada da una cota inferior de ese hijo
+        if profundidad >= 2:
+            suma_sondeos = 0.0
+            restante = 1.0
+            for jugadas, probabilidad in hijos:
+                restante -= probabilidad
+                sondeo = self._valor_decision(board, color, jugadas[:1], profundidad,
+                                              VALOR_MINIMO, VALOR_MAXIMO)
+                suma_sondeos += probabilidad * sondeo
+                if suma_sondeos + restante * VALOR_MINIMO >= beta:
+                    valor = suma_sondeos + restante * VALOR_MINIMO
+                    self._guardar(clave, profundidad, valor, COTA_INFERIOR)
+                    return valor
+
+        # Star1: cada tirada se busca con la ventana que todavía puede cambiar el resultado
+        suma = 0.0
+        restante = 1.0
+        for jugadas, probabilidad in hijos:
+            resto = restante - probabilidad
+            cota_a = (alfa - suma - resto * VALOR_MAXIMO) / probabilidad
+            cota_b = (beta - suma - resto * VALOR_MINIMO) / probabilidad
+            if cota_a >= VALOR_MAXIMO or cota_b <= VALOR_MINIMO:
+                # Ningún valor de esta tirada puede dejar el resultado dentro de la ventana
+                valor = VALOR_MAXIMO if cota_a >= VALOR_MAXIMO else VALOR_MINIMO
+            else:
+                valor = self._valor_decision(board, color, jugadas, profundidad,
+                                             max(cota_a, VALOR_MINIMO),
+                                             min(cota_b, VALOR_MAXIMO))
+            if valor <= cota_a:
+                cota = suma + probabilidad * valor + resto * VALOR_MAXIMO
+                self._guardar(clave, profundidad, cota, COTA_SUPERIOR)
+                return cota
+            if valor >= cota_b:
+                cota = suma + probabilidad * valor + resto * VALOR_MINIMO
+                self._guardar(clave, profundidad, cota, COTA_INFERIOR)
+                return cota
+            suma += probabilidad * valor
+            restante = resto
+
+        self._guardar(clave, profundidad, suma, EXACTO)
+        return suma
+
+    def _valor_decision(self, board: Board, color: str, jugadas: list, profundidad: int,
+                        alfa: float, beta: float) -> float:
+        """
+        Nodo de decisión: 'color' elige entre 'jugadas' la de mayor valor (poda alfa-beta).
+        Sin jugadas posibles el jugador pasa y el turno sigue con el rival.
+
+        Returns:
+            float: Valor para 'color' (exacto o cota si sale de la ventana).
+        """
+        rival = color_rival(color)
+        if not jugadas:
+            return -self._valor_azar(board, rival, profundidad - 1, -beta, -alfa)
+        if profundidad == 1 and self.__evaluador__ is not None:
+            return max(self._valores_hojas(board, color, jugadas))
+
+        mejor = -math.inf
+        for jugada in jugadas:
+            board.aplicar_jugada(color, jugada)
+            try:
+                valor = -self._valor_azar(board, rival, profundidad - 1,
+                                          -beta, -max(alfa, mejor))
+            finally:
+                board.deshacer_jugada(jugada)
+            if valor > mejor:
+                mejor = valor
+                if mejor >= beta:
+                    break
+        return mejor
+
+    def _jugadas_ordenadas(self, board: Board, color: str, dados: Dice,
+                           profundidad: int) -> list:
+        """
+        Genera las jugadas legales ordenadas de mejor a peor según la evaluación estática.
+        En el último nivel no se ordena porque igualmente se evalúan todas.
+        """
+        jugadas = board.obtener_jugadas_legales(color, dados)
+        if profundidad <= 1 or len(jugadas) <= 1:
+            return jugadas
+        if self.__evaluador__ is not None:
+            puntajes = list(equidad(self.__evaluador__.evaluar_jugadas(board, color, jugadas)))
+        else:
+            puntajes = []
+            for jugada in jugadas:
+                board.aplicar_jugada(color, jugada)
+                puntajes.append(evaluar_posicion(board, color))
+                board.deshacer_jugada(jugada)
+        orden = sorted(range(len(jugadas)), key=lambda i: puntajes[i], reverse=True)
+        return [jugadas[i] for i in orden]
+
+    def _evaluar(self, board: Board, color: str) -> float:
+        """
+        Evalúa una hoja desde el punto de vista de 'color', que está por tirar.
+        Con red, la equidad (en [-2, 2]) se escala a las cotas de la búsqueda.
+        """
+        if self.__evaluador__ is None:
+            return evaluar_posicion(board, color)
+        probabilidades = self.__evaluador__.evaluar([board], color, turno_rival=False)
+        return float(equidad(probabilidades[0])) / 2.0
+
+    def _valores_hojas(self, board: Board, color: str, jugadas: list) -> list[float]:
+        """
+        Puntúa todas las jugadas de 'color' que llevan a hojas en una sola pasada de la red.
+
+        Returns:
+            list[float]: Valor para 'color' de cada jugada, en el mismo orden.
+        """
+        for _ in jugadas:
+            self._contar_nodo()
+        probabilidades = self.__evaluador__.evaluar_jugadas(board, color, jugadas)
+        return [float(valor) / 2.0 for valor in equidad(probabilidades)]
+
+    def _guardar(self, clave: tuple, profundidad: int, valor: float, tipo: int) -> None:
+        """Guarda un resultado en la tabla de transposición."""
+        self.__tabla__[clave] = (profundidad, valor, tipo)
+
+    def _contar_nodo(self) -> None:
+        """
+        Cuenta un nodo visitado y verifica el presupuesto de la búsqueda.
+
+        Raises:
+            _PresupuestoAgotado: Si se superó el límite de nodos o de tiempo.
+        """
+        self.__nodos__ += 1
+        if not self.__limite_activo__:
+            return
+        if self.__limite_nodos__ is not None and self.__nodos__ > self.__limite_nodos__:
+            raise _PresupuestoAgotado()
+        if self.__fin__ is not None and time.perf_counter() > self.__fin__:
+            raise _PresupuestoAgotado()
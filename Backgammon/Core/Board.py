@@ -2,6 +2,70 @@
 import copy
 from Backgammon.Core.Dice import Dice
 
+# Casillas usadas por el hash Zobrist: 0 a 23 son los puntos 1 a 24
+CASILLA_BARRA = 24
+CASILLA_CASA = 25
+INDICE_COLOR = {"negro": 0, "blanco": 1}
+_MASCARA_64 = (1 << 64) - 1
+
+
+def _splitmix64(valor: int) -> int:
+    """Mezcla un entero y devuelve un valor pseudoaleatorio de 64 bits (determinista)."""
+    z = (valor + 0x9E3779B97F4A7C15) & _MASCARA_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASCARA_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASCARA_64
+    return z ^ (z >> 31)
+
+
+def _calcular_clave_zobrist(indice_color: int, casilla: int, cantidad: int) -> int:
+    """Clave de 64 bits para (color, casilla, cantidad). Cantidad 0 no aporta al hash."""
+    if cantidad == 0:
+        return 0
+    return _splitmix64((((indice_color * 26) + casilla) << 16) | cantidad)
+
+
+# Tabla precalculada para las cantidades habituales (0 a 15 fichas)
+_TABLA_ZOBRIST = [
+    [tuple(_calcular_clave_zobrist(color, casilla, cantidad) for cantidad in range(16))
+     for casilla in range(26)]
+    for color in range(2)
+]
+
+
+def clave_zobrist(color: str, casilla: int, cantidad: int) -> int:
+    """
+    Devuelve la clave Zobrist de tener 'cantidad' fichas de 'color' en 'casilla'.
+    Las claves no dependen del proceso, así los hashes sirven entre procesos y ejecuciones.
+
+    Args:
+        color (str): Color de las fichas.
+        casilla (int): 0 a 23 para los puntos, CASILLA_BARRA o CASILLA_CASA.
+        cantidad (int): Número de fichas.
+
+    Returns:
+        int: Clave de 64 bits.
+    """
+    if cantidad == 0:
+        return 0
+    indice_color = INDICE_COLOR[color]
+    if cantidad < 16:
+        return _TABLA_ZOBRIST[indice_color][casilla][cantidad]
+    return _calcular_clave_zobrist(indice_color, casilla, cantidad)
+
+
+def validar_color(color: str) -> None:
+    """
+    Verifica que el color sea el de un jugador, antes de que llegue al hash y los contadores.
+
+    Args:
+        color (str): Color a verificar.
+
+    Raises:
+        ValueError: Si el color no es "negro" ni "blanco".
+    """
+    if color not in INDICE_COLOR:
+        raise ValueError(f"Color de ficha inválido: {color!r} (debe ser 'negro' o 'blanco').")
+
 
 class Board:
     """
@@ -16,10 +80,25 @@ class Board:
             __puntos__ (list): Lista de 24 puntos, cada uno con [color, cantidad] o None.
             __barra__ (dict): Diccionario {color: cantidad} de fichas enviadas a la barra.
             __casa__ (dict): Diccionario {color: cantidad} de fichas enviadas a la casa.
+            __deshacer__ (list): Pila de registros para deshacer movimientos aplicados.
+            __hash_posicion__ (int): Hash Zobrist de 64 bits de la posición actual.
+            __pips__ (dict): Conteo de pips por color.
+            __fuera_de_casa__ (dict): Fichas en puntos fuera del cuadrante casa, por color.
+            __ocupacion_casa__ (dict): Máscara de 6 bits con los puntos de casa ocupados, por color.
+        """
+        self._vaciar_tablero()
+
+    def _vaciar_tablero(self) -> None:
+        """
+        Deja el tablero sin fichas en puntos, barra y casa.
+        OCP: Las variantes con otra representación interna redefinen solo este método.
         """
         self.__puntos__ = [None] * 24
         self.__barra__ = {}
         self.__casa__ = {}
+        self.__deshacer__ = []
+        self.__hash_posicion__ = 0
+        self._reiniciar_contadores()
 
     def inicializar_posiciones_estandar(self) -> None:
         """
@@ -34,9 +113,7 @@ class Board:
             None
         """
         # Limpiar tablero
-        self.__puntos__ = [None] * 24
-        self.__barra__ = {}
-        self.__casa__ = {}
+        self._vaciar_tablero()
 
         # Fichas negras
         self.colocar_ficha(1, "negro", 2)   # Posición inicial negro
@@ -61,18 +138,24 @@ class Board:
             cantidad (int, optional): Número de fichas a colocar. Por defecto 1.
 
         Raises:
-            ValueError: Si se intenta mezclar fichas de distinto color en el mismo punto.
+            ValueError: Si se colocan fichas de un color que no es de un jugador o
+                se intenta mezclar fichas de distinto color en el mismo punto.
         """
+        if cantidad:
+            # Colocar 0 fichas no toca el hash ni los contadores: se acepta cualquier color
+            validar_color(color)
         if self.__puntos__[punto - 1] is None:
             self.__puntos__[punto - 1] = [color, cantidad]
+            anterior = 0
         else:
-            mismo_color, _ = self.__puntos__[punto - 1]
+            mismo_color, anterior = self.__puntos__[punto - 1]
             if mismo_color == color:
                 self.__puntos__[punto - 1][1] += cantidad
             else:
                 raise ValueError(
                  "No se pueden mezclar fichas de distinto color en el mismo punto."
                 )
+        self._registrar_cambio(color, punto - 1, anterior, anterior + cantidad)
 
     def remover_ficha(self, punto: int, cantidad: int = 1) -> None:
         """
@@ -88,13 +171,14 @@ class Board:
         if self.__puntos__[punto - 1] is None:
             raise ValueError("No hay fichas en este punto.")
 
-        _ , cant_actual = self.__puntos__[punto - 1]
+        color, cant_actual = self.__puntos__[punto - 1]
         if cant_actual < cantidad:
             raise ValueError("No hay suficientes fichas para quitar.")
 
         self.__puntos__[punto - 1][1] -= cantidad
         if self.__puntos__[punto - 1][1] == 0:
             self.__puntos__[punto - 1] = None
+        self._registrar_cambio(color, punto - 1, cant_actual, cant_actual - cantidad)
 
     def obtener_estado_punto(self, punto: int):
         """
@@ -162,7 +246,7 @@ class Board:
             bool: True si el movimiento fue exitoso, False si no es posible.
         """
         # Verificar si hay fichas en la barra
-        if self.__barra__.get(color, 0) == 0:
+        if not self.tiene_fichas_en_barra(color):
             return False
 
         # Calcular punto de entrada
@@ -176,9 +260,7 @@ class Board:
             return False
 
         # Realizar el movimiento
-        self.__barra__[color] -= 1
-        if self.__barra__[color] == 0:
-            del self.__barra__[color]
+        self._quitar_de_barra(color)
 
         # Si hay una ficha contraria, comerla
         estado_destino = self.obtener_estado_punto(destino)
@@ -219,6 +301,7 @@ class Board:
         """
         Verifica si un jugador puede comenzar a sacar fichas (todas en el cuarto final).
         SRP: Evalúa condición de fin de partida.
+        Usa los contadores incrementales, por lo que es O(1).
         Args:
             color (str): Color del jugador.
 
@@ -226,23 +309,11 @@ class Board:
             bool: True si puede sacar fichas, False en caso contrario.
         """
         # No puede sacar si tiene fichas en la barra
-        if self.__barra__.get(color, 0) > 0:
+        if self.tiene_fichas_en_barra(color):
             return False
 
-        if color == "negro":
-            # Negro debe tener todas las fichas en puntos 19-24
-            for i in range(1, 19):
-                estado = self.obtener_estado_punto(i)
-                if estado is not None and estado[0] == color:
-                    return False
-        else:  # blanco
-            # Blanco debe tener todas las fichas en puntos 1-6
-            for i in range(7, 25):
-                estado = self.obtener_estado_punto(i)
-                if estado is not None and estado[0] == color:
-                    return False
-
-        return True
+        # Negro debe tener todas las fichas en puntos 19-24, blanco en puntos 1-6
+        return self.__fuera_de_casa__[color] == 0
 
     def debug_estado_jugador(self, color: str) -> str:
         """
@@ -260,8 +331,8 @@ class Board:
             if estado is not None and estado[0] == color:
                 puntos_con_fichas.append(f"{i}: {estado[1]} fichas")
 
-        barra = self.__barra__.get(color, 0)
-        casa = self.__casa__.get(color, 0)
+        barra = self.get_barra().get(color, 0)
+        casa = self.get_casa().get(color, 0)
         puede_sacar = self.puede_sacar_fichas(color)
 
         return (
@@ -386,17 +457,10 @@ class Board:
         Indica si hay fichas del color en posiciones MÁS LEJANAS AL BORNE.
         Para NEGRO (casa 19..24): "más atrás" son puntos con índice MENOR (19..origen-1).
         Para BLANCO (casa 1..6): "más atrás" son puntos con índice MAYOR (origen+1..6).
+        Se responde en O(1) con la máscara de ocupación de la casa.
         """
-        if color == "negro":
-            puntos_a_revisar = range(19, origen)  # 19..origen-1
-        else:  # blanco
-            puntos_a_revisar = range(origen + 1, 7)  # origen+1..6
-
-        for punto in puntos_a_revisar:
-            estado = self.obtener_estado_punto(punto)
-            if estado is not None and estado[0] == color and estado[1] > 0:
-                return True
-        return False
+        distancia = 25 - origen if color == "negro" else origen
+        return self.__ocupacion_casa__[color] >> distancia != 0
 
 
 
@@ -569,7 +633,7 @@ class Board:
         dado1, dado2 = dados.obtener_valores()
 
         # Si hay fichas en la barra, solo puede mover desde ahí
-        if self.__barra__.get(color, 0) > 0:
+        if self.tiene_fichas_en_barra(color):
             if color == "negro":
                 destino1 = dado1
                 destino2 = dado2
@@ -582,6 +646,9 @@ class Board:
                 movimientos_posibles.append(0)
             return movimientos_posibles
 
+        # Verificar si puede sacar fichas (no cambia dentro del recorrido)
+        puede_sacar = self.puede_sacar_fichas(color)
+
         # Verificar movimientos desde cada punto del tablero
         for punto in range(1, 25):
             estado = self.obtener_estado_punto(punto)
@@ -589,9 +656,6 @@ class Board:
                 destino1 = self.calcular_destino(punto, dado1, color)
                 destino2 = self.calcular_destino(punto, dado2, color)
 
-                # Verificar si puede sacar fichas
-                puede_sacar = self.puede_sacar_fichas(color)
-
                 movimiento_valido = False
 
                 # Verificar dado1
@@ -612,6 +676,262 @@ class Board:
 
         return movimientos_posibles
 
+    def obtener_jugadas_legales(self, color: str, dados: Dice) -> list[list[tuple[int, int]]]:
+        """
+        Devuelve todas las jugadas completas y legales para la tirada actual.
+
+        Reglas aplicadas:
+        - Se prueban ambos órdenes de los dados, y cuatro movimientos en los dobles.
+        - Se deben usar tantos dados como sea posible.
+        - Si solo se puede usar un dado (tirada no doble), debe ser el mayor si es posible.
+        - Las jugadas que llegan a la misma posición final se devuelven una sola vez.
+
+        SRP: Consulta de estado; aplica y deshace movimientos, el tablero queda igual.
+        ISP: Interfaz común para bots, pistas y análisis.
+
+        Args:
+            color (str): Color del jugador.
+            dados (Dice): Objeto dados con la tirada actual.
+
+        Returns:
+            list[list[tuple[int, int]]]: Lista de jugadas; cada jugada es una lista de
+            movimientos (origen, destino). Origen 0 es la barra; destino 25 (negro) o
+            0 (blanco) es sacar ficha. Lista vacía si no hay ningún movimiento posible.
+        """
+        if not dados.han_sido_tirados():
+            return []
+
+        dado1, dado2 = dados.obtener_valores()
+        if dado1 == dado2:
+            ordenes = [(dado1,) * 4]
+        else:
+            ordenes = [(dado1, dado2), (dado2, dado1)]
+
+        finales = {}
+        visitados = set()
+        for orden in ordenes:
+            self._explorar_jugadas(color, orden, [], finales, visitados)
+
+        if not finales:
+            return []
+
+        max_dados = max(len(jugada) for jugada in finales.values())
+        candidatas = [jugada for jugada in finales.values() if len(jugada) == max_dados]
+
+        # Con un solo dado utilizable se debe usar el mayor si es posible
+        if max_dados == 1 and dado1 != dado2:
+            mayor = max(dado1, dado2)
+            con_mayor = [jugada for jugada in candidatas if jugada[0][2] == mayor]
+            if con_mayor:
+                candidatas = con_mayor
+
+        return [[(origen, destino) for origen, destino, _ in jugada] for jugada in candidatas]
+
+    def _explorar_jugadas(self, color: str, dados: tuple, jugada: list,
+                          finales: dict, visitados: set) -> None:
+        """
+        Recorre en profundidad los movimientos posibles para los dados restantes.
+        Cada movimiento se aplica y se deshace en el mismo tablero (sin copias).
+        Una posición ya alcanzada con los mismos dados restantes no se vuelve a explorar
+        (transposición), así cada jugada distinta se genera una única vez.
+
+        Args:
+            color (str): Color del jugador.
+            dados (tuple): Dados que faltan usar, en orden.
+            jugada (list): Movimientos (origen, destino, dado) hechos hasta ahora.
+            finales (dict): Jugadas terminadas por clave de posición final.
+            visitados (set): Pares (posición, dados restantes) ya explorados.
+        """
+        movio = False
+        if dados:
+            dado = dados[0]
+            for origen in self._origenes_con_fichas(color):
+                destino = self._destino_legal(color, origen, dado)
+                if destino is None:
+                    continue
+                movio = True
+                self.aplicar_movimiento(color, origen, destino)
+                clave = (self._clave_posicion(), dados[1:])
+                if clave not in visitados:
+                    visitados.add(clave)
+                    self._explorar_jugadas(color, dados[1:], jugada + [(origen, destino, dado)],
+                                           finales, visitados)
+                self.deshacer_movimiento()
+
+        if not movio and jugada:
+            clave_final = self._clave_posicion()
+            registrada = finales.get(clave_final)
+            if registrada is None or len(registrada) < len(jugada):
+                finales[clave_final] = jugada
+
+    def _origenes_con_fichas(self, color: str) -> list[int]:
+        """
+        Devuelve los orígenes desde los que el color podría mover.
+
+        Returns:
+            list[int]: [0] si hay fichas en la barra, o los puntos con fichas propias.
+        """
+        if self.tiene_fichas_en_barra(color):
+            return [0]
+        origenes = []
+        for punto in range(1, 25):
+            estado = self.obtener_estado_punto(punto)
+            if estado is not None and estado[0] == color:
+                origenes.append(punto)
+        return origenes
+
+    def _destino_legal(self, color: str, origen: int, dado: int) -> int | None:
+        """
+        Calcula el destino de mover una ficha propia desde origen con un dado, aplicando
+        las reglas de barra, bloqueo y bearing off, sin modificar el tablero.
+
+        Returns:
+            int | None: Destino del movimiento, o None si no es legal.
+        """
+        if origen == 0:
+            destino = dado if color == "negro" else 25 - dado
+            return destino if self.es_movimiento_valido_a_punto(destino, color) else None
+
+        destino = self.calcular_destino(origen, dado, color)
+        if (destino <= 0 and color == "blanco") or (destino >= 25 and color == "negro"):
+            if self.puede_sacar_fichas(color) and self._es_bearing_off_valido(color, origen, dado):
+                return destino
+            return None
+        return destino if self.es_movimiento_valido_a_punto(destino, color) else None
+
+    def aplicar_movimiento(self, color: str, origen: int, destino: int) -> None:
+        """
+        Aplica un movimiento en el lugar y guarda lo necesario para deshacerlo.
+        Usa mover_ficha, mover_desde_barra y sacar_ficha, así las reglas siguen en un solo lugar.
+        SRP: Solo ejecuta y registra; la legalidad completa (dados, bearing off exacto)
+        corresponde a obtener_jugadas_legales.
+
+        Args:
+            color (str): Color de la ficha que se mueve.
+            origen (int): Punto de origen (0 para barra, 1 a 24).
+            destino (int): Punto de destino (1 a 24, 25 negro / 0 blanco para sacar ficha).
+
+        Raises:
+            ValueError: Si el movimiento no se puede realizar en la posición actual.
+        """
+        if origen == 0:
+            capturada = self.__es_ficha_rival_sola(destino, color)
+            dado = destino if color == "negro" else 25 - destino
+            if not self.mover_desde_barra(color, dado):
+                raise ValueError("No se puede entrar desde la barra a ese punto.")
+        elif (destino <= 0 and color == "blanco") or (destino >= 25 and color == "negro"):
+            capturada = False
+            if not self.puede_sacar_fichas(color):
+                raise ValueError("No se pueden sacar fichas todavía.")
+            estado_origen = self.obtener_estado_punto(origen)
+            if estado_origen is None or estado_origen[0] != color:
+                raise ValueError("No hay fichas del color indicado en el origen.")
+            self.remover_ficha(origen, 1)
+            self.sacar_ficha(color)
+        else:
+            capturada = self.__es_ficha_rival_sola(destino, color)
+            self.mover_ficha(origen, destino, color)
+
+        self.__deshacer__.append((color, origen, destino, capturada))
+
+    def deshacer_movimiento(self) -> None:
+        """
+        Deshace el último movimiento aplicado con aplicar_movimiento.
+        Restaura la ficha capturada (desde la barra) y la ficha sacada (desde la casa).
+
+        Raises:
+            IndexError: Si no hay movimientos para deshacer.
+        """
+        color, origen, destino, capturada = self.__deshacer__.pop()
+
+        if (destino <= 0 and color == "blanco") or (destino >= 25 and color == "negro"):
+            self._quitar_de_casa(color)
+            self.colocar_ficha(origen, color, 1)
+            return
+
+        self.remover_ficha(destino, 1)
+        if capturada:
+            rival = "blanco" if color == "negro" else "negro"
+            self._quitar_de_barra(rival)
+            self.colocar_ficha(destino, rival, 1)
+
+        if origen == 0:
+            self.enviar_a_barra(color)
+        else:
+            self.colocar_ficha(origen, color, 1)
+
+    def asignar_dados(self, color: str, jugada: list[tuple[int, int]],
+                      dados: list[int]) -> list[int] | None:
+        """
+        Asigna a cada movimiento de una jugada el dado con el que es legal.
+
+        Sirve para repetir una jugada de obtener_jugadas_legales paso a paso:
+        al sacar fichas el destino no dice qué dado se usó (un 6 y un 5 sacan
+        igual desde el punto 3), así que se busca una asignación con la que
+        todos los movimientos, en orden, sean legales. Ante varias, se prefiere
+        el dado menor en cada paso. El tablero queda igual.
+
+        Args:
+            color (str): Color del jugador.
+            jugada (list[tuple[int, int]]): Movimientos (origen, destino).
+            dados (list[int]): Dados disponibles (cuatro iguales en los dobles).
+
+        Returns:
+            list[int] | None: El dado de cada movimiento, o None si la jugada
+            no es legal con esos dados.
+        """
+        if not jugada:
+            return []
+        origen, destino = jugada[0]
+        for dado in sorted(set(dados)):
+            if self._destino_legal(color, origen, dado) != destino:
+                continue
+            restantes = list(dados)
+            restantes.remove(dado)
+            self.aplicar_movimiento(color, origen, destino)
+            try:
+                siguientes = self.asignar_dados(color, jugada[1:], restantes)
+            finally:
+                self.deshacer_movimiento()
+            if siguientes is not None:
+                return [dado] + siguientes
+        return None
+
+    def aplicar_jugada(self, color: str, jugada: list[tuple[int, int]]) -> None:
+        """
+        Aplica en orden todos los movimientos de una jugada completa.
+
+        Args:
+            color (str): Color del jugador.
+            jugada (list[tuple[int, int]]): Movimientos (origen, destino).
+        """
+        for origen, destino in jugada:
+            self.aplicar_movimiento(color, origen, destino)
+
+    def deshacer_jugada(self, jugada: list[tuple[int, int]]) -> None:
+        """
+        Deshace una jugada completa aplicada con aplicar_jugada.
+
+        Args:
+            jugada (list[tuple[int, int]]): La misma jugada que se aplicó.
+        """
+        for _ in jugada:
+            self.deshacer_movimiento()
+
+    def __es_ficha_rival_sola(self, punto: int, color: str) -> bool:
+        """Indica si en el punto hay exactamente una ficha del rival (se captura al llegar)."""
+        estado = self.obtener_estado_punto(punto)
+        return estado is not None and estado[0] != color and estado[1] == 1
+
+    def _clave_posicion(self) -> tuple:
+        """
+        Devuelve una clave inmutable que identifica la posición completa.
+        Usada para detectar jugadas que llegan a la misma posición.
+        """
+        puntos = tuple(None if p is None else (p[0], p[1]) for p in self.__puntos__)
+        return (puntos, tuple(sorted(self.__barra__.items())),
+                tuple(sorted(self.__casa__.items())))
+
     def tiene_fichas_en_barra(self, color: str) -> bool:
         """
         Verifica si un jugador tiene fichas en la barra.
@@ -622,7 +942,7 @@ class Board:
         Returns:
             bool: True si tiene fichas en la barra, False en caso contrario.
         """
-        return self.__barra__.get(color, 0) > 0
+        return self.get_barra().get(color, 0) > 0
 
     def ha_ganado(self, color: str) -> bool:
         """
@@ -636,7 +956,7 @@ class Board:
         Returns:
             bool: True si ha ganado, False en caso contrario.
         """
-        return self.__casa__.get(color, 0) == 15
+        return self.get_casa().get(color, 0) == 15
 
     def mover_ficha(self, origen: int, destino: int, color: str) -> None:
         """
@@ -695,8 +1015,27 @@ class Board:
 
         Returns:
             None
+
+        Raises:
+            ValueError: Si el color no es "negro" ni "blanco".
         """
-        self.__barra__[color] = self.__barra__.get(color, 0) + 1
+        validar_color(color)
+        anterior = self.__barra__.get(color, 0)
+        self.__barra__[color] = anterior + 1
+        self._registrar_cambio(color, CASILLA_BARRA, anterior, anterior + 1)
+
+    def _quitar_de_barra(self, color: str) -> None:
+        """
+        Retira una ficha de la barra (la ficha reingresa al tablero).
+
+        Args:
+            color (str): Color de la ficha.
+        """
+        anterior = self.__barra__[color]
+        self.__barra__[color] -= 1
+        if self.__barra__[color] == 0:
+            del self.__barra__[color]
+        self._registrar_cambio(color, CASILLA_BARRA, anterior, anterior - 1)
 
     def sacar_ficha(self, color: str) -> None:
         """
@@ -707,8 +1046,169 @@ class Board:
 
         Returns:
             None
+
+        Raises:
+            ValueError: Si el color no es "negro" ni "blanco".
+        """
+        validar_color(color)
+        anterior = self.__casa__.get(color, 0)
+        self.__casa__[color] = anterior + 1
+        self._registrar_cambio(color, CASILLA_CASA, anterior, anterior + 1)
+
+    def _quitar_de_casa(self, color: str) -> None:
+        """
+        Retira una ficha de la casa (usado al deshacer una salida de ficha).
+
+        Args:
+            color (str): Color de la ficha.
         """
-        self.__casa__[color] = self.__casa__.get(color, 0) + 1
+        anterior = self.__casa__[color]
+        self.__casa__[color] -= 1
+        if self.__casa__[color] == 0:
+            del self.__casa__[color]
+        self._registrar_cambio(color, CASILLA_CASA, anterior, anterior - 1)
+
+    def _registrar_cambio(self, color: str, casilla: int, anterior: int, nueva: int) -> None:
+        """
+        Registra el cambio de cantidad de fichas de una casilla en el hash y los contadores.
+        Lo llaman todas las primitivas que modifican puntos, barra o casa.
+
+        Args:
+            color (str): Color de las fichas de la casilla.
+            casilla (int): 0 a 23 para los puntos, CASILLA_BARRA o CASILLA_CASA.
+            anterior (int): Cantidad antes del cambio.
+            nueva (int): Cantidad después del cambio.
+        """
+        if anterior == nueva:
+            return
+        self._actualizar_hash(color, casilla, anterior, nueva)
+        self._actualizar_contadores(color, casilla, anterior, nueva)
+
+    def _actualizar_hash(self, color: str, casilla: int, anterior: int, nueva: int) -> None:
+        """
+        Actualiza el hash Zobrist en O(1) cuando cambia la cantidad de fichas de una casilla.
+
+        Args:
+            color (str): Color de las fichas de la casilla.
+            casilla (int): 0 a 23 para los puntos, CASILLA_BARRA o CASILLA_CASA.
+            anterior (int): Cantidad antes del cambio.
+            nueva (int): Cantidad después del cambio.
+        """
+        self.__hash_posicion__ ^= (clave_zobrist(color, casilla, anterior)
+                                   ^ clave_zobrist(color, casilla, nueva))
+
+    def obtener_hash(self) -> int:
+        """
+        Devuelve el hash Zobrist de 64 bits de la posición (puntos, barra y casa).
+        Se mantiene en forma incremental, así la consulta es O(1).
+        Dos tableros con la misma posición tienen el mismo hash, sin importar
+        el orden de los movimientos que llevaron a ella.
+
+        Returns:
+            int: Hash de la posición.
+        """
+        return self.__hash_posicion__
+
+    def _actualizar_contadores(self, color: str, casilla: int, anterior: int, nueva: int) -> None:
+        """
+        Actualiza en O(1) los pips, las fichas fuera de casa y la ocupación de la casa.
+        La ocupación es una máscara de 6 bits: el bit d-1 indica fichas a distancia d del borne.
+
+        Args:
+            color (str): Color de las fichas de la casilla.
+            casilla (int): 0 a 23 para los puntos, CASILLA_BARRA o CASILLA_CASA.
+            anterior (int): Cantidad antes del cambio.
+            nueva (int): Cantidad después del cambio.
+        """
+        if casilla == CASILLA_CASA:
+            return  # Las fichas sacadas no suman pips
+        diferencia = nueva - anterior
+        if casilla == CASILLA_BARRA:
+            self.__pips__[color] += 25 * diferencia
+            return
+
+        distancia = 24 - casilla if color == "negro" else casilla + 1
+        self.__pips__[color] += distancia * diferencia
+        if distancia > 6:
+            self.__fuera_de_casa__[color] += diferencia
+        elif nueva == 0:
+            self.__ocupacion_casa__[color] &= ~(1 << (distancia - 1))
+        elif anterior == 0:
+            self.__ocupacion_casa__[color] |= 1 << (distancia - 1)
+
+    def obtener_pips(self, color: str) -> int:
+        """
+        Devuelve el conteo de pips del jugador (suma de distancias al borne, la barra vale 25).
+        Se mantiene en forma incremental, así la consulta es O(1).
+
+        Args:
+            color (str): Color del jugador.
+
+        Returns:
+            int: Pips que le faltan al jugador para sacar todas sus fichas.
+        """
+        return self.__pips__.get(color, 0)
+
+    def fichas_fuera_de_casa(self, color: str) -> int:
+        """
+        Devuelve cuántas fichas del jugador hay en puntos fuera de su cuadrante casa (sin contar la barra).
+
+        Args:
+            color (str): Color del jugador.
+
+        Returns:
+            int: Cantidad de fichas fuera de casa.
+        """
+        return self.__fuera_de_casa__.get(color, 0)
+
+    def punto_mas_alto_en_casa(self, color: str) -> int:
+        """
+        Devuelve la distancia al borne (1 a 6) de la ficha más alejada dentro de la casa.
+        Para NEGRO es 25 - punto, para BLANCO es el número de punto.
+
+        Args:
+            color (str): Color del jugador.
+
+        Returns:
+            int: Distancia de la ficha más alejada en casa, o 0 si no tiene fichas en casa.
+        """
+        return self.__ocupacion_casa__.get(color, 0).bit_length()
+
+    def _recalcular_derivados(self) -> None:
+        """
+        Recalcula desde cero el hash y los contadores (usado al cargar un estado completo).
+        """
+        self._recalcular_hash()
+        self._reiniciar_contadores()
+        for casilla in range(24):
+            estado = self.obtener_estado_punto(casilla + 1)
+            if estado is not None and estado[0] is not None and estado[1] > 0:
+                self._actualizar_contadores(estado[0], casilla, 0, estado[1])
+        for color, cantidad in self.get_barra().items():
+            self._actualizar_contadores(color, CASILLA_BARRA, 0, cantidad)
+
+    def _reiniciar_contadores(self) -> None:
+        """
+        Deja los contadores incrementales en cero (tablero vacío).
+        """
+        self.__pips__ = {"negro": 0, "blanco": 0}
+        self.__fuera_de_casa__ = {"negro": 0, "blanco": 0}
+        self.__ocupacion_casa__ = {"negro": 0, "blanco": 0}
+
+    def _recalcular_hash(self) -> None:
+        """
+        Recalcula el hash desde cero (usado al cargar un estado completo).
+        """
+        valor = 0
+        for casilla in range(24):
+            estado = self.obtener_estado_punto(casilla + 1)
+            if estado is not None and estado[0] is not None:
+                valor ^= clave_zobrist(estado[0], casilla, estado[1])
+        for color, cantidad in self.get_barra().items():
+            valor ^= clave_zobrist(color, CASILLA_BARRA, cantidad)
+        for color, cantidad in self.get_casa().items():
+            valor ^= clave_zobrist(color, CASILLA_CASA, cantidad)
+        self.__hash_posicion__ = valor
 
     # ----- Getters para tests -----
     def get_barra(self) -> dict:
@@ -728,7 +1228,16 @@ class Board:
             dict: Diccionario {color: cantidad} de fichas en la casa.
         """
         return self.__casa__
-    
+
+    def copiar(self) -> "Board":
+        """
+        Devuelve una copia independiente del tablero.
+        Usado por búsquedas y simulaciones que prueban jugadas sin alterar el original.
+
+        Returns:
+            Board: Nuevo tablero con el mismo estado.
+        """
+        return copy.deepcopy(self)
 
     def obtener_estado_dict(self) -> dict:
         """
@@ -746,12 +1255,15 @@ class Board:
         Carga el estado del tablero desde un diccionario (JSON).
         SRP: Única responsabilidad de desempaquetar y aplicar estado.
         """
+        # Los movimientos apilados eran de la posición anterior
+        self.__deshacer__.clear()
         try:
             # Usamos .get() para cargar de forma segura,
             # proveyendo valores por defecto si la clave no existe
             self.__puntos__ = estado.get("puntos", [None] * 24)
             self.__barra__ = estado.get("barra", {})
             self.__casa__ = estado.get("casa", {})
+            self._recalcular_derivados()
         except Exception as e:
             print(f"Error grave al cargar estado del tablero: {e}")
             # Si el estado está muy corrupto, restaurar al inicio
@@ -768,7 +1280,8 @@ class Board:
             str: Estado del tablero en formato legible.
         """
         estado = []
-        for i, punto in enumerate(self.__puntos__, start=1):
+        for i in range(1, 25):
+            punto = self.obtener_estado_punto(i)
             if punto is None:
                 estado.append(f"{i}: vacío")
             else:
@@ -776,9 +1289,11 @@ class Board:
                 estado.append(f"{i}: {cant} {color}")
 
         # Agregar información de barra y casa
-        if self.__barra__:
-            estado.append(f"Barra: {self.__barra__}")
-        if self.__casa__:
-            estado.append(f"Casa: {self.__casa__}")
+        barra = self.get_barra()
+        casa = self.get_casa()
+        if barra:
+            estado.append(f"Barra: {barra}")
+        if casa:
+            estado.append(f"Casa: {casa}")
 
         return "\n".join(estado)
@@ -0,0 +1,316 @@
+"""Clase CompactBoard: tablero de Backgammon sobre un arreglo compacto de enteros."""
+from array import array
+from Backgammon.Core.Board import Board, CASILLA_BARRA, CASILLA_CASA, validar_color
+
+# Distribución de las 28 casillas del arreglo
+TAMANIO_POSICION = 28
+BARRA_NEGRO = 24
+BARRA_BLANCO = 25
+CASA_NEGRO = 26
+CASA_BLANCO = 27
+
+# Signo que representa a cada color dentro del arreglo
+SIGNO_COLOR = {"negro": 1, "blanco": -1}
+
+
+class CompactBoard(Board):
+    """
+    Tablero de Backgammon que guarda toda la posición en un arreglo de 28 enteros con signo.
+
+    Casillas:
+        - 0 a 23: puntos 1 a 24.
+        - 24 / 25: barra de negro / barra de blanco.
+        - 26 / 27: casa de negro / casa de blanco.
+
+    El signo indica el color (negro positivo, blanco negativo) y el valor
+    absoluto la cantidad de fichas.
+
+    PRINCIPIOS SOLID:
+    - LSP: Mantiene el contrato público de Board (mismos métodos y resultados).
+    - OCP: Solo redefine el almacenamiento y los accesos más usados, las reglas
+      siguen implementadas una única vez en Board.
+    """
+
+    def _vaciar_tablero(self) -> None:
+        """
+        Deja el tablero sin fichas.
+        SRP: Crea el arreglo de posiciones en cero, sin lógica de reglas.
+        Attributes:
+            __posiciones__ (array): Arreglo 'b' de 28 casillas con signo.
+            __deshacer__ (list): Pila de registros para deshacer movimientos aplicados.
+            __hash_posicion__ (int): Hash Zobrist de 64 bits de la posición actual.
+            __pips__, __fuera_de_casa__, __ocupacion_casa__ (dict): Contadores incrementales de Board.
+        """
+        self.__posiciones__ = array("b", bytes(TAMANIO_POSICION))
+        self.__deshacer__ = []
+        self.__hash_posicion__ = 0
+        self._reiniciar_contadores()
+
+    def colocar_ficha(self, punto: int, color: str, cantidad: int = 1) -> None:
+        """
+        Coloca fichas en un punto específico del tablero.
+
+        Args:
+            punto (int): Número del punto (1 a 24).
+            color (str): Color de las fichas.
+            cantidad (int, optional): Número de fichas a colocar. Por defecto 1.
+
+        Raises:
+            ValueError: Si se colocan fichas de un color que no es de un jugador o
+                se intenta mezclar fichas de distinto color en el mismo punto.
+        """
+        if cantidad:
+            # Colocar 0 fichas no toca el hash ni los contadores: se acepta cualquier color
+            validar_color(color)
+        signo = SIGNO_COLOR.get(color, 0)
+        valor = self.__posiciones__[punto - 1]
+        if valor * signo < 0:
+            raise ValueError(
+                "No se pueden mezclar fichas de distinto color en el mismo punto."
+            )
+        self.__posiciones__[punto - 1] = valor + signo * cantidad
+        anterior = abs(valor)
+        self._registrar_cambio(color, punto - 1, anterior, anterior + cantidad)
+
+    def remover_ficha(self, punto: int, cantidad: int = 1) -> None:
+        """
+        Quita fichas de un punto específico.
+
+        Args:
+            punto (int): Número del punto (1 a 24).
+            cantidad (int, optional): Número de fichas a quitar. Por defecto 1.
+
+        Raises:
+            ValueError: Si el punto está vacío o no hay fichas suficientes.
+        """
+        valor = self.__posiciones__[punto - 1]
+        if valor == 0:
+            raise ValueError("No hay fichas en este punto.")
+        if abs(valor) < cantidad:
+            raise ValueError("No hay suficientes fichas para quitar.")
+        if valor > 0:
+            self.__posiciones__[punto - 1] = valor - cantidad
+            self._registrar_cambio("negro", punto - 1, valor, valor - cantidad)
+        else:
+            self.__posiciones__[punto - 1] = valor + cantidad
+            self._registrar_cambio("blanco", punto - 1, -valor, -valor - cantidad)
+
+    def obtener_estado_punto(self, punto: int):
+        """
+        Devuelve el estado de un punto.
+
+        Args:
+            punto (int): Número del punto (1 a 24).
+
+        Returns:
+            list | None: [color, cantidad] si hay fichas, o None si está vacío.
+        """
+        valor = self.__posiciones__[punto - 1]
+        if valor == 0:
+            return None
+        if valor > 0:
+            return ["negro", valor]
+        return ["blanco", -valor]
+
+    def esta_vacio(self, punto: int) -> bool:
+        """
+        Indica si un punto está vacío.
+
+        Args:
+            punto (int): Número del punto (1 a 24).
+
+        Returns:
+            bool: True si está vacío, False en caso contrario.
+        """
+        return self.__posiciones__[punto - 1] == 0
+
+    def es_movimiento_valido_a_punto(self, punto: int, color: str) -> bool:
+        """
+        Verifica si es válido mover a un punto específico leyendo el arreglo directamente.
+
+        Args:
+            punto (int): Punto de destino (1 a 24).
+            color (str): Color de la ficha que se mueve.
+
+        Returns:
+            bool: True si el movimiento es válido, False si está bloqueado.
+        """
+        if punto < 1 or punto > 24:
+            return False
+        # Positivo o cero: propio o vacío. -1: una sola ficha contraria
+        return self.__posiciones__[punto - 1] * SIGNO_COLOR[color] >= -1
+
+    def tiene_fichas_en_barra(self, color: str) -> bool:
+        """
+        Verifica si un jugador tiene fichas en la barra.
+
+        Args:
+            color (str): Color del jugador.
+
+        Returns:
+            bool: True si tiene fichas en la barra, False en caso contrario.
+        """
+        indice = BARRA_NEGRO if color == "negro" else BARRA_BLANCO
+        return self.__posiciones__[indice] != 0
+
+    def ha_ganado(self, color: str) -> bool:
+        """
+        Verifica si un jugador ha ganado (todas sus fichas están en casa).
+
+        Args:
+            color (str): Color del jugador.
+
+        Returns:
+            bool: True si ha ganado, False en caso contrario.
+        """
+        indice = CASA_NEGRO if color == "negro" else CASA_BLANCO
+        return abs(self.__posiciones__[indice]) == 15
+
+    def enviar_a_barra(self, color: str) -> None:
+        """
+        Envía una ficha a la barra.
+
+        Args:
+            color (str): Color de la ficha.
+
+        Raises:
+            ValueError: Si el color no es "negro" ni "blanco".
+        """
+        validar_color(color)
+        indice = BARRA_NEGRO if color == "negro" else BARRA_BLANCO
+        anterior = abs(self.__posiciones__[indice])
+        self.__posiciones__[indice] += SIGNO_COLOR[color]
+        self._registrar_cambio(color, CASILLA_BARRA, anterior, anterior + 1)
+
+    def _quitar_de_barra(self, color: str) -> None:
+        """
+        Retira una ficha de la barra (la ficha reingresa al tablero).
+
+        Args:
+            color (str): Color de la ficha.
+        """
+        indice = BARRA_NEGRO if color == "negro" else BARRA_BLANCO
+        anterior = abs(self.__posiciones__[indice])
+        self.__posiciones__[indice] -= SIGNO_COLOR[color]
+        self._registrar_cambio(color, CASILLA_BARRA, anterior, anterior - 1)
+
+    def sacar_ficha(self, color: str) -> None:
+        """
+        Envía una ficha a la casa del jugador.
+
+        Args:
+            color (str): Color de la ficha.
+
+        Raises:
+            ValueError: Si el color no es "negro" ni "blanco".
+        """
+        validar_color(color)
+        indice = CASA_NEGRO if color == "negro" else CASA_BLANCO
+        anterior = abs(self.__posiciones__[indice])
+        self.__posiciones__[indice] += SIGNO_COLOR[color]
+        self._registrar_cambio(color, CASILLA_CASA, anterior, anterior + 1)
+
+    def _quitar_de_casa(self, color: str) -> None:
+        """
+        Retira una ficha de la casa (usado al deshacer una salida de ficha).
+
+        Args:
+            color (str): Color de la ficha.
+        """
+        indice = CASA_NEGRO if color == "negro" else CASA_BLANCO
+        anterior = abs(self.__posiciones__[indice])
+        self.__posiciones__[indice] -= SIGNO_COLOR[color]
+        self._registrar_cambio(color, CASILLA_CASA, anterior, anterior - 1)
+
+    def get_barra(self) -> dict:
+        """
+        Devuelve el estado de la barra con el mismo formato que Board.
+
+        Returns:
+            dict: Diccionario {color: cantidad} solo con los colores que tienen fichas.
+        """
+        return self.__contar_casillas(BARRA_NEGRO, BARRA_BLANCO)
+
+    def get_casa(self) -> dict:
+        """
+        Devuelve el estado de la casa con el mismo formato que Board.
+
+        Returns:
+            dict: Diccionario {color: cantidad} solo con los colores que tienen fichas.
+        """
+        return self.__contar_casillas(CASA_NEGRO, CASA_BLANCO)
+
+    def __contar_casillas(self, indice_negro: int, indice_blanco: int) -> dict:
+        """Arma el diccionario {color: cantidad} de un par de casillas barra/casa."""
+        resultado = {}
+        if self.__posiciones__[indice_negro]:
+            resultado["negro"] = abs(self.__posiciones__[indice_negro])
+        if self.__posiciones__[indice_blanco]:
+            resultado["blanco"] = abs(self.__posiciones__[indice_blanco])
+        return resultado
+
+    def obtener_posiciones(self) -> array:
+        """
+        Devuelve el arreglo interno de 28 casillas (sin copiar).
+        Pensado para simulaciones y bots que leen la posición en bloque.
+
+        Returns:
+            array: Arreglo con signo de la posición actual.
+        """
+        return self.__posiciones__
+
+    def copiar(self) -> "CompactBoard":
+        """
+        Devuelve una copia independiente del tablero copiando el arreglo en un solo paso.
+
+        Returns:
+            CompactBoard: Nuevo tablero con el mismo estado.
+        """
+        copia = CompactBoard.__new__(CompactBoard)
+        copia.__posiciones__ = array("b", self.__posiciones__)
+        copia.__deshacer__ = list(self.__deshacer__)
+        copia.__hash_posicion__ = self.__hash_posicion__
+        copia.__pips__ = dict(self.__pips__)
+        copia.__fuera_de_casa__ = dict(self.__fuera_de_casa__)
+        copia.__ocupacion_casa__ = dict(self.__ocupacion_casa__)
+        return copia
+
+    def _clave_posicion(self) -> bytes:
+        """
+        Devuelve los bytes del arreglo como clave inmutable de la posición.
+        """
+        return self.__posiciones__.tobytes()
+
+    def obtener_estado_dict(self) -> dict:
+        """
+        Exporta el estado actual con el mismo formato JSON que Board.
+        Así las partidas guardadas son intercambiables entre ambos tableros.
+        """
+        return {
+            "puntos": [self.obtener_estado_punto(i) for i in range(1, 25)],
+            "barra": self.get_barra(),
+            "casa": self.get_casa()
+        }
+
+    def cargar_estado_dict(self, estado: dict) -> None:
+        """
+        Carga el estado del tablero desde un diccionario con el formato de Board.
+        """
+        # Los movimientos apilados eran de la posición anterior
+        self.__deshacer__.clear()
+        try:
+            self._vaciar_tablero()
+            for i, punto in enumerate(estado.get("puntos", [None] * 24), start=1):
+                if punto is not None and punto[0] is not None and punto[1] > 0:
+                    self.colocar_ficha(i, punto[0], punto[1])
+            for color, cantidad in estado.get("barra", {}).items():
+                indice = BARRA_NEGRO if color == "negro" else BARRA_BLANCO
+                self.__posiciones__[indice] = SIGNO_COLOR[color] * cantidad
+            for color, cantidad in estado.get("casa", {}).items():
+                indice = CASA_NEGRO if color == "negro" else CASA_BLANCO
+                self.__posiciones__[indice] = SIGNO_COLOR[color] * cantidad
+            self._recalcular_derivados()
+        except Exception as e:
+            print(f"Error grave al cargar estado del tablero: {e}")
+            # Si el estado está muy corrupto, restaurar al inicio
+            self.inicializar_posiciones_estandar()
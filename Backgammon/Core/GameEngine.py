@@ -0,0 +1,231 @@
+"""Clase GameEngine: motor de partida sin interfaz (tirar, jugadas legales, aplicar, resultado)."""
+import random
+from Backgammon.Core.Board import Board
+from Backgammon.Core.CompactBoard import CompactBoard
+from Backgammon.Core.Dice import Dice
+
+# Fases del turno
+FASE_TIRAR = "tirar"
+FASE_JUGAR = "jugar"
+FASE_TERMINADA = "terminada"
+
+# Tipos de victoria y puntos que valen
+PUNTOS_POR_TIPO = {"simple": 1, "gammon": 2, "backgammon": 3}
+
+
+def color_rival(color: str) -> str:
+    """Devuelve el color del oponente."""
+    return "blanco" if color == "negro" else "negro"
+
+
+class GameEngine:
+    """
+    Motor de una partida de Backgammon con una API explícita por pasos.
+
+    Cada turno pasa por dos fases: FASE_TIRAR (tirar_dados) y FASE_JUGAR
+    (obtener_jugadas_legales y aplicar_jugada con una jugada completa). Al
+    ganar un jugador la partida queda en FASE_TERMINADA y obtener_resultado
+    informa el ganador y el tipo de victoria. No usa pygame ni entrada
+    estándar, así que sirve para simular partidas a velocidad de CPU.
+
+    PRINCIPIOS SOLID:
+    - SRP: Solo maneja la máquina de estados del turno; las reglas están en Board.
+    - DIP: Los jugadores son cualquier objeto con elegir_jugada(board, dados) (por ejemplo AIPlayer).
+    - ISP: Expone pocos métodos: tirar, jugadas legales, aplicar y resultado.
+    """
+
+    def __init__(self, board: Board | None = None, turno: str | None = "negro",
+                 generador: random.Random | None = None):
+        """
+        Inicializa la partida.
+
+        Args:
+            board (Board | None): Tablero a usar tal como está (None = CompactBoard en la posición inicial).
+            turno (str | None): Color que empieza (None = se sortea con un dado por jugador).
+            generador (random.Random | None): Generador para las tiradas (None = el de Dice).
+
+        Raises:
+            ValueError: Si el color inicial no es 'negro' ni 'blanco'.
+        """
+        if board is None:
+            board = CompactBoard()
+            board.inicializar_posiciones_estandar()
+        self.__board__ = board
+        self.__dados__ = Dice()
+        self.__generador__ = generador
+        if turno is None:
+            turno = self.sortear_turno_inicial()
+        elif turno not in ("negro", "blanco"):
+            raise ValueError("El turno debe ser 'negro' o 'blanco'.")
+        self.__turno__ = turno
+        self.__fase__ = FASE_TIRAR
+        self.__jugadas__ = []
+        self.__turnos__ = 0
+        self.__resultado__ = None
+
+    def sortear_turno_inicial(self) -> str:
+        """
+        Cada jugador tira un dado hasta que salgan distintos; empieza el mayor.
+
+        Returns:
+            str: Color que empieza.
+        """
+        while True:
+            dado_negro, dado_blanco = self._tirar_valores()
+            if dado_negro != dado_blanco:
+                return "negro" if dado_negro > dado_blanco else "blanco"
+
+    def obtener_tablero(self) -> Board:
+        """Devuelve el tablero de la partida (sin copiar)."""
+        return self.__board__
+
+    def obtener_dados(self) -> Dice:
+        """Devuelve los dados de la partida."""
+        return self.__dados__
+
+    def obtener_turno(self) -> str:
+        """Devuelve el color que tiene el turno."""
+        return self.__turno__
+
+    def obtener_fase(self) -> str:
+        """Devuelve la fase actual (FASE_TIRAR, FASE_JUGAR o FASE_TERMINADA)."""
+        return self.__fase__
+
+    def obtener_turnos(self) -> int:
+        """Devuelve la cantidad de turnos jugados."""
+        return self.__turnos__
+
+    def termino(self) -> bool:
+        """Indica si la partida terminó."""
+        return self.__fase__ == FASE_TERMINADA
+
+    def obtener_resultado(self) -> dict | None:
+        """
+        Devuelve el resultado de la partida.
+
+        Returns:
+            dict | None: ganador, tipo ('simple', 'gammon' o 'backgammon'), puntos y turnos;
+            None si la partida no terminó.
+        """
+        return dict(self.__resultado__) if self.__resultado__ is not None else None
+
+    def tirar_dados(self, dado1: int | None = None, dado2: int | None = None) -> tuple[int, int]:
+        """
+        Tira los dados del jugador de turno y calcula sus jugadas legales.
+
+        Args:
+            dado1 (int | None): Valor fijo del primer dado (para repetir partidas o tests).
+            dado2 (int | None): Valor fijo del segundo dado.
+
+        Returns:
+            tuple[int, int]: Valores de la tirada.
+
+        Raises:
+            ValueError: Si no es momento de tirar.
+        """
+        if self.__fase__ != FASE_TIRAR:
+            raise ValueError(f"No se puede tirar en la fase '{self.__fase__}'.")
+        if dado1 is None or dado2 is None:
+            dado1, dado2 = self._tirar_valores()
+        self.__dados__.set_dados_para_test(dado1, dado2)
+        self.__jugadas__ = self.__board__.obtener_jugadas_legales(self.__turno__, self.__dados__)
+        self.__fase__ = FASE_JUGAR
+        return dado1, dado2
+
+    def obtener_jugadas_legales(self) -> list[list[tuple[int, int]]]:
+        """
+        Devuelve las jugadas legales de la tirada actual (lista vacía si debe pasar).
+        Es una copia: modificarla no cambia las jugadas que acepta aplicar_jugada.
+
+        Raises:
+            ValueError: Si todavía no se tiraron los dados.
+        """
+        if self.__fase__ != FASE_JUGAR:
+            raise ValueError("Primero hay que tirar los dados.")
+        return [list(jugada) for jugada in self.__jugadas__]
+
+    def aplicar_jugada(self, jugada: list[tuple[int, int]]) -> None:
+        """
+        Aplica una jugada completa del jugador de turno y pasa el turno.
+        Si no hay jugadas legales, la única jugada válida es [] (pasar).
+
+        Args:
+            jugada (list[tuple[int, int]]): Una de las jugadas de obtener_jugadas_legales.
+
+        Raises:
+            ValueError: Si no es momento de jugar o la jugada no es legal.
+        """
+        if self.__fase__ != FASE_JUGAR:
+            raise ValueError("Primero hay que tirar los dados.")
+        jugada = [tuple(movimiento) for movimiento in jugada]
+        if self.__jugadas__:
+            if jugada not in self.__jugadas__:
+                raise ValueError("La jugada no es legal para esta tirada.")
+            self.__board__.aplicar_jugada(self.__turno__, jugada)
+        elif jugada:
+            raise ValueError("No hay jugadas legales: solo se puede pasar.")
+
+        self.__turnos__ += 1
+        self.__dados__.reiniciar()
+        self.__jugadas__ = []
+        if self.__board__.ha_ganado(self.__turno__):
+            self.__fase__ = FASE_TERMINADA
+            self.__resultado__ = self._calcular_resultado(self.__turno__)
+            return
+        self.__turno__ = color_rival(self.__turno__)
+        self.__fase__ = FASE_TIRAR
+
+    def jugar_turno(self, jugador) -> list[tuple[int, int]]:
+        """
+        Juega un turno completo: tira, pide la jugada al jugador y la aplica.
+
+        Args:
+            jugador: Objeto con elegir_jugada(board, dados), por ejemplo AIPlayer.
+
+        Returns:
+            list[tuple[int, int]]: La jugada realizada ([] si pasó).
+        """
+        self.tirar_dados()
+        jugada = jugador.elegir_jugada(self.__board__, self.__dados__) if self.__jugadas__ else []
+        self.aplicar_jugada(jugada)
+        return jugada
+
+    def jugar_partida(self, jugadores: dict) -> dict:
+        """
+        Juega hasta el final alternando los jugadores de cada color.
+
+        Args:
+            jugadores (dict): Color -> objeto con elegir_jugada(board, dados).
+
+        Returns:
+            dict: El resultado de la partida (ver obtener_resultado).
+        """
+        while not self.termino():
+            self.jugar_turno(jugadores[self.__turno__])
+        return self.obtener_resultado()
+
+    def _tirar_valores(self) -> tuple[int, int]:
+        """Tira dos dados con el generador propio o con Dice."""
+        if self.__generador__ is not None:
+            return self.__generador__.randint(1, 6), self.__generador__.randint(1, 6)
+        self.__dados__.tirar()
+        return self.__dados__.obtener_valores()
+
+    def _calcular_resultado(self, ganador: str) -> dict:
+        """
+        Determina el tipo de victoria: gammon si el perdedor no sacó fichas, y backgammon
+        si además tiene fichas en la barra o en el cuadrante casa del ganador.
+        """
+        perdedor = color_rival(ganador)
+        tipo = "simple"
+        if self.__board__.get_casa().get(perdedor, 0) == 0:
+            tipo = "gammon"
+            en_casa_ganador = False
+            for punto in (range(19, 25) if ganador == "negro" else range(1, 7)):
+                estado = self.__board__.obtener_estado_punto(punto)
+                if estado is not None and estado[0] == perdedor and estado[1] > 0:
+                    en_casa_ganador = True
+            if self.__board__.get_barra().get(perdedor, 0) > 0 or en_casa_ganador:
+                tipo = "backgammon"
+        return {"ganador": ganador, "tipo": tipo, "puntos": PUNTOS_POR_TIPO[tipo],
+                "turnos": self.__turnos__}
@@ -0,0 +1,347 @@
+"""Clase NeuralEvaluator: red neuronal en NumPy que evalúa posiciones en lote."""
+import numpy as np
+from Backgammon.Core.Board import Board
+from Backgammon.Core.Dice import Dice
+
+# Distribución TD-Gammon: 4 unidades por punto y jugador, barra, casa y turno
+UNIDADES_POR_PUNTO = 4
+TAMANIO_ENTRADA = 24 * UNIDADES_POR_PUNTO * 2 + 6
+SALIDAS = ("victoria", "gammon", "gammon_rival")
+OCULTAS_POR_DEFECTO = 40
+
+
+class NeuralEvaluator:
+    """
+    Evaluador de posiciones con una red de una capa oculta (estilo TD-Gammon).
+
+    Codifica muchos tableros en una sola matriz de 198 columnas y los evalúa
+    con una única pasada de NumPy en CPU. Las salidas son probabilidades desde
+    el punto de vista del jugador indicado: ganar, ganar con gammon y perder
+    con gammon.
+
+    Codificación (198 entradas, siempre desde el punto de vista de 'color'):
+        - 96 unidades propias y 96 del rival: por cada punto, en orden de
+          distancia al borne de 'color', [n>=1, n>=2, n>=3, (n-3)/2 si n>3].
+        - Barra propia y rival (n/2), casa propia y rival (n/15).
+        - 2 unidades de turno: [le toca a 'color', le toca al rival].
+
+    PRINCIPIOS SOLID:
+    - SRP: Solo codifica y evalúa; no busca ni aplica jugadas.
+    - DIP: Lee los tableros con la interfaz pública de Board.
+    """
+
+    def __init__(self, pesos_ocultos: np.ndarray, sesgo_oculto: np.ndarray,
+                 pesos_salida: np.ndarray, sesgo_salida: np.ndarray):
+        """
+        Inicializa la red con sus pesos.
+
+        Args:
+            pesos_ocultos (np.ndarray): Matriz (198, ocultas).
+            sesgo_oculto (np.ndarray): Vector (ocultas,).
+            pesos_salida (np.ndarray): Matriz (ocultas, 3).
+            sesgo_salida (np.ndarray): Vector (3,).
+
+        Raises:
+            ValueError: Si las dimensiones no son compatibles.
+        """
+        ocultas = pesos_ocultos.shape[1] if pesos_ocultos.ndim == 2 else -1
+        if (pesos_ocultos.shape != (TAMANIO_ENTRADA, ocultas) or sesgo_oculto.shape != (ocultas,)
+                or pesos_salida.shape != (ocultas, len(SALIDAS))
+                or sesgo_salida.shape != (len(SALIDAS),)):
+            raise ValueError("Dimensiones de pesos incompatibles con la red.")
+        self.__pesos_ocultos__ = pesos_ocultos.astype(np.float64)
+        self.__sesgo_oculto__ = sesgo_oculto.astype(np.float64)
+        self.__pesos_salida__ = pesos_salida.astype(np.float64)
+        self.__sesgo_salida__ = sesgo_salida.astype(np.float64)
+
+    @classmethod
+    def aleatorio(cls, ocultas: int = OCULTAS_POR_DEFECTO, semilla: int | None = None) -> "NeuralEvaluator":
+        """
+        Crea una red con pesos aleatorios pequeños (punto de partida para entrenar).
+
+        Args:
+            ocultas (int): Cantidad de unidades ocultas.
+            semilla (int | None): Semilla para reproducibilidad.
+
+        Returns:
+            NeuralEvaluator: Red inicializada.
+        """
+        generador = np.random.default_rng(semilla)
+        return cls(generador.normal(0.0, 0.1, (TAMANIO_ENTRADA, ocultas)),
+                   np.zeros(ocultas),
+                   generador.normal(0.0, 0.1, (ocultas, len(SALIDAS))),
+                   np.zeros(len(SALIDAS)))
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "NeuralEvaluator":
+        """
+        Carga los pesos desde un archivo .npz local.
+
+        Args:
+            ruta (str): Ruta del archivo con las claves W1, b1, W2 y b2.
+
+        Returns:
+            NeuralEvaluator: Red con los pesos cargados.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            KeyError: Si falta alguna clave.
+        """
+        with np.load(ruta) as datos:
+            return cls(datos["W1"], datos["b1"], datos["W2"], datos["b2"])
+
+    def guardar(self, ruta: str) -> None:
+        """
+        Guarda los pesos en un archivo .npz.
+
+        Args:
+            ruta (str): Ruta de destino.
+        """
+        np.savez(ruta, W1=self.__pesos_ocultos__, b1=self.__sesgo_oculto__,
+                 W2=self.__pesos_salida__, b2=self.__sesgo_salida__)
+
+    def obtener_pesos(self) -> dict:
+        """
+        Devuelve los pesos de la red (sin copiar), por ejemplo para entrenarla.
+
+        Returns:
+            dict: Claves W1, b1, W2 y b2.
+        """
+        return {"W1": self.__pesos_ocultos__, "b1": self.__sesgo_oculto__,
+                "W2": self.__pesos_salida__, "b2": self.__sesgo_salida__}
+
+    @staticmethod
+    def posiciones_de(board: Board) -> np.ndarray:
+        """
+        Devuelve la posición como vector de 28 enteros con signo (formato de CompactBoard):
+        puntos 1-24, barra negro/blanco, casa negro/blanco; negro positivo, blanco negativo.
+
+        Args:
+            board (Board): Tablero a convertir.
+
+        Returns:
+            np.ndarray: Vector int8 de 28 casillas.
+        """
+        if hasattr(board, "obtener_posiciones"):
+            return np.frombuffer(board.obtener_posiciones(), dtype=np.int8)
+        vector = np.zeros(28, dtype=np.int8)
+        for punto in range(1, 25):
+            estado = board.obtener_estado_punto(punto)
+            if estado is not None and estado[0] is not None and estado[1] > 0:
+                vector[punto - 1] = estado[1] if estado[0] == "negro" else -estado[1]
+        barra = board.get_barra()
+        casa = board.get_casa()
+        vector[24] = barra.get("negro", 0)
+        vector[25] = -barra.get("blanco", 0)
+        vector[26] = casa.get("negro", 0)
+        vector[27] = -casa.get("blanco", 0)
+        return vector
+
+    @staticmethod
+    def codificar_posiciones(posiciones: np.ndarray, color: str,
+                             turno_rival: bool = True) -> np.ndarray:
+        """
+        Codifica en bloque una matriz (n, 28) de posiciones con signo.
+
+        Args:
+            posiciones (np.ndarray): Matriz (n, 28) en el formato de posiciones_de.
+            color (str): Punto de vista de la codificación.
+            turno_rival (bool): True si le toca tirar al rival (caso habitual tras una jugada).
+
+        Returns:
+            np.ndarray: Matriz (n, 198) de entradas de la red.
+        """
+        posiciones = np.asarray(posiciones, dtype=np.float64).reshape(-1, 28)
+        signo = 1.0 if color == "negro" else -1.0
+        puntos = posiciones[:, :24] * signo
+        if color == "negro":
+            # Ordenar por distancia al borne de negro (punto 24 primero)
+            puntos = puntos[:, ::-1]
+        propias = np.maximum(puntos, 0.0)
+        rivales = np.maximum(-puntos, 0.0)
+
+        filas = posiciones.shape[0]
+        entradas = np.empty((filas, TAMANIO_ENTRADA))
+        entradas[:, 0:96] = NeuralEvaluator.__unidades_por_punto(propias)
+        entradas[:, 96:192] = NeuralEvaluator.__unidades_por_punto(rivales)
+        barra_propia, barra_rival = (24, 25) if color == "negro" else (25, 24)
+        casa_propia, casa_rival = (26, 27) if color == "negro" else (27, 26)
+        entradas[:, 192] = np.abs(posiciones[:, barra_propia]) / 2.0
+        entradas[:, 193] = np.abs(posiciones[:, barra_rival]) / 2.0
+        entradas[:, 194] = np.abs(posiciones[:, casa_propia]) / 15.0
+        entradas[:, 195] = np.abs(posiciones[:, casa_rival]) / 15.0
+        entradas[:, 196] = 0.0 if turno_rival else 1.0
+        entradas[:, 197] = 1.0 if turno_rival else 0.0
+        return entradas
+
+    @staticmethod
+    def __unidades_por_punto(cantidades: np.ndarray) -> np.ndarray:
+        """Convierte cantidades (n, 24) en las 4 unidades TD-Gammon por punto (n, 96)."""
+        unidades = np.empty(cantidades.shape + (UNIDADES_POR_PUNTO,))
+        unidades[..., 0] = cantidades >= 1
+        unidades[..., 1] = cantidades >= 2
+        unidades[..., 2] = cantidades >= 3
+        unidades[..., 3] = np.maximum(cantidades - 3.0, 0.0) / 2.0
+        return unidades.reshape(cantidades.shape[0], -1)
+
+    def codificar(self, boards: list[Board], color: str, turno_rival: bool = True) -> np.ndarray:
+        """
+        Codifica varios tableros en una matriz de entradas.
+
+        Args:
+            boards (list[Board]): Tableros a codificar.
+            color (str): Punto de vista.
+            turno_rival (bool): True si le toca tirar al rival.
+
+        Returns:
+            np.ndarray: Matriz (len(boards), 198).
+        """
+        posiciones = np.array([self.posiciones_de(board) for board in boards], dtype=np.int8)
+        return self.codificar_posiciones(posiciones.reshape(-1, 28), color, turno_rival)
+
+    def evaluar_entradas(self, entradas: np.ndarray) -> np.ndarray:
+        """
+        Pasada hacia adelante de la red sobre una matriz de entradas.
+
+        Args:
+            entradas (np.ndarray): Matriz (n, 198).
+
+        Returns:
+            np.ndarray: Matriz (n, 3) con [victoria, gammon, gammon_rival].
+        """
+        ocultas = _sigmoide(entradas @ self.__pesos_ocultos__ + self.__sesgo_oculto__)
+        return _sigmoide(ocultas @ self.__pesos_salida__ + self.__sesgo_salida__)
+
+    def gradientes(self, entrada: np.ndarray) -> tuple[np.ndarray, dict]:
+        """
+        Calcula las salidas de una sola entrada y sus gradientes respecto de los pesos
+        (uno por cada salida), como los necesita el entrenamiento TD(λ).
+
+        Args:
+            entrada (np.ndarray): Vector (198,) de entradas.
+
+        Returns:
+            tuple[np.ndarray, dict]: Salidas (3,) y gradientes con las claves W1 (3, 198, ocultas),
+            b1 (3, ocultas), W2 (3, ocultas, 3) y b2 (3, 3).
+        """
+        ocultas = _sigmoide(entrada @ self.__pesos_ocultos__ + self.__sesgo_oculto__)
+        salidas = _sigmoide(ocultas @ self.__pesos_salida__ + self.__sesgo_salida__)
+        derivada_salida = salidas * (1.0 - salidas)
+        cantidad_salidas = len(SALIDAS)
+
+        # Gradiente de cada salida k respecto de la entrada neta de la capa oculta
+        delta_oculto = (derivada_salida[:, None] * self.__pesos_salida__.T) * (ocultas * (1.0 - ocultas))
+        gradiente_w2 = np.zeros((cantidad_salidas,) + self.__pesos_salida__.shape)
+        gradiente_b2 = np.zeros((cantidad_salidas, cantidad_salidas))
+        for salida in range(cantidad_salidas):
+            gradiente_w2[salida, :, salida] = derivada_salida[salida] * ocultas
+            gradiente_b2[salida, salida] = derivada_salida[salida]
+        return salidas, {"W1": entrada[None, :, None] * delta_oculto[:, None, :],
+                         "b1": delta_oculto, "W2": gradiente_w2, "b2": gradiente_b2}
+
+    def evaluar_posiciones(self, posiciones: np.ndarray, color: str,
+                           turno_rival: bool = True) -> np.ndarray:
+        """
+        Evalúa una matriz (n, 28) de posiciones con signo en una sola pasada.
+        Las partidas terminadas no pasan por la red: se devuelve su resultado exacto.
+
+        Args:
+            posiciones (np.ndarray): Matriz (n, 28) en el formato de posiciones_de.
+            color (str): Punto de vista de las probabilidades.
+            turno_rival (bool): True si le toca tirar al rival.
+
+        Returns:
+            np.ndarray: Matriz (n, 3) con [victoria, gammon, gammon_rival].
+        """
+        posiciones = np.asarray(posiciones).reshape(-1, 28)
+        salidas = self.evaluar_entradas(self.codificar_posiciones(posiciones, color, turno_rival))
+        casa_propia, casa_rival = (26, 27) if color == "negro" else (27, 26)
+        fuera_propias = np.abs(posiciones[:, casa_propia].astype(np.int16))
+        fuera_rivales = np.abs(posiciones[:, casa_rival].astype(np.int16))
+        gano = fuera_propias == 15
+        perdio = fuera_rivales == 15
+        salidas[gano] = np.stack([np.ones(gano.sum()), fuera_rivales[gano] == 0,
+                                  np.zeros(gano.sum())], axis=1)
+        salidas[perdio] = np.stack([np.zeros(perdio.sum()), np.zeros(perdio.sum()),
+                                    fuera_propias[perdio] == 0], axis=1)
+        return salidas
+
+    def evaluar(self, boards: list[Board], color: str, turno_rival: bool = True) -> np.ndarray:
+        """
+        Evalúa varios tableros en una sola pasada.
+
+        Args:
+            boards (list[Board]): Tableros a evaluar.
+            color (str): Punto de vista de las probabilidades.
+            turno_rival (bool): True si le toca tirar al rival.
+
+        Returns:
+            np.ndarray: Matriz (n, 3) con [victoria, gammon, gammon_rival].
+        """
+        posiciones = np.array([self.posiciones_de(board) for board in boards], dtype=np.int8)
+        return self.evaluar_posiciones(posiciones, color, turno_rival)
+
+    def evaluar_jugadas(self, board: Board, color: str, jugadas: list) -> np.ndarray:
+        """
+        Evalúa todas las jugadas candidatas de una tirada en una sola pasada.
+        Cada jugada se aplica y deshace en el mismo tablero para leer su posición.
+
+        Args:
+            board (Board): Tablero antes de la jugada (no queda modificado).
+            color (str): Jugador que mueve.
+            jugadas (list): Jugadas legales (listas de (origen, destino)).
+
+        Returns:
+            np.ndarray: Matriz (len(jugadas), 3) desde el punto de vista de 'color'.
+        """
+        posiciones = np.empty((len(jugadas), 28), dtype=np.int8)
+        for fila, jugada in enumerate(jugadas):
+            board.aplicar_jugada(color, jugada)
+            posiciones[fila] = self.posiciones_de(board)
+            board.deshacer_jugada(jugada)
+        return self.evaluar_posiciones(posiciones, color)
+
+    def sugerir_jugadas(self, board: Board, color: str, dados: Dice,
+                        cantidad: int | None = None) -> list[tuple[list, float, np.ndarray]]:
+        """
+        Ordena las jugadas legales de la tirada de mejor a peor (sugerencias).
+
+        Args:
+            board (Board): Tablero actual.
+            color (str): Jugador que mueve.
+            dados (Dice): Tirada actual.
+            cantidad (int | None): Máximo de sugerencias (None = todas).
+
+        Returns:
+            list[tuple[list, float, np.ndarray]]: (jugada, equidad, probabilidades) ordenadas.
+        """
+        jugadas = board.obtener_jugadas_legales(color, dados)
+        if not jugadas:
+            return []
+        probabilidades = self.evaluar_jugadas(board, color, jugadas)
+        equidades = equidad(probabilidades)
+        orden = np.argsort(-equidades, kind="stable")
+        if cantidad is not None:
+            orden = orden[:cantidad]
+        return [(jugadas[i], float(equidades[i]), probabilidades[i]) for i in orden]
+
+
+def equidad(probabilidades: np.ndarray) -> np.ndarray:
+    """
+    Calcula la equidad esperada (sin cubo) a partir de las salidas de la red.
+    Ganar vale 1, ganar con gammon 2 (y lo mismo en negativo al perder).
+
+    Args:
+        probabilidades (np.ndarray): Matriz (n, 3) o vector (3,).
+
+    Returns:
+        np.ndarray: Equidades en [-2, 2].
+    """
+    probabilidades = np.asarray(probabilidades)
+    return (2.0 * probabilidades[..., 0] - 1.0
+            + probabilidades[..., 1] - probabilidades[..., 2])
+
+
+def _sigmoide(valores: np.ndarray) -> np.ndarray:
+    """Función logística."""
+    return 1.0 / (1.0 + np.exp(-valores))
@@ -1,6 +1,10 @@
 """Interfaz de línea de comandos para Backgammon."""
+from Backgammon.Core.AIPlayer import AIPlayer
 from Backgammon.Core.Board import Board
 from Backgammon.Core.Dice import Dice
+from Backgammon.Interfaces.Opciones import crear_oponente, crear_parser
+from Backgammon.Persistence.AutoSave import GuardadoDiferido, SLOT_AUTOGUARDADO
+from Backgammon.Persistence.Storage import crear_almacen, es_conflicto
 
 
 class CLI:
@@ -17,18 +21,27 @@ class CLI:
         - DIP: Usa las clases del núcleo (Board, Dice) sin depender de sus implementaciones internas.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, oponente: AIPlayer | None = None,
+                 autoguardado: GuardadoDiferido | None = None) -> None:
         """
         Inicializa la interfaz CLI.
 
         SRP: Configura el estado inicial de la interfaz (tablero, dados, jugadores, turno).
         DIP: Depende de las abstracciones del dominio sin modificar su implementación.
+
+        Args:
+            oponente (AIPlayer | None): Jugador automático que juega con su color, o None
+                para una partida entre dos personas.
+            autoguardado (GuardadoDiferido | None): Planificador que guarda la partida
+                después de cada turno, o None para no guardar.
         """
         self.board = Board()
         self.dados = Dice()
         self.jugador_negro = ""
         self.jugador_blanco = ""
         self.turno_actual = "negro"
+        self.oponente = oponente
+        self.autoguardado = autoguardado
 
     def iniciar_juego(self) -> None:
         """
@@ -41,8 +54,15 @@ class CLI:
         print("   🎲 BIENVENIDO AL BACKGAMMON 🎲")
         print("=" * 50)
 
-        self.jugador_negro = input("Ingrese el nombre del Jugador 1 (fichas ○): ").strip()
-        self.jugador_blanco = input("Ingrese el nombre del Jugador 2 (fichas ●): ").strip()
+        color_oponente = self.oponente.obtener_color() if self.oponente else None
+        if color_oponente == "negro":
+            self.jugador_negro = self.oponente.obtener_nombre()
+        else:
+            self.jugador_negro = input("Ingrese el nombre del Jugador 1 (fichas ○): ").strip()
+        if color_oponente == "blanco":
+            self.jugador_blanco = self.oponente.obtener_nombre()
+        else:
+            self.jugador_blanco = input("Ingrese el nombre del Jugador 2 (fichas ●): ").strip()
 
         if not self.jugador_negro:
             self.jugador_negro = "Jugador 1"
@@ -167,6 +187,9 @@ class CLI:
         else:
             print("\n🎯 CASA: vacía")
 
+        print(f"\n📏 PIPS: ○ {self.board.obtener_pips('negro')} | "
+              f"● {self.board.obtener_pips('blanco')}")
+
         print("-" * 80)
 
     def loop_principal(self) -> None:
@@ -186,6 +209,26 @@ class CLI:
 
             self.turno_jugador()
             self.turno_actual = "blanco" if self.turno_actual == "negro" else "negro"
+            self.autoguardar()
+
+        # Partida terminada: se escribe ya, sin esperar el intervalo
+        if self.autoguardado is not None:
+            self.autoguardado.vaciar()
+
+    def autoguardar(self) -> None:
+        """
+        Marca el estado actual para el guardado automático diferido.
+
+        SRP: Solo arma el estado; cuándo se escribe lo decide GuardadoDiferido.
+        """
+        if self.autoguardado is None:
+            return
+        self.autoguardado.marcar(SLOT_AUTOGUARDADO, {
+            "board_state": self.board.obtener_estado_dict(),
+            "ui_state": {"current_player": self.turno_actual,
+                         "jugador_negro": self.jugador_negro,
+                         "jugador_blanco": self.jugador_blanco},
+        })
 
     def turno_jugador(self) -> None:
         """
@@ -194,6 +237,10 @@ class CLI:
         SRP: Coordina tirada de dados y llamadas al tablero, sin implementar reglas.
         DIP: Usa Board y Dice sin conocer sus detalles internos.
         """
+        if self.oponente is not None and self.turno_actual == self.oponente.obtener_color():
+            self.turno_computadora()
+            return
+
         nombre_jugador = self.jugador_negro if self.turno_actual == "negro" else self.jugador_blanco
         simbolo = "○" if self.turno_actual == "negro" else "●"
 
@@ -217,6 +264,47 @@ class CLI:
 
         self.dados.reiniciar()
 
+    def turno_computadora(self) -> None:
+        """
+        Juega el turno del jugador automático sin pedir datos al usuario.
+
+        SRP: Solo muestra la jugada; la decisión es del AIPlayer y las reglas del Board.
+        DIP: Usa AIPlayer.elegir_jugada y Board.aplicar_jugada.
+        """
+        simbolo = "○" if self.turno_actual == "negro" else "●"
+        print(f"\n{'='*20} TURNO DE {self.oponente.obtener_nombre().upper()} {simbolo} {'='*20}")
+
+        self.dados.tirar()
+        print(f"\n🎲 {self.dados}")
+
+        jugada = self.oponente.elegir_jugada(self.board, self.dados)
+        if not jugada:
+            print(f"❌ No hay movimientos posibles para {self.oponente.obtener_nombre()}.")
+        else:
+            self.board.aplicar_jugada(self.turno_actual, jugada)
+            print(f"🤖 {self.oponente.obtener_nombre()} juega: {self.formatear_jugada(jugada)}")
+            self.mostrar_tablero()
+
+        self.dados.reiniciar()
+
+    @staticmethod
+    def formatear_jugada(jugada: list[tuple[int, int]]) -> str:
+        """
+        Devuelve la jugada en notación legible, por ejemplo "13/7, 8/7".
+
+        Args:
+            jugada (list[tuple[int, int]]): Movimientos (origen, destino).
+
+        Returns:
+            str: Movimientos separados por coma ("barra" para el origen 0, "fuera" al sacar).
+        """
+        partes = []
+        for origen, destino in jugada:
+            desde = "barra" if origen == 0 else str(origen)
+            hasta = "fuera" if destino in (0, 25) else str(destino)
+            partes.append(f"{desde}/{hasta}")
+        return ", ".join(partes)
+
     def mostrar_movimientos_disponibles(self) -> bool:
         """
         Muestra los movimientos posibles del jugador actual.
@@ -432,20 +520,51 @@ class CLI:
         return self.realizar_movimiento_simple_con_dados(True, False)
 
 
+def informar_autoguardado(resultados: dict) -> None:
+    """
+    Muestra los guardados automáticos que fallaron; los correctos no se anuncian.
+
+    GuardadoDiferido la llama desde su hilo de fondo con el resultado de cada escritura.
+    Un conflicto significa que otro proceso escribió el slot y que ya no se autoguarda.
+
+    Args:
+        resultados (dict): slot -> (éxito, mensaje).
+    """
+    for slot_id, resultado in resultados.items():
+        if es_conflicto(resultado):
+            print(f"\n⚠️  Autoguardado detenido en '{slot_id}': {resultado[1]}")
+        elif not resultado[0]:
+            print(f"\n⚠️  Falló el autoguardado: {resultado[1]}")
+
+
 def main() -> None:
     """
     Punto de entrada de la aplicación CLI.
 
     SRP: Encargado solo de iniciar la interfaz y manejar excepciones generales.
     DIP: No depende de detalles del dominio, solo del contrato de la clase CLI.
+
+    Ejemplo:
+        python3 -m Backgammon.Interfaces.CLI --ia --pesos pesos.npz --autoguardar
     """
-    juego = CLI()
+    parser = crear_parser("Backgammon por línea de comandos.")
+    parser.add_argument("--autoguardar", action="store_true",
+                        help="Guarda la partida después de cada turno (ver BACKGAMMON_ALMACEN).")
+    argumentos = parser.parse_args()
+    oponente = crear_oponente(parser, argumentos)
+    autoguardado = None
+    if argumentos.autoguardar:
+        autoguardado = GuardadoDiferido(crear_almacen(), al_guardar=informar_autoguardado)
+    juego = CLI(oponente, autoguardado)
     try:
         juego.iniciar_juego()
     except KeyboardInterrupt:
         print("\n\n¡Hasta luego! 👋")
     except Exception as e:
         print(f"\n❌ Error inesperado: {e}")
+    finally:
+        if autoguardado is not None:
+            autoguardado.detener()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,52 @@
+"""Opciones de línea de comandos compartidas por la CLI y la interfaz gráfica."""
+import argparse
+from Backgammon.Core.AIPlayer import AIPlayer
+from Backgammon.Core.NeuralEvaluator import NeuralEvaluator
+
+
+def crear_parser(descripcion: str) -> argparse.ArgumentParser:
+    """
+    Crea el parser con las opciones del oponente automático (--ia y --pesos).
+
+    SRP: Las dos interfaces aceptan las mismas opciones sin repetir su definición.
+
+    Args:
+        descripcion (str): Descripción que muestra --help.
+
+    Returns:
+        argparse.ArgumentParser: Parser al que cada interfaz puede agregar sus opciones.
+    """
+    parser = argparse.ArgumentParser(description=descripcion)
+    parser.add_argument("--ia", action="store_true",
+                        help="La computadora controla las fichas blancas.")
+    parser.add_argument("--pesos", metavar="ARCHIVO.npz",
+                        help="Pesos de la red neuronal con la que evalúa la computadora (requiere --ia).")
+    return parser
+
+
+def crear_oponente(parser: argparse.ArgumentParser,
+                   argumentos: argparse.Namespace) -> AIPlayer | None:
+    """
+    Crea el oponente automático pedido por --ia y --pesos.
+
+    Una combinación inválida o un archivo de pesos que no se puede cargar
+    terminan con parser.error (mensaje de uso y código 2).
+
+    Args:
+        parser (argparse.ArgumentParser): Parser que leyó los argumentos.
+        argumentos (argparse.Namespace): Resultado de parser.parse_args().
+
+    Returns:
+        AIPlayer | None: Jugador blanco automático, o None sin --ia.
+    """
+    if argumentos.pesos is not None and not argumentos.ia:
+        parser.error("--pesos requiere --ia")
+    if not argumentos.ia:
+        return None
+    evaluador = None
+    if argumentos.pesos is not None:
+        try:
+            evaluador = NeuralEvaluator.cargar(argumentos.pesos)
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"no se pudieron cargar los pesos de '{argumentos.pesos}': {e}")
+    return AIPlayer("Computadora", "blanco", evaluador=evaluador)
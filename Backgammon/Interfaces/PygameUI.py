@@ -1,14 +1,27 @@
+import copy
 import os
+import queue
 import sys
+import threading
+from collections import OrderedDict
 from typing import Tuple, Optional, List
 import pygame
+import pygame.gfxdraw
 import math
 import time
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from Backgammon.Core.AIPlayer import AIPlayer  # pylint: disable=wrong-import-position
 from Backgammon.Core.Board import Board  # pylint: disable=wrong-import-position
 from Backgammon.Core.Dice import Dice  # pylint: disable=wrong-import-position
-from Backgammon.Persistence.RedisManager import RedisManager
+from Backgammon.Interfaces.Opciones import crear_oponente, crear_parser  # pylint: disable=wrong-import-position
+from Backgammon.Persistence.AutoSave import GuardadoDiferido, SLOT_AUTOGUARDADO  # pylint: disable=wrong-import-position
+from Backgammon.Persistence.Storage import AlmacenPartidas, crear_almacen, es_conflicto  # pylint: disable=wrong-import-position
+
+# Espera máxima (ms) de pygame.event.wait cuando no hay nada que animar
+IDLE_WAIT_MS = 250
+# Evento que publica StorageWorker al terminar un guardado o una carga
+STORAGE_EVENT = pygame.event.custom_type()
 
 class PygameUI:
     """
@@ -26,7 +39,10 @@ class PygameUI:
           no de implementaciones concretas.
     """
 
-    def __init__(self, board_width: int = 1600, board_height: int = 900):
+    def __init__(self, board_width: int = 1600, board_height: int = 900,
+                 ai_player: Optional[AIPlayer] = None,
+                 storage: Optional[AlmacenPartidas] = None,
+                 autosave_interval: float = 2.0):
         """
         Inicializa la interfaz gráfica y todos sus componentes.
         
@@ -34,6 +50,12 @@ class PygameUI:
             - SRP: Solo inicializa componentes, no implementa lógica de juego.
             - DIP: Inyecta dependencias (Board, Dice, gestores) mediante composición.
             - ISP: Utiliza interfaces específicas de cada gestor sin acoplamiento excesivo.
+
+        Args:
+            ai_player: Jugador automático que controla su color, o None para dos personas.
+            storage: Almacenamiento de partidas, o None para elegirlo con
+                BACKGAMMON_ALMACEN (ver crear_almacen; Redis por defecto).
+            autosave_interval: Segundos entre escrituras del guardado automático.
         """
         pygame.init()  # pylint: disable=no-member
         pygame.mixer.init()
@@ -50,7 +72,7 @@ class PygameUI:
         self.__dice_rolls__ = []
         self.__available_moves__ = []
         self.__current_player__ = None
-        self.__font__ = pygame.font.Font(None, 45)
+        self.__text_cache__ = TextCache()
         self.__message__ = self.__message_manager__.get_start_message()
         self.__is_doubles_roll__ = False
         self.__board__ = Board()
@@ -76,7 +98,22 @@ class PygameUI:
         self.__board_width__ = 1500
         self.__board_height__ = 800
         self.__bar_width__ = 80
-        self.__redis_manager__ = RedisManager()
+        self.__background_color__ = (139, 69, 19)
+        self.__static_layer__: Optional[pygame.Surface] = None
+        self.__frame_signatures__: Optional[dict] = None
+        self.__frame_size__: Optional[Tuple[int, int]] = None
+        self.__checker_sprites__ = CheckerSpriteAtlas(
+            {"negro": self.__checker_black__, "blanco": self.__checker_white__},
+            self.__checker_border__, self.__doubles_highlight__, radii=(20, 25))
+        self.__storage__ = storage if storage is not None else crear_almacen()
+        self.__storage_worker__ = StorageWorker()
+        # Slot cuyo último guardado dio conflicto: la próxima G lo sobrescribe
+        self.__save_conflict__: Optional[str] = None
+        self.__autosave__ = GuardadoDiferido(self.__storage__, autosave_interval,
+                                             al_guardar=self.__post_autosave_results)
+        self.__ai_player__ = ai_player
+        # True si la jugada de la IA no se pudo aplicar: no se reintenta hasta el próximo turno
+        self.__ai_desync__ = False
 
         try:
             base_path = os.path.dirname(__file__)
@@ -108,20 +145,31 @@ class PygameUI:
     def run(self) -> None:
         """
         Inicia el bucle principal del juego.
+
+        Si no hay animación ni turno de la IA pendiente, el bucle se bloquea en
+        pygame.event.wait (hasta IDLE_WAIT_MS) en lugar de girar a 60 FPS, y
+        cada frame solo redibuja las regiones que cambiaron.
         
         Principios SOLID:
             - SRP: Su única responsabilidad es mantener el ciclo de vida del juego.
             - OCP: Puede extenderse el ciclo sin modificar este método base.
         """
         while self.__running__:
-            self.__handle_events()
+            pending_events = []
+            if self.__is_idle():
+                event = pygame.event.wait(IDLE_WAIT_MS)
+                if event.type != pygame.NOEVENT:
+                    pending_events.append(event)
+            self.__handle_events(pending_events)
             self.__update()
-            self.__draw()
+            self.__render_frame()
             self.__clock__.tick(60)
+        # Escribe la última jugada pendiente del guardado automático
+        self.__autosave__.detener()
         pygame.quit()  # pylint: disable=no-member
         sys.exit()
 
-    def __handle_events(self) -> None:
+    def __handle_events(self, pending_events: Optional[List[pygame.event.Event]] = None) -> None:
         """
         Gestiona las entradas del usuario (teclado y mouse).
         
@@ -129,10 +177,21 @@ class PygameUI:
             - SRP: Solo maneja eventos de entrada, delega acciones a métodos especializados.
             - OCP: Nuevos eventos pueden agregarse sin modificar eventos existentes.
             - ISP: Separa eventos por tipo (teclado, mouse) para interfaces específicas.
+
+        Args:
+            pending_events: Eventos ya sacados de la cola (por pygame.event.wait),
+                que se procesan antes que los de pygame.event.get.
         """
-        for event in pygame.event.get():
+        for event in list(pending_events or []) + pygame.event.get():
             if event.type == pygame.QUIT:
                 self.__running__ = False
+
+            elif event.type == STORAGE_EVENT:
+                self.__handle_storage_result(event)
+
+            elif event.type == pygame.VIDEOEXPOSE:
+                # La ventana se volvió a mostrar: hay que repintarla entera
+                self.__frame_signatures__ = None
             
             # --- MANEJO DE TECLADO ---
             elif event.type == pygame.KEYDOWN:
@@ -273,33 +332,48 @@ class PygameUI:
                 self.__sound_error__.play()
 
 
-    def __attempt_move(self, origen: int, destino: int) -> None:
+    def __attempt_move(self, origen: int, destino: int, dice_value: Optional[int] = None) -> None:
         """
         Intenta realizar un movimiento desde origen a destino.
+
+        Args:
+            origen: Punto de origen (0 para la barra).
+            destino: Punto de destino.
+            dice_value: Dado a usar si el movimiento saca una ficha (la IA pasa
+                el de su jugada); None usa el menor válido. Los demás movimientos
+                siempre usan la distancia exacta.
         
         Principios SOLID:
             - SRP: Coordina validación y ejecución, pero delega cada tarea a métodos especializados.
             - OCP: Bearing off es una extensión sin modificar movimientos normales.
             - DIP: Depende de validadores abstractos (BearingOffValidator).
         """
+        moves_before = len(self.__available_moves__)
+
         # Verificar si es un intento de bearing off
         if self.__bearing_off_validator__.is_bearing_off_move(
                 self.__current_player__, origen, destino):
-            self.__attempt_bearing_off(origen, destino)
-            return
-        
-        # Validar el movimiento ANTES de ejecutarlo
-        if not self.__validate_and_report_move(origen, destino):
-            # Ya hay mensaje de error
-            return
-        
-        # Si pasó la validación, ejecutar
-        self.__execute_move(origen, destino)
+            self.__attempt_bearing_off(origen, destino, dice_value)
+
+        # Validar el movimiento ANTES de ejecutarlo (si falla, ya hay mensaje de error)
+        elif self.__validate_and_report_move(origen, destino):
+            # Si pasó la validación, ejecutar
+            self.__execute_move(origen, destino)
 
+        # Se usó un dado: la jugada cambió la partida
+        if len(self.__available_moves__) != moves_before:
+            self.__autosave()
 
-    def __attempt_bearing_off(self, origen: int, destino: int) -> None:
+
+    def __attempt_bearing_off(self, origen: int, destino: int,
+                              dice_value: Optional[int] = None) -> None:
         """
         Intenta realizar bearing off (sacar fichas del tablero).
+
+        Args:
+            origen: Punto desde el que sale la ficha.
+            destino: Casa del jugador.
+            dice_value: Dado a usar; None busca el menor dado válido.
         
         Principios SOLID:
             - SRP: Gestiona solo la lógica de bearing off, no movimientos normales.
@@ -315,12 +389,15 @@ class PygameUI:
         # 2. Encontrar un dado válido para este movimiento
         dice_to_use = None
         # Iteramos los dados disponibles ordenados (para usar el más bajo válido)
-        for dice_value in sorted(list(set(self.__available_moves__))):
+        candidates = sorted(set(self.__available_moves__))
+        if dice_value is not None:
+            candidates = [dice_value] if dice_value in self.__available_moves__ else []
+        for candidate in candidates:
             is_valid, _ = self.__bearing_off_validator__.validate_bearing_off_move(
-                self.__current_player__, origen, dice_value)
+                self.__current_player__, origen, candidate)
             
             if is_valid:
-                dice_to_use = dice_value
+                dice_to_use = candidate
                 break # Encontramos el dado más bajo que funciona
 
         # 3. Verificar si encontramos un dado
@@ -561,6 +638,7 @@ class PygameUI:
             - DIP: Usa GameStateManager para cambiar estados.
         """
         self.__switch_player()
+        self.__ai_desync__ = False
         self.__game_state_manager__.change_state('AWAITING_ROLL')
         self.__dice_rolls__ = []
         self.__available_moves__ = []
@@ -822,12 +900,76 @@ class PygameUI:
     def __update(self) -> None:
         """
         Actualiza la lógica del juego cada frame.
+        Si es el turno del jugador automático, tira, juega y pasa el turno.
         
         Principios SOLID:
-            - SRP: Placeholder para actualizaciones futuras.
+            - SRP: Solo avanza el turno automático; las reglas siguen en los validadores.
             - OCP: Puede extenderse con animaciones sin modificar estructura.
         """
-        pass
+        if (self.__ai_player__ is None or
+                self.__current_player__ != self.__ai_player__.obtener_color() or
+                self.__ai_desync__ or
+                self.__home_manager__.has_won("negro") or
+                self.__home_manager__.has_won("blanco")):
+            return
+
+        current_state = self.__game_state_manager__.get_current_state()
+        if current_state == 'AWAITING_ROLL':
+            self.__roll_player_dice()
+        elif current_state == 'AWAITING_SKIP_CONFIRMATION':
+            self.__end_turn()
+        elif current_state == 'AWAITING_PIECE_SELECTION':
+            self.__play_ai_turn()
+
+    def __play_ai_turn(self) -> None:
+        """
+        Pide la jugada al AIPlayer y la ejecuta movimiento a movimiento con las
+        mismas validaciones que un click del usuario.
+        
+        Principios SOLID:
+            - SRP: Traduce la jugada del bot a movimientos de la UI.
+            - DIP: Depende de AIPlayer.elegir_jugada, no de cómo busca.
+        """
+        ai_color = self.__ai_player__.obtener_color()
+
+        # La barra y la casa de la UI viven en sus gestores: se copian a un tablero de búsqueda
+        search_board = self.__board__.copiar()
+        for color, count in self.__bar_manager__.get_bar_state().items():
+            for _ in range(count):
+                search_board.enviar_a_barra(color)
+        for color, count in self.__home_manager__.get_home_state().items():
+            for _ in range(count):
+                search_board.sacar_ficha(color)
+
+        play = self.__ai_player__.elegir_jugada(search_board, self.__dice__)
+        # Cada paso se aplica con el dado que supuso la búsqueda, no con el que elegiría la UI
+        dice = (search_board.asignar_dados(ai_color, play, list(self.__available_moves__))
+                or [None] * len(play))
+        applied = 0
+        for (origen, destino), dice_value in zip(play, dice):
+            if (self.__current_player__ != ai_color or
+                    self.__game_state_manager__.get_current_state() != 'AWAITING_PIECE_SELECTION'):
+                break
+            moves_before = len(self.__available_moves__)
+            self.__attempt_move(origen, destino, dice_value)
+            if len(self.__available_moves__) >= moves_before:
+                break
+            applied += 1
+
+        if self.__home_manager__.has_won(ai_color):
+            return
+        moves_str = ", ".join(f"{origen}/{destino}" for origen, destino in play) or "sin movimientos"
+        if applied < len(play):
+            # La UI y la búsqueda no coinciden: se informa en vez de descartar los dados
+            origen, destino = play[applied]
+            self.__ai_desync__ = True
+            self.__message__ = (f"IA ({ai_color}): no se pudo aplicar {origen}/{destino} de su "
+                                f"jugada ({moves_str}): {self.__message__} Completa el turno a mano.")
+            return
+        if self.__current_player__ == ai_color:
+            self.__end_turn()
+        self.__message__ = (f"IA ({ai_color}) jugó: {moves_str}. "
+                            f"{self.__message_manager__.get_awaiting_roll_message(self.__current_player__)}")
 
     def __draw_bar_pieces(self) -> None:
         """
@@ -836,38 +978,35 @@ class PygameUI:
         Principios SOLID:
             - SRP: Solo renderiza fichas de la barra.
             - DIP: Usa BarManager para obtener estado sin implementar lógica.
+
+        Todas las fichas y contadores se copian con una sola llamada a Surface.blits.
         """
         bar_x = self.__board_margin__ + (self.__board_width__ // 2) - (self.__bar_width__ // 2)
         bar_center_x = bar_x + (self.__bar_width__ // 2)
         checker_radius = 20
+        sprites = []
         negro_count = self.__bar_manager__.get_pieces_count("negro")
         if negro_count > 0:
             start_y = self.__board_margin__ + 50
+            sprite = self.__checker_sprites__.get("negro", checker_radius)
             for i in range(min(negro_count, 8)):
                 ficha_y = start_y + (i * checker_radius * 1.5)
-                pygame.draw.circle(self.__screen__, self.__checker_black__,
-                                 (bar_center_x, int(ficha_y)), checker_radius)
-                pygame.draw.circle(self.__screen__, self.__checker_border__,
-                                 (bar_center_x, int(ficha_y)), checker_radius, 2)
+                sprites.append((sprite, sprite.get_rect(center=(bar_center_x, int(ficha_y)))))
             if negro_count > 8:
-                font_small = pygame.font.Font(None, 20)
-                count_text = font_small.render(str(negro_count), True, self.__white__)
-                text_rect = count_text.get_rect(center=(bar_center_x, start_y + 200))
-                self.__screen__.blit(count_text, text_rect)
+                count_text = self.__text_cache__.render(str(negro_count), 20, self.__white__)
+                sprites.append((count_text, count_text.get_rect(center=(bar_center_x, start_y + 200))))
         blanco_count = self.__bar_manager__.get_pieces_count("blanco")
         if blanco_count > 0:
             start_y = self.__board_margin__ + self.__board_height__ - 50
+            sprite = self.__checker_sprites__.get("blanco", checker_radius)
             for i in range(min(blanco_count, 8)):
                 ficha_y = start_y - (i * checker_radius * 1.5)
-                pygame.draw.circle(self.__screen__, self.__checker_white__,
-                                 (bar_center_x, int(ficha_y)), checker_radius)
-                pygame.draw.circle(self.__screen__, self.__checker_border__,
-                                 (bar_center_x, int(ficha_y)), checker_radius, 2)
+                sprites.append((sprite, sprite.get_rect(center=(bar_center_x, int(ficha_y)))))
             if blanco_count > 8:
-                font_small = pygame.font.Font(None, 20)
-                count_text = font_small.render(str(blanco_count), True, self.__black__)
-                text_rect = count_text.get_rect(center=(bar_center_x, start_y - 200))
-                self.__screen__.blit(count_text, text_rect)
+                count_text = self.__text_cache__.render(str(blanco_count), 20, self.__black__)
+                sprites.append((count_text, count_text.get_rect(center=(bar_center_x, start_y - 200))))
+        if sprites:
+            self.__screen__.blits(sprites, doreturn=False)
 
     
     def __draw_bearing_off_zones(self) -> None:
@@ -879,35 +1018,20 @@ class PygameUI:
             - OCP: Extensión visual que no modifica renderizado base.
             - DIP: Usa BearingOffValidator para determinar visibilidad.
         """
-        # Solo mostrar si el jugador actual PUEDE hacer bearing off
-        if not self.__bearing_off_validator__.can_bear_off(self.__current_player__):
+        # Solo mostrar si el jugador actual PUEDE sacar y está eligiendo ficha
+        if not self.__bearing_off_zone_active():
             return
         
-        # Solo mostrar en estado de selección
-        if self.__game_state_manager__.get_current_state() != 'AWAITING_PIECE_SELECTION':
-            return
-        
-        # Configuración de dimensiones
-        side_width = (self.__board_width__ - self.__bar_width__) // 2
-        point_width = side_width // 6
-        
         # Efecto pulsante para llamar la atención
         import math
         import time
         pulse = int(40 * abs(math.sin(time.time() * 2.5)))
-        
-        font_large = pygame.font.Font(None, 50)
-        font_small = pygame.font.Font(None, 30)
+
         
         if self.__current_player__ == "negro":
             # Casa Negro: cuadrante 13-18 (inferior izquierdo)
             # Dibujar rectángulo horizontal que cubre los 6 puntos
-            start_x = self.__board_margin__
-            start_y = self.__board_margin__ + (self.__board_height__ // 2) + 10
-            zone_width = side_width
-            zone_height = (self.__board_height__ // 2) - 20
-            
-            zone_rect = pygame.Rect(start_x, start_y, zone_width, zone_height)
+            zone_rect = self.__bearing_off_zone_rect()
             
             # Color base marrón oscuro con efecto pulsante
             base_color = (101, 67, 33)
@@ -921,12 +1045,12 @@ class PygameUI:
             pygame.draw.rect(self.__screen__, border_color, zone_rect, 6, border_radius=15)
             
             # Textos centrados
-            text1 = font_large.render("🏠 CASA NEGRO", True, (255, 255, 255))
-            text2 = font_small.render("Click aquí para sacar fichas", True, (200, 255, 200))
+            text1 = self.__text_cache__.render("🏠 CASA NEGRO", 50, (255, 255, 255))
+            text2 = self.__text_cache__.render("Click aquí para sacar fichas", 30, (200, 255, 200))
             
             # Cantidad de fichas en casa
             home_count = self.__home_manager__.get_pieces_count("negro")
-            text3 = font_small.render(f"Fichas en casa: {home_count}/15", True, (255, 215, 0))
+            text3 = self.__text_cache__.render(f"Fichas en casa: {home_count}/15", 30, (255, 215, 0))
             
             # Centrar textos verticalmente
             center_y = zone_rect.centery
@@ -939,12 +1063,7 @@ class PygameUI:
             
         else:  # blanco
             # Casa Blanco: cuadrante 7-12 (superior izquierdo)
-            start_x = self.__board_margin__
-            start_y = self.__board_margin__ + 10
-            zone_width = side_width
-            zone_height = (self.__board_height__ // 2) - 20
-            
-            zone_rect = pygame.Rect(start_x, start_y, zone_width, zone_height)
+            zone_rect = self.__bearing_off_zone_rect()
             
             # Color base marrón oscuro con efecto pulsante
             base_color = (101, 67, 33)
@@ -958,12 +1077,12 @@ class PygameUI:
             pygame.draw.rect(self.__screen__, border_color, zone_rect, 6, border_radius=15)
             
             # Textos centrados
-            text1 = font_large.render("🏠 CASA BLANCO", True, (255, 255, 255))
-            text2 = font_small.render("Click aquí para sacar fichas", True, (200, 255, 200))
+            text1 = self.__text_cache__.render("🏠 CASA BLANCO", 50, (255, 255, 255))
+            text2 = self.__text_cache__.render("Click aquí para sacar fichas", 30, (200, 255, 200))
             
             # Cantidad de fichas en casa
             home_count = self.__home_manager__.get_pieces_count("blanco")
-            text3 = font_small.render(f"Fichas en casa: {home_count}/15", True, (255, 215, 0))
+            text3 = self.__text_cache__.render(f"Fichas en casa: {home_count}/15", 30, (255, 215, 0))
             
             # Centrar textos verticalmente
             center_y = zone_rect.centery
@@ -974,18 +1093,132 @@ class PygameUI:
             self.__screen__.blit(text3, (zone_rect.centerx - text3.get_width() // 2, 
                                         center_y + 30))
             
+    def __bearing_off_zone_active(self) -> bool:
+        """
+        Indica si se muestra la zona (animada) de bearing off.
+
+        Returns:
+            bool: True si el jugador actual puede sacar fichas y está eligiendo ficha.
+        """
+        return (self.__game_state_manager__.get_current_state() == 'AWAITING_PIECE_SELECTION'
+                and self.__bearing_off_validator__.can_bear_off(self.__current_player__))
+
+    def __bearing_off_zone_rect(self) -> pygame.Rect:
+        """
+        Calcula el rectángulo de la zona de bearing off del jugador actual.
+
+        Returns:
+            pygame.Rect: Cuadrante 13-18 para negro o 7-12 para blanco.
+        """
+        side_width = (self.__board_width__ - self.__bar_width__) // 2
+        zone_height = (self.__board_height__ // 2) - 20
+        if self.__current_player__ == "negro":
+            start_y = self.__board_margin__ + (self.__board_height__ // 2) + 10
+        else:
+            start_y = self.__board_margin__ + 10
+        return pygame.Rect(self.__board_margin__, start_y, side_width, zone_height)
+
+    def __is_idle(self) -> bool:
+        """
+        Indica si el bucle puede bloquearse esperando eventos.
+
+        Returns:
+            bool: False si hay una animación en curso o le toca jugar a la IA.
+        """
+        if self.__bearing_off_zone_active():
+            return False
+        return (self.__ai_player__ is None or
+                self.__current_player__ != self.__ai_player__.obtener_color() or
+                self.__ai_desync__ or
+                self.__home_manager__.has_won("negro") or
+                self.__home_manager__.has_won("blanco"))
+
+    def __frame_regions(self) -> dict:
+        """
+        Describe las regiones de la pantalla y el estado que muestra cada una.
+
+        Returns:
+            dict: Nombre de región -> (pygame.Rect, firma del estado dibujado).
+        """
+        width, height = self.__screen__.get_size()
+        band_height = 60
+        current_state = self.__game_state_manager__.get_current_state()
+        board_rect = pygame.Rect(self.__board_margin__, self.__board_margin__,
+                                 self.__board_width__, self.__board_height__)
+        board_signature = (
+            self.__board__.obtener_hash(),
+            tuple(sorted(self.__bar_manager__.get_bar_state().items())),
+            tuple(sorted(self.__home_manager__.get_home_state().items())),
+            self.__selected_point__, tuple(self.__dice_rolls__), self.__is_doubles_roll__,
+            self.__current_player__, current_state)
+        return {
+            "message": (pygame.Rect(0, 0, width, band_height),
+                        (self.__message__, current_state, self.__is_doubles_roll__)),
+            "board": (board_rect, board_signature),
+            "moves": (pygame.Rect(0, height - band_height, width, band_height),
+                      (tuple(self.__available_moves__), self.__is_doubles_roll__,
+                       self.__storage_worker__.get_pending_operation())),
+        }
+
+    def __render_frame(self) -> List[pygame.Rect]:
+        """
+        Redibuja solo las regiones cuyo estado cambió desde el último frame.
+
+        La primera vez, al cambiar el tamaño de la ventana o tras VIDEOEXPOSE se
+        dibuja todo con __draw. Después se compara la firma de cada región y el
+        frame se dibuja recortado (set_clip) a las regiones cambiadas, que se
+        envían con pygame.display.update(rects). La zona de bearing off pulsa,
+        por lo que se redibuja cada frame mientras está visible.
+
+        Principios SOLID:
+            - SRP: Decide qué redibujar; el dibujo sigue en los métodos __draw_*.
+
+        Returns:
+            List[pygame.Rect]: Regiones actualizadas (vacía si no cambió nada).
+        """
+        regions = self.__frame_regions()
+        signatures = {name: signature for name, (_, signature) in regions.items()}
+        screen_size = self.__screen__.get_size()
+        if self.__frame_signatures__ is None or self.__frame_size__ != screen_size:
+            self.__frame_signatures__ = signatures
+            self.__frame_size__ = screen_size
+            self.__draw()
+            return [self.__screen__.get_rect()]
+
+        dirty = [rect for name, (rect, signature) in regions.items()
+                 if self.__frame_signatures__.get(name) != signature]
+        if self.__bearing_off_zone_active():
+            dirty.append(self.__bearing_off_zone_rect())
+        self.__frame_signatures__ = signatures
+        if not dirty:
+            return []
+
+        self.__screen__.set_clip(dirty[0].unionall(dirty[1:]))
+        try:
+            self.__draw_frame()
+        finally:
+            self.__screen__.set_clip(None)
+        pygame.display.update(dirty)
+        return dirty
+
     def __draw(self) -> None:
         """
-        Dibuja todos los elementos visuales del juego.
+        Dibuja el frame completo y actualiza toda la ventana.
         
         Principios SOLID:
             - SRP: Coordina renderizado, delega cada elemento a métodos especializados.
             - OCP: Nuevos elementos visuales pueden agregarse sin modificar existentes.
             - ISP: Llama solo a métodos de dibujo necesarios.
         """
-        self.__screen__.fill((139, 69, 19))
-        
-            # Primero dibujar tablero
+        self.__draw_frame()
+        pygame.display.flip()
+
+    def __draw_frame(self) -> None:
+        """
+        Dibuja todos los elementos visuales del juego en la pantalla, sin
+        actualizar la ventana (respeta el recorte activo de la pantalla).
+        """
+        # Primero el tablero (la capa estática cubre toda la pantalla)
         self.__draw_backgammon_board()
         
         # DESPUÉS dibujar bearing off zones (para que queden ENCIMA)
@@ -998,7 +1231,7 @@ class PygameUI:
         if self.__dice_rolls__:
             self.__draw_dice()
         self.__draw_available_moves()
-        pygame.display.flip()
+        self.__draw_storage_indicator()
 
     def __draw_available_moves(self) -> None:
         """
@@ -1010,8 +1243,7 @@ class PygameUI:
         """
         if not self.__available_moves__:
             return
-        font_small = pygame.font.Font(None, 35)
-        
+
         # Mensaje compacto
         if self.__is_doubles_roll__:
             moves_text = f"¡DOBLES! Tienes {len(self.__available_moves__)} movimientos"
@@ -1020,13 +1252,29 @@ class PygameUI:
             moves_text = f"Dados disponibles: {', '.join(map(str, self.__available_moves__))}"
             text_color = self.__white__
         
-        text_surface = font_small.render(moves_text, True, text_color)
+        text_surface = self.__text_cache__.render(moves_text, 35, text_color)
         text_rect = text_surface.get_rect()
         # Posicionar en la parte inferior
         text_rect.center = (self.__screen__.get_width() // 2, 
                         self.__screen__.get_height() - 30)
         self.__screen__.blit(text_surface, text_rect)
 
+    def __draw_storage_indicator(self) -> None:
+        """
+        Muestra en la esquina inferior derecha si hay un guardado o una carga en curso.
+
+        Principios SOLID:
+            - SRP: Solo renderiza el indicador; el estado lo da StorageWorker.
+        """
+        operation = self.__storage_worker__.get_pending_operation()
+        if operation is None:
+            return
+        text = "Guardando..." if operation == "save" else "Cargando..."
+        text_surface = self.__text_cache__.render(text, 30, self.__doubles_highlight__)
+        text_rect = text_surface.get_rect(bottomright=(self.__screen__.get_width() - 20,
+                                                       self.__screen__.get_height() - 15))
+        self.__screen__.blit(text_surface, text_rect)
+
     def __draw_message(self) -> None:
         """
         Renderiza el mensaje de estado del juego.
@@ -1046,7 +1294,7 @@ class PygameUI:
         else:
             text_color = self.__white__
         
-        text_surface = self.__font__.render(self.__message__, True, text_color)
+        text_surface = self.__text_cache__.render(self.__message__, 45, text_color)
         text_rect = text_surface.get_rect(center=(self.__screen__.get_width() // 2, 30))
         self.__screen__.blit(text_surface, text_rect)
 
@@ -1111,30 +1359,62 @@ class PygameUI:
     def __draw_backgammon_board(self) -> None:
         """
         Dibuja el tablero principal de Backgammon.
+
+        El fondo, el borde, la barra y los 24 triángulos no cambian durante la
+        partida: se dibujan una sola vez en una Surface fuera de pantalla y en
+        cada frame solo se copia esa capa. Se vuelve a generar únicamente si
+        cambia el tamaño de la ventana.
         
         Principios SOLID:
             - SRP: Solo dibuja la estructura base del tablero.
             - ISP: Método específico de renderizado de tablero.
         """
+        screen_size = self.__screen__.get_size()
+        if self.__static_layer__ is None or self.__static_layer__.get_size() != screen_size:
+            self.__static_layer__ = self.__render_static_layer(screen_size)
+        self.__screen__.blit(self.__static_layer__, (0, 0))
+
+    def __render_static_layer(self, size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Genera la capa estática del tablero (fondo, borde, barra y puntos).
+
+        Principios SOLID:
+            - SRP: Solo construye la imagen fija; decidir cuándo regenerarla es
+              responsabilidad de __draw_backgammon_board.
+
+        Args:
+            size: Tamaño de la pantalla en píxeles.
+
+        Returns:
+            pygame.Surface: Capa con el mismo formato de píxeles que la pantalla.
+        """
+        layer = pygame.Surface(size, 0, self.__screen__)
+        layer.fill(self.__background_color__)
+
         board_rect = pygame.Rect(self.__board_margin__, self.__board_margin__, self.__board_width__, self.__board_height__)
-        pygame.draw.rect(self.__screen__, self.__brown_light__, board_rect)
-        pygame.draw.rect(self.__screen__, self.__board_border__, board_rect, 5)
+        pygame.draw.rect(layer, self.__brown_light__, board_rect)
+        pygame.draw.rect(layer, self.__board_border__, board_rect, 5)
         
         bar_x = self.__board_margin__ + (self.__board_width__ // 2) - (self.__bar_width__ // 2)
         bar_rect = pygame.Rect(bar_x, self.__board_margin__, self.__bar_width__, self.__board_height__)
-        pygame.draw.rect(self.__screen__, self.__bar_color__, bar_rect)
-        pygame.draw.rect(self.__screen__, self.__black__, bar_rect, 3)
+        pygame.draw.rect(layer, self.__bar_color__, bar_rect)
+        pygame.draw.rect(layer, self.__black__, bar_rect, 3)
         
-        self.__draw_points()
+        self.__draw_points(layer)
+        return layer
         
-    def __draw_points(self) -> None:
+    def __draw_points(self, surface: Optional[pygame.Surface] = None) -> None:
         """
         Dibuja los 24 puntos triangulares del tablero.
         
         Principios SOLID:
             - SRP: Renderiza solo los puntos, no fichas ni otros elementos.
             - ISP: Método enfocado en una tarea visual específica.
+
+        Args:
+            surface: Superficie destino (por defecto, la pantalla).
         """
+        surface = surface if surface is not None else self.__screen__
         side_width = (self.__board_width__ - self.__bar_width__) // 2
         point_width = side_width // 6
         point_height = 320
@@ -1145,7 +1425,8 @@ class PygameUI:
             x = start_x_top_right + ((5 - i) * point_width) 
             y = self.__board_margin__
             color = self.__brown_light__ if i % 2 == 0 else self.__brown_dark__
-            self.__draw_triangle_point(x, y, point_width, point_height, color, pointing_down=True)
+            self.__draw_triangle_point(x, y, point_width, point_height, color, pointing_down=True,
+                                       surface=surface)
             
         # Cuadrante superior izquierdo (puntos 7-12)
         start_x_top_left = self.__board_margin__
@@ -1153,24 +1434,28 @@ class PygameUI:
             x = start_x_top_left + i * point_width
             y = self.__board_margin__
             color = self.__brown_light__ if i % 2 == 0 else self.__brown_dark__
-            self.__draw_triangle_point(x, y, point_width, point_height, color, pointing_down=True)
+            self.__draw_triangle_point(x, y, point_width, point_height, color, pointing_down=True,
+                                       surface=surface)
             
         # Cuadrante inferior izquierdo (puntos 13-18)
         for i in range(6):
             x = start_x_top_left + i * point_width
             y = self.__board_margin__ + self.__board_height__ - point_height
             color = self.__brown_dark__ if i % 2 == 0 else self.__brown_light__
-            self.__draw_triangle_point(x, y, point_width, point_height, color, pointing_down=False)
+            self.__draw_triangle_point(x, y, point_width, point_height, color, pointing_down=False,
+                                       surface=surface)
             
         # Cuadrante inferior derecho (puntos 19-24)
         for i in range(6):
             x = start_x_top_right + ((5 - i) * point_width)
             y = self.__board_margin__ + self.__board_height__ - point_height
             color = self.__brown_dark__ if i % 2 == 0 else self.__brown_light__
-            self.__draw_triangle_point(x, y, point_width, point_height, color, pointing_down=False)
+            self.__draw_triangle_point(x, y, point_width, point_height, color, pointing_down=False,
+                                       surface=surface)
 
     def __draw_triangle_point(self, x: int, y: int, width: int, height: int, 
-                            color: Tuple[int, int, int], pointing_down: bool = True) -> None:
+                            color: Tuple[int, int, int], pointing_down: bool = True,
+                            surface: Optional[pygame.Surface] = None) -> None:
         """
         Dibuja un único punto triangular.
         
@@ -1178,29 +1463,39 @@ class PygameUI:
             - SRP: Renderiza un solo triángulo con parámetros dados.
             - OCP: Puede reutilizarse para distintos estilos sin modificación.
             - ISP: Interfaz mínima con parámetros esenciales.
+
+        Args:
+            surface: Superficie destino (por defecto, la pantalla).
         """
+        surface = surface if surface is not None else self.__screen__
         if pointing_down:
             points = [(x + width // 2, y + height), (x, y), (x + width, y)]
         else:
             points = [(x + width // 2, y), (x, y + height), (x + width, y + height)]
-        pygame.draw.polygon(self.__screen__, color, points)
-        pygame.draw.polygon(self.__screen__, self.__black__, points, 2)
+        pygame.draw.polygon(surface, color, points)
+        pygame.draw.polygon(surface, self.__black__, points, 2)
     
     def __draw_checkers(self) -> None:
         """
         Dibuja todas las fichas en el tablero.
         
         Principios SOLID:
-            - SRP: Coordina dibujo de fichas, delega pilas a método especializado.
+            - SRP: Coordina dibujo de fichas, delega el armado de pilas a __checker_stack_sprites.
             - DIP: Usa Board para obtener estado sin conocer implementación interna.
+
+        Junta los sprites de todas las pilas y los copia con una sola llamada a Surface.blits.
         """
         checker_radius = 25
+        sprites = []
         for point_num in range(1, 25):
             point_data = self.__board__.obtener_estado_punto(point_num)
             if point_data:
                 color, cantidad = point_data
                 point_x, point_y = self.__get_point_screen_position(point_num)
-                self.__draw_checker_stack(point_x, point_y, color, cantidad, point_num, checker_radius)
+                sprites.extend(self.__checker_stack_sprites(point_x, point_y, color, cantidad,
+                                                            point_num, checker_radius))
+        if sprites:
+            self.__screen__.blits(sprites, doreturn=False)
     
     def __get_point_screen_position(self, point_num: int) -> Tuple[int, int]:
         """
@@ -1232,65 +1527,158 @@ class PygameUI:
             y = self.__board_margin__ + self.__board_height__ - checker_radius
         return x, y
 
-    def __draw_checker_stack(self, x: int, y: int, color: str, cantidad: int, 
-                           point_num: int, radius: int) -> None:
+    def __checker_stack_sprites(self, x: int, y: int, color: str, cantidad: int,
+                                point_num: int, radius: int) -> List[Tuple[pygame.Surface, pygame.Rect]]:
         """
-        Dibuja una pila de fichas en una posición específica.
-        
+        Calcula los sprites de una pila (como máximo 10 fichas visibles) y dónde copiarlos.
+        La ficha superior del punto seleccionado usa el sprite resaltado.
+
         Principios SOLID:
-            - SRP: Renderiza una pila completa de fichas.
-            - ISP: Parámetros específicos sin exceso de información.
+            - SRP: Solo calcula posiciones; copiar a pantalla es responsabilidad de quien llama.
+
+        Returns:
+            List[Tuple[pygame.Surface, pygame.Rect]]: Pares (sprite, destino) para Surface.blits.
         """
-        checker_color = self.__checker_white__ if color == "blanco" else self.__checker_black__
         going_down = 1 <= point_num <= 12
-        
-        for i in range(min(cantidad, 10)):
+        visibles = min(cantidad, 10)
+        sprite = self.__checker_sprites__.get(color, radius)
+        sprites = []
+        for i in range(visibles):
             if going_down:
                 ficha_y = y + i * (radius * 1.2)
             else:
                 ficha_y = y - i * (radius * 1.2)
-            pygame.draw.circle(self.__screen__, checker_color, (x, int(ficha_y)), radius)
-            pygame.draw.circle(self.__screen__, self.__checker_border__, (x, int(ficha_y)), radius, 2)
+            if i == visibles - 1 and point_num == self.__selected_point__:
+                sprite = self.__checker_sprites__.get(color, radius, highlighted=True)
+            sprites.append((sprite, sprite.get_rect(center=(x, int(ficha_y)))))
+        return sprites
     
-    # Metodos para RedisManager
+    # Metodos de guardado y carga (AlmacenPartidas)
 
     def __save_game(self, slot_id: str = "partida_guardada_1") -> None:
         """
-        Recopila el estado del juego y le pide al RedisManager que lo guarde.
+        Recopila el estado del juego y le pide al almacenamiento que lo guarde
+        en el hilo de StorageWorker; el resultado llega como STORAGE_EVENT.
+
+        Si el guardado anterior en el mismo slot dio conflicto (otro proceso
+        lo guardó), este lo sobrescribe: el jugador ya vio el aviso.
         """
+        if self.__storage_worker__.get_pending_operation() is not None:
+            self.__message__ = "Espera a que termine la operación de guardado/carga."
+            return
+
         # 1. Recopilar el estado (lógica que SÍ pertenece a la UI)
-        estado_board = self.__board__.obtener_estado_dict()
+        estado_completo = self.__collect_game_state()
+
+        # 2. Pedir el guardado sin bloquear el bucle de dibujo
+        self.__storage_worker__.submit("save", slot_id, self.__storage__.guardar_partida,
+                                       slot_id, estado_completo,
+                                       self.__save_conflict__ == slot_id)
+        self.__message__ = f"Guardando partida en '{slot_id}'..."
+
+    def __collect_game_state(self) -> dict:
+        """
+        Arma el estado completo de la partida para guardarlo.
+
+        Las listas se copian porque el guardado corre en otro hilo mientras la
+        UI sigue jugando.
+
+        Returns:
+            dict: {"board_state": ..., "ui_state": ...}.
+        """
+        estado_board = copy.deepcopy(self.__board__.obtener_estado_dict())
         estado_ui = {
             "current_player": self.__current_player__,
-            "dice_rolls": self.__dice_rolls__,
-            "available_moves": self.__available_moves__,
+            "dice_rolls": list(self.__dice_rolls__),
+            "available_moves": list(self.__available_moves__),
             "is_doubles_roll": self.__is_doubles_roll__,
             "selected_point": self.__selected_point__,
             "game_state": self.__game_state_manager__.get_current_state(),
-            "home_pieces": self.__home_manager__.get_home_state(),
-            "bar_pieces": self.__bar_manager__.get_bar_state()
+            "home_pieces": dict(self.__home_manager__.get_home_state()),
+            "bar_pieces": dict(self.__bar_manager__.get_bar_state())
         }
-        estado_completo = {
+        return {
             "board_state": estado_board,
             "ui_state": estado_ui
         }
 
-        # 2. Llamar al manager (actualizado a __redis_manager__)
-        exito, mensaje = self.__redis_manager__.guardar_partida(slot_id, estado_completo)
-        self.__message__ = mensaje # Mostrar el mensaje (éxito o error)
+    def __autosave(self) -> None:
+        """
+        Marca la partida para el guardado automático diferido; si alguien
+        ganó, pide escribirla enseguida.
+        """
+        self.__autosave__.marcar(SLOT_AUTOGUARDADO, self.__collect_game_state())
+        if self.__home_manager__.has_won("negro") or self.__home_manager__.has_won("blanco"):
+            self.__autosave__.solicitar_vaciado()
+
+    @staticmethod
+    def __post_autosave_results(resultados: dict) -> None:
+        """
+        Publica el resultado de una escritura del guardado automático como
+        STORAGE_EVENT; GuardadoDiferido la llama desde su hilo de fondo.
+
+        Args:
+            resultados: slot -> (éxito, mensaje) de la escritura.
+        """
+        try:
+            pygame.event.post(pygame.event.Event(STORAGE_EVENT, operation="autosave",
+                                                 slot_id=None, result=resultados))
+        except pygame.error:
+            pass  # pygame ya se cerró: nadie espera el resultado
 
     def __load_game(self, slot_id: str = "partida_guardada_1") -> None:
         """
-        Pide el estado al RedisManager y lo aplica a la UI.
+        Pide el estado al almacenamiento en el hilo de StorageWorker; se aplica
+        al recibir el STORAGE_EVENT correspondiente.
         """
-        # 1. Llamar al manager para obtener el estado (actualizado a __redis_manager__)
-        estado_completo, mensaje = self.__redis_manager__.cargar_partida(slot_id)
+        if self.__storage_worker__.get_pending_operation() is not None:
+            self.__message__ = "Espera a que termine la operación de guardado/carga."
+            return
+
+        self.__storage_worker__.submit("load", slot_id, self.__storage__.cargar_partida,
+                                       slot_id)
+        self.__message__ = f"Cargando partida desde '{slot_id}'..."
+
+    def __handle_storage_result(self, event: pygame.event.Event) -> None:
+        """
+        Procesa el resultado de un guardado o una carga publicado por StorageWorker.
+
+        Args:
+            event: STORAGE_EVENT con operation, slot_id y result (la tupla
+                devuelta por AlmacenPartidas, o slot -> tupla en "autosave").
+        """
+        if event.operation == "autosave":
+            # Los guardados automáticos correctos no se anuncian; los fallos sí
+            for slot_id, resultado in event.result.items():
+                if es_conflicto(resultado):
+                    self.__message__ = f"Autoguardado detenido en '{slot_id}': {resultado[1]}"
+                elif not resultado[0]:
+                    self.__message__ = f"Falló el autoguardado: {resultado[1]}"
+            return
+
+        if event.operation == "save":
+            _, mensaje = event.result
+            self.__message__ = mensaje # Mostrar el mensaje (éxito o error)
+            if es_conflicto(event.result):
+                self.__save_conflict__ = event.slot_id
+                self.__message__ += " Presiona G otra vez para sobrescribir o L para cargarla."
+            else:
+                self.__save_conflict__ = None
+            return
+
+        self.__save_conflict__ = None
+        estado_completo, mensaje = event.result
         self.__message__ = mensaje # Mostrar el mensaje (éxito o error)
+        if estado_completo:
+            self.__apply_loaded_state(estado_completo)
 
-        if not estado_completo:
-            return # No se pudo cargar, no hacer nada más
+    def __apply_loaded_state(self, estado_completo: dict) -> None:
+        """
+        Aplica a la UI un estado cargado del almacenamiento.
 
-        # 2. Aplicar el estado (lógica que SÍ pertenece a la UI)
+        Args:
+            estado_completo: Diccionario con "board_state" y "ui_state".
+        """
         try:
             # Cargar estado en el Board
             self.__board__.cargar_estado_dict(estado_completo.get("board_state", {}))
@@ -1310,8 +1698,6 @@ class PygameUI:
             # Restaurar el estado del juego
             game_state = ui_state.get("game_state", "AWAITING_ROLL")
             self.__game_state_manager__.change_state(game_state)
-            
-            self.__draw() # Forzar redibujado
         
         except Exception as e:
             self.__message__ = f"Error al aplicar estado cargado: {e}"
@@ -1916,19 +2302,11 @@ class BearingOffValidator:
             - SRP: Valida únicamente condición de bearing off permitido.
             - DIP: Usa Board sin conocer implementación interna.
             - ISP: Método específico que retorna booleano.
-        """
-        if player == "negro":
-            home_quadrant = range(19, 25)  # 19-24 (último cuadrante)
-            other_points = range(1, 19)
-        else:  # blanco
-            home_quadrant = range(1, 7)  # 1-6 (último cuadrante)
-            other_points = range(7, 25)
 
-        for point in other_points:
-            state = self.board.obtener_estado_punto(point)
-            if state and state[0] == player:
-                return False
-        return True
+        Usa el contador incremental de Board (O(1)), ya que se consulta en cada frame.
+        La barra la controla BarManager, por eso aquí solo se miran los puntos.
+        """
+        return self.board.fichas_fuera_de_casa(player) == 0
 
     def is_bearing_off_move(self, player: str, origin: int, destination: int) -> bool:
         """
@@ -1995,19 +2373,9 @@ class BearingOffValidator:
             - SRP: Verificación específica de posiciones superiores.
             - ISP: Método privado enfocado.
         """
-        if player == "negro":
-            # Negro (19-24): más alejado = menor número
-            higher_points = range(19, origin)
-        else:
-            # Blanco (1-6): más alejado = mayor número
-            higher_points = range(origin + 1, 7)
-
-        for point in higher_points:
-            state = self.board.obtener_estado_punto(point)
-            if state and state[0] == player:
-                return True
-
-        return False
+        # Distancia al borne: Negro (19-24) 25 - origen, Blanco (1-6) el mismo origen
+        distance = 25 - origin if player == "negro" else origin
+        return self.board.punto_mas_alto_en_casa(player) > distance
 
     def get_bearing_off_destination(self, player: str) -> int:
         """
@@ -2089,7 +2457,242 @@ class HomeManager:
     def load_status_dict(self, estado: dict) -> None:
         """Carga el estado de la casa desde un diccionario."""
         self.__home_pieces__ = estado or {"negro": 0, "blanco": 0}
-    
+
+
+class StorageWorker:
+    """
+    Ejecuta guardados y cargas en un hilo de fondo para no congelar el dibujo.
+
+    Las operaciones se encolan y se ejecutan de a una; al terminar cada una se
+    publica un STORAGE_EVENT (pygame.event.post es seguro entre hilos) con los
+    atributos operation, slot_id y result.
+
+    Principios SOLID:
+        - SRP: Solo mueve la llamada a otro hilo; no sabe qué se guarda.
+        - DIP: Recibe la función a ejecutar (p. ej. RedisManager.guardar_partida).
+    """
+
+    def __init__(self):
+        """Crea la cola de operaciones; el hilo se inicia con la primera."""
+        self.__tasks__ = queue.Queue()
+        self.__lock__ = threading.Lock()
+        self.__pending__: List[str] = []
+        self.__thread__: Optional[threading.Thread] = None
+
+    def submit(self, operation: str, slot_id: str, function, *args) -> None:
+        """
+        Encola una operación de almacenamiento.
+
+        Args:
+            operation: "save" o "load".
+            slot_id: Ranura afectada (se devuelve en el evento).
+            function: Función bloqueante a ejecutar en el hilo.
+            *args: Argumentos de la función.
+        """
+        with self.__lock__:
+            self.__pending__.append(operation)
+            if self.__thread__ is None:
+                self.__thread__ = threading.Thread(target=self.__run, name="StorageWorker",
+                                                   daemon=True)
+                self.__thread__.start()
+        self.__tasks__.put((operation, slot_id, function, args))
+
+    def get_pending_operation(self) -> Optional[str]:
+        """
+        Devuelve la operación en curso (o la primera en espera).
+
+        Returns:
+            Optional[str]: "save", "load" o None si no hay nada pendiente.
+        """
+        with self.__lock__:
+            return self.__pending__[0] if self.__pending__ else None
+
+    def __run(self) -> None:
+        """Bucle del hilo: ejecuta las operaciones en orden y publica su resultado."""
+        while True:
+            operation, slot_id, function, args = self.__tasks__.get()
+            try:
+                result = function(*args)
+            except Exception as e:  # pylint: disable=broad-except
+                result = (None if operation == "load" else False,
+                          f"Error de almacenamiento: {e}")
+            with self.__lock__:
+                self.__pending__.pop(0)
+            try:
+                pygame.event.post(pygame.event.Event(STORAGE_EVENT, operation=operation,
+                                                     slot_id=slot_id, result=result))
+            except pygame.error:
+                pass  # pygame ya se cerró: nadie espera el resultado
+
+
+class CheckerSpriteAtlas:
+    """
+    Sprites de fichas pre-renderizados por color, radio y estado de resaltado.
+
+    Cada sprite se dibuja una sola vez (opcionalmente con antialias) en una
+    Surface con transparencia; después las fichas se copian con Surface.blits
+    en lugar de dibujar dos círculos por ficha en cada frame.
+
+    Principios SOLID:
+        - SRP: Solo construye y entrega sprites de fichas.
+        - OCP: Se pueden agregar estilos nuevos cambiando solo __build_sprite.
+    """
+
+    def __init__(self, colors: dict, border_color: Tuple[int, int, int],
+                 highlight_color: Tuple[int, int, int], radii: Tuple[int, ...] = (25,),
+                 antialias: bool = True):
+        """
+        Construye los sprites de todos los colores y radios indicados.
+
+        Args:
+            colors: Color de ficha ('negro'/'blanco') -> color RGB de relleno.
+            border_color: Color RGB del borde.
+            highlight_color: Color RGB del borde de la ficha resaltada.
+            radii: Radios a pre-renderizar (otros radios se construyen al primer uso).
+            antialias: Si es True, los bordes se suavizan con pygame.gfxdraw.
+        """
+        self.__colors__ = colors
+        self.__border_color__ = border_color
+        self.__highlight_color__ = highlight_color
+        self.__antialias__ = antialias
+        self.__sprites__ = {}
+        for color in colors:
+            for radius in radii:
+                for highlighted in (False, True):
+                    self.get(color, radius, highlighted)
+
+    def get(self, color: str, radius: int, highlighted: bool = False) -> pygame.Surface:
+        """
+        Devuelve el sprite de una ficha.
+
+        Args:
+            color: Color de la ficha ('negro' o 'blanco').
+            radius: Radio en píxeles.
+            highlighted: True para la ficha resaltada (seleccionada).
+
+        Returns:
+            pygame.Surface: Sprite compartido (no modificar).
+        """
+        key = (color, radius, highlighted)
+        sprite = self.__sprites__.get(key)
+        if sprite is None:
+            sprite = self.__build_sprite(color, radius, highlighted)
+            self.__sprites__[key] = sprite
+        return sprite
+
+    def __build_sprite(self, color: str, radius: int, highlighted: bool) -> pygame.Surface:
+        """Dibuja una ficha (relleno y borde) centrada en una Surface transparente."""
+        size = 2 * radius + 2
+        center = radius + 1
+        fill = self.__colors__[color]
+        border = self.__highlight_color__ if highlighted else self.__border_color__
+        border_width = 4 if highlighted else 2
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        if self.__antialias__:
+            pygame.gfxdraw.aacircle(sprite, center, center, radius, border)
+            pygame.gfxdraw.filled_circle(sprite, center, center, radius, border)
+            pygame.gfxdraw.aacircle(sprite, center, center, radius - border_width, fill)
+            pygame.gfxdraw.filled_circle(sprite, center, center, radius - border_width, fill)
+        else:
+            pygame.draw.circle(sprite, fill, (center, center), radius)
+            pygame.draw.circle(sprite, border, (center, center), radius, border_width)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+
+
+class TextCache:
+    """
+    Registro compartido de fuentes y caché LRU de textos renderizados.
+
+    Las fuentes se crean una sola vez por tamaño y cada texto renderizado se
+    guarda con la clave (texto, tamaño, color), así los métodos de dibujo no
+    crean fuentes ni vuelven a renderizar el mismo texto en cada frame.
+
+    Principios SOLID:
+        - SRP: Solo crea fuentes y guarda superficies de texto.
+        - DIP: Los métodos de dibujo piden el texto sin conocer cómo se cachea.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        """
+        Inicializa el registro vacío (las fuentes se crean al primer uso).
+
+        Args:
+            max_entries: Máximo de textos renderizados que se conservan.
+        """
+        self.__fonts__ = {}
+        self.__surfaces__ = OrderedDict()
+        self.__max_entries__ = max_entries
+        self.__hits__ = 0
+        self.__misses__ = 0
+
+    def get_font(self, size: int) -> pygame.font.Font:
+        """
+        Devuelve la fuente por defecto del tamaño pedido, creándola una sola vez.
+
+        Args:
+            size: Tamaño de la fuente.
+
+        Returns:
+            pygame.font.Font: Fuente compartida.
+        """
+        font = self.__fonts__.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self.__fonts__[size] = font
+        return font
+
+    def render(self, text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Devuelve el texto renderizado (con antialias), reutilizándolo si ya estaba en caché.
+        Al superar el máximo se descarta el texto usado hace más tiempo.
+
+        Args:
+            text: Texto a renderizar.
+            size: Tamaño de la fuente.
+            color: Color RGB del texto.
+
+        Returns:
+            pygame.Surface: Superficie con el texto (compartida, no modificar).
+        """
+        key = (text, size, tuple(color))
+        surface = self.__surfaces__.get(key)
+        if surface is not None:
+            self.__surfaces__.move_to_end(key)
+            self.__hits__ += 1
+            return surface
+        self.__misses__ += 1
+        surface = self.get_font(size).render(text, True, color)
+        self.__surfaces__[key] = surface
+        if len(self.__surfaces__) > self.__max_entries__:
+            self.__surfaces__.popitem(last=False)
+        return surface
+
+    def get_stats(self) -> dict:
+        """
+        Devuelve estadísticas de uso de la caché.
+
+        Returns:
+            dict: fonts, entries, hits y misses.
+        """
+        return {"fonts": len(self.__fonts__), "entries": len(self.__surfaces__),
+                "hits": self.__hits__, "misses": self.__misses__}
+
+
+def main() -> None:
+    """
+    Punto de entrada de la interfaz gráfica; acepta las mismas opciones del
+    oponente que la CLI (--ia y --pesos).
+
+    Ejemplo:
+        python3 -m Backgammon.Interfaces.PygameUI --ia --pesos pesos.npz
+    """
+    parser = crear_parser("Backgammon con interfaz gráfica (Pygame).")
+    argumentos = parser.parse_args()
+    game = PygameUI(ai_player=crear_oponente(parser, argumentos))
+    game.run()
+
+
 if __name__ == "__main__":
-    game = PygameUI()
-    game.run()
\ No newline at end of file
+    main()
\ No newline at end of file
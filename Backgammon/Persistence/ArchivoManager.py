@@ -0,0 +1,335 @@
+import bisect
+import os
+import struct
+import threading
+import zlib
+from Backgammon.Persistence.SaveCodec import serializar_partida, deserializar_partida
+from Backgammon.Persistence.Storage import (AlmacenPartidas, LIMITE_LISTADO, calcular_metadatos,
+                                            mensaje_error_carga)
+
+# Cabecera de cada registro: largo del slot, largo de los datos y CRC32 de ambos
+_REGISTRO = struct.Struct("<HII")
+
+
+class ArchivoManager(AlmacenPartidas):
+    """
+    Guarda las partidas en un archivo local de solo agregado.
+
+    Cada guardado agrega un registro (cabecera, slot, partida serializada por
+    SaveCodec) al final del archivo; nunca se reescribe nada. Un índice en
+    memoria (slot -> posición del último registro) se arma leyendo el archivo
+    una vez, en el primer uso; una lista de posiciones en orden de escritura
+    sirve al listado. Guardar varias partidas es una sola escritura
+    y un solo fsync.
+
+    Si el programa se corta a mitad de una escritura, el registro incompleto
+    del final se detecta y se descarta al abrir. Un registro dañado en el
+    medio del archivo (CRC inválido) se saltea sin borrar nada: los
+    registros válidos que le siguen se siguen leyendo. Si la escritura
+    falla sin cortar el programa, el archivo se recorta en el momento, para
+    que los guardados siguientes no queden detrás del registro roto.
+
+    SRP: Solo persiste partidas en un archivo.
+    LSP: Mismo contrato y mensajes que RedisManager.
+    """
+
+    def __init__(self, ruta: str = "partidas.log", formato: str = "binario",
+                 sincronizar: bool = True):
+        """
+        Prepara el almacenamiento sin abrir el archivo todavía.
+
+        Args:
+            ruta: Archivo de registros (se crea si no existe).
+            formato: "binario" (SaveCodec, con JSON si no se puede representar) o "json".
+            sincronizar: Si es True, cada guardado termina con os.fsync.
+
+        Raises:
+            ValueError: Si el formato no es "binario" ni "json".
+        """
+        if formato not in ("binario", "json"):
+            raise ValueError(f"Formato de guardado desconocido: {formato}")
+        self.__ruta__ = ruta
+        self.__formato__ = formato
+        self.__sincronizar__ = sincronizar
+        self.__archivo__ = None
+        # slot -> (posición de los datos, largo de los datos, cantidad de registros)
+        self.__indice__ = {}
+        # (posición, slot) de cada registro en orden de escritura; las entradas
+        # de registros ya reemplazados se saltean y se limpian al acumularse
+        self.__orden__ = []
+        # La UI guarda desde el hilo de StorageWorker
+        self.__lock__ = threading.Lock()
+
+    def __obtener_archivo(self):
+        """
+        Devuelve el archivo abierto; en el primer uso lo abre y arma el índice.
+        Debe llamarse con el lock tomado.
+
+        Raises:
+            OSError: Si no se puede abrir el archivo.
+        """
+        if self.__archivo__ is None:
+            archivo = open(self.__ruta__, "a+b")
+            archivo.seek(0)
+            self.__indice__ = {}
+            self.__orden__ = []
+            fin_valido = self.__leer_indice(archivo)
+            if fin_valido < archivo.seek(0, os.SEEK_END):
+                # Registro incompleto de una escritura cortada
+                archivo.truncate(fin_valido)
+            self.__archivo__ = archivo
+        return self.__archivo__
+
+    def __leer_indice(self, archivo) -> int:
+        """
+        Recorre los registros y deja en el índice el último de cada slot.
+
+        Un registro dañado (CRC o largo inválidos) no corta la lectura: se
+        busca el siguiente registro válido y se sigue desde ahí, sin tocar
+        los bytes dañados. Solo un registro incompleto al final del archivo,
+        sin nada válido después, es una escritura cortada.
+
+        Returns:
+            int: Posición donde termina el último registro completo (el largo
+            del archivo si no hay una escritura cortada al final).
+        """
+        posicion = 0
+        while True:
+            archivo.seek(posicion)
+            cabecera = archivo.read(_REGISTRO.size)
+            if not cabecera:
+                return posicion
+            completo = len(cabecera) == _REGISTRO.size
+            largo = 0
+            if completo:
+                largo_slot, largo_datos, crc = _REGISTRO.unpack(cabecera)
+                largo = _REGISTRO.size + largo_slot + largo_datos
+                cuerpo = archivo.read(largo_slot + largo_datos)
+                completo = len(cuerpo) == largo_slot + largo_datos
+                slot_id = self.__slot_valido(cuerpo, largo_slot, crc) if completo else None
+                if slot_id is not None:
+                    self.__agregar_al_indice(slot_id, posicion + _REGISTRO.size + largo_slot,
+                                             largo_datos)
+                    posicion += largo
+                    continue
+            siguiente = self.__buscar_registro(archivo, posicion + 1)
+            if siguiente is not None:
+                posicion = siguiente
+            elif completo:
+                # Registro completo pero dañado al final: se saltea sin borrarlo
+                posicion += largo
+            else:
+                # Registro incompleto de una escritura cortada
+                return posicion
+
+    @staticmethod
+    def __slot_valido(cuerpo: bytes, largo_slot: int, crc: int) -> str | None:
+        """
+        Verifica el CRC de un registro completo y decodifica su slot.
+
+        Returns:
+            str | None: El slot, o None si el registro está dañado.
+        """
+        if zlib.crc32(cuerpo) != crc:
+            return None
+        try:
+            return cuerpo[:largo_slot].decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    def __buscar_registro(self, archivo, desde: int) -> int | None:
+        """
+        Busca, byte a byte desde `desde`, la primera posición donde empieza un
+        registro válido. Solo se usa después de encontrar un registro dañado.
+
+        Returns:
+            int | None: Posición del registro, o None si no hay ninguno.
+        """
+        archivo.seek(desde)
+        resto = archivo.read()
+        for inicio in range(len(resto) - _REGISTRO.size + 1):
+            largo_slot, largo_datos, crc = _REGISTRO.unpack_from(resto, inicio)
+            fin = inicio + _REGISTRO.size + largo_slot + largo_datos
+            if fin <= len(resto) and self.__slot_valido(
+                    resto[inicio + _REGISTRO.size:fin], largo_slot, crc) is not None:
+                return desde + inicio
+        return None
+
+    def __agregar_al_indice(self, slot_id: str, posicion: int, largo: int) -> None:
+        """Registra el último registro de un slot y cuenta sus guardados."""
+        anterior = self.__indice__.get(slot_id)
+        self.__indice__[slot_id] = (posicion, largo, anterior[2] + 1 if anterior else 1)
+        # Las posiciones crecen, así que agregar al final mantiene la lista ordenada
+        self.__orden__.append((posicion, slot_id))
+        if len(self.__orden__) > 2 * len(self.__indice__) + 64:
+            self.__orden__ = sorted((entrada[0], slot)
+                                    for slot, entrada in self.__indice__.items())
+
+    def __deshacer_escritura(self, inicio: int) -> None:
+        """
+        Quita lo que una escritura fallida haya dejado después de `inicio`.
+        Si ni siquiera se puede recortar, cierra el archivo para que el próximo
+        uso lo vuelva a recorrer y descarte el registro incompleto. Debe
+        llamarse con el lock tomado.
+
+        Args:
+            inicio: Fin del archivo antes de la escritura.
+        """
+        try:
+            self.__archivo__.truncate(inicio)
+            self.__archivo__.seek(0, os.SEEK_END)
+        except OSError:
+            try:
+                self.__archivo__.close()
+            except OSError:
+                pass  # Lo que quedó a medias se descarta al volver a abrir
+            self.__archivo__ = None
+
+    def cerrar(self) -> None:
+        """Cierra el archivo (se vuelve a abrir solo en el próximo uso)."""
+        with self.__lock__:
+            if self.__archivo__ is not None:
+                self.__archivo__.close()
+                self.__archivo__ = None
+
+    def guardar_partidas(self, estados: dict, sobrescribir: bool = False) -> dict:
+        """
+        Agrega un registro por partida con una sola escritura y un solo fsync.
+
+        Args:
+            estados: slot -> estado completo.
+            sobrescribir: Se ignora: este backend no tiene versiones y siempre sobrescribe.
+
+        Returns:
+            dict: slot -> (éxito, mensaje), en el mismo orden que `estados`.
+        """
+        resultados = {}
+        registros = []
+        for slot_id, estado_completo in estados.items():
+            try:
+                datos = serializar_partida(estado_completo, self.__formato__)
+            except TypeError as e:
+                # Error común si el objeto no es serializable
+                resultados[slot_id] = (False, f"Error al guardar partida (JSON no serializable): {e}")
+                continue
+            slot = slot_id.encode("utf-8")
+            cuerpo = slot + datos
+            registros.append((slot_id, len(slot), len(datos),
+                              _REGISTRO.pack(len(slot), len(datos), zlib.crc32(cuerpo)) + cuerpo))
+
+        if registros:
+            try:
+                with self.__lock__:
+                    archivo = self.__obtener_archivo()
+                    inicio = archivo.seek(0, os.SEEK_END)
+                    try:
+                        archivo.write(b"".join(registro for *_, registro in registros))
+                        archivo.flush()
+                        if self.__sincronizar__:
+                            os.fsync(archivo.fileno())
+                    except OSError:
+                        self.__deshacer_escritura(inicio)
+                        raise
+                    for slot_id, largo_slot, largo_datos, registro in registros:
+                        self.__agregar_al_indice(slot_id, inicio + _REGISTRO.size + largo_slot,
+                                                 largo_datos)
+                        inicio += len(registro)
+            except OSError as e:
+                for slot_id, *_ in registros:
+                    resultados[slot_id] = (False, f"Error al guardar partida: {e}")
+            else:
+                for slot_id, *_ in registros:
+                    resultados[slot_id] = (True, f"Partida guardada en '{slot_id}'.")
+        return {slot_id: resultados[slot_id] for slot_id in estados}
+
+    def cargar_partidas(self, slots: list) -> dict:
+        """
+        Carga varias partidas leyendo solo sus últimos registros, en el orden
+        en que están en el archivo.
+
+        Args:
+            slots: Slots a cargar.
+
+        Returns:
+            dict: slot -> (estado o None, mensaje), en el orden de `slots`.
+        """
+        slots = list(dict.fromkeys(slots))
+        datos = {}
+        try:
+            with self.__lock__:
+                archivo = self.__obtener_archivo()
+                encontrados = sorted((self.__indice__[slot_id][:2], slot_id)
+                                     for slot_id in slots if slot_id in self.__indice__)
+                for (posicion, largo), slot_id in encontrados:
+                    archivo.seek(posicion)
+                    datos[slot_id] = archivo.read(largo)
+        except OSError as e:
+            return {slot_id: (None, mensaje_error_carga(e)) for slot_id in slots}
+
+        resultados = {}
+        for slot_id in slots:
+            if slot_id not in datos:
+                resultados[slot_id] = (None, f"No se encontró partida guardada en '{slot_id}'.")
+                continue
+            try:
+                resultados[slot_id] = (deserializar_partida(datos[slot_id]),
+                                       f"Partida cargada desde '{slot_id}'.")
+            except ValueError as e:
+                resultados[slot_id] = (None, mensaje_error_carga(e))
+        return resultados
+
+    def listar_partidas(self, cursor: int | tuple = 0,
+                        limite: int = LIMITE_LISTADO) -> tuple[list[dict] | None, int | None, str]:
+        """
+        Lista una página de partidas, de la guardada más tarde a la más
+        antigua (el orden de sus últimos registros en el archivo).
+
+        El cursor es la posición en el archivo de la última partida listada:
+        la página siguiente se busca en la lista ordenada del índice (bisect)
+        y se recorre hacia atrás, así cada página cuesta lo mismo sin importar
+        cuántas hay antes. Del archivo solo se leen las partidas de la página,
+        para calcular sus metadatos. Los registros no guardan la hora, así que
+        "guardada" es None.
+
+        Args:
+            cursor: 0 para la primera página, o el cursor devuelto por la anterior.
+            limite: Cantidad máxima de partidas de la página.
+
+        Returns:
+            tuple: (partidas o None si falla, cursor siguiente o None, mensaje).
+
+        Raises:
+            ValueError: Si el cursor no es 0 ni una posición del archivo
+                (un entero positivo), o el límite es menor que 1.
+        """
+        if limite < 1:
+            raise ValueError("El límite debe ser >= 1")
+        if isinstance(cursor, bool) or not isinstance(cursor, int) or cursor < 0:
+            raise ValueError(f"Cursor de listado inválido: {cursor!r}")
+        try:
+            with self.__lock__:
+                self.__obtener_archivo()
+                orden = self.__orden__
+                indice = bisect.bisect_left(orden, (cursor,)) if cursor else len(orden)
+                # Una partida de más para saber si hay otra página
+                pagina = []
+                while indice > 0 and len(pagina) <= limite:
+                    indice -= 1
+                    posicion, slot_id = orden[indice]
+                    entrada = self.__indice__[slot_id]
+                    if entrada[0] == posicion:
+                        pagina.append((slot_id, posicion, entrada[2]))
+        except OSError as e:
+            return None, None, f"Error al listar partidas: {e}"
+
+        hay_mas = len(pagina) > limite
+        pagina = pagina[:limite]
+        cargadas = self.cargar_partidas([slot_id for slot_id, *_ in pagina])
+        partidas = []
+        for slot_id, _, jugada in pagina:
+            estado, _ = cargadas[slot_id]
+            partida = calcular_metadatos(estado or {})
+            partida.update(slot=slot_id, guardada=None, jugada=jugada)
+            partidas.append(partida)
+        siguiente = pagina[-1][1] if hay_mas else None
+        return partidas, siguiente, f"{len(partidas)} partidas guardadas."
@@ -0,0 +1,351 @@
+import asyncio
+import weakref
+import redis.asyncio
+from Backgammon.Persistence.RedisManager import (CLAVE_INDICE, ERRORES_CONEXION, INTENTOS_TRANSACCION,
+                                                  RegistroPartidas)
+from Backgammon.Persistence.Storage import LIMITE_LISTADO
+
+# Pools compartidos por configuración; uno por event loop, porque las
+# conexiones de redis.asyncio quedan atadas al loop donde se crearon
+_POOLS = weakref.WeakKeyDictionary()
+
+
+def obtener_pool_async(host: str = 'localhost', port: int = 6379, db: int = 0,
+                       max_conexiones: int = 8, timeout_conexion: float = 0.5,
+                       timeout_socket: float = 2.0) -> redis.asyncio.ConnectionPool:
+    """
+    Devuelve el ConnectionPool de redis.asyncio compartido para esa
+    configuración en el event loop actual, creándolo la primera vez.
+
+    Args:
+        host: Servidor Redis.
+        port: Puerto del servidor.
+        db: Número de base de datos.
+        max_conexiones: Conexiones abiertas como máximo en el pool.
+        timeout_conexion: Segundos máximos para conectar.
+        timeout_socket: Segundos máximos de espera por cada comando.
+
+    Returns:
+        redis.asyncio.ConnectionPool: Pool compartido.
+
+    Raises:
+        RuntimeError: Si no hay un event loop en ejecución.
+    """
+    pools = _POOLS.setdefault(asyncio.get_running_loop(), {})
+    clave = (host, port, db, max_conexiones, timeout_conexion, timeout_socket)
+    pool = pools.get(clave)
+    if pool is None:
+        pool = redis.asyncio.ConnectionPool(host=host, port=port, db=db,
+                                            max_connections=max_conexiones,
+                                            socket_connect_timeout=timeout_conexion,
+                                            socket_timeout=timeout_socket)
+        pools[clave] = pool
+    return pool
+
+
+class AsyncRedisManager(RegistroPartidas):
+    """
+    Versión asyncio de RedisManager, para servidores de juego con event loop.
+
+    Tiene el mismo contrato (guardar_partida, cargar_partida, sus versiones en
+    lote, listar_partidas y obtener_historial, con los mismos resultados,
+    mensajes y conflictos de versión) pero cada método es una corrutina sobre
+    redis.asyncio: no bloquea el loop ni usa hilos. La reconexión después de
+    un fallo corre como tarea del loop.
+    Aplica la misma retención por clase de partida; la compactación y el
+    reporte de memoria son trabajos de mantenimiento de RedisManager.
+
+    SRP: Solo persiste partidas; el formato está en RegistroPartidas.
+    LSP: Guarda y lee exactamente lo mismo que RedisManager.
+    """
+
+    def __init__(self, client=None, host: str = 'localhost', port: int = 6379, db: int = 0,
+                 max_conexiones: int = 8, timeout_conexion: float = 0.5,
+                 timeout_socket: float = 2.0, reintento_segundos: float = 5.0,
+                 formato: str = "binario", snapshot_cada: int = 20,
+                 retencion: dict | None = None):
+        """
+        Prepara la conexión sin conectarse todavía (puede crearse fuera del loop).
+
+        Args:
+            client: Cliente redis.asyncio ya creado (p. ej. fakeredis.FakeAsyncRedis), o None.
+            host: Servidor Redis.
+            port: Puerto del servidor.
+            db: Número de base de datos.
+            max_conexiones: Tamaño máximo del pool compartido.
+            timeout_conexion: Segundos máximos para conectar.
+            timeout_socket: Segundos máximos de espera por cada comando.
+            reintento_segundos: Pausa entre reintentos de conexión en segundo plano.
+            formato: "binario" o "json" (ver RegistroPartidas).
+            snapshot_cada: Cantidad de eventos entre snapshots completos.
+            retencion: clase -> segundos de vida (ver RETENCION_POR_DEFECTO).
+
+        Raises:
+            ValueError: Si el formato, snapshot_cada o la retención no son válidos.
+        """
+        super().__init__(formato, snapshot_cada, retencion)
+        self.__redis_db__ = client
+        self.__config_pool__ = (host, port, db, max_conexiones, timeout_conexion, timeout_socket)
+        self.__reintento_segundos__ = reintento_segundos
+        self.__lock__ = asyncio.Lock()
+        self.__intentado__ = client is not None
+        self.__tarea_reconexion__ = None
+
+    @property
+    def client(self):
+        """Cliente actual, o None si todavía no se conectó o se perdió la conexión."""
+        return self.__redis_db__
+
+    @client.setter
+    def client(self, client) -> None:
+        """Reemplaza el cliente (por ejemplo, por uno de fakeredis en los tests)."""
+        self.__redis_db__ = client
+        self.__intentado__ = True
+
+    def esta_conectado(self) -> bool:
+        """
+        Indica si hay un cliente conectado, sin intentar conectar.
+
+        Returns:
+            bool: True si hay conexión activa.
+        """
+        return self.__redis_db__ is not None
+
+    async def __crear_cliente(self):
+        """
+        Crea un cliente sobre el pool compartido y comprueba la conexión.
+
+        Raises:
+            redis.exceptions.ConnectionError: Si Redis no responde.
+            redis.exceptions.TimeoutError: Si se agota el tiempo de conexión.
+        """
+        cliente = redis.asyncio.Redis(connection_pool=obtener_pool_async(*self.__config_pool__))
+        await cliente.ping()
+        return cliente
+
+    async def __obtener_cliente(self):
+        """
+        Devuelve el cliente conectado; en el primer uso intenta conectar.
+
+        Returns:
+            redis.asyncio.Redis | None: Cliente, o None si no hay conexión.
+        """
+        async with self.__lock__:
+            if self.__redis_db__ is not None or self.__intentado__:
+                return self.__redis_db__
+            self.__intentado__ = True
+            try:
+                self.__redis_db__ = await self.__crear_cliente()
+                print("Conectado a Redis exitosamente (desde AsyncRedisManager).")
+            except ERRORES_CONEXION as e:
+                print(f"Error al conectar con Redis: {e}")
+                print("Se reintentará la conexión en segundo plano.")
+                self.__marcar_desconectado()
+            return self.__redis_db__
+
+    def __marcar_desconectado(self) -> None:
+        """Descarta el cliente actual e inicia la tarea de reconexión si no corre ya."""
+        self.__redis_db__ = None
+        if self.__tarea_reconexion__ is not None and not self.__tarea_reconexion__.done():
+            return
+        self.__tarea_reconexion__ = asyncio.get_running_loop().create_task(self.__reconectar())
+
+    async def __reconectar(self) -> None:
+        """Tarea de fondo: reintenta conectar hasta lograrlo."""
+        while True:
+            await asyncio.sleep(self.__reintento_segundos__)
+            try:
+                cliente = await self.__crear_cliente()
+            except ERRORES_CONEXION:
+                continue
+            if self.__redis_db__ is None:
+                self.__redis_db__ = cliente
+            print("Reconectado a Redis.")
+            return
+
+    async def cerrar(self) -> None:
+        """Cancela la reconexión en curso, si la hay."""
+        if self.__tarea_reconexion__ is not None:
+            self.__tarea_reconexion__.cancel()
+            try:
+                await self.__tarea_reconexion__
+            except asyncio.CancelledError:
+                pass
+            self.__tarea_reconexion__ = None
+
+    async def guardar_partida(self, slot_id: str, estado_completo: dict,
+                              sobrescribir: bool = False) -> tuple[bool, str]:
+        """
+        Igual que RedisManager.guardar_partida, sin bloquear el event loop.
+        """
+        return (await self.guardar_partidas({slot_id: estado_completo}, sobrescribir))[slot_id]
+
+    async def guardar_partidas(self, estados: dict, sobrescribir: bool = False) -> dict:
+        """
+        Igual que RedisManager.guardar_partidas: guardado condicional por
+        versión con WATCH/MULTI, a lo sumo cuatro pipelines.
+
+        Args:
+            estados: slot -> estado completo.
+            sobrescribir: Si es True, pisa lo guardado aunque este manager no
+                haya cargado la última versión.
+
+        Returns:
+            dict: slot -> (éxito, mensaje), en el mismo orden que `estados`.
+        """
+        cliente = await self.__obtener_cliente()
+        if not cliente:
+            return {slot_id: (False, "Error: No hay conexión a Redis.") for slot_id in estados}
+
+        resultados = {}
+        try:
+            if sobrescribir:
+                self._olvidar_registros(estados)
+            registros, faltantes = self._registros_conocidos(estados)
+            if faltantes:
+                registros.update(await self.__leer_registros(cliente, faltantes))
+            for _ in range(INTENTOS_TRANSACCION):
+                try:
+                    resultados, reparaciones = await self.__guardar_condicional(
+                        cliente, estados, registros, sobrescribir)
+                    break
+                except redis.exceptions.WatchError:
+                    continue
+            else:
+                return self._conflicto_persistente(estados)
+            if reparaciones:
+                pipe = cliente.pipeline()
+                self._preparar_reparacion(pipe, reparaciones)
+                await pipe.execute()
+        except Exception as e:
+            if isinstance(e, ERRORES_CONEXION):
+                self.__marcar_desconectado()
+            return self._fallo_guardado(estados, resultados, e)
+        return {slot_id: resultados[slot_id] for slot_id in estados}
+
+    async def __guardar_condicional(self, cliente, estados: dict, registros: dict,
+                                    sobrescribir: bool) -> tuple[dict, list]:
+        """
+        Igual que en RedisManager: WATCH, lectura de versiones y transacción.
+
+        Raises:
+            redis.exceptions.WatchError: Si otra escritura tocó alguna partida antes del EXEC.
+        """
+        async with cliente.pipeline() as pipe:
+            await pipe.watch(*[self.clave_metadatos(slot_id) for slot_id in estados])
+            lectura = cliente.pipeline(transaction=False)
+            for slot_id in estados:
+                lectura.hget(self.clave_metadatos(slot_id), "version")
+            conflictos, libres = self._separar_conflictos(estados, registros, await lectura.execute(),
+                                                          sobrescribir)
+            pipe.multi()
+            resultados, pendientes = self._preparar_guardado(pipe, libres, registros)
+            respuestas = await pipe.execute(raise_on_error=False) if pendientes else []
+        self._olvidar_registros(conflictos)
+        resultados.update(conflictos)
+        return resultados, self._registrar_guardado(resultados, pendientes, respuestas)
+
+    async def cargar_partida(self, slot_id: str) -> tuple[dict | None, str]:
+        """
+        Igual que RedisManager.cargar_partida, sin bloquear el event loop.
+        """
+        return (await self.cargar_partidas([slot_id]))[slot_id]
+
+    async def cargar_partidas(self, slots: list) -> dict:
+        """
+        Igual que RedisManager.cargar_partidas: dos pipelines y un MGET.
+
+        Args:
+            slots: Slots a cargar.
+
+        Returns:
+            dict: slot -> (estado o None, mensaje), en el orden de `slots`.
+        """
+        slots = list(dict.fromkeys(slots))
+        cliente = await self.__obtener_cliente()
+        if not cliente:
+            return {slot_id: (None, "Error: No hay conexión a Redis.") for slot_id in slots}
+
+        try:
+            registros = await self.__leer_registros(cliente, slots)
+            resultados, anteriores = self._resultados_carga(slots, registros)
+            # Formato anterior: el estado completo en la clave del slot
+            valores = await cliente.mget(anteriores) if anteriores else []
+            self._resultados_anteriores(resultados, anteriores, valores)
+        except Exception as e:
+            if isinstance(e, ERRORES_CONEXION):
+                self.__marcar_desconectado()
+            return {slot_id: (None, self._mensaje_error_carga(e)) for slot_id in slots}
+        return {slot_id: resultados[slot_id] for slot_id in slots}
+
+    async def __leer_registros(self, cliente, slots: list) -> dict:
+        """
+        Lee versiones, snapshots y eventos de varias partidas con dos pipelines.
+
+        Returns:
+            dict: Ver RegistroPartidas._armar_registros.
+        """
+        pipe = cliente.pipeline(transaction=False)
+        for slot_id in slots:
+            pipe.hget(self.clave_metadatos(slot_id), "version")
+            pipe.hgetall(self.clave_snapshot(slot_id))
+        respuestas = await pipe.execute()
+        versiones, snapshots = respuestas[0::2], respuestas[1::2]
+
+        pipe = cliente.pipeline(transaction=False)
+        for slot_id, snapshot in zip(slots, snapshots):
+            pipe.lrange(self.clave_eventos(slot_id), self._indice_snapshot(snapshot), -1)
+        return self._armar_registros(slots, snapshots, await pipe.execute(), versiones)
+
+    async def listar_partidas(self, cursor: int | tuple = 0, limite: int = LIMITE_LISTADO
+                              ) -> tuple[list[dict] | None, tuple | None, str]:
+        """
+        Igual que RedisManager.listar_partidas, sin bloquear el event loop.
+
+        Raises:
+            ValueError: Si el cursor no es 0 ni un cursor (guardada, slot), o
+                el límite es menor que 1.
+        """
+        self._validar_cursor(cursor, limite)
+        cliente = await self.__obtener_cliente()
+        if not cliente:
+            return None, None, "Error: No hay conexión a Redis."
+
+        try:
+            posicion = None
+            for intento in range(INTENTOS_TRANSACCION + 2):
+                pipe = cliente.pipeline()
+                por_rango = self._pedir_pagina(pipe, cursor, limite, posicion,
+                                               filtrar=intento > INTENTOS_TRANSACCION)
+                miembros, posicion = self._leer_pagina(await pipe.execute(), cursor, limite,
+                                                       posicion, por_rango)
+                if miembros is not None:
+                    break
+            pipe = cliente.pipeline(transaction=False)
+            for slot_id, _ in miembros[:limite]:
+                pipe.hgetall(self.clave_metadatos(self._texto(slot_id)))
+            metadatos = await pipe.execute()
+        except ERRORES_CONEXION as e:
+            self.__marcar_desconectado()
+            return None, None, f"Error al listar partidas (sin conexión a Redis): {e}"
+        partidas = self._armar_listado(miembros[:limite], metadatos)
+        return partidas, self._siguiente_cursor(miembros, limite), f"{len(partidas)} partidas guardadas."
+
+    async def obtener_historial(self, slot_id: str) -> tuple[list[dict] | None, str]:
+        """
+        Igual que RedisManager.obtener_historial, sin bloquear el event loop.
+        """
+        cliente = await self.__obtener_cliente()
+        if not cliente:
+            return None, "Error: No hay conexión a Redis."
+
+        try:
+            pipe = cliente.pipeline(transaction=False)
+            pipe.hget(self.clave_archivo(slot_id), "eventos")
+            pipe.lrange(self.clave_eventos(slot_id), 0, -1)
+            return self._armar_historial(slot_id, *await pipe.execute())
+        except ERRORES_CONEXION as e:
+            self.__marcar_desconectado()
+            return None, f"Error al leer historial (sin conexión a Redis): {e}"
+        except ValueError as e:
+            return None, f"Error al leer historial (evento corrupto): {e}"
@@ -0,0 +1,186 @@
+"""Guardado automático diferido: junta los guardados frecuentes y los escribe en segundo plano."""
+import copy
+import threading
+from typing import Callable, Optional
+from Backgammon.Persistence.Storage import AlmacenPartidas, es_conflicto
+
+# Slot donde las interfaces guardan la partida en curso
+SLOT_AUTOGUARDADO = "autoguardado"
+
+
+class GuardadoDiferido:
+    """
+    Planificador de guardado automático con escritura diferida (write-behind).
+
+    Las interfaces llaman a marcar() después de cada jugada; el planificador
+    solo recuerda el último estado de cada slot. Un hilo de fondo escribe los
+    slots pendientes cada `intervalo` segundos con una sola llamada a
+    guardar_partidas, así varias jugadas sobre el mismo slot terminan en una
+    única escritura. Al terminar la partida se pide un guardado inmediato.
+
+    Si un guardado falla, el estado no se reintenta: la próxima jugada marca
+    un estado más nuevo. El resultado se informa por `al_guardar`.
+
+    La primera escritura de cada slot en la sesión lo reclama con
+    sobrescribir=True (el autoguardado de una sesión anterior se reemplaza);
+    las siguientes son condicionales. Si una devuelve un conflicto, otro
+    proceso escribió el slot: el planificador deja de guardarlo en lugar de
+    pisarlo, y las marcas posteriores de ese slot se ignoran.
+
+    SRP: Decide cuándo guardar; cómo guardar es del AlmacenPartidas.
+    DIP: Funciona con cualquier AlmacenPartidas (Redis, SQLite, archivo).
+    """
+
+    def __init__(self, almacen: AlmacenPartidas, intervalo: float = 2.0,
+                 al_guardar: Optional[Callable[[dict], None]] = None):
+        """
+        Prepara el planificador; el hilo se inicia con la primera marca.
+
+        Args:
+            almacen: Almacenamiento donde se escriben las partidas.
+            intervalo: Segundos entre escrituras en segundo plano.
+            al_guardar: Función que recibe el resultado de cada escritura
+                (slot -> (éxito, mensaje)); se llama desde el hilo de fondo.
+
+        Raises:
+            ValueError: Si el intervalo no es positivo.
+        """
+        if intervalo <= 0:
+            raise ValueError("El intervalo de guardado debe ser positivo")
+        self.__almacen__ = almacen
+        self.__intervalo__ = intervalo
+        self.__al_guardar__ = al_guardar
+        self.__pendientes__ = {}
+        # Slots ya escritos en esta sesión y slots detenidos por un conflicto
+        self.__reclamados__ = set()
+        self.__en_conflicto__ = set()
+        self.__lock__ = threading.Lock()
+        # Una escritura a la vez, para que dos vaciados no se adelanten entre sí
+        self.__lock_escritura__ = threading.Lock()
+        self.__despertar__ = threading.Event()
+        self.__detenido__ = False
+        self.__hilo__ = None
+        self.__marcas__ = 0
+        self.__escrituras__ = 0
+
+    def marcar(self, slot_id: str, estado_completo: dict) -> None:
+        """
+        Registra el último estado de un slot para guardarlo más tarde.
+
+        El estado se copia: Board.obtener_estado_dict devuelve listas que
+        cambian con la siguiente jugada. Un slot detenido por un conflicto se ignora.
+
+        Args:
+            slot_id: Slot a guardar.
+            estado_completo: Partida a guardar.
+        """
+        estado = copy.deepcopy(estado_completo)
+        with self.__lock__:
+            if slot_id in self.__en_conflicto__:
+                return
+            self.__pendientes__[slot_id] = estado
+            self.__marcas__ += 1
+            if self.__hilo__ is None and not self.__detenido__:
+                self.__hilo__ = threading.Thread(target=self.__run, daemon=True)
+                self.__hilo__.start()
+
+    def solicitar_vaciado(self) -> None:
+        """Pide al hilo de fondo que escriba ya, sin esperar el intervalo ni bloquear."""
+        self.__despertar__.set()
+
+    def vaciar(self) -> dict:
+        """
+        Escribe ahora todos los slots pendientes, en el hilo que llama.
+
+        Returns:
+            dict: slot -> (éxito, mensaje) de lo escrito ({} si no había nada).
+        """
+        with self.__lock_escritura__:
+            with self.__lock__:
+                lote, self.__pendientes__ = self.__pendientes__, {}
+            if not lote:
+                return {}
+            reclamados = {slot_id: estado for slot_id, estado in lote.items()
+                          if slot_id in self.__reclamados__}
+            nuevos = {slot_id: estado for slot_id, estado in lote.items()
+                      if slot_id not in reclamados}
+            resultados = {}
+            for partidas, sobrescribir in ((reclamados, False), (nuevos, True)):
+                if partidas:
+                    resultados.update(self.__escribir(partidas, sobrescribir))
+            with self.__lock__:
+                self.__escrituras__ += 1
+                for slot_id, resultado in resultados.items():
+                    if resultado[0]:
+                        self.__reclamados__.add(slot_id)
+                    elif es_conflicto(resultado):
+                        self.__en_conflicto__.add(slot_id)
+                        self.__pendientes__.pop(slot_id, None)
+        if self.__al_guardar__ is not None:
+            self.__al_guardar__(resultados)
+        return resultados
+
+    def esta_en_conflicto(self, slot_id: str) -> bool:
+        """
+        Indica si el autoguardado de un slot se detuvo por un conflicto de versión.
+
+        Args:
+            slot_id: Slot a consultar.
+
+        Returns:
+            bool: True si otro proceso escribió el slot y ya no se guarda.
+        """
+        with self.__lock__:
+            return slot_id in self.__en_conflicto__
+
+    def detener(self) -> dict:
+        """
+        Detiene el hilo de fondo y escribe lo pendiente (al cerrar la interfaz).
+
+        Returns:
+            dict: Resultado del último vaciado.
+        """
+        with self.__lock__:
+            self.__detenido__ = True
+            hilo = self.__hilo__
+        self.__despertar__.set()
+        if hilo is not None:
+            hilo.join()
+        return self.vaciar()
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Devuelve cuántas marcas se recibieron y cuántas escrituras se hicieron.
+
+        Returns:
+            dict: {"marcas", "escrituras", "pendientes"}.
+        """
+        with self.__lock__:
+            return {"marcas": self.__marcas__, "escrituras": self.__escrituras__,
+                    "pendientes": len(self.__pendientes__)}
+
+    def __escribir(self, lote: dict, sobrescribir: bool) -> dict:
+        """
+        Escribe un lote con una llamada a guardar_partidas; una excepción se
+        convierte en un error por slot.
+
+        Args:
+            lote: slot -> estado a escribir.
+            sobrescribir: True para reclamar slots que la sesión todavía no escribió.
+
+        Returns:
+            dict: slot -> (éxito, mensaje).
+        """
+        try:
+            return self.__almacen__.guardar_partidas(lote, sobrescribir=sobrescribir)
+        except Exception as e:
+            return {slot_id: (False, f"Error al guardar partida: {e}") for slot_id in lote}
+
+    def __run(self) -> None:
+        """Bucle del hilo de fondo: espera el intervalo (o un pedido) y vacía."""
+        while True:
+            self.__despertar__.wait(self.__intervalo__)
+            self.__despertar__.clear()
+            if self.__detenido__:
+                return
+            self.vaciar()
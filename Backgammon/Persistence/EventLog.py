@@ -0,0 +1,155 @@
+"""Eventos de partida: diferencias entre dos estados guardados y su reaplicación."""
+import copy
+import json
+
+# Clave de puntos del tablero, que se registra punto por punto
+CLAVE_PUNTOS = "puntos"
+
+# Prefijos de ruta que se abrevian al guardar un evento (el más largo primero);
+# "~" no aparece en las claves de la partida, así una ruta sin abreviar no se confunde
+ABREVIATURAS = (("board_state.puntos.", "~p"), ("board_state.", "~b."), ("ui_state.", "~u."))
+
+
+def aplanar_estado(estado_completo: dict) -> dict:
+    """
+    Aplana una partida en rutas separadas por puntos.
+
+    Cada sección (board_state, ui_state) queda como su propia ruta con valor {}
+    y cada clave dentro de ella como "seccion.clave". La lista de puntos se
+    separa en "seccion.puntos.#" (largo) y "seccion.puntos.<i>", así mover una
+    ficha cambia solo dos rutas.
+
+    Los valores se copian: Board.obtener_estado_dict devuelve sus listas
+    internas, que cambian con la siguiente jugada.
+
+    Args:
+        estado_completo: Partida con el formato de PygameUI.__save_game.
+
+    Returns:
+        dict: Ruta -> valor.
+    """
+    estado_completo = copy.deepcopy(estado_completo)
+    plano = {}
+    for seccion, valor in estado_completo.items():
+        if not isinstance(valor, dict):
+            plano[seccion] = valor
+            continue
+        plano[seccion] = {}
+        for clave, dato in valor.items():
+            if clave == CLAVE_PUNTOS and isinstance(dato, list):
+                plano[f"{seccion}.{clave}.#"] = len(dato)
+                for indice, punto in enumerate(dato):
+                    plano[f"{seccion}.{clave}.{indice}"] = punto
+            else:
+                plano[f"{seccion}.{clave}"] = dato
+    return plano
+
+
+def desaplanar_estado(plano: dict) -> dict:
+    """
+    Reconstruye una partida a partir de sus rutas (inversa de aplanar_estado).
+
+    Args:
+        plano: Ruta -> valor.
+
+    Returns:
+        dict: Partida (copia independiente de los valores de `plano`).
+    """
+    estado = {}
+    rutas = sorted(plano, key=lambda ruta: ruta.count("."))
+    for ruta in rutas:
+        partes = ruta.split(".")
+        valor = copy.deepcopy(plano[ruta])
+        if len(partes) == 1:
+            estado[ruta] = valor
+        elif len(partes) == 2:
+            estado[partes[0]][partes[1]] = valor
+        elif partes[2] == "#":
+            estado[partes[0]][partes[1]] = [None] * valor
+        else:
+            estado[partes[0]][partes[1]][int(partes[2])] = valor
+    return estado
+
+
+def calcular_evento(anterior: dict, nuevo: dict) -> dict:
+    """
+    Calcula el evento que lleva de un estado aplanado a otro.
+
+    Args:
+        anterior: Estado aplanado previo ({} para la primera jugada).
+        nuevo: Estado aplanado actual.
+
+    Returns:
+        dict: {"set": {ruta: valor}, "del": [rutas]} con solo lo que cambió.
+    """
+    faltante = object()
+    return {
+        "set": {ruta: valor for ruta, valor in nuevo.items()
+                if anterior.get(ruta, faltante) != valor},
+        "del": [ruta for ruta in anterior if ruta not in nuevo],
+    }
+
+
+def aplicar_evento(plano: dict, evento: dict) -> None:
+    """
+    Aplica un evento sobre un estado aplanado, en el lugar.
+
+    Args:
+        plano: Estado aplanado a modificar.
+        evento: Evento devuelto por calcular_evento.
+    """
+    plano.update(evento.get("set", {}))
+    for ruta in evento.get("del", []):
+        plano.pop(ruta, None)
+
+
+def _abreviar(ruta: str) -> str:
+    """Reemplaza el prefijo conocido de una ruta por su abreviatura."""
+    for prefijo, abreviatura in ABREVIATURAS:
+        if ruta.startswith(prefijo):
+            return abreviatura + ruta[len(prefijo):]
+    return ruta
+
+
+def _expandir(ruta: str) -> str:
+    """Inversa de _abreviar."""
+    for prefijo, abreviatura in ABREVIATURAS:
+        if ruta.startswith(abreviatura):
+            return prefijo + ruta[len(abreviatura):]
+    return ruta
+
+
+def codificar_evento(evento: dict) -> bytes:
+    """
+    Serializa un evento como JSON compacto, con las rutas abreviadas
+    ("~p3" en lugar de "board_state.puntos.3") y sin la lista "del" si está vacía.
+    Un movimiento ocupa menos de 100 bytes.
+
+    Args:
+        evento: Evento a serializar.
+
+    Returns:
+        bytes: JSON sin espacios.
+    """
+    compacto = {"s": {_abreviar(ruta): valor for ruta, valor in evento.get("set", {}).items()}}
+    if evento.get("del"):
+        compacto["d"] = [_abreviar(ruta) for ruta in evento["del"]]
+    return json.dumps(compacto, separators=(",", ":")).encode("utf-8")
+
+
+def decodificar_evento(datos) -> dict:
+    """
+    Deserializa un evento guardado con codificar_evento.
+
+    Args:
+        datos: JSON en bytes o str.
+
+    Returns:
+        dict: Evento con las rutas completas.
+
+    Raises:
+        ValueError: Si el JSON es inválido.
+    """
+    compacto = json.loads(datos)
+    return {"set": {_expandir(ruta): valor for ruta, valor in compacto.get("s", {}).items()},
+            "del": [_expandir(ruta) for ruta in compacto.get("d", [])]}
@@ -1,77 +1,1194 @@
+import threading
+import time
+import zlib
 import redis
-import json
 from Backgammon.Core.Board import Board # Importa Board para type hinting
+from Backgammon.Persistence.EventLog import (aplanar_estado, desaplanar_estado, calcular_evento,
+                                              aplicar_evento, codificar_evento, decodificar_evento)
+from Backgammon.Persistence.AutoSave import SLOT_AUTOGUARDADO
+from Backgammon.Persistence.SaveCodec import serializar_partida, deserializar_partida
+from Backgammon.Persistence.Storage import (AlmacenPartidas, LIMITE_LISTADO, calcular_metadatos,
+                                            PREFIJO_CONFLICTO, mensaje_conflicto,
+                                            mensaje_error_carga)
 
-class RedisManager:
+# Pools compartidos por todos los RedisManager con la misma configuración
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def obtener_pool(host: str = 'localhost', port: int = 6379, db: int = 0,
+                 max_conexiones: int = 8, timeout_conexion: float = 0.5,
+                 timeout_socket: float = 2.0) -> redis.ConnectionPool:
+    """
+    Devuelve el ConnectionPool compartido para esa configuración, creándolo
+    la primera vez. Crear el pool no abre ninguna conexión.
+
+    Args:
+        host: Servidor Redis.
+        port: Puerto del servidor.
+        db: Número de base de datos.
+        max_conexiones: Conexiones abiertas como máximo en el pool.
+        timeout_conexion: Segundos máximos para conectar.
+        timeout_socket: Segundos máximos de espera por cada comando.
+
+    Returns:
+        redis.ConnectionPool: Pool compartido.
+    """
+    clave = (host, port, db, max_conexiones, timeout_conexion, timeout_socket)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(clave)
+        if pool is None:
+            # Sin decode_responses: las partidas binarias no son texto
+            pool = redis.ConnectionPool(host=host, port=port, db=db,
+                                        max_connections=max_conexiones,
+                                        socket_connect_timeout=timeout_conexion,
+                                        socket_timeout=timeout_socket)
+            _POOLS[clave] = pool
+        return pool
+
+
+ERRORES_CONEXION = (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)
+
+# Índice de partidas guardadas: sorted set slot -> momento del último guardado
+CLAVE_INDICE = "partidas:indice"
+# Campos numéricos del hash de metadatos (Redis los devuelve como texto)
+CAMPOS_ENTEROS = ("jugada", "version", "pips_negro", "pips_blanco")
+
+# Clases de partida para la retención y el reporte de memoria
+CLASES_PARTIDA = ("autoguardado", "manual", "finalizada")
+# Segundos que se conserva una partida sin guardados nuevos (None: para siempre)
+RETENCION_POR_DEFECTO = {"autoguardado": 7 * 24 * 3600, "manual": None,
+                         "finalizada": 30 * 24 * 3600}
+FICHAS_POR_JUGADOR = 15
+# Veces que se repite un guardado cuya transacción abortó por WATCH
+INTENTOS_TRANSACCION = 5
+
+
+def clasificar_partida(slot_id: str, estado_completo: dict) -> str:
+    """
+    Decide la clase de retención de una partida.
+
+    Una partida está finalizada si la UI la marcó GAME_OVER o si un jugador
+    ya sacó sus 15 fichas; si no, es "autoguardado" en SLOT_AUTOGUARDADO y
+    "manual" en cualquier otro slot.
+
+    Args:
+        slot_id: Slot donde se guarda.
+        estado_completo: Partida a guardar.
+
+    Returns:
+        str: Una de CLASES_PARTIDA.
+    """
+    ui_state = estado_completo.get("ui_state") or {}
+    board_state = estado_completo.get("board_state") or {}
+    if ui_state.get("game_state") == "GAME_OVER":
+        return "finalizada"
+    for casa in (board_state.get("casa"), ui_state.get("home_pieces")):
+        if isinstance(casa, dict) and any(isinstance(fichas, int) and fichas >= FICHAS_POR_JUGADOR
+                                          for fichas in casa.values()):
+            return "finalizada"
+    return "autoguardado" if slot_id == SLOT_AUTOGUARDADO else "manual"
+
+
+class RegistroPartidas:
+    """
+    Lógica común del registro de eventos de partidas, sin entrada/salida.
+
+    Cada partida se guarda como un registro de eventos: la lista
+    "<slot>:eventos" recibe un evento pequeño por guardado (solo lo que cambió)
+    y cada `snapshot_cada` eventos se escribe el estado completo en el hash
+    "<slot>:snapshot". Cargar lee el último snapshot y aplica los eventos
+    posteriores.
+
+    Cada guardado actualiza además el índice de partidas: el sorted set
+    CLAVE_INDICE (puntaje = momento del guardado) y el hash "<slot>:meta" con
+    jugadores, turno, número de jugada y pips. Listar una página es un
+    ZREVRANGEBYSCORE y un HGETALL por partida de la página, sin recorrer las claves.
+
+    Cada partida tiene una clase (clasificar_partida) y sus claves vencen
+    según la retención de esa clase, contada desde el último guardado. Las
+    partidas finalizadas pueden compactarse: sus eventos pasan comprimidos al
+    hash "<slot>:archivo" y queda solo el snapshot final.
+
+    Cada partida tiene además un número de versión (campo "version" de
+    "<slot>:meta") que sube en cada guardado. Guardar es condicional: solo se
+    escribe si la versión en Redis es la última que este manager cargó o
+    guardó (0 si nunca la cargó, es decir, la partida tiene que ser nueva).
+    Si no, el resultado es un conflicto (ver Storage.es_conflicto), la
+    partida no se toca y los reintentos siguen en conflicto hasta que se
+    cargue la partida o se guarde con sobrescribir=True.
+
+    RedisManager y AsyncRedisManager heredan de esta clase y solo agregan la
+    forma de hablar con Redis (bloqueante o con asyncio), así ambos guardan el
+    mismo formato y devuelven los mismos mensajes.
+
+    SRP: Arma comandos e interpreta respuestas; no abre conexiones.
+    """
+
+    def __init__(self, formato: str = "binario", snapshot_cada: int = 20,
+                 retencion: dict | None = None):
+        """
+        Args:
+            formato: "binario" (SaveCodec, con JSON si no se puede representar) o "json".
+                Al cargar, el formato se detecta solo.
+            snapshot_cada: Cantidad de eventos entre snapshots completos.
+            retencion: clase -> segundos de vida (None: sin vencimiento); las
+                clases que falten usan RETENCION_POR_DEFECTO.
+
+        Raises:
+            ValueError: Si el formato no es "binario" ni "json", snapshot_cada < 1
+                o la retención tiene una clase desconocida o un tiempo no positivo.
+        """
+        if formato not in ("binario", "json"):
+            raise ValueError(f"Formato de guardado desconocido: {formato}")
+        if snapshot_cada < 1:
+            raise ValueError("snapshot_cada debe ser al menos 1")
+        retencion = {**RETENCION_POR_DEFECTO, **(retencion or {})}
+        for clase, segundos in retencion.items():
+            if clase not in CLASES_PARTIDA:
+                raise ValueError(f"Clase de partida desconocida: {clase}")
+            if segundos is not None and segundos < 1:
+                raise ValueError("La retención debe ser de al menos 1 segundo")
+        self.__formato__ = formato
+        self.__snapshot_cada__ = snapshot_cada
+        self.__retencion__ = retencion
+        # Último estado aplanado, cantidad de eventos y versión leídos de cada partida
+        self.__registros__ = {}
+        # Versión esperada de cada partida: solo la cambian cargar y guardar con éxito
+        self.__versiones__ = {}
+
+    @staticmethod
+    def clave_eventos(slot_id: str) -> str:
+        """Clave de la lista de eventos de una partida."""
+        return f"{slot_id}:eventos"
+
+    @staticmethod
+    def clave_snapshot(slot_id: str) -> str:
+        """Clave del hash con el último snapshot de una partida."""
+        return f"{slot_id}:snapshot"
+
+    @staticmethod
+    def clave_metadatos(slot_id: str) -> str:
+        """Clave del hash con los metadatos de una partida para el listado."""
+        return f"{slot_id}:meta"
+
+    @staticmethod
+    def clave_archivo(slot_id: str) -> str:
+        """Clave del hash con los eventos comprimidos de una partida compactada."""
+        return f"{slot_id}:archivo"
+
+    @classmethod
+    def claves_partida(cls, slot_id: str) -> tuple[str, str, str, str]:
+        """Todas las claves de una partida: eventos, snapshot, metadatos y archivo."""
+        return (cls.clave_eventos(slot_id), cls.clave_snapshot(slot_id),
+                cls.clave_metadatos(slot_id), cls.clave_archivo(slot_id))
+
+    def _encolar_retencion(self, pipe, clase: str, claves) -> int:
+        """
+        Encola EXPIRE (o PERSIST si la clase no vence) para cada clave.
+
+        Returns:
+            int: Cantidad de comandos encolados.
+        """
+        segundos = self.__retencion__[clase]
+        for clave in claves:
+            if segundos is None:
+                pipe.persist(clave)
+            else:
+                pipe.expire(clave, segundos)
+        return len(claves)
+
+    @staticmethod
+    def _texto(valor) -> str:
+        """Decodifica una respuesta de Redis si el cliente no decodifica respuestas."""
+        return valor.decode() if isinstance(valor, bytes) else valor
+
+    @staticmethod
+    def _campo(hash_redis: dict, nombre: str):
+        """Lee un campo de HGETALL tanto si el cliente decodifica respuestas como si no."""
+        return hash_redis.get(nombre.encode(), hash_redis.get(nombre))
+
+    def _indice_snapshot(self, snapshot: dict) -> int:
+        """Cantidad de eventos que cubre un snapshot (0 si no hay)."""
+        return int(self._campo(snapshot, "indice")) if snapshot else 0
+
+    def _armar_registros(self, slots: list, snapshots: list, colas: list,
+                         versiones: list | None = None) -> dict:
+        """
+        Reconstruye el estado aplanado de cada partida desde su último
+        snapshot y los eventos posteriores.
+
+        Args:
+            slots: Partidas leídas.
+            snapshots: Respuesta de HGETALL "<slot>:snapshot" de cada una.
+            colas: Respuesta de LRANGE "<slot>:eventos" desde el índice del snapshot.
+            versiones: Respuesta de HGET "<slot>:meta" "version" de cada una
+                (None si no hacen falta).
+
+        Returns:
+            dict: slot -> (estado aplanado o None si no tiene eventos, cantidad
+            de eventos, versión), o la excepción si sus datos están corruptos.
+        """
+        registros = {}
+        versiones = versiones or [None] * len(slots)
+        for slot_id, snapshot, eventos, version in zip(slots, snapshots, colas, versiones):
+            version = int(version or 0)
+            if not snapshot and not eventos:
+                registros[slot_id] = (None, 0, version)
+                continue
+            try:
+                plano = (aplanar_estado(deserializar_partida(self._campo(snapshot, "estado")))
+                         if snapshot else {})
+                for evento in eventos:
+                    aplicar_evento(plano, decodificar_evento(evento))
+                registros[slot_id] = (plano, self._indice_snapshot(snapshot) + len(eventos), version)
+            except ValueError as e:
+                registros[slot_id] = e
+        return registros
+
+    def _registros_conocidos(self, slots) -> tuple[dict, list]:
+        """
+        Copia los registros en memoria de las partidas de un guardado.
+
+        El guardado trabaja con esta copia y no vuelve a mirar __registros__:
+        mientras espera a Redis, otro hilo o corrutina puede descartar un
+        registro (_olvidar_registros). Si la copia quedó vieja, la versión no
+        coincide y la partida sale en conflicto (ver _separar_conflictos).
+
+        Returns:
+            tuple: (slot -> registro conocido, partidas cuyo registro hay que leer).
+        """
+        conocidos = {slot_id: self.__registros__.get(slot_id) for slot_id in slots}
+        faltantes = [slot_id for slot_id, registro in conocidos.items() if registro is None]
+        return ({slot_id: registro for slot_id, registro in conocidos.items() if registro is not None},
+                faltantes)
+
+    def _separar_conflictos(self, estados: dict, registros: dict, actuales: list,
+                            sobrescribir: bool = False) -> tuple[dict, dict]:
+        """
+        Compara la versión de cada partida en Redis con la esperada.
+
+        La versión esperada es la última que este manager cargó o guardó, o 0
+        si nunca la cargó: guardar sobre una partida existente sin haberla
+        cargado es un conflicto. Con `sobrescribir`, la esperada es la del
+        registro recién leído (se pisa lo guardado, pero no una escritura que
+        llegue en el medio).
+
+        Args:
+            estados: slot -> estado completo.
+            registros: slot -> registro de cada partida (_registros_conocidos
+                más los leídos con _armar_registros).
+            actuales: Respuesta de HGET "<slot>:meta" "version" de cada partida,
+                leída después del WATCH.
+            sobrescribir: Si es True, no se exige haber cargado la partida.
+
+        Returns:
+            tuple: (slot -> resultado de conflicto, slot -> estado de las
+            partidas que se pueden guardar).
+        """
+        conflictos = {}
+        libres = {}
+        for (slot_id, estado_completo), actual in zip(estados.items(), actuales):
+            registro = registros[slot_id]
+            actual = int(actual or 0)
+            if isinstance(registro, Exception):
+                libres[slot_id] = estado_completo
+                continue
+            esperada = registro[2] if sobrescribir else self.__versiones__.get(slot_id, 0)
+            # El registro también tiene que ser de esa versión: los eventos son diferencias
+            if actual != esperada or registro[2] != actual:
+                conflictos[slot_id] = (False, mensaje_conflicto(slot_id, actual, esperada))
+            else:
+                libres[slot_id] = estado_completo
+        return conflictos, libres
+
+    def _preparar_guardado(self, pipe, estados: dict, registros: dict) -> tuple[dict, list]:
+        """
+        Encola en `pipe` el evento (y el snapshot si corresponde) de cada
+        partida, con sus metadatos y su entrada en el índice.
+
+        Args:
+            pipe: Pipeline (sincrónico o asyncio) donde encolar los comandos.
+            estados: slot -> estado completo.
+            registros: slot -> registro de cada partida (ver _separar_conflictos).
+
+        Returns:
+            tuple: (resultados de las partidas que ya fallaron, pendientes
+            (slot, estado aplanado, cantidad, versión nueva, comandos
+            encolados, clase)).
+        """
+        resultados = {}
+        pendientes = []
+        guardada = time.time()
+        for slot_id, estado_completo in estados.items():
+            registro = registros[slot_id]
+            if isinstance(registro, Exception):
+                resultados[slot_id] = (False, f"Error al guardar partida: {registro}")
+                continue
+            plano_anterior, cantidad, version = registro
+            try:
+                plano = aplanar_estado(estado_completo)
+                evento = codificar_evento(calcular_evento(plano_anterior or {}, plano))
+                snapshot = None
+                if (cantidad + 1) % self.__snapshot_cada__ == 0:
+                    snapshot = serializar_partida(estado_completo, self.__formato__)
+            except TypeError as e:
+                # Error común si el objeto no es serializable
+                resultados[slot_id] = (False, f"Error al guardar partida (JSON no serializable): {e}")
+                continue
+            pipe.rpush(self.clave_eventos(slot_id), evento)
+            if snapshot is not None:
+                pipe.hset(self.clave_snapshot(slot_id),
+                          mapping={"indice": cantidad + 1, "estado": snapshot})
+            clase = clasificar_partida(slot_id, estado_completo)
+            metadatos = calcular_metadatos(estado_completo)
+            metadatos.update(jugada=cantidad + 1, version=version + 1, clase=clase, compactada=0)
+            pipe.hset(self.clave_metadatos(slot_id), mapping=metadatos)
+            pipe.zadd(CLAVE_INDICE, {slot_id: guardada})
+            comandos = 3 if snapshot is None else 4
+            comandos += self._encolar_retencion(pipe, clase, self.claves_partida(slot_id))
+            pendientes.append((slot_id, plano, cantidad + 1, version + 1, comandos, clase))
+        return resultados, pendientes
+
+    def _registrar_guardado(self, resultados: dict, pendientes: list, respuestas: list) -> list:
+        """
+        Interpreta las respuestas de la transacción de guardado.
+
+        Si el largo de la lista de eventos no es el esperado, el registro en
+        memoria estaba desactualizado (las claves vencieron o la partida se
+        compactó desde otro proceso): el evento se calculó contra un estado
+        que Redis ya no tiene, así que la partida necesita un snapshot nuevo.
+
+        Args:
+            resultados: Resultados por partida, se completan en el lugar.
+            pendientes: Devueltos por _preparar_guardado.
+            respuestas: Respuesta de EXEC (con las excepciones por comando).
+
+        Returns:
+            list: Partidas a reparar con _preparar_reparacion.
+        """
+        reparaciones = []
+        posicion = 0
+        for slot_id, plano, cantidad, version, comandos, clase in pendientes:
+            propias = respuestas[posicion:posicion + comandos]
+            errores = [respuesta for respuesta in propias if isinstance(respuesta, Exception)]
+            posicion += comandos
+            if errores:
+                self.__registros__.pop(slot_id, None)
+                resultados[slot_id] = (False, f"Error al guardar partida: {errores[0]}")
+                continue
+            # La primera respuesta es la de RPUSH: el largo de la lista
+            if propias[0] != cantidad:
+                reparaciones.append((slot_id, plano, propias[0], clase))
+            self.__registros__[slot_id] = (plano, propias[0], version)
+            self.__versiones__[slot_id] = version
+            resultados[slot_id] = (True, f"Partida guardada en '{slot_id}'.")
+        return reparaciones
+
+    def _preparar_reparacion(self, pipe, reparaciones: list) -> None:
+        """
+        Encola un snapshot completo al final de la lista de eventos de cada
+        partida a reparar, así cargarla no depende de los eventos anteriores.
+
+        Args:
+            pipe: Pipeline (sincrónico o asyncio) donde encolar los comandos.
+            reparaciones: Devueltas por _registrar_guardado.
+        """
+        for slot_id, plano, largo, clase in reparaciones:
+            pipe.hset(self.clave_snapshot(slot_id),
+                      mapping={"indice": largo,
+                               "estado": serializar_partida(desaplanar_estado(plano),
+                                                            self.__formato__)})
+            self._encolar_retencion(pipe, clase, (self.clave_snapshot(slot_id),))
+
+    def _olvidar_registros(self, slots) -> None:
+        """
+        Descarta el registro en memoria de partidas que cambiaron en Redis
+        (compactadas o guardadas por otro proceso); se vuelven a leer en el
+        próximo uso. La versión esperada no cambia: solo cargar la actualiza.
+        """
+        for slot_id in slots:
+            self.__registros__.pop(slot_id, None)
+
+    def _fallo_guardado(self, estados: dict, resultados: dict, error: Exception) -> dict:
+        """
+        Resultados de un guardado en lote que falló por completo.
+
+        Returns:
+            dict: slot -> (False, mensaje), en el orden de `estados`.
+        """
+        for slot_id in estados:
+            self.__registros__.pop(slot_id, None)
+        if isinstance(error, ERRORES_CONEXION):
+            mensaje = f"Error al guardar partida (sin conexión a Redis): {error}"
+        else:
+            mensaje = f"Error al guardar partida: {error}"
+        return {slot_id: (resultados[slot_id] if slot_id in resultados and not resultados[slot_id][0]
+                          else (False, mensaje))
+                for slot_id in estados}
+
+    def _conflicto_persistente(self, estados: dict) -> dict:
+        """
+        Resultados de un lote cuya transacción abortó INTENTOS_TRANSACCION
+        veces seguidas: otro proceso guarda esas partidas sin parar.
+
+        Returns:
+            dict: slot -> (False, mensaje de conflicto), en el orden de `estados`.
+        """
+        self._olvidar_registros(estados)
+        return {slot_id: (False, f"{PREFIJO_CONFLICTO} en '{slot_id}': otro proceso la "
+                                 f"guardó {INTENTOS_TRANSACCION} veces durante el guardado.")
+                for slot_id in estados}
+
+    @staticmethod
+    def _mensaje_error_carga(error: Exception) -> str:
+        """Arma el mensaje de una partida que no se pudo leer."""
+        if isinstance(error, ERRORES_CONEXION):
+            return f"Error al cargar partida (sin conexión a Redis): {error}"
+        return mensaje_error_carga(error)
+
+    def _resultados_carga(self, slots: list, registros: dict) -> tuple[dict, list]:
+        """
+        Arma el resultado de las partidas con registro de eventos y toma
+        como esperada la versión leída de cada partida.
+
+        Returns:
+            tuple: (resultados por partida, partidas a buscar con el formato anterior).
+        """
+        resultados = {}
+        anteriores = []
+        for slot_id in slots:
+            registro = registros[slot_id]
+            if isinstance(registro, Exception):
+                resultados[slot_id] = (None, self._mensaje_error_carga(registro))
+                continue
+            self.__versiones__[slot_id] = registro[2]
+            if registro[0] is None:
+                anteriores.append(slot_id)
+            else:
+                self.__registros__[slot_id] = registro
+                resultados[slot_id] = (desaplanar_estado(registro[0]),
+                                       f"Partida cargada desde '{slot_id}'.")
+        return resultados, anteriores
+
+    def _resultados_anteriores(self, resultados: dict, anteriores: list, valores: list) -> None:
+        """
+        Completa los resultados de las partidas con el formato anterior (MGET).
+
+        Args:
+            resultados: Resultados por partida, se completan en el lugar.
+            anteriores: Partidas pedidas con MGET.
+            valores: Respuesta de MGET.
+        """
+        for slot_id, datos in zip(anteriores, valores):
+            if not datos:
+                resultados[slot_id] = (None, f"No se encontró partida guardada en '{slot_id}'.")
+                continue
+            try:
+                # Convertir de nuevo a objeto (binario o JSON)
+                resultados[slot_id] = (deserializar_partida(datos),
+                                       f"Partida cargada desde '{slot_id}'.")
+            except ValueError as e:
+                resultados[slot_id] = (None, self._mensaje_error_carga(e))
+
+    @staticmethod
+    def _validar_cursor(cursor, limite: int) -> None:
+        """
+        Valida los argumentos de listar_partidas.
+
+        Raises:
+            ValueError: Si el cursor no es 0 ni un cursor (guardada, slot), o
+                el límite es menor que 1.
+        """
+        if limite < 1:
+            raise ValueError("El límite debe ser >= 1")
+        if cursor != 0 and not (isinstance(cursor, tuple) and len(cursor) == 2):
+            raise ValueError(f"Cursor de listado inválido: {cursor!r}")
+
+    @staticmethod
+    def _pedir_pagina(pipe, cursor, limite: int, posicion: tuple | None,
+                      filtrar: bool = False) -> bool:
+        """
+        Encola en `pipe` la lectura de una página del índice (una partida de
+        más para saber si hay otra página).
+
+        El cursor (guardada, slot) es la última partida listada. En el sorted
+        set las partidas con el mismo puntaje (las de un mismo lote) quedan
+        ordenadas por slot de mayor a menor, así que la página sigue con las
+        empatadas de slot menor y después con las más antiguas:
+        - Sin `posicion` solo se pide dónde está el cursor: su puntaje, su
+          rango y cuántas partidas son más nuevas.
+        - Si el slot del cursor sigue con ese puntaje, ZREVRANGEBYSCORE con
+          LIMIT saltea las empatadas hasta él (O(log N + página)); la
+          posición se vuelve a pedir para confirmar que nada se movió.
+        - Si se volvió a guardar, se borró o `filtrar` es True, se piden las
+          empatadas para filtrarlas por slot.
+
+        Returns:
+            bool: True si la página se pidió por rango (ver _leer_pagina).
+        """
+        if cursor == 0:
+            pipe.zrevrangebyscore(CLAVE_INDICE, "+inf", "-inf", start=0, num=limite + 1,
+                                  withscores=True)
+            return False
+        guardada, ultimo = cursor
+        pipe.zscore(CLAVE_INDICE, ultimo)
+        pipe.zrevrank(CLAVE_INDICE, ultimo)
+        pipe.zcount(CLAVE_INDICE, f"({guardada!r}", "+inf")
+        if posicion is None:
+            return False
+        puntaje, rango, mas_nuevas = posicion
+        if puntaje == guardada and not filtrar:
+            pipe.zrevrangebyscore(CLAVE_INDICE, guardada, "-inf", start=rango - mas_nuevas + 1,
+                                  num=limite + 1, withscores=True)
+            return True
+        pipe.zrevrangebyscore(CLAVE_INDICE, guardada, guardada, withscores=True)
+        pipe.zrevrangebyscore(CLAVE_INDICE, f"({guardada!r}", "-inf", start=0, num=limite + 1,
+                              withscores=True)
+        return False
+
+    @staticmethod
+    def _leer_pagina(respuestas: list, cursor, limite: int, posicion: tuple | None,
+                     por_rango: bool) -> tuple[list | None, tuple | None]:
+        """
+        Interpreta las respuestas de lo encolado por _pedir_pagina.
+
+        Returns:
+            tuple: (miembros de la página con sus puntajes, o None si hay que
+            volver a pedirla con la posición nueva; posición del cursor).
+        """
+        if cursor == 0:
+            return respuestas[0], None
+        actual = tuple(respuestas[:3])
+        if posicion is None:
+            return None, actual
+        if por_rango:
+            return (respuestas[3] if actual == posicion else None), actual
+        empatadas, anteriores = respuestas[3:]
+        ultimo = cursor[1]
+        siguen = [(slot_id, puntaje) for slot_id, puntaje in empatadas
+                  if RegistroPartidas._texto(slot_id) < ultimo]
+        return (siguen + anteriores)[:limite + 1], actual
+
+    @staticmethod
+    def _siguiente_cursor(miembros: list, limite: int) -> tuple | None:
+        """Cursor (guardada, slot) de la última partida de la página, o None si es la última."""
+        if len(miembros) <= limite:
+            return None
+        slot_id, guardada = miembros[limite - 1]
+        return float(guardada), RegistroPartidas._texto(slot_id)
+
+    @staticmethod
+    def _armar_listado(miembros: list, metadatos: list) -> list[dict]:
+        """
+        Arma las partidas de una página del listado.
+
+        Args:
+            miembros: Respuesta de ZREVRANGEBYSCORE con puntajes ((slot, guardada)).
+            metadatos: Respuesta de HGETALL "<slot>:meta" de cada una.
+
+        Returns:
+            list[dict]: Ver AlmacenPartidas.listar_partidas.
+        """
+        partidas = []
+        for (slot_id, guardada), hash_meta in zip(miembros, metadatos):
+            if not hash_meta:
+                # Venció: compactar_finalizadas la quita del índice
+                continue
+            partida = {RegistroPartidas._texto(clave): RegistroPartidas._texto(valor)
+                       for clave, valor in hash_meta.items()}
+            partida.pop("compactada", None)
+            for campo in CAMPOS_ENTEROS:
+                partida[campo] = int(partida.get(campo, 0))
+            partida["slot"] = RegistroPartidas._texto(slot_id)
+            partida["guardada"] = float(guardada)
+            partidas.append(partida)
+        return partidas
+
+    @staticmethod
+    def _comprimir_eventos(eventos: list) -> bytes:
+        """Comprime eventos (JSON de una línea) para el hash "<slot>:archivo"."""
+        return zlib.compress(b"\n".join(eventos), 9)
+
+    @staticmethod
+    def _descomprimir_eventos(datos) -> list:
+        """
+        Eventos archivados por compactación ([] si no hay archivo).
+
+        Raises:
+            ValueError: Si el archivo está corrupto.
+        """
+        if not datos:
+            return []
+        try:
+            return zlib.decompress(datos).split(b"\n")
+        except zlib.error as e:
+            raise ValueError(f"archivo de eventos corrupto: {e}") from e
+
+    @staticmethod
+    def _armar_historial(slot_id: str, archivados, eventos: list) -> tuple[list[dict], str]:
+        """
+        Reproduce los eventos de una partida desde el primero, empezando por
+        los archivados si se compactó.
+
+        Raises:
+            ValueError: Si un evento o el archivo están corruptos.
+        """
+        plano = {}
+        historial = []
+        for evento in RegistroPartidas._descomprimir_eventos(archivados) + list(eventos):
+            aplicar_evento(plano, decodificar_evento(evento))
+            historial.append(desaplanar_estado(plano))
+        return historial, f"{len(historial)} estados en '{slot_id}'."
+
+
+class RedisManager(RegistroPartidas, AlmacenPartidas):
     """
     Gestiona la conexión y la lógica para guardar/cargar el estado del juego
     en una base de datos Redis.
-    
+
+    La conexión se abre recién en el primer uso, desde un ConnectionPool
+    compartido. Si falla, los pedidos devuelven error enseguida mientras un
+    hilo de fondo reintenta conectar cada `reintento_segundos`. El formato de
+    guardado (eventos y snapshots) está en RegistroPartidas.
+
     SRP: Su única responsabilidad es la persistencia de datos.
-    DIP: Las interfaces (UI/CLI) dependerán de esta abstracción, no de Redis directamente.
+    DIP: Implementa AlmacenPartidas; las interfaces (UI/CLI) no dependen de Redis directamente.
     """
-    
-    def __init__(self, client=None):
+
+    def __init__(self, client=None, host: str = 'localhost', port: int = 6379, db: int = 0,
+                 max_conexiones: int = 8, timeout_conexion: float = 0.5,
+                 timeout_socket: float = 2.0, reintento_segundos: float = 5.0,
+                 formato: str = "binario", snapshot_cada: int = 20,
+                 retencion: dict | None = None):
         """
-        Inicializa la conexión con Redis.
-        
+        Prepara la conexión con Redis sin conectarse todavía.
+
         Si se provee un 'client' (para testing), lo utiliza.
-        Si no, crea una conexión real a localhost.
+        Si no, la conexión real se crea en el primer uso.
+
+        Args:
+            client: Cliente Redis ya creado (p. ej. fakeredis), o None.
+            host: Servidor Redis.
+            port: Puerto del servidor.
+            db: Número de base de datos.
+            max_conexiones: Tamaño máximo del pool compartido.
+            timeout_conexion: Segundos máximos para conectar.
+            timeout_socket: Segundos máximos de espera por cada comando.
+            reintento_segundos: Pausa entre reintentos de conexión en segundo plano.
+            formato: "binario" (SaveCodec, con JSON si no se puede representar) o "json".
+                Al cargar, el formato se detecta solo.
+            snapshot_cada: Cantidad de eventos entre snapshots completos.
+            retencion: clase -> segundos de vida (ver RETENCION_POR_DEFECTO).
+
+        Raises:
+            ValueError: Si el formato, snapshot_cada o la retención no son válidos.
         """
+        super().__init__(formato, snapshot_cada, retencion)
+        self.__redis_db__ = client # <-- ¡¡DOBLE GUIÓN BAJO!!
+        self.__config_pool__ = (host, port, db, max_conexiones, timeout_conexion, timeout_socket)
+        self.__reintento_segundos__ = reintento_segundos
+        self.__lock__ = threading.Lock()
+        self.__intentado__ = client is not None
+        self.__hilo_reconexion__ = None
+        # Algunos servidores (y fakeredis) no tienen MEMORY USAGE: se mide con DUMP
+        self.__sin_memory_usage__ = False
         if client:
             # Cliente inyectado (usado para tests con fakeredis)
-            self.__redis_db__ = client # <-- ¡¡DOBLE GUIÓN BAJO!!
             print("Conectado a Redis (cliente inyectado, modo Test).")
-        else:
-            # Conexión real (usada en producción)
-            self.__redis_db__ = None # <-- ¡¡DOBLE GUIÓN BAJO!!
+
+    @property
+    def client(self):
+        """
+        Cliente Redis conectado, o None si no hay conexión.
+        El primer acceso intenta conectar.
+        """
+        return self.__obtener_cliente()
+
+    @client.setter
+    def client(self, client) -> None:
+        """Reemplaza el cliente (por ejemplo, por uno de fakeredis en los tests)."""
+        with self.__lock__:
+            self.__redis_db__ = client
+            self.__intentado__ = True
+
+    def esta_conectado(self) -> bool:
+        """
+        Indica si hay un cliente conectado, sin intentar conectar.
+
+        Returns:
+            bool: True si hay conexión activa.
+        """
+        return self.__redis_db__ is not None
+
+    def __crear_cliente(self):
+        """
+        Crea un cliente sobre el pool compartido y comprueba la conexión.
+
+        Returns:
+            redis.Redis: Cliente que respondió al ping.
+
+        Raises:
+            redis.exceptions.ConnectionError: Si Redis no responde.
+            redis.exceptions.TimeoutError: Si se agota el tiempo de conexión.
+        """
+        cliente = redis.Redis(connection_pool=obtener_pool(*self.__config_pool__))
+        cliente.ping()
+        return cliente
+
+    def __obtener_cliente(self):
+        """
+        Devuelve el cliente conectado; en el primer uso intenta conectar.
+
+        Returns:
+            redis.Redis | None: Cliente, o None si no hay conexión (en ese caso
+            hay un hilo reintentando en segundo plano).
+        """
+        with self.__lock__:
+            if self.__redis_db__ is not None or self.__intentado__:
+                return self.__redis_db__
+            self.__intentado__ = True
+        try:
+            cliente = self.__crear_cliente()
+            print("Conectado a Redis exitosamente (desde RedisManager).")
+        except ERRORES_CONEXION as e:
+            print(f"Error al conectar con Redis: {e}")
+            print("Se reintentará la conexión en segundo plano.")
+            self.__marcar_desconectado()
+            return None
+        with self.__lock__:
+            self.__redis_db__ = cliente
+        return cliente
+
+    def __marcar_desconectado(self) -> None:
+        """Descarta el cliente actual e inicia el hilo de reconexión si no corre ya."""
+        with self.__lock__:
+            self.__redis_db__ = None
+            if self.__hilo_reconexion__ is not None and self.__hilo_reconexion__.is_alive():
+                return
+            self.__hilo_reconexion__ = threading.Thread(target=self.__reconectar,
+                                                        name="RedisReconexion", daemon=True)
+            self.__hilo_reconexion__.start()
+
+    def __reconectar(self) -> None:
+        """Hilo de fondo: reintenta conectar hasta lograrlo."""
+        while True:
+            time.sleep(self.__reintento_segundos__)
             try:
-                # decode_responses=True es clave para que devuelva strings
-                self.__redis_db__ = redis.Redis(host='localhost', port=6379, decode_responses=True) # <-- ¡¡DOBLE GUIÓN BAJO!!
-                self.__redis_db__.ping()
-                print("Conectado a Redis exitosamente (desde RedisManager).")
-            except redis.exceptions.ConnectionError as e:
-                print(f"Error al conectar con Redis: {e}")
-                print("Funcionalidad de Guardar/Cargar estará desactivada.")
-                self.__redis_db__ = None # <-- ¡¡DOBLE GUIÓN BAJO!!
+                cliente = self.__crear_cliente()
+            except ERRORES_CONEXION:
+                continue
+            with self.__lock__:
+                if self.__redis_db__ is None:
+                    self.__redis_db__ = cliente
+            print("Reconectado a Redis.")
+            return
 
-    def guardar_partida(self, slot_id: str, estado_completo: dict) -> tuple[bool, str]:
+    def guardar_partida(self, slot_id: str, estado_completo: dict,
+                        sobrescribir: bool = False) -> tuple[bool, str]:
         """
-        Guarda un diccionario de estado del juego en Redis como JSON.
+        Agrega al registro de la partida un evento con lo que cambió desde el
+        último guardado y, cada `snapshot_cada` eventos, un snapshot completo
+        (binario o JSON según `formato`). Es un RPUSH pequeño en lugar de
+        reescribir todo el estado.
+        """
+        return self.guardar_partidas({slot_id: estado_completo}, sobrescribir)[slot_id]
+
+    def guardar_partidas(self, estados: dict, sobrescribir: bool = False) -> dict:
+        """
+        Guarda varias partidas a la vez: lee con dos pipelines el registro de
+        las partidas que todavía no conoce y escribe todos los eventos y
+        snapshots en una sola transacción (MULTI/EXEC) vigilada con WATCH.
+        Guardar 1.000 partidas son a lo sumo cuatro pipelines.
+
+        Cada partida se guarda solo si su versión en Redis es la última que
+        este manager cargó o guardó (ver RegistroPartidas._separar_conflictos);
+        si no, su resultado es un conflicto (Storage.es_conflicto) y las demás
+        se guardan igual. Si otra escritura toca alguna partida entre el WATCH
+        y el EXEC, la transacción se repite (hasta INTENTOS_TRANSACCION veces)
+        y esa partida queda en conflicto.
+
+        Args:
+            estados: slot -> estado completo.
+            sobrescribir: Si es True, pisa lo guardado aunque este manager no
+                haya cargado la última versión (relee el registro antes).
+
+        Returns:
+            dict: slot -> (éxito, mensaje), en el mismo orden que `estados`.
         """
-        if not self.__redis_db__: # <-- ¡¡DOBLE GUIÓN BAJO!!
-            return False, "Error: No hay conexión a Redis."
+        cliente = self.__obtener_cliente()
+        if not cliente:
+            return {slot_id: (False, "Error: No hay conexión a Redis.") for slot_id in estados}
 
+        resultados = {}
         try:
-            # Convertir objeto a JSON string
-            json_data = json.dumps(estado_completo)
-            self.__redis_db__.set(slot_id, json_data) # <-- ¡¡DOBLE GUIÓN BAJO!!
-            return True, f"Partida guardada en '{slot_id}'."
-        except TypeError as e:
-            # Error común si el objeto no es serializable
-            return False, f"Error al guardar partida (JSON no serializable): {e}"
+            if sobrescribir:
+                self._olvidar_registros(estados)
+            registros, faltantes = self._registros_conocidos(estados)
+            if faltantes:
+                registros.update(self.__leer_registros(cliente, faltantes))
+            for _ in range(INTENTOS_TRANSACCION):
+                try:
+                    resultados, reparaciones = self.__guardar_condicional(cliente, estados, registros,
+                                                                          sobrescribir)
+                    break
+                except redis.exceptions.WatchError:
+                    continue
+            else:
+                return self._conflicto_persistente(estados)
+            if reparaciones:
+                pipe = cliente.pipeline()
+                self._preparar_reparacion(pipe, reparaciones)
+                pipe.execute()
         except Exception as e:
-            return False, f"Error al guardar partida: {e}"
+            if isinstance(e, ERRORES_CONEXION):
+                self.__marcar_desconectado()
+            return self._fallo_guardado(estados, resultados, e)
+        return {slot_id: resultados[slot_id] for slot_id in estados}
+
+    def __guardar_condicional(self, cliente, estados: dict, registros: dict,
+                              sobrescribir: bool) -> tuple[dict, list]:
+        """
+        Hace WATCH sobre los metadatos de las partidas, lee sus versiones y
+        guarda en una transacción las que no están en conflicto.
+
+        Returns:
+            tuple: (resultados por partida, partidas a reparar).
+
+        Raises:
+            redis.exceptions.WatchError: Si otra escritura tocó alguna partida antes del EXEC.
+        """
+        with cliente.pipeline() as pipe:
+            pipe.watch(*[self.clave_metadatos(slot_id) for slot_id in estados])
+            lectura = cliente.pipeline(transaction=False)
+            for slot_id in estados:
+                lectura.hget(self.clave_metadatos(slot_id), "version")
+            conflictos, libres = self._separar_conflictos(estados, registros, lectura.execute(),
+                                                          sobrescribir)
+            pipe.multi()
+            resultados, pendientes = self._preparar_guardado(pipe, libres, registros)
+            respuestas = pipe.execute(raise_on_error=False) if pendientes else []
+        self._olvidar_registros(conflictos)
+        resultados.update(conflictos)
+        return resultados, self._registrar_guardado(resultados, pendientes, respuestas)
 
     def cargar_partida(self, slot_id: str) -> tuple[dict | None, str]:
         """
-        Carga un estado del juego desde Redis y lo devuelve como diccionario.
+        Carga un estado del juego desde Redis y lo devuelve como diccionario:
+        último snapshot más los eventos posteriores. Si la partida no tiene
+        registro de eventos, lee el formato anterior (una clave con el estado
+        completo, binario o JSON).
         """
-        if not self.__redis_db__: # <-- ¡¡DOBLE GUIÓN BAJO!!
-            return None, "Error: No hay conexión a Redis."
+        return self.cargar_partidas([slot_id])[slot_id]
+
+    def cargar_partidas(self, slots: list) -> dict:
+        """
+        Carga varias partidas a la vez: dos pipelines para snapshots y eventos
+        y un MGET para las guardadas con el formato anterior.
+
+        Args:
+            slots: Slots a cargar.
+
+        Returns:
+            dict: slot -> (estado o None, mensaje), en el orden de `slots`.
+        """
+        slots = list(dict.fromkeys(slots))
+        cliente = self.__obtener_cliente()
+        if not cliente:
+            return {slot_id: (None, "Error: No hay conexión a Redis.") for slot_id in slots}
 
         try:
-            # Obtener JSON string desde Redis
-            json_data = self.__redis_db__.get(slot_id) # <-- ¡¡DOBLE GUIÓN BAJO!!
-            if not json_data:
-                return None, f"No se encontró partida guardada en '{slot_id}'."
-            
-            # Convertir JSON string de nuevo a objeto
-            estado_completo = json.loads(json_data)
-            return estado_completo, f"Partida cargada desde '{slot_id}'."
-        
-        except json.JSONDecodeError as e:
-            # Error común si los datos en Redis están corruptos
-             return None, f"Error al cargar partida (JSON corrupto): {e}"
+            registros = self.__leer_registros(cliente, slots)
+            resultados, anteriores = self._resultados_carga(slots, registros)
+            # Formato anterior: el estado completo en la clave del slot
+            valores = cliente.mget(anteriores) if anteriores else []
+            self._resultados_anteriores(resultados, anteriores, valores)
         except Exception as e:
-            return None, f"Error al cargar partida: {e}"
\ No newline at end of file
+            if isinstance(e, ERRORES_CONEXION):
+                self.__marcar_desconectado()
+            return {slot_id: (None, self._mensaje_error_carga(e)) for slot_id in slots}
+        return {slot_id: resultados[slot_id] for slot_id in slots}
+
+    def __leer_registros(self, cliente, slots: list) -> dict:
+        """
+        Lee versiones, snapshots y eventos de varias partidas con dos
+        pipelines (dos viajes a Redis sin importar la cantidad de partidas).
+        La versión se lee antes que los eventos: si otro proceso guarda en el
+        medio, el próximo guardado da conflicto en lugar de pisarlo.
+
+        Returns:
+            dict: Ver RegistroPartidas._armar_registros.
+        """
+        pipe = cliente.pipeline(transaction=False)
+        for slot_id in slots:
+            pipe.hget(self.clave_metadatos(slot_id), "version")
+            pipe.hgetall(self.clave_snapshot(slot_id))
+        respuestas = pipe.execute()
+        versiones, snapshots = respuestas[0::2], respuestas[1::2]
+
+        pipe = cliente.pipeline(transaction=False)
+        for slot_id, snapshot in zip(slots, snapshots):
+            pipe.lrange(self.clave_eventos(slot_id), self._indice_snapshot(snapshot), -1)
+        return self._armar_registros(slots, snapshots, pipe.execute(), versiones)
+
+    def listar_partidas(self, cursor: int | tuple = 0, limite: int = LIMITE_LISTADO
+                        ) -> tuple[list[dict] | None, tuple | None, str]:
+        """
+        Lista una página de partidas del índice, de la más reciente a la más
+        antigua: ZREVRANGEBYSCORE con LIMIT (O(log N + página)) y un pipeline
+        con los metadatos de la página. Nunca usa KEYS ni recorre todas las
+        partidas.
+
+        El cursor es la clave (guardada, slot) de la última partida de la
+        página, como en SQLiteManager: un guardado entre dos páginas no hace
+        repetir ni saltear otras partidas. Ver _pedir_pagina.
+
+        Args:
+            cursor: 0 para la primera página, o el cursor devuelto por la anterior.
+            limite: Cantidad máxima de partidas de la página.
+
+        Returns:
+            tuple: (partidas o None si falla, cursor siguiente o None, mensaje).
+
+        Raises:
+            ValueError: Si el cursor no es 0 ni un cursor (guardada, slot), o
+                el límite es menor que 1.
+        """
+        self._validar_cursor(cursor, limite)
+        cliente = self.__obtener_cliente()
+        if not cliente:
+            return None, None, "Error: No hay conexión a Redis."
+
+        try:
+            posicion = None
+            # Si el cursor se mueve entre la posición y la página, se repite;
+            # el último intento filtra las empatadas, que no depende del rango
+            for intento in range(INTENTOS_TRANSACCION + 2):
+                pipe = cliente.pipeline()
+                por_rango = self._pedir_pagina(pipe, cursor, limite, posicion,
+                                               filtrar=intento > INTENTOS_TRANSACCION)
+                miembros, posicion = self._leer_pagina(pipe.execute(), cursor, limite,
+                                                       posicion, por_rango)
+                if miembros is not None:
+                    break
+            pipe = cliente.pipeline(transaction=False)
+            for slot_id, _ in miembros[:limite]:
+                pipe.hgetall(self.clave_metadatos(self._texto(slot_id)))
+            metadatos = pipe.execute()
+        except ERRORES_CONEXION as e:
+            self.__marcar_desconectado()
+            return None, None, f"Error al listar partidas (sin conexión a Redis): {e}"
+        partidas = self._armar_listado(miembros[:limite], metadatos)
+        return partidas, self._siguiente_cursor(miembros, limite), f"{len(partidas)} partidas guardadas."
+
+    def obtener_historial(self, slot_id: str) -> tuple[list[dict] | None, str]:
+        """
+        Reproduce la partida desde el primer evento para repetición o análisis.
+
+        Returns:
+            tuple: (lista con el estado después de cada guardado, o None si
+            falla, y un mensaje).
+        """
+        cliente = self.__obtener_cliente()
+        if not cliente:
+            return None, "Error: No hay conexión a Redis."
+
+        try:
+            pipe = cliente.pipeline(transaction=False)
+            pipe.hget(self.clave_archivo(slot_id), "eventos")
+            pipe.lrange(self.clave_eventos(slot_id), 0, -1)
+            return self._armar_historial(slot_id, *pipe.execute())
+        except ERRORES_CONEXION as e:
+            self.__marcar_desconectado()
+            return None, f"Error al leer historial (sin conexión a Redis): {e}"
+        except ValueError as e:
+            return None, f"Error al leer historial (evento corrupto): {e}"
+
+    def compactar_finalizadas(self, lote: int = 100) -> tuple[int | None, str]:
+        """
+        Trabajo de mantenimiento: compacta las partidas finalizadas y quita
+        del índice las que vencieron.
+
+        Recorre CLAVE_INDICE de a `lote` partidas (ZRANGE por posición, nunca
+        KEYS). De cada partida finalizada sin compactar pasa los eventos,
+        comprimidos con zlib, al hash "<slot>:archivo", escribe el estado final
+        como snapshot y borra la lista de eventos: cargarla es un HGETALL y
+        obtener_historial la sigue reproduciendo completa. La retención de la
+        clase "finalizada" se cuenta desde la compactación.
+
+        Cada lote se escribe en una transacción con WATCH sobre sus partidas:
+        si otro proceso guarda una de ellas en el medio, el lote queda para la
+        próxima corrida.
+
+        Args:
+            lote: Partidas del índice leídas por viaje.
+
+        Returns:
+            tuple: (partidas compactadas o None si falla, mensaje).
+
+        Raises:
+            ValueError: Si el lote es menor que 1.
+        """
+        if lote < 1:
+            raise ValueError("El lote debe ser al menos 1")
+        cliente = self.__obtener_cliente()
+        if not cliente:
+            return None, "Error: No hay conexión a Redis."
+
+        compactadas = quitadas = 0
+        inicio = 0
+        try:
+            while True:
+                slots = [self._texto(slot_id)
+                         for slot_id in cliente.zrange(CLAVE_INDICE, inicio, inicio + lote - 1)]
+                if not slots:
+                    break
+                pipe = cliente.pipeline(transaction=False)
+                for slot_id in slots:
+                    pipe.hmget(self.clave_metadatos(slot_id), "clase", "compactada")
+                campos = pipe.execute()
+                vencidas = [slot_id for slot_id, (clase, _) in zip(slots, campos) if clase is None]
+                finalizadas = [slot_id for slot_id, (clase, compactada) in zip(slots, campos)
+                               if self._texto(clase) == "finalizada"
+                               and self._texto(compactada) != "1"]
+                lote_compactadas, lote_quitadas = (
+                    self.__compactar_lote(cliente, finalizadas, vencidas)
+                    if finalizadas or vencidas else (0, 0))
+                compactadas += lote_compactadas
+                quitadas += lote_quitadas
+                # Las quitadas del índice corren las posiciones siguientes
+                inicio += len(slots) - lote_quitadas
+        except ERRORES_CONEXION as e:
+            self.__marcar_desconectado()
+            return None, f"Error al compactar partidas (sin conexión a Redis): {e}"
+        return compactadas, (f"{compactadas} partidas compactadas, "
+                             f"{quitadas} vencidas quitadas del índice.")
+
+    def __compactar_lote(self, cliente, finalizadas: list, vencidas: list) -> tuple[int, int]:
+        """
+        Compacta las partidas finalizadas de un lote y quita del índice las
+        vencidas, en una sola transacción vigilada con WATCH.
+
+        Returns:
+            tuple: (compactadas, quitadas del índice); (0, 0) si otro proceso
+            tocó alguna partida del lote.
+        """
+        hechas = []
+        with cliente.pipeline() as pipe:
+            try:
+                pipe.watch(*[self.clave_eventos(slot_id) for slot_id in finalizadas],
+                           *[self.clave_metadatos(slot_id) for slot_id in finalizadas + vencidas])
+                lectura = cliente.pipeline(transaction=False)
+                for slot_id in finalizadas:
+                    lectura.hgetall(self.clave_snapshot(slot_id))
+                    lectura.lrange(self.clave_eventos(slot_id), 0, -1)
+                    lectura.hget(self.clave_archivo(slot_id), "eventos")
+                respuestas = lectura.execute()
+                snapshots, colas, archivados = respuestas[0::3], respuestas[1::3], respuestas[2::3]
+                registros = self._armar_registros(
+                    finalizadas, snapshots,
+                    [cola[self._indice_snapshot(snapshot):]
+                     for snapshot, cola in zip(snapshots, colas)])
+
+                pipe.multi()
+                for slot_id, cola, archivado in zip(finalizadas, colas, archivados):
+                    registro = registros[slot_id]
+                    if isinstance(registro, Exception) or registro[0] is None:
+                        continue
+                    try:
+                        eventos = self._descomprimir_eventos(archivado) + cola
+                    except ValueError:
+                        # Se deja como está: obtener_historial informa el error
+                        continue
+                    pipe.hset(self.clave_archivo(slot_id),
+                              mapping={"eventos": self._comprimir_eventos(eventos),
+                                       "cantidad": len(eventos)})
+                    pipe.hset(self.clave_snapshot(slot_id),
+                              mapping={"indice": 0,
+                                       "estado": serializar_partida(desaplanar_estado(registro[0]),
+                                                                    self.__formato__)})
+                    pipe.delete(self.clave_eventos(slot_id))
+                    pipe.hset(self.clave_metadatos(slot_id), "compactada", 1)
+                    self._encolar_retencion(pipe, "finalizada", self.claves_partida(slot_id))
+                    hechas.append(slot_id)
+                if vencidas:
+                    pipe.zrem(CLAVE_INDICE, *vencidas)
+                pipe.execute()
+            except redis.exceptions.WatchError:
+                return 0, 0
+        self._olvidar_registros(hechas)
+        return len(hechas), len(vencidas)
+
+    def reporte_memoria(self, lote: int = 500) -> tuple[dict | None, str]:
+        """
+        Bytes que ocupa cada clase de partida, para mantener un despliegue
+        largo dentro de un presupuesto fijo de memoria de Redis.
+
+        Recorre el índice de a `lote` partidas: un pipeline con la clase de
+        cada una y otro con MEMORY USAGE de sus cuatro claves. Si el servidor
+        no tiene MEMORY USAGE se usa el largo de DUMP (el tamaño serializado,
+        algo menor que lo que ocupa en memoria). Las partidas vencidas no se
+        cuentan.
+
+        Args:
+            lote: Partidas del índice medidas por viaje.
+
+        Returns:
+            tuple: ({clase: {"partidas", "bytes"}} para cada una de
+            CLASES_PARTIDA más "indice" (el sorted set), o None si falla, y un
+            mensaje con el total).
+
+        Raises:
+            ValueError: Si el lote es menor que 1.
+        """
+        if lote < 1:
+            raise ValueError("El lote debe ser al menos 1")
+        cliente = self.__obtener_cliente()
+        if not cliente:
+            return None, "Error: No hay conexión a Redis."
+
+        reporte = {clase: {"partidas": 0, "bytes": 0} for clase in CLASES_PARTIDA}
+        inicio = 0
+        try:
+            while True:
+                slots = [self._texto(slot_id)
+                         for slot_id in cliente.zrange(CLAVE_INDICE, inicio, inicio + lote - 1)]
+                if not slots:
+                    break
+                inicio += len(slots)
+                pipe = cliente.pipeline(transaction=False)
+                for slot_id in slots:
+                    pipe.hget(self.clave_metadatos(slot_id), "clase")
+                clases = pipe.execute()
+                medidas = self.__medir(cliente, [clave for slot_id in slots
+                                                 for clave in self.claves_partida(slot_id)])
+                for numero, clase in enumerate(clases):
+                    clase = self._texto(clase)
+                    if clase in reporte:
+                        reporte[clase]["partidas"] += 1
+                        reporte[clase]["bytes"] += sum(medidas[numero * 4:numero * 4 + 4])
+            reporte["indice"] = {"partidas": cliente.zcard(CLAVE_INDICE),
+                                 "bytes": self.__medir(cliente, [CLAVE_INDICE])[0]}
+        except ERRORES_CONEXION as e:
+            self.__marcar_desconectado()
+            return None, f"Error al medir memoria (sin conexión a Redis): {e}"
+        total = sum(categoria["bytes"] for categoria in reporte.values())
+        return reporte, f"{total} bytes en {reporte['indice']['partidas']} partidas."
+
+    def __medir(self, cliente, claves: list) -> list[int]:
+        """
+        Bytes de cada clave (0 si no existe) con un pipeline de MEMORY USAGE,
+        o de DUMP si el servidor no tiene MEMORY USAGE.
+        """
+        if not self.__sin_memory_usage__:
+            pipe = cliente.pipeline(transaction=False)
+            for clave in claves:
+                pipe.memory_usage(clave)
+            medidas = pipe.execute(raise_on_error=False)
+            if not any(isinstance(medida, redis.exceptions.ResponseError) for medida in medidas):
+                return [medida or 0 for medida in medidas]
+            self.__sin_memory_usage__ = True
+        pipe = cliente.pipeline(transaction=False)
+        for clave in claves:
+            pipe.dump(clave)
+        return [len(volcado) if volcado else 0 for volcado in pipe.execute()]
@@ -0,0 +1,207 @@
+import json
+import sqlite3
+import threading
+import time
+from Backgammon.Persistence.SaveCodec import serializar_partida, deserializar_partida
+from Backgammon.Persistence.Storage import (AlmacenPartidas, LIMITE_LISTADO, calcular_metadatos,
+                                            mensaje_error_carga)
+
+# Slots por consulta "IN (...)"; SQLite antiguo admite hasta 999 parámetros
+SLOTS_POR_CONSULTA = 500
+# Columnas agregadas después de la primera versión de la tabla (se agregan al abrir)
+COLUMNAS_AGREGADAS = {"jugada": "INTEGER NOT NULL DEFAULT 0",
+                      "metadatos": "TEXT NOT NULL DEFAULT '{}'"}
+
+
+class SQLiteManager(AlmacenPartidas):
+    """
+    Guarda las partidas en un archivo SQLite local, sin servicio de red
+    (kioscos sin conexión, CI).
+
+    Cada partida es una fila (slot, datos, guardada, jugada, metadatos) con
+    el estado completo serializado por SaveCodec y los metadatos del listado
+    en JSON; un índice por fecha de guardado sirve a listar_partidas.
+    Guardar varias partidas es una sola transacción; la base usa WAL y
+    synchronous=NORMAL, así cada commit es una escritura secuencial al log
+    sin esperar a que se reescriba la base.
+
+    SRP: Solo persiste partidas en SQLite.
+    LSP: Mismo contrato y mensajes que RedisManager.
+    """
+
+    def __init__(self, ruta: str = "partidas.db", formato: str = "binario"):
+        """
+        Prepara el almacenamiento sin abrir la base todavía.
+
+        Args:
+            ruta: Archivo de la base (":memory:" para una base en memoria).
+            formato: "binario" (SaveCodec, con JSON si no se puede representar) o "json".
+
+        Raises:
+            ValueError: Si el formato no es "binario" ni "json".
+        """
+        if formato not in ("binario", "json"):
+            raise ValueError(f"Formato de guardado desconocido: {formato}")
+        self.__ruta__ = ruta
+        self.__formato__ = formato
+        self.__conexion__ = None
+        # La UI guarda desde el hilo de StorageWorker
+        self.__lock__ = threading.Lock()
+
+    def __obtener_conexion(self) -> sqlite3.Connection:
+        """
+        Devuelve la conexión, abriéndola y creando la tabla en el primer uso.
+        Debe llamarse con el lock tomado.
+
+        Raises:
+            sqlite3.Error: Si no se puede abrir la base.
+        """
+        if self.__conexion__ is None:
+            conexion = sqlite3.connect(self.__ruta__, check_same_thread=False)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            conexion.execute("CREATE TABLE IF NOT EXISTS partidas ("
+                             "slot TEXT PRIMARY KEY, datos BLOB NOT NULL, guardada REAL NOT NULL)")
+            existentes = {fila[1] for fila in conexion.execute("PRAGMA table_info(partidas)")}
+            for columna, definicion in COLUMNAS_AGREGADAS.items():
+                if columna not in existentes:
+                    conexion.execute(f"ALTER TABLE partidas ADD COLUMN {columna} {definicion}")
+            conexion.execute("CREATE INDEX IF NOT EXISTS partidas_por_fecha "
+                             "ON partidas (guardada DESC, slot)")
+            conexion.commit()
+            self.__conexion__ = conexion
+        return self.__conexion__
+
+    def cerrar(self) -> None:
+        """Cierra la conexión (se vuelve a abrir sola en el próximo uso)."""
+        with self.__lock__:
+            if self.__conexion__ is not None:
+                self.__conexion__.close()
+                self.__conexion__ = None
+
+    def guardar_partidas(self, estados: dict, sobrescribir: bool = False) -> dict:
+        """
+        Guarda varias partidas en una sola transacción (un único commit).
+
+        Args:
+            estados: slot -> estado completo.
+            sobrescribir: Se ignora: este backend no tiene versiones y siempre sobrescribe.
+
+        Returns:
+            dict: slot -> (éxito, mensaje), en el mismo orden que `estados`.
+        """
+        resultados = {}
+        filas = []
+        guardada = time.time()
+        for slot_id, estado_completo in estados.items():
+            try:
+                filas.append((slot_id, serializar_partida(estado_completo, self.__formato__),
+                              guardada, json.dumps(calcular_metadatos(estado_completo))))
+            except TypeError as e:
+                # Error común si el objeto no es serializable
+                resultados[slot_id] = (False, f"Error al guardar partida (JSON no serializable): {e}")
+
+        if filas:
+            try:
+                with self.__lock__:
+                    conexion = self.__obtener_conexion()
+                    with conexion:
+                        conexion.executemany(
+                            "INSERT INTO partidas (slot, datos, guardada, jugada, metadatos) "
+                            "VALUES (?, ?, ?, 1, ?) "
+                            "ON CONFLICT(slot) DO UPDATE SET datos = excluded.datos, "
+                            "guardada = excluded.guardada, jugada = partidas.jugada + 1, "
+                            "metadatos = excluded.metadatos", filas)
+            except sqlite3.Error as e:
+                for slot_id, *_ in filas:
+                    resultados[slot_id] = (False, f"Error al guardar partida: {e}")
+            else:
+                for slot_id, *_ in filas:
+                    resultados[slot_id] = (True, f"Partida guardada en '{slot_id}'.")
+        return {slot_id: resultados[slot_id] for slot_id in estados}
+
+    def cargar_partidas(self, slots: list) -> dict:
+        """
+        Carga varias partidas con una consulta por cada SLOTS_POR_CONSULTA slots.
+
+        Args:
+            slots: Slots a cargar.
+
+        Returns:
+            dict: slot -> (estado o None, mensaje), en el orden de `slots`.
+        """
+        slots = list(dict.fromkeys(slots))
+        datos = {}
+        try:
+            with self.__lock__:
+                conexion = self.__obtener_conexion()
+                for inicio in range(0, len(slots), SLOTS_POR_CONSULTA):
+                    grupo = slots[inicio:inicio + SLOTS_POR_CONSULTA]
+                    marcas = ", ".join("?" * len(grupo))
+                    datos.update(conexion.execute(
+                        f"SELECT slot, datos FROM partidas WHERE slot IN ({marcas})", grupo))
+        except sqlite3.Error as e:
+            return {slot_id: (None, mensaje_error_carga(e)) for slot_id in slots}
+
+        resultados = {}
+        for slot_id in slots:
+            if slot_id not in datos:
+                resultados[slot_id] = (None, f"No se encontró partida guardada en '{slot_id}'.")
+                continue
+            try:
+                resultados[slot_id] = (deserializar_partida(datos[slot_id]),
+                                       f"Partida cargada desde '{slot_id}'.")
+            except ValueError as e:
+                resultados[slot_id] = (None, mensaje_error_carga(e))
+        return resultados
+
+    def listar_partidas(self, cursor: int | tuple = 0, limite: int = LIMITE_LISTADO
+                        ) -> tuple[list[dict] | None, tuple | None, str]:
+        """
+        Lista una página de partidas por fecha de guardado (usa el índice
+        partidas_por_fecha; los metadatos se leen de la misma fila).
+
+        El cursor es la clave (guardada, slot) de la última partida de la
+        página: la siguiente empieza en el índice justo después de ella, así
+        cada página cuesta lo mismo sin importar cuántas hay antes y un
+        guardado entre dos páginas no hace repetir ni saltear otras partidas.
+
+        Args:
+            cursor: 0 para la primera página, o el cursor devuelto por la anterior.
+            limite: Cantidad máxima de partidas de la página.
+
+        Returns:
+            tuple: (partidas o None si falla, cursor siguiente o None, mensaje).
+
+        Raises:
+            ValueError: Si el cursor no es 0 ni un cursor (guardada, slot), o
+                el límite es menor que 1.
+        """
+        if limite < 1:
+            raise ValueError("El límite debe ser >= 1")
+        if cursor != 0 and not (isinstance(cursor, tuple) and len(cursor) == 2):
+            raise ValueError(f"Cursor de listado inválido: {cursor!r}")
+        consulta = "SELECT slot, guardada, jugada, metadatos FROM partidas "
+        parametros = ()
+        if cursor != 0:
+            guardada, slot_id = cursor
+            consulta += "WHERE guardada <= ? AND (guardada < ? OR slot > ?) "
+            parametros = (guardada, guardada, slot_id)
+        try:
+            with self.__lock__:
+                # Se pide una partida de más para saber si hay otra página
+                filas = self.__obtener_conexion().execute(
+                    consulta + "ORDER BY guardada DESC, slot LIMIT ?",
+                    parametros + (limite + 1,)).fetchall()
+        except sqlite3.Error as e:
+            return None, None, f"Error al listar partidas: {e}"
+
+        partidas = []
+        for slot_id, guardada, jugada, metadatos in filas[:limite]:
+            partida = json.loads(metadatos)
+            partida.update(slot=slot_id, guardada=guardada, jugada=jugada)
+            partidas.append(partida)
+        siguiente = None
+        if len(filas) > limite:
+            siguiente = (partidas[-1]["guardada"], partidas[-1]["slot"])
+        return partidas, siguiente, f"{len(partidas)} partidas guardadas."
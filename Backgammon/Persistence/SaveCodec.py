@@ -0,0 +1,208 @@
+"""Formato binario compacto y versionado para las partidas guardadas."""
+import json
+import struct
+from Backgammon.Core.CompactBoard import (TAMANIO_POSICION, BARRA_NEGRO, BARRA_BLANCO,
+                                          CASA_NEGRO, CASA_BLANCO, SIGNO_COLOR)
+
+# Cabecera: un primer byte que no puede iniciar un texto JSON, y la versión
+MAGIA = b"\x89BG"
+VERSION = 1
+
+# Valores enumerados que se guardan como un byte (el índice en la tupla)
+JUGADORES = (None, "negro", "blanco")
+ESTADOS = ('START_ROLL', 'AWAITING_ROLL', 'AWAITING_PIECE_SELECTION',
+           'AWAITING_SKIP_CONFIRMATION', 'GAME_OVER')
+SIN_SELECCION = 255
+
+# Claves que el formato binario sabe representar; con cualquier otra se usa JSON
+CLAVES_UI = {"current_player", "dice_rolls", "available_moves", "is_doubles_roll",
+             "selected_point", "game_state", "home_pieces", "bar_pieces"}
+
+# Magia y versión, 28 casillas del tablero, barra/casa de la UI, jugador,
+# estado, dobles y punto seleccionado
+_CABECERA = struct.Struct(f"<3sB{TAMANIO_POSICION}b4BBBBB")
+
+
+def codificar_partida(estado_completo: dict) -> bytes:
+    """
+    Codifica una partida (formato de PygameUI.__save_game) en bytes.
+
+    El tablero usa la misma distribución de 28 casillas con signo que
+    CompactBoard; dados y movimientos disponibles van como una cantidad
+    seguida de un byte por valor. Una posición de la UI ocupa menos de 50 bytes.
+
+    Args:
+        estado_completo: Diccionario con "board_state" y "ui_state".
+
+    Returns:
+        bytes: Partida codificada, empezando por MAGIA y VERSION.
+
+    Raises:
+        ValueError: Si el estado tiene claves o valores que el formato no representa.
+    """
+    try:
+        if set(estado_completo) != {"board_state", "ui_state"}:
+            raise ValueError("claves de partida desconocidas")
+        board_state = estado_completo["board_state"]
+        ui_state = estado_completo["ui_state"]
+        if set(board_state) - {"puntos", "barra", "casa"} or set(ui_state) != CLAVES_UI:
+            raise ValueError("claves de estado desconocidas")
+
+        posiciones = [0] * TAMANIO_POSICION
+        puntos = board_state.get("puntos", [None] * 24)
+        if len(puntos) != 24:
+            raise ValueError("el tablero debe tener 24 puntos")
+        for indice, punto in enumerate(puntos):
+            if punto is not None:
+                color, cantidad = punto
+                posiciones[indice] = SIGNO_COLOR[color] * cantidad
+        barra = board_state.get("barra", {})
+        casa = board_state.get("casa", {})
+        posiciones[BARRA_NEGRO] = barra.get("negro", 0)
+        posiciones[BARRA_BLANCO] = -barra.get("blanco", 0)
+        posiciones[CASA_NEGRO] = casa.get("negro", 0)
+        posiciones[CASA_BLANCO] = -casa.get("blanco", 0)
+
+        bar_ui = ui_state["bar_pieces"] or {}
+        home_ui = ui_state["home_pieces"] or {}
+        seleccion = ui_state["selected_point"]
+        cabecera = _CABECERA.pack(
+            MAGIA, VERSION, *posiciones,
+            bar_ui.get("negro", 0), bar_ui.get("blanco", 0),
+            home_ui.get("negro", 0), home_ui.get("blanco", 0),
+            JUGADORES.index(ui_state["current_player"]),
+            ESTADOS.index(ui_state["game_state"]),
+            int(bool(ui_state["is_doubles_roll"])),
+            SIN_SELECCION if seleccion is None else seleccion)
+        dados = list(ui_state["dice_rolls"])
+        movimientos = list(ui_state["available_moves"])
+        return (cabecera + bytes([len(dados)] + dados) +
+                bytes([len(movimientos)] + movimientos))
+    except (KeyError, TypeError, ValueError, struct.error) as e:
+        # Incluye list.index y bytes() con valores fuera de rango
+        raise ValueError(f"Estado no representable en binario: {e}") from e
+
+
+def decodificar_partida(datos: bytes) -> dict:
+    """
+    Decodifica una partida guardada con codificar_partida.
+
+    Los contadores de barra y casa del tablero en cero se omiten, igual que
+    cuando Board no tiene fichas de ese color.
+
+    Args:
+        datos: Bytes empezando por MAGIA.
+
+    Returns:
+        dict: Partida con el mismo formato que produce PygameUI.__save_game.
+
+    Raises:
+        ValueError: Si los datos no son una partida binaria o la versión no se conoce.
+    """
+    try:
+        (magia, version, *resto) = _CABECERA.unpack_from(datos)
+    except struct.error as e:
+        raise ValueError(f"Partida binaria incompleta: {e}") from e
+    if magia != MAGIA:
+        raise ValueError("Los datos no son una partida binaria.")
+    if version != VERSION:
+        raise ValueError(f"Versión de partida binaria no soportada: {version}")
+
+    posiciones = resto[:TAMANIO_POSICION]
+    (bar_negro, bar_blanco, casa_negro, casa_blanco,
+     jugador, estado, dobles, seleccion) = resto[TAMANIO_POSICION:]
+    try:
+        desplazamiento = _CABECERA.size
+        cantidad_dados = datos[desplazamiento]
+        dados = list(datos[desplazamiento + 1:desplazamiento + 1 + cantidad_dados])
+        desplazamiento += 1 + cantidad_dados
+        cantidad_movimientos = datos[desplazamiento]
+        movimientos = list(datos[desplazamiento + 1:desplazamiento + 1 + cantidad_movimientos])
+        jugador = JUGADORES[jugador]
+        estado = ESTADOS[estado]
+    except IndexError as e:
+        raise ValueError(f"Partida binaria corrupta: {e}") from e
+
+    puntos = []
+    for valor in posiciones[:24]:
+        if valor == 0:
+            puntos.append(None)
+        else:
+            puntos.append(["negro" if valor > 0 else "blanco", abs(valor)])
+    barra = {color: cantidad for color, cantidad in
+             (("negro", posiciones[BARRA_NEGRO]), ("blanco", -posiciones[BARRA_BLANCO]))
+             if cantidad}
+    casa = {color: cantidad for color, cantidad in
+            (("negro", posiciones[CASA_NEGRO]), ("blanco", -posiciones[CASA_BLANCO]))
+            if cantidad}
+    return {
+        "board_state": {"puntos": puntos, "barra": barra, "casa": casa},
+        "ui_state": {
+            "current_player": jugador,
+            "dice_rolls": dados,
+            "available_moves": movimientos,
+            "is_doubles_roll": bool(dobles),
+            "selected_point": None if seleccion == SIN_SELECCION else seleccion,
+            "game_state": estado,
+            "home_pieces": {"negro": casa_negro, "blanco": casa_blanco},
+            "bar_pieces": {"negro": bar_negro, "blanco": bar_blanco},
+        },
+    }
+
+
+def es_binario(datos) -> bool:
+    """
+    Indica si un valor guardado usa el formato binario.
+
+    Args:
+        datos: Valor leído del almacenamiento (bytes o str).
+
+    Returns:
+        bool: True si empieza por MAGIA.
+    """
+    return isinstance(datos, (bytes, bytearray)) and datos[:len(MAGIA)] == MAGIA
+
+
+def serializar_partida(estado_completo: dict, formato: str = "binario") -> bytes:
+    """
+    Serializa una partida en el formato pedido; si el binario no puede
+    representarla exactamente (la decodificación no devuelve el mismo
+    diccionario), usa JSON.
+
+    Args:
+        estado_completo: Partida a guardar.
+        formato: "binario" o "json".
+
+    Returns:
+        bytes: Partida serializada.
+
+    Raises:
+        TypeError: Si el estado no es serializable como JSON.
+    """
+    if formato == "binario":
+        try:
+            datos = codificar_partida(estado_completo)
+            if decodificar_partida(datos) == estado_completo:
+                return datos
+        except ValueError:
+            pass
+    return json.dumps(estado_completo).encode("utf-8")
+
+
+def deserializar_partida(datos) -> dict:
+    """
+    Deserializa una partida detectando el formato (binario o JSON).
+
+    Args:
+        datos: Valor leído del almacenamiento.
+
+    Returns:
+        dict: Partida.
+
+    Raises:
+        ValueError: Si los datos binarios son inválidos (json.JSONDecodeError
+            es subclase de ValueError).
+    """
+    if es_binario(datos):
+        return decodificar_partida(bytes(datos))
+    return json.loads(datos)
@@ -0,0 +1,229 @@
+"""Interfaz común de almacenamiento de partidas y elección del backend por configuración."""
+import json
+import os
+from abc import ABC, abstractmethod
+
+# Variable de entorno con el backend a usar: "redis", "sqlite[:ruta]" o "archivo[:ruta]"
+VARIABLE_ALMACEN = "BACKGAMMON_ALMACEN"
+ALMACEN_POR_DEFECTO = "redis"
+RUTA_SQLITE = "partidas.db"
+RUTA_ARCHIVO = "partidas.log"
+# Partidas por página de listar_partidas
+LIMITE_LISTADO = 20
+# Comienzo del mensaje de un guardado rechazado porque otro proceso guardó antes
+PREFIJO_CONFLICTO = "Conflicto al guardar partida"
+
+
+def calcular_metadatos(estado_completo: dict) -> dict:
+    """
+    Resume una partida para el listado de partidas guardadas.
+
+    Los pips se cuentan como Board.obtener_pips (distancia al borne, la barra
+    vale 25), sumando la barra del tablero y la de la UI. Si el estado no
+    tiene un tablero válido, los pips quedan en 0.
+
+    Args:
+        estado_completo: Partida a guardar.
+
+    Returns:
+        dict: jugador_negro, jugador_blanco (nombres, "" si la interfaz no
+        los guarda), turno ("" si no hay) y pips_negro, pips_blanco.
+    """
+    ui_state = estado_completo.get("ui_state") or {}
+    board_state = estado_completo.get("board_state") or {}
+    pips = {"negro": 0, "blanco": 0}
+    try:
+        for indice, punto in enumerate(board_state.get("puntos") or []):
+            if punto is not None:
+                color, cantidad = punto
+                pips[color] += (24 - indice if color == "negro" else indice + 1) * cantidad
+        for barra in (board_state.get("barra") or {}, ui_state.get("bar_pieces") or {}):
+            for color in pips:
+                pips[color] += 25 * barra.get(color, 0)
+    except (TypeError, ValueError, KeyError, AttributeError):
+        pips = {"negro": 0, "blanco": 0}
+    return {
+        "jugador_negro": str(ui_state.get("jugador_negro", "")),
+        "jugador_blanco": str(ui_state.get("jugador_blanco", "")),
+        "turno": str(ui_state.get("current_player") or ""),
+        "pips_negro": pips["negro"],
+        "pips_blanco": pips["blanco"],
+    }
+
+
+def mensaje_error_carga(error: Exception) -> str:
+    """
+    Arma el mensaje de una partida guardada que no se pudo leer.
+
+    Args:
+        error: Excepción al deserializar o al leer.
+
+    Returns:
+        str: Mensaje para mostrar al usuario.
+    """
+    if isinstance(error, json.JSONDecodeError):
+        # Error común si los datos guardados están corruptos
+        return f"Error al cargar partida (JSON corrupto): {error}"
+    if isinstance(error, ValueError):
+        return f"Error al cargar partida (datos binarios corruptos): {error}"
+    return f"Error al cargar partida: {error}"
+
+
+def mensaje_conflicto(slot_id: str, actual: int, esperada: int) -> str:
+    """
+    Arma el mensaje de un guardado rechazado por un conflicto de versión.
+
+    Args:
+        slot_id: Slot que se quiso guardar.
+        actual: Versión guardada en el almacenamiento.
+        esperada: Última versión que conocía quien guardaba.
+
+    Returns:
+        str: Mensaje que empieza con PREFIJO_CONFLICTO.
+    """
+    return (f"{PREFIJO_CONFLICTO} en '{slot_id}': otro proceso guardó la versión {actual} "
+            f"(se esperaba la {esperada}).")
+
+
+def es_conflicto(resultado: tuple) -> bool:
+    """
+    Indica si un resultado de guardar_partida es un conflicto de versión.
+
+    Un conflicto no es un error del almacenamiento: la partida no se tocó.
+    Reintentar sin más vuelve a dar conflicto; hay que cargarla (para no
+    pisar lo que guardó el otro proceso) o guardar con sobrescribir=True.
+
+    Args:
+        resultado: Tupla (éxito, mensaje) devuelta por guardar_partida.
+
+    Returns:
+        bool: True si el guardado se rechazó por un conflicto.
+    """
+    exito, mensaje = resultado
+    return not exito and mensaje.startswith(PREFIJO_CONFLICTO)
+
+
+class AlmacenPartidas(ABC):
+    """
+    Contrato de almacenamiento de partidas que usan las interfaces.
+
+    Las implementaciones (RedisManager, SQLiteManager, ArchivoManager)
+    devuelven siempre una tupla (resultado, mensaje) por partida y no lanzan
+    excepciones por errores de almacenamiento: el mensaje se muestra tal cual.
+    Un guardado rechazado porque otro proceso guardó antes la misma partida
+    se reconoce con es_conflicto; se reintenta después de cargarla, o con
+    sobrescribir=True para pisarla a propósito.
+
+    DIP: PygameUI depende de esta abstracción y no de un backend concreto.
+    ISP: Guardar y cargar (de a una partida o en lote) y listar lo guardado.
+    """
+
+    @abstractmethod
+    def guardar_partidas(self, estados: dict, sobrescribir: bool = False) -> dict:
+        """
+        Guarda varias partidas en una sola operación del backend.
+
+        Los backends con versiones (RedisManager) rechazan como conflicto el
+        guardado de una partida que cambió desde que se cargó, o que existe y
+        nunca se cargó; `sobrescribir` la pisa igual. Los demás la ignoran.
+
+        Args:
+            estados: slot -> estado completo.
+            sobrescribir: Si es True, guarda aunque haya un conflicto de versión.
+
+        Returns:
+            dict: slot -> (éxito, mensaje), en el mismo orden que `estados`.
+        """
+
+    @abstractmethod
+    def cargar_partidas(self, slots: list) -> dict:
+        """
+        Carga varias partidas en una sola operación del backend.
+
+        Args:
+            slots: Slots a cargar.
+
+        Returns:
+            dict: slot -> (estado o None, mensaje), en el orden de `slots`.
+        """
+
+    @abstractmethod
+    def listar_partidas(self, cursor: int | tuple = 0, limite: int = LIMITE_LISTADO
+                        ) -> tuple[list[dict] | None, int | tuple | None, str]:
+        """
+        Lista una página de partidas guardadas, de la más reciente a la más antigua.
+
+        Cada partida es un diccionario con "slot", "guardada" (timestamp o
+        None si el backend no lo registra), "jugada" (cantidad de guardados
+        de la partida) y los campos de calcular_metadatos.
+
+        Args:
+            cursor: 0 para la primera página, o el cursor que devolvió la página
+                anterior (su forma depende del backend y no debe armarse a mano).
+            limite: Cantidad máxima de partidas de la página.
+
+        Returns:
+            tuple: (partidas o None si hubo un error, cursor de la página
+            siguiente o None si es la última, mensaje).
+        """
+
+    def guardar_partida(self, slot_id: str, estado_completo: dict,
+                        sobrescribir: bool = False) -> tuple[bool, str]:
+        """
+        Guarda una partida.
+
+        Args:
+            slot_id: Identificador del slot.
+            estado_completo: Estado de la partida.
+            sobrescribir: Ver guardar_partidas.
+
+        Returns:
+            tuple[bool, str]: (éxito, mensaje).
+        """
+        return self.guardar_partidas({slot_id: estado_completo}, sobrescribir)[slot_id]
+
+    def cargar_partida(self, slot_id: str) -> tuple[dict | None, str]:
+        """
+        Carga una partida.
+
+        Args:
+            slot_id: Identificador del slot.
+
+        Returns:
+            tuple[dict | None, str]: (estado o None, mensaje).
+        """
+        return self.cargar_partidas([slot_id])[slot_id]
+
+
+def crear_almacen(configuracion: str | None = None) -> AlmacenPartidas:
+    """
+    Crea el backend de almacenamiento indicado por la configuración.
+
+    Formatos aceptados: "redis", "sqlite", "sqlite:<ruta>", "archivo" y
+    "archivo:<ruta>". Sin configuración se usa la variable de entorno
+    BACKGAMMON_ALMACEN y, si no está, Redis.
+
+    Args:
+        configuracion: Backend elegido, o None para leer el entorno.
+
+    Returns:
+        AlmacenPartidas: Backend listo para usar (ninguno se conecta al crearse).
+
+    Raises:
+        ValueError: Si el backend no se conoce.
+    """
+    if configuracion is None:
+        configuracion = os.environ.get(VARIABLE_ALMACEN, ALMACEN_POR_DEFECTO)
+    tipo, _, ruta = configuracion.partition(":")
+    tipo = tipo.strip().lower()
+    # Importaciones locales: cada backend importa esta interfaz
+    if tipo == "redis":
+        from Backgammon.Persistence.RedisManager import RedisManager
+        return RedisManager()
+    if tipo == "sqlite":
+        from Backgammon.Persistence.SQLiteManager import SQLiteManager
+        return SQLiteManager(ruta or RUTA_SQLITE)
+    if tipo == "archivo":
+        from Backgammon.Persistence.ArchivoManager import ArchivoManager
+        return ArchivoManager(ruta or RUTA_ARCHIVO)
+    raise ValueError(f"Almacenamiento desconocido: {configuracion}")
@@ -0,0 +1,235 @@
+import math
+import unittest
+from Backgammon.Core.AIPlayer import (AIPlayer, TIRADAS_POSIBLES, color_rival,
+                                      evaluar_posicion)
+from Backgammon.Core.Board import Board
+from Backgammon.Core.CompactBoard import CompactBoard
+from Backgammon.Core.Dice import Dice
+from Backgammon.Core.NeuralEvaluator import NeuralEvaluator
+from Backgammon.Core.Player import Player
+
+
+def _valor_azar_completo(board, color, profundidad):
+    """Expectiminimax sin podas ni tabla, usado como referencia en los tests."""
+    if board.ha_ganado(color_rival(color)):
+        return -1.0
+    if profundidad == 0:
+        return evaluar_posicion(board, color)
+    total = 0.0
+    for dado1, dado2, probabilidad in TIRADAS_POSIBLES:
+        dados = Dice()
+        dados.set_dados_para_test(dado1, dado2)
+        jugadas = board.obtener_jugadas_legales(color, dados)
+        if not jugadas:
+            valor = -_valor_azar_completo(board, color_rival(color), profundidad - 1)
+        else:
+            valor = -math.inf
+            for jugada in jugadas:
+                board.aplicar_jugada(color, jugada)
+                valor = max(valor, -_valor_azar_completo(board, color_rival(color),
+                                                         profundidad - 1))
+                board.deshacer_jugada(jugada)
+        total += probabilidad * valor
+    return total
+
+
+class TestAIPlayer(unittest.TestCase):
+    """Tests del jugador automático con expectiminimax."""
+
+    def setUp(self):
+        """Crea tablero inicial, dados y un jugador automático negro."""
+        self.tablero = Board()
+        self.tablero.inicializar_posiciones_estandar()
+        self.dados = Dice()
+        self.ia = AIPlayer("Bot", "negro", profundidad_maxima=2, limite_tiempo=None)
+
+    def test_es_un_player(self):
+        """
+        Verifica que AIPlayer mantiene el contrato de Player.
+
+        SOLID: LSP - Puede usarse donde se espera un Player.
+        """
+        self.assertIsInstance(self.ia, Player)
+        self.assertEqual(self.ia.obtener_nombre(), "Bot")
+        self.assertEqual(self.ia.obtener_color(), "negro")
+        self.assertEqual(len(self.ia.obtener_fichas()), 15)
+
+    def test_profundidad_invalida(self):
+        """Una profundidad menor que 1 lanza ValueError."""
+        with self.assertRaises(ValueError):
+            AIPlayer("Bot", "negro", profundidad_maxima=0)
+
+    def test_tiradas_posibles(self):
+        """Las 21 tiradas distintas suman probabilidad 1."""
+        self.assertEqual(len(TIRADAS_POSIBLES), 21)
+        self.assertAlmostEqual(sum(p for _, _, p in TIRADAS_POSIBLES), 1.0)
+
+    def test_evaluacion_antisimetrica_y_acotada(self):
+        """La evaluación es antisimétrica y vale 1 al ganar."""
+        self.tablero.aplicar_movimiento("negro", 1, 4)
+        valor = evaluar_posicion(self.tablero, "negro")
+        self.assertAlmostEqual(valor, -evaluar_posicion(self.tablero, "blanco"))
+        self.assertTrue(-1 < valor < 1)
+
+        ganado = Board()
+        for _ in range(15):
+            ganado.sacar_ficha("negro")
+        ganado.colocar_ficha(5, "blanco", 15)
+        self.assertEqual(evaluar_posicion(ganado, "negro"), 1.0)
+        self.assertEqual(evaluar_posicion(ganado, "blanco"), -1.0)
+
+    def test_elige_jugada_legal_sin_modificar_tablero(self):
+        """
+        Verifica que la jugada elegida es legal y que el tablero original no cambia.
+
+        SOLID: SRP - El bot solo decide, no aplica la jugada.
+        """
+        antes = self.tablero.obtener_estado_dict()
+        hash_antes = self.tablero.obtener_hash()
+        self.dados.set_dados_para_test(3, 1)
+
+        jugada = self.ia.elegir_jugada(self.tablero, self.dados)
+
+        self.assertIn(jugada, self.tablero.obtener_jugadas_legales("negro", self.dados))
+        self.assertEqual(self.tablero.obtener_estado_dict(), antes)
+        self.assertEqual(self.tablero.obtener_hash(), hash_antes)
+        self.assertEqual(self.ia.obtener_estadisticas()["profundidad"], 2)
+
+    def test_sin_jugadas_devuelve_lista_vacia(self):
+        """Si no hay jugadas legales devuelve una lista vacía."""
+        tablero = Board()
+        tablero.enviar_a_barra("negro")
+        for punto in range(1, 7):
+            tablero.colocar_ficha(punto, "blanco", 2)
+        self.dados.set_dados_para_test(3, 5)
+        self.assertEqual(self.ia.elegir_jugada(tablero, self.dados), [])
+
+    def test_toma_la_jugada_ganadora(self):
+        """Con la última ficha en casa, el bot la saca."""
+        tablero = Board()
+        tablero.colocar_ficha(22, "negro", 1)
+        for _ in range(14):
+            tablero.sacar_ficha("negro")
+        tablero.colocar_ficha(20, "blanco", 1)
+        tablero.colocar_ficha(5, "blanco", 14)
+        self.dados.set_dados_para_test(3, 1)
+
+        jugada = self.ia.elegir_jugada(tablero, self.dados)
+
+        tablero.aplicar_jugada("negro", jugada)
+        self.assertTrue(tablero.ha_ganado("negro"))
+
+    def test_podas_no_cambian_el_resultado(self):
+        """
+        Verifica que Star1/Star2 y la tabla eligen una jugada de valor óptimo
+        comparando con expectiminimax completo en finales pequeños.
+
+        SOLID: OCP - Las podas son una optimización que no altera el resultado.
+        """
+        tablero = CompactBoard()
+        tablero.colocar_ficha(20, "negro", 1)
+        tablero.colocar_ficha(23, "negro", 1)
+        tablero.colocar_ficha(3, "blanco", 1)
+        tablero.colocar_ficha(10, "blanco", 1)
+        for _ in range(13):
+            tablero.sacar_ficha("negro")
+            tablero.sacar_ficha("blanco")
+
+        for dado1, dado2 in ((6, 2), (4, 4)):
+            self.dados.set_dados_para_test(dado1, dado2)
+            for profundidad in (2, 3):
+                ia = AIPlayer("Bot", "negro", profundidad_maxima=profundidad,
+                              limite_tiempo=None)
+                elegida = ia.elegir_jugada(tablero, self.dados)
+                valores = {}
+                for jugada in tablero.obtener_jugadas_legales("negro", self.dados):
+                    tablero.aplicar_jugada("negro", jugada)
+                    valores[tuple(jugada)] = -_valor_azar_completo(tablero, "blanco",
+                                                                   profundidad - 1)
+                    tablero.deshacer_jugada(jugada)
+                self.assertAlmostEqual(valores[tuple(elegida)], max(valores.values()))
+
+    def test_tabla_de_transposicion_se_reutiliza(self):
+        """Repetir la misma búsqueda aprovecha la tabla de transposición."""
+        tablero = CompactBoard()
+        tablero.colocar_ficha(20, "negro", 2)
+        tablero.colocar_ficha(4, "blanco", 2)
+        for _ in range(13):
+            tablero.sacar_ficha("negro")
+            tablero.sacar_ficha("blanco")
+        self.dados.set_dados_para_test(2, 1)
+        ia = AIPlayer("Bot", "negro", profundidad_maxima=3, limite_tiempo=None)
+
+        primera = ia.elegir_jugada(tablero, self.dados)
+        nodos_primera = ia.obtener_estadisticas()["nodos"]
+        segunda = ia.elegir_jugada(tablero, self.dados)
+
+        self.assertEqual(primera, segunda)
+        self.assertGreater(ia.obtener_estadisticas()["aciertos_tabla"], 0)
+        self.assertLess(ia.obtener_estadisticas()["nodos"], nodos_primera)
+
+    def test_presupuesto_de_nodos(self):
+        """
+        Con presupuesto agotado devuelve la mejor jugada de la última profundidad completa.
+
+        SOLID: SRP - El presupuesto solo corta la búsqueda, no cambia la legalidad.
+        """
+        ia = AIPlayer("Bot", "negro", profundidad_maxima=3, limite_tiempo=None,
+                      limite_nodos=50)
+        self.dados.set_dados_para_test(6, 5)
+
+        jugada = ia.elegir_jugada(self.tablero, self.dados)
+
+        self.assertIn(jugada, self.tablero.obtener_jugadas_legales("negro", self.dados))
+        self.assertEqual(ia.obtener_estadisticas()["profundidad"], 1)
+
+    def test_presupuesto_de_tiempo(self):
+        """Con límite de tiempo la decisión termina rápido aunque la profundidad sea alta."""
+        ia = AIPlayer("Bot", "blanco", profundidad_maxima=4, limite_tiempo=0.05)
+        self.dados.set_dados_para_test(5, 2)
+
+        jugada = ia.elegir_jugada(self.tablero, self.dados)
+
+        self.assertIn(jugada, self.tablero.obtener_jugadas_legales("blanco", self.dados))
+        self.assertLess(ia.obtener_estadisticas()["tiempo"], 1.0)
+
+    def test_con_evaluador_neuronal(self):
+        """
+        Con red a profundidad 1 elige la mejor sugerencia de la red; a profundidad 2 sigue siendo legal.
+
+        SOLID: DIP - El evaluador se inyecta sin cambiar la búsqueda.
+        """
+        red = NeuralEvaluator.aleatorio(ocultas=8, semilla=3)
+        self.dados.set_dados_para_test(4, 2)
+        mejor = red.sugerir_jugadas(self.tablero, "negro", self.dados, cantidad=1)[0][0]
+
+        ia = AIPlayer("Bot", "negro", profundidad_maxima=1, limite_tiempo=None, evaluador=red)
+        self.assertEqual(ia.elegir_jugada(self.tablero, self.dados), mejor)
+
+        ia = AIPlayer("Bot", "negro", profundidad_maxima=2, limite_tiempo=None,
+                      limite_nodos=3000, evaluador=red)
+        jugada = ia.elegir_jugada(self.tablero, self.dados)
+        self.assertIn(jugada, self.tablero.obtener_jugadas_legales("negro", self.dados))
+
+    def test_partida_terminada_con_evaluador_usa_la_escala_de_la_red(self):
+        """
+        Con red, una derrota en la búsqueda vale su equidad / 2 (-0.5 simple,
+        -1 con gammon), igual que en las hojas de profundidad 1.
+        """
+        red = NeuralEvaluator.aleatorio(ocultas=8, semilla=3)
+        ia = AIPlayer("Bot", "negro", limite_tiempo=None, evaluador=red)
+        sin_red = AIPlayer("Bot", "negro", limite_tiempo=None)
+        for fuera, esperado in ((14, -0.5), (0, -1.0)):
+            tablero = Board()
+            tablero.colocar_ficha(5, "negro", 15 - fuera)
+            for _ in range(fuera):
+                tablero.sacar_ficha("negro")
+            for _ in range(15):
+                tablero.sacar_ficha("blanco")
+            self.assertEqual(ia._valor_azar(tablero, "negro", 2, -1.0, 1.0), esperado)
+            self.assertEqual(ia._evaluar(tablero, "negro"), esperado)
+            self.assertEqual(sin_red._valor_azar(tablero, "negro", 2, -1.0, 1.0), -1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
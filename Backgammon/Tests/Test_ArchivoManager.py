@@ -0,0 +1,186 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+from Backgammon.Core.Board import Board
+from Backgammon.Persistence.ArchivoManager import ArchivoManager
+
+
+class TestArchivoManager(unittest.TestCase):
+    """Tests del almacenamiento en archivo de solo agregado."""
+
+    def setUp(self):
+        """Crea un manager sobre un archivo temporal."""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+        self.ruta = os.path.join(self.directorio.name, "partidas.log")
+        self.manager = ArchivoManager(self.ruta)
+        self.addCleanup(self.manager.cerrar)
+        board = Board()
+        board.inicializar_posiciones_estandar()
+        self.estado = {"board_state": board.obtener_estado_dict(),
+                       "ui_state": {"current_player": "negro"}}
+
+    def test_guardar_y_cargar_el_ultimo_registro(self):
+        """
+        Guardar de nuevo agrega al final y cargar devuelve el último registro.
+
+        SOLID: LSP - Mismos mensajes que RedisManager.
+        """
+        self.assertEqual(self.manager.guardar_partida("slot1", {"ui_state": {"turno": 1}}),
+                         (True, "Partida guardada en 'slot1'."))
+        tamanio = os.path.getsize(self.ruta)
+        self.manager.guardar_partida("slot1", self.estado)
+        self.assertGreater(os.path.getsize(self.ruta), tamanio)
+        self.assertEqual(self.manager.cargar_partida("slot1"),
+                         (self.estado, "Partida cargada desde 'slot1'."))
+
+        self.manager.cerrar()
+        otro = ArchivoManager(self.ruta)
+        self.addCleanup(otro.cerrar)
+        self.assertEqual(otro.cargar_partida("slot1")[0], self.estado)
+        self.assertEqual(otro.cargar_partida("vacio"),
+                         (None, "No se encontró partida guardada en 'vacio'."))
+
+    def test_lote_en_una_escritura(self):
+        """Guardar 1.000 partidas es una sola escritura y un solo fsync."""
+        estados = {f"mesa{numero}": {"ui_state": {"turno": numero}} for numero in range(1000)}
+        estados["mala"] = {"ui_state": {"x": object()}}
+        with patch("os.fsync") as mock_fsync:
+            resultados = self.manager.guardar_partidas(estados)
+        mock_fsync.assert_called_once()
+        self.assertIn("no serializable", resultados["mala"][1])
+        self.assertEqual(sum(exito for exito, _ in resultados.values()), 1000)
+        cargadas = self.manager.cargar_partidas(list(estados))
+        self.assertEqual(list(cargadas), list(estados))
+        self.assertEqual(cargadas["mesa500"][0], estados["mesa500"])
+
+    def test_descarta_registro_incompleto(self):
+        """Un registro cortado al final se descarta y el archivo sigue siendo usable."""
+        self.manager.guardar_partida("slot1", self.estado)
+        self.manager.cerrar()
+        tamanio = os.path.getsize(self.ruta)
+        with open(self.ruta, "ab") as archivo:
+            archivo.write(b"\x05\x00\x40\x00\x00\x00basura")
+
+        otro = ArchivoManager(self.ruta)
+        self.addCleanup(otro.cerrar)
+        self.assertEqual(otro.cargar_partida("slot1")[0], self.estado)
+        self.assertEqual(os.path.getsize(self.ruta), tamanio)
+        otro.guardar_partida("slot2", self.estado)
+        otro.cerrar()
+        self.assertEqual(ArchivoManager(self.ruta).cargar_partida("slot2")[0], self.estado)
+
+    def test_registro_danado_en_el_medio_no_borra_los_siguientes(self):
+        """
+        Un byte cambiado en el primer registro o un largo roto en otro no
+        truncan el archivo: se saltean y los registros válidos se siguen leyendo.
+        """
+        for numero in range(5):
+            self.manager.guardar_partida(f"slot{numero}", {"ui_state": {"turno": numero}})
+        self.manager.cerrar()
+        tamanio = os.path.getsize(self.ruta)
+        with open(self.ruta, "r+b") as archivo:
+            contenido = bytearray(archivo.read())
+            largo_registro = len(contenido) // 5
+            contenido[largo_registro - 2] ^= 0xFF
+            # Largo de los datos del tercer registro (bytes 2..6 de su cabecera)
+            contenido[2 * largo_registro + 4] ^= 0x10
+            archivo.seek(0)
+            archivo.write(contenido)
+
+        otro = ArchivoManager(self.ruta)
+        self.addCleanup(otro.cerrar)
+        cargadas = otro.cargar_partidas([f"slot{numero}" for numero in range(5)])
+        self.assertEqual([estado for estado, _ in cargadas.values()],
+                         [None, {"ui_state": {"turno": 1}}, None,
+                          {"ui_state": {"turno": 3}}, {"ui_state": {"turno": 4}}])
+        self.assertEqual(os.path.getsize(self.ruta), tamanio)
+
+        otro.guardar_partida("slot0", {"ui_state": {"turno": 5}})
+        otro.cerrar()
+        tercero = ArchivoManager(self.ruta)
+        self.addCleanup(tercero.cerrar)
+        self.assertEqual(tercero.cargar_partida("slot0")[0], {"ui_state": {"turno": 5}})
+        self.assertEqual(tercero.cargar_partida("slot4")[0], {"ui_state": {"turno": 4}})
+
+    def test_escritura_fallida_no_deja_registro_roto(self):
+        """
+        Si fsync falla después de escribir, el registro se quita y los guardados
+        siguientes sobreviven a volver a abrir el archivo.
+
+        SOLID: SRP - El manager deja el archivo consistente; la UI solo muestra el error.
+        """
+        self.manager.guardar_partida("slot1", self.estado)
+        tamanio = os.path.getsize(self.ruta)
+        with patch("os.fsync", side_effect=OSError("disco lleno")):
+            exito, mensaje = self.manager.guardar_partida("fallida", self.estado)
+        self.assertFalse(exito)
+        self.assertIn("disco lleno", mensaje)
+        self.assertEqual(os.path.getsize(self.ruta), tamanio)
+        self.manager.guardar_partida("slot2", {"ui_state": {"turno": 2}})
+
+        # Si tampoco se puede recortar, el archivo se cierra y se recorre de nuevo
+        archivo = self.manager.__archivo__
+        self.manager.__archivo__ = Mock(wraps=archivo)
+        self.manager.__archivo__.truncate.side_effect = OSError("sin permiso")
+        with patch("os.fsync", side_effect=OSError("disco lleno")):
+            self.assertFalse(self.manager.guardar_partida("otra", self.estado)[0])
+        self.assertIsNone(self.manager.__archivo__)
+        self.assertTrue(archivo.closed)
+        self.manager.guardar_partida("slot3", {"ui_state": {"turno": 3}})
+        self.manager.cerrar()
+
+        otro = ArchivoManager(self.ruta)
+        self.addCleanup(otro.cerrar)
+        cargadas = otro.cargar_partidas(["slot1", "fallida", "slot2", "slot3"])
+        self.assertEqual(cargadas["slot1"][0], self.estado)
+        self.assertIsNone(cargadas["fallida"][0])
+        self.assertEqual(cargadas["slot2"][0], {"ui_state": {"turno": 2}})
+        self.assertEqual(cargadas["slot3"][0], {"ui_state": {"turno": 3}})
+
+    def test_listado_por_orden_de_guardado(self):
+        """El listado sigue el orden de los últimos registros y solo lee la página."""
+        for numero in range(5):
+            self.manager.guardar_partida(f"mesa{numero}", self.estado)
+        self.manager.guardar_partida("mesa1", self.estado)
+        self.manager.cerrar()
+
+        otro = ArchivoManager(self.ruta)
+        self.addCleanup(otro.cerrar)
+        pagina, cursor, _ = otro.listar_partidas(0, 2)
+        self.assertEqual([partida["slot"] for partida in pagina], ["mesa1", "mesa4"])
+        self.assertEqual(pagina[0]["jugada"], 2)
+        self.assertEqual(pagina[0]["pips_blanco"], 167)
+        self.assertIsNone(pagina[0]["guardada"])
+        pagina, cursor, _ = otro.listar_partidas(cursor, 2)
+        self.assertEqual([partida["slot"] for partida in pagina], ["mesa3", "mesa2"])
+
+        # Un guardado entre páginas no hace repetir ni saltear las demás
+        otro.guardar_partida("mesa3", self.estado)
+        pagina, cursor, _ = otro.listar_partidas(cursor, 2)
+        self.assertEqual([partida["slot"] for partida in pagina], ["mesa0"])
+        self.assertIsNone(cursor)
+        # Un cursor de otro backend no se confunde con una posición
+        for invalido in (-1, (1000.0, "mesa1")):
+            with self.assertRaises(ValueError):
+                otro.listar_partidas(invalido, 2)
+
+    def test_listado_con_muchos_registros_reemplazados(self):
+        """Reescribir los mismos slots muchas veces no deja entradas viejas en el listado."""
+        for vuelta in range(100):
+            self.manager.guardar_partidas({f"mesa{numero}": {"ui_state": {"vuelta": vuelta}}
+                                           for numero in range(3)})
+        slots = []
+        cursor = 0
+        while True:
+            pagina, cursor, _ = self.manager.listar_partidas(cursor, 2)
+            slots += [partida["slot"] for partida in pagina]
+            if cursor is None:
+                break
+        self.assertEqual(slots, ["mesa2", "mesa1", "mesa0"])
+        self.assertLess(len(self.manager.__orden__), 2 * 3 + 64 + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+import fakeredis
+import redis
+from Backgammon.Persistence.AsyncRedisManager import AsyncRedisManager, obtener_pool_async
+from Backgammon.Persistence.RedisManager import RedisManager
+from Backgammon.Persistence.Storage import es_conflicto
+
+
+class TestAsyncRedisManager(unittest.IsolatedAsyncioTestCase):
+    """Tests del contrato de AsyncRedisManager contra fakeredis."""
+
+    def setUp(self):
+        """Crea un servidor falso compartido por un cliente síncrono y uno asyncio."""
+        self.servidor = fakeredis.FakeServer()
+        self.cliente_sync = fakeredis.FakeStrictRedis(server=self.servidor)
+        self.cliente_async = fakeredis.FakeAsyncRedis(server=self.servidor)
+        self.manager = AsyncRedisManager(client=self.cliente_async, snapshot_cada=2)
+        self.estado = {"board_state": {"puntos": [["negro", 5]]},
+                       "ui_state": {"current_player": "negro"}}
+
+    async def test_guardar_y_cargar(self):
+        """
+        Guardar y cargar devuelven el mismo estado y los mismos mensajes que RedisManager.
+
+        SOLID: LSP - Las dos clases cumplen el mismo contrato.
+        """
+        sincrono = RedisManager(client=fakeredis.FakeStrictRedis(), snapshot_cada=2)
+        for _ in range(3):
+            self.assertEqual(await self.manager.guardar_partida("slot1", self.estado),
+                             sincrono.guardar_partida("slot1", self.estado))
+        self.assertEqual(await self.manager.cargar_partida("slot1"),
+                         sincrono.cargar_partida("slot1"))
+        self.assertEqual(await self.manager.cargar_partida("vacio"),
+                         sincrono.cargar_partida("vacio"))
+        self.assertEqual(await self.manager.obtener_historial("slot1"),
+                         sincrono.obtener_historial("slot1"))
+
+    async def test_formato_compartido_con_la_version_sincrona(self):
+        """Una partida guardada por una clase se carga con la otra."""
+        await self.manager.guardar_partida("mesa", self.estado)
+        estado, _ = RedisManager(client=self.cliente_sync).cargar_partida("mesa")
+        self.assertEqual(estado, self.estado)
+
+        RedisManager(client=self.cliente_sync).guardar_partida("otra", self.estado)
+        estado, _ = await AsyncRedisManager(client=self.cliente_async).cargar_partida("otra")
+        self.assertEqual(estado, self.estado)
+
+    async def test_lote_con_pipelines(self):
+        """Guardar y cargar 200 partidas usa los mismos pipelines que la versión síncrona."""
+        estados = {f"mesa{numero}": {"board_state": {"puntos": [["negro", numero % 15 + 1]]},
+                                     "ui_state": {"current_player": "negro"}}
+                   for numero in range(200)}
+        original = redis.asyncio.client.Pipeline.execute
+        with patch.object(redis.asyncio.client.Pipeline, 'execute', autospec=True,
+                          side_effect=original) as mock_execute:
+            resultados = await self.manager.guardar_partidas(estados)
+            self.assertEqual(mock_execute.call_count, 4)
+            cargadas = await AsyncRedisManager(client=self.cliente_async).cargar_partidas(list(estados))
+            self.assertEqual(mock_execute.call_count, 6)
+        self.assertTrue(all(exito for exito, _ in resultados.values()))
+        self.assertEqual(cargadas["mesa42"][0], estados["mesa42"])
+
+    async def test_listado_igual_que_la_version_sincrona(self):
+        """listar_partidas devuelve lo mismo que RedisManager sobre el mismo servidor."""
+        for numero in range(5):
+            await self.manager.guardar_partida(f"mesa{numero}", self.estado)
+        sincrono = RedisManager(client=self.cliente_sync)
+        primera = await self.manager.listar_partidas(0, 3)
+        self.assertEqual(primera, sincrono.listar_partidas(0, 3))
+        cursor = primera[1]
+        self.assertEqual(cursor, (primera[0][-1]["guardada"], primera[0][-1]["slot"]))
+        self.assertEqual(await self.manager.listar_partidas(cursor, 3),
+                         sincrono.listar_partidas(cursor, 3))
+        pagina, cursor, _ = await self.manager.listar_partidas(cursor, 3)
+        self.assertEqual(len(pagina), 2)
+        self.assertIsNone(cursor)
+        with self.assertRaises(ValueError):
+            await self.manager.listar_partidas(3, 3)
+
+    async def test_retencion_y_partida_compactada(self):
+        """Aplica la misma retención y lee el historial de una partida compactada."""
+        final = {"board_state": {"puntos": [None], "casa": {"negro": 15}},
+                 "ui_state": {"current_player": "negro", "game_state": "GAME_OVER"}}
+        await self.manager.guardar_partida("mesa", self.estado)
+        await self.manager.guardar_partida("mesa", final)
+        self.assertGreater(await self.cliente_async.ttl("mesa:eventos"), 0)
+
+        RedisManager(client=self.cliente_sync).compactar_finalizadas()
+        self.assertEqual(await self.manager.obtener_historial("mesa"),
+                         RedisManager(client=self.cliente_sync).obtener_historial("mesa"))
+        self.assertEqual((await self.manager.obtener_historial("mesa"))[0], [self.estado, final])
+
+    async def test_conflicto_entre_workers(self):
+        """
+        Dos workers que comparten un slot no se pisan: el que guarda sobre una versión vieja recibe un conflicto.
+
+        SOLID: LSP - Los conflictos son los mismos que en RedisManager.
+        """
+        otro = AsyncRedisManager(client=self.cliente_async)
+        nuevo = {"board_state": {"puntos": [["negro", 2]]}, "ui_state": {"current_player": "blanco"}}
+        await self.manager.guardar_partida("mesa", self.estado)
+        await otro.cargar_partida("mesa")
+        self.assertTrue((await self.manager.guardar_partida("mesa", nuevo))[0])
+
+        self.assertTrue(es_conflicto(await otro.guardar_partida("mesa", self.estado)))
+        self.assertEqual((await otro.cargar_partida("mesa"))[0], nuevo)
+        self.assertTrue((await otro.guardar_partida("mesa", self.estado))[0])
+        self.assertEqual(int(await self.cliente_async.hget("mesa:meta", "version")), 3)
+        # Un manager que nunca cargó la partida no la pisa, salvo que lo pida
+        sincrono = RedisManager(client=self.cliente_sync)
+        self.assertTrue(es_conflicto(sincrono.guardar_partida("mesa", nuevo)))
+        self.assertTrue(sincrono.guardar_partida("mesa", nuevo, sobrescribir=True)[0])
+        self.assertTrue(es_conflicto(await otro.guardar_partida("mesa", nuevo)))
+        self.assertTrue((await otro.guardar_partida("mesa", nuevo, sobrescribir=True))[0])
+
+    async def test_registro_olvidado_durante_el_guardado(self):
+        """
+        Si otra corrutina descarta el registro de una partida mientras el
+        guardado espera a Redis, el guardado sigue con el que copió al empezar.
+        """
+        await self.manager.guardar_partida("mesa", self.estado)
+        original = self.manager._AsyncRedisManager__leer_registros
+
+        async def olvidar_en_el_medio(cliente, slots):
+            self.manager._olvidar_registros(["mesa"])
+            return await original(cliente, slots)
+
+        nuevo = {"board_state": {"puntos": [["negro", 2]]}, "ui_state": {"current_player": "blanco"}}
+        with patch.object(self.manager, '_AsyncRedisManager__leer_registros',
+                          side_effect=olvidar_en_el_medio):
+            resultados = await self.manager.guardar_partidas({"mesa": nuevo, "nueva": nuevo})
+        self.assertEqual(resultados, {"mesa": (True, "Partida guardada en 'mesa'."),
+                                      "nueva": (True, "Partida guardada en 'nueva'.")})
+        self.assertEqual((await AsyncRedisManager(client=self.cliente_async).cargar_partida("mesa"))[0], nuevo)
+
+    async def test_errores_por_partida(self):
+        """Los errores de serialización y de datos corruptos usan los mismos mensajes."""
+        resultados = await self.manager.guardar_partidas({"buena": self.estado,
+                                                          "mala": {"ui_state": {"x": object()}}})
+        self.assertTrue(resultados["buena"][0])
+        self.assertIn("no serializable", resultados["mala"][1])
+
+        await self.cliente_async.rpush("rota:eventos", b"{no es json")
+        cargadas = await AsyncRedisManager(client=self.cliente_async).cargar_partidas(["rota"])
+        self.assertIsNone(cargadas["rota"][0])
+        self.assertIn("JSON corrupto", cargadas["rota"][1])
+
+
+class TestAsyncRedisManagerConexion(unittest.IsolatedAsyncioTestCase):
+    """Tests de la conexión perezosa y la reconexión como tarea del loop."""
+
+    async def test_no_conecta_al_construir(self):
+        """Construir el manager no abre conexiones ni necesita un loop."""
+        with patch('redis.asyncio.Redis') as mock_redis:
+            manager = AsyncRedisManager(host='no-existe')
+        mock_redis.assert_not_called()
+        self.assertFalse(manager.esta_conectado())
+
+    async def test_pool_compartido(self):
+        """Dos managers con la misma configuración comparten el pool en el mismo loop."""
+        self.assertIs(obtener_pool_async(port=6399), obtener_pool_async(port=6399))
+        self.assertIsNot(obtener_pool_async(port=6399), obtener_pool_async(port=6398))
+
+    async def test_sin_conexion_y_reconexion(self):
+        """
+        Sin Redis, los métodos informan el error y una tarea reintenta conectar.
+
+        SOLID: SRP - La reconexión no bloquea al llamador.
+        """
+        falso = fakeredis.FakeAsyncRedis()
+        manager = AsyncRedisManager(reintento_segundos=0.01)
+        with patch.object(AsyncRedisManager, '_AsyncRedisManager__crear_cliente',
+                          side_effect=[redis.exceptions.ConnectionError("caído"), falso]):
+            exito, mensaje = await manager.guardar_partida("slot", {"ui_state": {}})
+            self.assertFalse(exito)
+            self.assertEqual(mensaje, "Error: No hay conexión a Redis.")
+            for _ in range(100):
+                if manager.esta_conectado():
+                    break
+                await asyncio.sleep(0.01)
+        self.assertIs(manager.client, falso)
+        self.assertTrue((await manager.guardar_partida("slot", {"ui_state": {}}))[0])
+        await manager.cerrar()
+
+
+if __name__ == "__main__":
+    unittest.main()
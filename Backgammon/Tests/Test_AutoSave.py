@@ -0,0 +1,134 @@
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+import fakeredis
+from Backgammon.Persistence.AutoSave import GuardadoDiferido
+from Backgammon.Persistence.RedisManager import RedisManager
+from Backgammon.Persistence.SQLiteManager import SQLiteManager
+from Backgammon.Persistence.Storage import es_conflicto
+
+
+class TestGuardadoDiferido(unittest.TestCase):
+    """Tests del guardado automático con escritura diferida."""
+
+    def setUp(self):
+        """Crea un planificador sobre una base SQLite en memoria."""
+        self.almacen = SQLiteManager(":memory:")
+        self.addCleanup(self.almacen.cerrar)
+
+    def test_varias_marcas_una_escritura(self):
+        """
+        Muchas jugadas sobre el mismo slot terminan en una sola escritura del último estado.
+
+        SOLID: SRP - El planificador decide cuándo; el almacén, cómo.
+        """
+        almacen = Mock(wraps=self.almacen)
+        guardado = GuardadoDiferido(almacen, intervalo=60)
+        for turno in range(50):
+            guardado.marcar("auto", {"ui_state": {"turno": turno}})
+            guardado.marcar(f"otra{turno % 2}", {"ui_state": {"turno": turno}})
+        almacen.guardar_partidas.assert_not_called()
+
+        resultados = guardado.detener()
+        almacen.guardar_partidas.assert_called_once()
+        self.assertEqual(list(resultados), ["auto", "otra0", "otra1"])
+        self.assertEqual(self.almacen.cargar_partida("auto")[0], {"ui_state": {"turno": 49}})
+        self.assertEqual(guardado.obtener_estadisticas(),
+                         {"marcas": 100, "escrituras": 1, "pendientes": 0})
+
+    def test_copia_el_estado_al_marcar(self):
+        """Cambiar el estado después de marcarlo no cambia lo que se guarda."""
+        guardado = GuardadoDiferido(self.almacen, intervalo=60)
+        estado = {"board_state": {"puntos": [["negro", 2]]}}
+        guardado.marcar("auto", estado)
+        estado["board_state"]["puntos"][0][1] = 5
+        guardado.detener()
+        self.assertEqual(self.almacen.cargar_partida("auto")[0],
+                         {"board_state": {"puntos": [["negro", 2]]}})
+
+    def test_escribe_en_segundo_plano(self):
+        """El hilo escribe al pasar el intervalo y enseguida si se pide el vaciado."""
+        escrito = threading.Event()
+        guardado = GuardadoDiferido(self.almacen, intervalo=0.05,
+                                    al_guardar=lambda resultados: escrito.set())
+        guardado.marcar("auto", {"ui_state": {"turno": 1}})
+        self.assertTrue(escrito.wait(2))
+
+        lento = GuardadoDiferido(self.almacen, intervalo=60,
+                                 al_guardar=lambda resultados: escrito.set())
+        escrito.clear()
+        lento.marcar("fin", {"ui_state": {"ganador": "negro"}})
+        inicio = time.monotonic()
+        lento.solicitar_vaciado()
+        self.assertTrue(escrito.wait(2))
+        self.assertLess(time.monotonic() - inicio, 2)
+        self.assertEqual(self.almacen.cargar_partida("fin")[0], {"ui_state": {"ganador": "negro"}})
+        guardado.detener()
+        lento.detener()
+
+    def test_errores_se_informan(self):
+        """Una excepción del almacén llega como resultado y no detiene el planificador."""
+        almacen = Mock()
+        almacen.guardar_partidas.side_effect = ConnectionError("sin red")
+        informados = []
+        guardado = GuardadoDiferido(almacen, intervalo=60, al_guardar=informados.append)
+        guardado.marcar("auto", {})
+        self.assertEqual(guardado.vaciar(), {"auto": (False, "Error al guardar partida: sin red")})
+        self.assertEqual(informados, [{"auto": (False, "Error al guardar partida: sin red")}])
+        self.assertEqual(guardado.vaciar(), {})
+        with self.assertRaises(ValueError):
+            GuardadoDiferido(almacen, intervalo=0)
+        guardado.detener()
+
+    def test_reclama_el_slot_y_se_detiene_ante_un_conflicto(self):
+        """
+        La primera escritura reemplaza el autoguardado anterior; si otro proceso
+        escribe el slot después, el planificador deja de guardarlo en vez de pisarlo.
+
+        SOLID: SRP - El planificador decide qué hacer con el conflicto; Redis solo lo detecta.
+        """
+        servidor = fakeredis.FakeStrictRedis()
+        anterior = RedisManager(client=servidor)
+        anterior.guardar_partida("auto", {"ui_state": {"turno": 0}})
+        informados = []
+        guardado = GuardadoDiferido(RedisManager(client=servidor), intervalo=60,
+                                    al_guardar=informados.append)
+        guardado.marcar("auto", {"ui_state": {"turno": 1}})
+        self.assertTrue(guardado.vaciar()["auto"][0])
+        guardado.marcar("auto", {"ui_state": {"turno": 2}})
+        self.assertTrue(guardado.vaciar()["auto"][0])
+
+        otro = RedisManager(client=servidor)
+        otro.cargar_partida("auto")
+        otro.guardar_partida("auto", {"ui_state": {"turno": 99}})
+        guardado.marcar("auto", {"ui_state": {"turno": 3}})
+        guardado.marcar("propio", {"ui_state": {"turno": 3}})
+        resultados = guardado.vaciar()
+        self.assertTrue(es_conflicto(resultados["auto"]))
+        self.assertTrue(resultados["propio"][0])
+        self.assertEqual(informados[-1], resultados)
+        self.assertTrue(guardado.esta_en_conflicto("auto"))
+
+        guardado.marcar("auto", {"ui_state": {"turno": 4}})
+        self.assertEqual(guardado.detener(), {})
+        self.assertEqual(otro.cargar_partida("auto")[0], {"ui_state": {"turno": 99}})
+
+    def test_primera_escritura_sobrescribe(self):
+        """Los slots nuevos se escriben con sobrescribir=True y los ya escritos sin él."""
+        almacen = Mock()
+        almacen.guardar_partidas.side_effect = lambda lote, sobrescribir: {
+            slot_id: (True, "ok") for slot_id in lote}
+        guardado = GuardadoDiferido(almacen, intervalo=60)
+        guardado.marcar("a", {})
+        guardado.vaciar()
+        guardado.marcar("a", {})
+        guardado.marcar("b", {})
+        guardado.detener()
+        llamadas = [(sorted(c.args[0]), c.kwargs["sobrescribir"])
+                    for c in almacen.guardar_partidas.call_args_list]
+        self.assertEqual(llamadas, [(["a"], True), (["a"], False), (["b"], True)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import copy
 import unittest
 from Backgammon.Core.Board import Board
 from Backgammon.Core.Dice import Dice
@@ -1122,5 +1123,425 @@ class TestBoardSOLID(unittest.TestCase):
         self.assertTrue(exito)
 
 
+class TestBoardJugadasLegales(unittest.TestCase):
+    """Tests del generador de jugadas completas obtener_jugadas_legales."""
+
+    def setUp(self):
+        """Crea tablero limpio y dados para cada test."""
+        self.tablero = Board()
+        self.dados = Dice()
+
+    def _posicion_final(self, color: str, jugada: list) -> tuple:
+        """Aplica una jugada sobre una copia y devuelve la clave de la posición final."""
+        copia = self.tablero.copiar()
+        for origen, destino in jugada:
+            if origen == 0:
+                dado = destino if color == "negro" else 25 - destino
+                self.assertTrue(copia.mover_desde_barra(color, dado))
+            else:
+                self.assertTrue(copia.realizar_movimiento_simple(origen, destino, color))
+        return copia._clave_posicion()
+
+    def test_sin_dados_tirados_devuelve_lista_vacia(self):
+        """Sin tirada no hay jugadas."""
+        self.tablero.inicializar_posiciones_estandar()
+        self.assertEqual(self.tablero.obtener_jugadas_legales("negro", self.dados), [])
+
+    def test_apertura_sin_posiciones_repetidas(self):
+        """
+        Verifica que cada jugada de apertura llega a una posición distinta.
+
+        SOLID: SRP - El generador no modifica el tablero original.
+        """
+        self.tablero.inicializar_posiciones_estandar()
+        antes = self.tablero._clave_posicion()
+        self.dados.set_dados_para_test(3, 1)
+
+        jugadas = self.tablero.obtener_jugadas_legales("negro", self.dados)
+
+        self.assertEqual(self.tablero._clave_posicion(), antes)
+        self.assertTrue(all(len(jugada) == 2 for jugada in jugadas))
+        finales = [self._posicion_final("negro", jugada) for jugada in jugadas]
+        self.assertEqual(len(finales), len(set(finales)))
+        # Armar el punto 20 con 17->20 y 19->20 debe estar (en algún orden)
+        self.assertIn(self._posicion_final("negro", [(17, 20), (19, 20)]), finales)
+
+    def test_dobles_usan_cuatro_movimientos(self):
+        """Verifica que una tirada doble genera jugadas de cuatro movimientos."""
+        self.tablero.inicializar_posiciones_estandar()
+        self.dados.set_dados_para_test(2, 2)
+
+        jugadas = self.tablero.obtener_jugadas_legales("blanco", self.dados)
+
+        self.assertTrue(jugadas)
+        self.assertTrue(all(len(jugada) == 4 for jugada in jugadas))
+
+    def test_obligacion_de_usar_ambos_dados(self):
+        """
+        Si hay una forma de usar ambos dados, no se permite usar solo uno.
+        """
+        self.tablero.colocar_ficha(1, "negro", 1)
+        self.tablero.colocar_ficha(20, "negro", 1)
+        self.tablero.colocar_ficha(7, "blanco", 2)  # Bloquea 1->7
+        self.dados.set_dados_para_test(6, 1)
+
+        jugadas = self.tablero.obtener_jugadas_legales("negro", self.dados)
+
+        self.assertEqual(jugadas, [[(1, 2), (2, 8)]])
+
+    def test_obligacion_de_usar_dado_mayor(self):
+        """
+        Si solo se puede usar un dado, debe usarse el mayor.
+        """
+        self.tablero.colocar_ficha(1, "negro", 1)
+        self.tablero.colocar_ficha(8, "blanco", 2)  # Bloquea 6->8 y 3->8
+        self.dados.set_dados_para_test(2, 5)
+
+        jugadas = self.tablero.obtener_jugadas_legales("negro", self.dados)
+
+        self.assertEqual(jugadas, [[(1, 6)]])
+
+    def test_entrada_desde_barra_primero(self):
+        """Con fichas en la barra, el primer movimiento sale de la barra (origen 0)."""
+        self.tablero.inicializar_posiciones_estandar()
+        self.tablero.remover_ficha(1, 1)
+        self.tablero.enviar_a_barra("negro")
+        self.dados.set_dados_para_test(6, 5)  # 6 bloqueado por blanco
+
+        jugadas = self.tablero.obtener_jugadas_legales("negro", self.dados)
+
+        self.assertTrue(jugadas)
+        for jugada in jugadas:
+            self.assertEqual(jugada[0], (0, 5))
+
+    def test_bearing_off_con_destino_casa(self):
+        """Las salidas de fichas usan destino 25 para negro y 0 para blanco."""
+        self.tablero.colocar_ficha(24, "negro", 1)
+        self.tablero.colocar_ficha(23, "negro", 1)
+        self.dados.set_dados_para_test(1, 2)
+
+        jugadas = self.tablero.obtener_jugadas_legales("negro", self.dados)
+
+        self.assertIn(self._posicion_final("negro", [(24, 25), (23, 25)]),
+                      [self._posicion_final("negro", jugada) for jugada in jugadas])
+
+    def test_sin_movimientos_posibles(self):
+        """Si todos los destinos están bloqueados no hay jugadas."""
+        self.tablero.enviar_a_barra("negro")
+        for punto in range(1, 7):
+            self.tablero.colocar_ficha(punto, "blanco", 2)
+        self.dados.set_dados_para_test(4, 2)
+
+        self.assertEqual(self.tablero.obtener_jugadas_legales("negro", self.dados), [])
+
+
+class TestBoardAplicarDeshacer(unittest.TestCase):
+    """Tests de aplicar_movimiento / deshacer_movimiento con pila de deshacer."""
+
+    def setUp(self):
+        """Crea tablero con la posición inicial estándar."""
+        self.tablero = Board()
+        self.tablero.inicializar_posiciones_estandar()
+
+    def _estado(self) -> dict:
+        """Devuelve una copia del estado exportado para comparar."""
+        return copy.deepcopy(self.tablero.obtener_estado_dict())
+
+    def test_movimiento_normal_y_deshacer(self):
+        """
+        Verifica que deshacer un movimiento simple restaura la posición.
+
+        SOLID: SRP - Aplicar y deshacer son operaciones inversas.
+        """
+        antes = self._estado()
+        self.tablero.aplicar_movimiento("negro", 1, 4)
+        self.assertEqual(self.tablero.obtener_estado_punto(4), ["negro", 1])
+
+        self.tablero.deshacer_movimiento()
+        self.assertEqual(self._estado(), antes)
+
+    def test_captura_y_deshacer_restaura_ficha_rival(self):
+        """Verifica que deshacer una captura devuelve la ficha rival desde la barra."""
+        self.tablero.colocar_ficha(4, "blanco", 1)
+        antes = self._estado()
+
+        self.tablero.aplicar_movimiento("negro", 1, 4)
+        self.assertEqual(self.tablero.get_barra(), {"blanco": 1})
+
+        self.tablero.deshacer_movimiento()
+        self.assertEqual(self._estado(), antes)
+        self.assertEqual(self.tablero.get_barra(), {})
+
+    def test_entrada_desde_barra_con_captura_y_deshacer(self):
+        """Verifica aplicar/deshacer una entrada desde la barra que captura."""
+        self.tablero.remover_ficha(1, 1)
+        self.tablero.enviar_a_barra("negro")
+        self.tablero.colocar_ficha(3, "blanco", 1)
+        antes = self._estado()
+
+        self.tablero.aplicar_movimiento("negro", 0, 3)
+        self.assertEqual(self.tablero.obtener_estado_punto(3), ["negro", 1])
+        self.assertEqual(self.tablero.get_barra(), {"blanco": 1})
+
+        self.tablero.deshacer_movimiento()
+        self.assertEqual(self._estado(), antes)
+
+    def test_bearing_off_y_deshacer(self):
+        """Verifica que deshacer una salida de ficha la devuelve desde la casa."""
+        tablero = type(self.tablero)()
+        tablero.colocar_ficha(23, "negro", 2)
+        tablero.aplicar_movimiento("negro", 23, 25)
+        self.assertEqual(tablero.get_casa(), {"negro": 1})
+
+        tablero.deshacer_movimiento()
+        self.assertEqual(tablero.get_casa(), {})
+        self.assertEqual(tablero.obtener_estado_punto(23), ["negro", 2])
+
+    def test_movimiento_invalido_no_se_registra(self):
+        """Un movimiento bloqueado lanza ValueError y no deja registro en la pila."""
+        with self.assertRaises(ValueError):
+            self.tablero.aplicar_movimiento("negro", 1, 6)
+        with self.assertRaises(IndexError):
+            self.tablero.deshacer_movimiento()
+
+    def test_cargar_estado_vacia_la_pila(self):
+        """Cargar una posición descarta los movimientos apilados de la anterior."""
+        self.tablero.aplicar_movimiento("negro", 1, 4)
+        cargado = self._estado()
+        self.tablero.cargar_estado_dict(copy.deepcopy(cargado))
+        with self.assertRaises(IndexError):
+            self.tablero.deshacer_movimiento()
+        self.assertEqual(self._estado(), cargado)
+
+    def test_asignar_dados(self):
+        """
+        Cada movimiento recibe el dado con el que es legal, también al sacar
+        fichas con un dado mayor; una jugada imposible devuelve None.
+        """
+        antes = self._estado()
+        self.assertEqual(self.tablero.asignar_dados("blanco", [(13, 7), (8, 3)], [5, 6]), [6, 5])
+        self.assertIsNone(self.tablero.asignar_dados("blanco", [(13, 7), (13, 7)], [5, 6]))
+        self.assertEqual(self._estado(), antes)
+
+        tablero = type(self.tablero)()
+        tablero.colocar_ficha(20, "negro", 1)
+        tablero.colocar_ficha(24, "negro", 1)
+        for _ in range(13):
+            tablero.sacar_ficha("negro")
+        self.assertEqual(tablero.asignar_dados("negro", [(20, 25), (24, 25)], [2, 6]), [6, 2])
+        self.assertIsNone(tablero.asignar_dados("negro", [(24, 25), (20, 25)], [2, 6]))
+
+    def test_aplicar_y_deshacer_jugadas_legales(self):
+        """
+        Verifica que todas las jugadas legales se pueden aplicar y deshacer en el lugar.
+
+        SOLID: DIP - La búsqueda usa la interfaz del tablero, sin copiarlo.
+        """
+        dados = Dice()
+        antes = self._estado()
+        for dado1 in range(1, 7):
+            for dado2 in range(1, 7):
+                dados.set_dados_para_test(dado1, dado2)
+                for jugada in self.tablero.obtener_jugadas_legales("blanco", dados):
+                    self.tablero.aplicar_jugada("blanco", jugada)
+                    self.tablero.deshacer_jugada(jugada)
+                    self.assertEqual(self._estado(), antes)
+
+
+class TestBoardHashZobrist(unittest.TestCase):
+    """Tests del hash Zobrist incremental del tablero."""
+
+    def setUp(self):
+        """Crea tablero con la posición inicial estándar."""
+        self.tablero = Board()
+        self.tablero.inicializar_posiciones_estandar()
+
+    def _hash_desde_cero(self, tablero):
+        """Recalcula el hash en un tablero nuevo cargando el mismo estado."""
+        nuevo = type(tablero)()
+        nuevo.cargar_estado_dict(copy.deepcopy(tablero.obtener_estado_dict()))
+        return nuevo.obtener_hash()
+
+    def test_tablero_vacio_hash_cero(self):
+        """Un tablero sin fichas tiene hash 0."""
+        self.assertEqual(type(self.tablero)().obtener_hash(), 0)
+
+    def test_hash_incremental_igual_a_recalculado(self):
+        """
+        Verifica que el hash incremental coincide con el recalculado tras mover,
+        capturar, entrar desde la barra y sacar fichas.
+
+        SOLID: SRP - Cada primitiva mantiene su parte del hash.
+        """
+        self.tablero.mover_ficha(1, 4, "negro")
+        self.assertEqual(self.tablero.obtener_hash(), self._hash_desde_cero(self.tablero))
+        self.tablero.enviar_a_barra("blanco")
+        self.assertEqual(self.tablero.obtener_hash(), self._hash_desde_cero(self.tablero))
+        self.tablero.mover_desde_barra("blanco", 4)
+        self.assertEqual(self.tablero.obtener_hash(), self._hash_desde_cero(self.tablero))
+        self.tablero.sacar_ficha("negro")
+        self.assertEqual(self.tablero.obtener_hash(), self._hash_desde_cero(self.tablero))
+
+    def test_deshacer_restaura_hash(self):
+        """Aplicar y deshacer jugadas deja el hash igual al inicial."""
+        inicial = self.tablero.obtener_hash()
+        dados = Dice()
+        for dado1 in range(1, 7):
+            for dado2 in range(dado1, 7):
+                dados.set_dados_para_test(dado1, dado2)
+                for jugada in self.tablero.obtener_jugadas_legales("negro", dados):
+                    self.tablero.aplicar_jugada("negro", jugada)
+                    self.assertEqual(self.tablero.obtener_hash(),
+                                     self._hash_desde_cero(self.tablero))
+                    self.tablero.deshacer_jugada(jugada)
+                    self.assertEqual(self.tablero.obtener_hash(), inicial)
+
+    def test_transposicion_mismo_hash(self):
+        """Dos órdenes distintos que llegan a la misma posición dan el mismo hash."""
+        otro = self.tablero.copiar()
+        self.tablero.aplicar_jugada("negro", [(17, 20), (19, 20)])
+        otro.aplicar_jugada("negro", [(19, 20), (17, 20)])
+        self.assertEqual(self.tablero.obtener_hash(), otro.obtener_hash())
+
+    def test_posiciones_distintas_hash_distinto(self):
+        """Las posiciones alcanzables con la tirada de apertura tienen hashes distintos."""
+        dados = Dice()
+        dados.set_dados_para_test(6, 5)
+        hashes = set()
+        posiciones = set()
+        for jugada in self.tablero.obtener_jugadas_legales("negro", dados):
+            self.tablero.aplicar_jugada("negro", jugada)
+            hashes.add(self.tablero.obtener_hash())
+            posiciones.add(self.tablero._clave_posicion())
+            self.tablero.deshacer_jugada(jugada)
+        self.assertEqual(len(hashes), len(posiciones))
+
+    def test_hash_entre_tableros_y_colores(self):
+        """Misma posición en tableros distintos da el mismo hash; el color importa."""
+        negro = type(self.tablero)()
+        negro.colocar_ficha(5, "negro", 2)
+        blanco = type(self.tablero)()
+        blanco.colocar_ficha(5, "blanco", 2)
+        otro_negro = type(self.tablero)()
+        otro_negro.colocar_ficha(5, "negro", 1)
+        otro_negro.colocar_ficha(5, "negro", 1)
+
+        self.assertNotEqual(negro.obtener_hash(), blanco.obtener_hash())
+        self.assertEqual(negro.obtener_hash(), otro_negro.obtener_hash())
+        self.assertEqual(negro.copiar().obtener_hash(), negro.obtener_hash())
+
+    def test_color_invalido(self):
+        """Un color que no es de un jugador da ValueError y no cambia el tablero ni el hash."""
+        hash_inicial = self.tablero.obtener_hash()
+        estado = copy.deepcopy(self.tablero.obtener_estado_dict())
+        for accion in (lambda: self.tablero.colocar_ficha(3, "azul", 1),
+                       lambda: self.tablero.enviar_a_barra("azul"),
+                       lambda: self.tablero.sacar_ficha("azul")):
+            with self.assertRaises(ValueError) as contexto:
+                accion()
+            self.assertIn("azul", str(contexto.exception))
+        self.assertEqual(self.tablero.obtener_hash(), hash_inicial)
+        self.assertEqual(self.tablero.obtener_estado_dict(), estado)
+
+
+class TestBoardContadores(unittest.TestCase):
+    """Tests de los contadores incrementales (pips, fichas fuera de casa, punto más alto en casa)."""
+
+    def setUp(self):
+        """Crea tablero con la posición inicial estándar."""
+        self.tablero = Board()
+        self.tablero.inicializar_posiciones_estandar()
+
+    def _contadores_desde_cero(self, tablero, color):
+        """Calcula los contadores recorriendo el tablero punto por punto."""
+        pips = 25 * tablero.get_barra().get(color, 0)
+        fuera = 0
+        mas_alto = 0
+        for punto in range(1, 25):
+            estado = tablero.obtener_estado_punto(punto)
+            if estado is None or estado[0] != color:
+                continue
+            distancia = 25 - punto if color == "negro" else punto
+            pips += distancia * estado[1]
+            if distancia > 6:
+                fuera += estado[1]
+            else:
+                mas_alto = max(mas_alto, distancia)
+        return pips, fuera, mas_alto
+
+    def _verificar(self, tablero):
+        """Compara los contadores incrementales con los recalculados para ambos colores."""
+        for color in ("negro", "blanco"):
+            self.assertEqual(
+                (tablero.obtener_pips(color), tablero.fichas_fuera_de_casa(color),
+                 tablero.punto_mas_alto_en_casa(color)),
+                self._contadores_desde_cero(tablero, color))
+
+    def test_posicion_inicial(self):
+        """La posición inicial tiene 167 pips por color y ninguno puede sacar fichas."""
+        self.assertEqual(self.tablero.obtener_pips("negro"), 167)
+        self.assertEqual(self.tablero.obtener_pips("blanco"), 167)
+        self.assertEqual(self.tablero.fichas_fuera_de_casa("negro"), 10)
+        self.assertEqual(self.tablero.punto_mas_alto_en_casa("blanco"), 6)
+        self.assertFalse(self.tablero.puede_sacar_fichas("negro"))
+
+    def test_contadores_con_captura_y_barra(self):
+        """
+        Verifica los contadores tras mover, capturar y reingresar desde la barra.
+
+        SOLID: SRP - Cada primitiva actualiza sus contadores.
+        """
+        self.tablero.aplicar_movimiento("negro", 1, 4)
+        self._verificar(self.tablero)
+        self.tablero.colocar_ficha(3, "blanco", 1)
+        self.tablero.aplicar_movimiento("negro", 1, 3)
+        self.assertEqual(self.tablero.obtener_pips("blanco"), 167 + 3 + 22)
+        self._verificar(self.tablero)
+        self.tablero.aplicar_movimiento("blanco", 0, 20)
+        self._verificar(self.tablero)
+        self.tablero.deshacer_movimiento()
+        self.tablero.deshacer_movimiento()
+        self._verificar(self.tablero)
+
+    def test_contadores_en_bearing_off(self):
+        """Verifica puede_sacar_fichas, el punto más alto y los pips al sacar fichas."""
+        tablero = type(self.tablero)()
+        tablero.colocar_ficha(20, "negro", 1)
+        tablero.colocar_ficha(23, "negro", 2)
+        self.assertTrue(tablero.puede_sacar_fichas("negro"))
+        self.assertEqual(tablero.punto_mas_alto_en_casa("negro"), 5)
+
+        tablero.aplicar_movimiento("negro", 20, 25)
+        self.assertEqual(tablero.punto_mas_alto_en_casa("negro"), 2)
+        self.assertEqual(tablero.obtener_pips("negro"), 4)
+        self.assertTrue(tablero._es_bearing_off_valido("negro", 23, 6))
+
+        tablero.enviar_a_barra("negro")
+        self.assertFalse(tablero.puede_sacar_fichas("negro"))
+        self.assertEqual(tablero.fichas_fuera_de_casa("negro"), 0)
+        self._verificar(tablero)
+
+    def test_contadores_en_jugadas_legales(self):
+        """Aplicar y deshacer cada jugada legal mantiene los contadores correctos."""
+        dados = Dice()
+        for dado1 in range(1, 7):
+            for dado2 in range(dado1, 7):
+                dados.set_dados_para_test(dado1, dado2)
+                for jugada in self.tablero.obtener_jugadas_legales("blanco", dados):
+                    self.tablero.aplicar_jugada("blanco", jugada)
+                    self._verificar(self.tablero)
+                    self.tablero.deshacer_jugada(jugada)
+        self._verificar(self.tablero)
+
+    def test_contadores_tras_cargar_estado(self):
+        """cargar_estado_dict recalcula los contadores y copiar los conserva."""
+        self.tablero.enviar_a_barra("blanco")
+        nuevo = type(self.tablero)()
+        nuevo.cargar_estado_dict(copy.deepcopy(self.tablero.obtener_estado_dict()))
+        self._verificar(nuevo)
+        self.assertEqual(nuevo.obtener_pips("blanco"), 167 + 25)
+        self._verificar(nuevo.copiar())
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
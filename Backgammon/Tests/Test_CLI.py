@@ -1,6 +1,8 @@
+import io
 import unittest
 from unittest.mock import Mock, patch
-from Backgammon.Interfaces.CLI import CLI, main
+from Backgammon.Interfaces.CLI import CLI, informar_autoguardado, main
+from Backgammon.Core.AIPlayer import AIPlayer
 
 
 class TestCLI(unittest.TestCase):
@@ -242,7 +244,7 @@ class TestCLIIntegration(unittest.TestCase):
         
         Principio SRP: main solo inicia y maneja excepciones globales.
         """
-        with patch('Backgammon.Interfaces.CLI.CLI') as mock_cli_class:
+        with patch('Backgammon.Interfaces.CLI.CLI') as mock_cli_class, patch('sys.argv', ["cli"]):
             mock_cli_instance = Mock()
             mock_cli_class.return_value = mock_cli_instance
 
@@ -260,7 +262,7 @@ class TestCLIIntegration(unittest.TestCase):
         
         Principio SRP: Manejo de interrupciones centralizado.
         """
-        with patch('Backgammon.Interfaces.CLI.CLI') as mock_cli_class:
+        with patch('Backgammon.Interfaces.CLI.CLI') as mock_cli_class, patch('sys.argv', ["cli"]):
             mock_cli_instance = Mock()
             mock_cli_instance.iniciar_juego.side_effect = KeyboardInterrupt()
             mock_cli_class.return_value = mock_cli_instance
@@ -279,7 +281,7 @@ class TestCLIIntegration(unittest.TestCase):
         
         Principio SRP: Gestión de errores separada de lógica principal.
         """
-        with patch('Backgammon.Interfaces.CLI.CLI') as mock_cli_class:
+        with patch('Backgammon.Interfaces.CLI.CLI') as mock_cli_class, patch('sys.argv', ["cli"]):
             mock_cli_instance = Mock()
             mock_cli_instance.iniciar_juego.side_effect = Exception("Error inesperado")
             mock_cli_class.return_value = mock_cli_instance
@@ -975,5 +977,141 @@ class TestCLISOLIDPrinciples(unittest.TestCase):
                           f"Método cohesivo {metodo} debe existir")
 
 
+class TestCLIOponenteIA(unittest.TestCase):
+    """
+    Tests de la partida contra el jugador automático en la CLI.
+
+    Principios SOLID verificados:
+        - DIP: La CLI usa AIPlayer sin conocer cómo busca la jugada.
+        - SRP: La CLI solo muestra la jugada elegida.
+    """
+
+    def setUp(self):
+        """Crea una CLI con un bot blanco y el tablero inicial."""
+        self.cli = CLI(AIPlayer("Bot", "blanco", profundidad_maxima=1))
+        self.cli.board.inicializar_posiciones_estandar()
+
+    @patch('builtins.input')
+    @patch('builtins.print')
+    def test_turno_computadora_no_pide_datos(self, mock_print, mock_input):
+        """El turno del bot tira los dados, aplica la jugada y no usa input()."""
+        self.cli.turno_actual = "blanco"
+        self.cli.dados.tirar = Mock(side_effect=lambda: self.cli.dados.set_dados_para_test(6, 4))
+
+        self.cli.turno_jugador()
+
+        mock_input.assert_not_called()
+        self.assertEqual(self.cli.board.obtener_pips("blanco"), 167 - 10)
+        self.assertFalse(self.cli.dados.han_sido_tirados())
+        salida = " ".join(str(call) for call in mock_print.call_args_list)
+        self.assertIn("Bot juega:", salida)
+
+    @patch('builtins.input', side_effect=["Ana"])
+    @patch('builtins.print')
+    def test_iniciar_juego_solo_pide_nombre_humano(self, mock_print, mock_input):
+        """Contra el bot solo se pide el nombre del jugador humano."""
+        self.cli.determinar_primer_jugador = Mock()
+        self.cli.loop_principal = Mock()
+
+        self.cli.iniciar_juego()
+
+        self.assertEqual(self.cli.jugador_negro, "Ana")
+        self.assertEqual(self.cli.jugador_blanco, "Bot")
+        self.assertEqual(mock_input.call_count, 1)
+
+    def test_formatear_jugada(self):
+        """Verifica la notación de barra, movimientos normales y salidas."""
+        self.assertEqual(CLI.formatear_jugada([(0, 22), (13, 7)]), "barra/22, 13/7")
+        self.assertEqual(CLI.formatear_jugada([(23, 25), (3, 0)]), "23/fuera, 3/fuera")
+
+    def test_main_con_opcion_ia(self):
+        """main crea la CLI con un AIPlayer blanco cuando recibe --ia."""
+        with patch('Backgammon.Interfaces.CLI.CLI') as mock_cli_class, \
+             patch('sys.argv', ["cli", "--ia"]):
+            main()
+
+        oponente = mock_cli_class.call_args[0][0]
+        self.assertIsInstance(oponente, AIPlayer)
+        self.assertEqual(oponente.obtener_color(), "blanco")
+
+    def test_main_con_pesos(self):
+        """--pesos carga la red del oponente; sin --ia, sin archivo o con opciones desconocidas es un error de uso."""
+        with patch('Backgammon.Interfaces.CLI.CLI') as mock_cli_class, \
+             patch('Backgammon.Interfaces.Opciones.NeuralEvaluator.cargar') as mock_cargar, \
+             patch('sys.argv', ["cli", "--ia", "--pesos", "pesos.npz"]):
+            main()
+        mock_cargar.assert_called_once_with("pesos.npz")
+        self.assertIsInstance(mock_cli_class.call_args[0][0], AIPlayer)
+
+        for argumentos in (["--pesos", "pesos.npz"], ["--ia", "--pesos"], ["--rapido"],
+                           ["--ia", "--pesos", "no_existe.npz"]):
+            with self.subTest(argumentos=argumentos), \
+                 patch('Backgammon.Interfaces.CLI.CLI') as mock_cli_class, \
+                 patch('sys.argv', ["cli"] + argumentos), \
+                 patch('sys.stderr', new_callable=io.StringIO) as mock_stderr, \
+                 self.assertRaises(SystemExit) as salida:
+                main()
+            self.assertEqual(salida.exception.code, 2)
+            self.assertIn("usage", mock_stderr.getvalue())
+            mock_cli_class.assert_not_called()
+
+
+class TestCLIAutoguardado(unittest.TestCase):
+    """
+    Tests del guardado automático de la CLI.
+
+    Principios SOLID verificados:
+        - SRP: La CLI solo marca el estado; GuardadoDiferido decide cuándo escribir.
+        - DIP: La CLI recibe el planificador por constructor.
+    """
+
+    def setUp(self):
+        """Crea una CLI con un planificador simulado y el tablero inicial."""
+        self.autoguardado = Mock()
+        self.cli = CLI(autoguardado=self.autoguardado)
+        self.cli.jugador_negro = "Ana"
+        self.cli.jugador_blanco = "Beto"
+        self.cli.board.inicializar_posiciones_estandar()
+
+    def test_marca_cada_turno_y_vacia_al_terminar(self):
+        """Cada turno marca el slot de autoguardado y el final de la partida lo escribe."""
+        ganado = iter([False, False, False, False, True])
+        self.cli.board.ha_ganado = Mock(side_effect=lambda color: next(ganado))
+
+        with patch.object(self.cli, 'turno_jugador'), patch('builtins.print'):
+            self.cli.loop_principal()
+
+        self.assertEqual(self.autoguardado.marcar.call_count, 2)
+        slot, estado = self.autoguardado.marcar.call_args[0]
+        self.assertEqual(slot, "autoguardado")
+        self.assertEqual(estado["ui_state"]["jugador_negro"], "Ana")
+        self.autoguardado.vaciar.assert_called_once()
+
+    def test_main_con_autoguardar(self):
+        """main crea el planificador con --autoguardar y lo detiene al salir."""
+        with patch('Backgammon.Interfaces.CLI.CLI') as mock_cli_class, \
+             patch('Backgammon.Interfaces.CLI.crear_almacen'), \
+             patch('Backgammon.Interfaces.CLI.GuardadoDiferido') as mock_guardado, \
+             patch('sys.argv', ["cli", "--autoguardar"]):
+            main()
+
+        self.assertIs(mock_guardado.call_args.kwargs["al_guardar"], informar_autoguardado)
+        self.assertIs(mock_cli_class.call_args[0][1], mock_guardado.return_value)
+        mock_guardado.return_value.detener.assert_called_once()
+
+    @patch('builtins.print')
+    def test_informar_autoguardado(self, mock_print):
+        """Solo se muestran los fallos; un conflicto avisa que el slot ya no se guarda."""
+        informar_autoguardado({"autoguardado": (True, "Partida guardada en 'autoguardado'.")})
+        mock_print.assert_not_called()
+
+        informar_autoguardado({"autoguardado": (
+            False, "Conflicto al guardar partida en 'autoguardado': otro proceso guardó "
+                   "la versión 3 (se esperaba la 2).")})
+        self.assertIn("Autoguardado detenido en 'autoguardado'", mock_print.call_args[0][0])
+        informar_autoguardado({"autoguardado": (False, "Error de conexión")})
+        self.assertIn("Falló el autoguardado: Error de conexión", mock_print.call_args[0][0])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,168 @@
+import unittest
+from Backgammon.Core.Board import Board
+from Backgammon.Core.CompactBoard import CompactBoard
+from Backgammon.Core.Dice import Dice
+from Backgammon.Tests import Test_Board
+
+
+class TestCompactBoardContratoBoard(Test_Board.TestBoardFunctionality):
+    """
+    Ejecuta los tests de funcionalidad de Board sobre CompactBoard.
+
+    SOLID: LSP - CompactBoard debe poder sustituir a Board sin cambiar resultados.
+    """
+
+    def setUp(self):
+        """Crea tablero compacto limpio para cada test."""
+        self.tablero = CompactBoard()
+
+
+class TestCompactBoardCoverageContrato(Test_Board.TestBoardCoverageCompletion):
+    """Ejecuta los tests de reglas de bearing off y movimientos sobre CompactBoard."""
+
+    def setUp(self):
+        """Crea tablero compacto limpio para cada test."""
+        self.tablero = CompactBoard()
+
+
+class TestCompactBoardJugadasLegales(Test_Board.TestBoardJugadasLegales):
+    """Ejecuta los tests del generador de jugadas sobre CompactBoard."""
+
+    def setUp(self):
+        """Crea tablero compacto limpio y dados para cada test."""
+        self.tablero = CompactBoard()
+        self.dados = Dice()
+
+
+class TestCompactBoardAplicarDeshacer(Test_Board.TestBoardAplicarDeshacer):
+    """Ejecuta los tests de aplicar/deshacer movimientos sobre CompactBoard."""
+
+    def setUp(self):
+        """Crea tablero compacto con la posición inicial estándar."""
+        self.tablero = CompactBoard()
+        self.tablero.inicializar_posiciones_estandar()
+
+
+class TestCompactBoardHashZobrist(Test_Board.TestBoardHashZobrist):
+    """Ejecuta los tests del hash Zobrist sobre CompactBoard."""
+
+    def setUp(self):
+        """Crea tablero compacto con la posición inicial estándar."""
+        self.tablero = CompactBoard()
+        self.tablero.inicializar_posiciones_estandar()
+
+    def test_mismo_hash_que_board(self):
+        """
+        Verifica que ambos tableros dan el mismo hash para la misma posición.
+
+        SOLID: LSP - El hash no depende de la implementación del tablero.
+        """
+        board = Board()
+        board.inicializar_posiciones_estandar()
+        self.assertEqual(self.tablero.obtener_hash(), board.obtener_hash())
+        self.tablero.aplicar_movimiento("negro", 1, 4)
+        board.aplicar_movimiento("negro", 1, 4)
+        self.assertEqual(self.tablero.obtener_hash(), board.obtener_hash())
+
+
+class TestCompactBoardContadores(Test_Board.TestBoardContadores):
+    """Ejecuta los tests de contadores incrementales sobre CompactBoard."""
+
+    def setUp(self):
+        """Crea tablero compacto con la posición inicial estándar."""
+        self.tablero = CompactBoard()
+        self.tablero.inicializar_posiciones_estandar()
+
+
+class TestCompactBoardRepresentacion(unittest.TestCase):
+    """Tests específicos de la representación en arreglo de CompactBoard."""
+
+    def setUp(self):
+        """Crea tablero compacto con la posición inicial estándar."""
+        self.tablero = CompactBoard()
+        self.tablero.inicializar_posiciones_estandar()
+
+    def test_arreglo_de_28_casillas_con_signo(self):
+        """
+        Verifica el signo por color y el tamaño fijo del arreglo.
+
+        SOLID: SRP - El arreglo es la única estructura de estado.
+        """
+        posiciones = self.tablero.obtener_posiciones()
+        self.assertEqual(len(posiciones), 28)
+        self.assertEqual(posiciones[0], 2)     # Punto 1: 2 negras
+        self.assertEqual(posiciones[23], -2)   # Punto 24: 2 blancas
+        self.assertEqual(sum(v for v in posiciones if v > 0), 15)
+        self.assertEqual(sum(v for v in posiciones if v < 0), -15)
+
+    def test_barra_y_casa_en_casillas_propias(self):
+        """Verifica que barra y casa se guardan en las casillas 24 a 27."""
+        self.tablero.enviar_a_barra("negro")
+        self.tablero.enviar_a_barra("blanco")
+        self.tablero.sacar_ficha("blanco")
+
+        posiciones = self.tablero.obtener_posiciones()
+        self.assertEqual(list(posiciones[24:28]), [1, -1, 0, -1])
+        self.assertEqual(self.tablero.get_barra(), {"negro": 1, "blanco": 1})
+        self.assertEqual(self.tablero.get_casa(), {"blanco": 1})
+
+    def test_copiar_es_independiente(self):
+        """
+        Verifica que la copia no comparte el arreglo con el original.
+
+        SOLID: SRP - Copiar no altera el tablero de origen.
+        """
+        copia = self.tablero.copiar()
+        copia.mover_ficha(1, 3, "negro")
+
+        self.assertEqual(self.tablero.obtener_estado_punto(1), ["negro", 2])
+        self.assertEqual(copia.obtener_estado_punto(1), ["negro", 1])
+        self.assertEqual(copia.obtener_estado_punto(3), ["negro", 1])
+
+    def test_estado_dict_intercambiable_con_board(self):
+        """Verifica que un estado exportado por CompactBoard se carga en Board y viceversa."""
+        self.tablero.mover_ficha(1, 4, "negro")
+        self.tablero.enviar_a_barra("blanco")
+        estado = self.tablero.obtener_estado_dict()
+
+        board = Board()
+        board.cargar_estado_dict(estado)
+        for punto in range(1, 25):
+            self.assertEqual(board.obtener_estado_punto(punto),
+                             self.tablero.obtener_estado_punto(punto))
+
+        compacto = CompactBoard()
+        compacto.cargar_estado_dict(board.obtener_estado_dict())
+        self.assertEqual(list(compacto.obtener_posiciones()),
+                         list(self.tablero.obtener_posiciones()))
+
+    def test_mover_desde_barra_captura(self):
+        """Verifica reingreso desde la barra con captura usando el arreglo."""
+        tablero = CompactBoard()
+        tablero.enviar_a_barra("negro")
+        tablero.colocar_ficha(3, "blanco", 1)
+
+        self.assertTrue(tablero.mover_desde_barra("negro", 3))
+        self.assertEqual(tablero.obtener_estado_punto(3), ["negro", 1])
+        self.assertEqual(tablero.get_barra(), {"blanco": 1})
+
+    def test_movimientos_posibles_igual_que_board(self):
+        """
+        Verifica que la misma posición da los mismos movimientos en ambos tableros.
+
+        SOLID: LSP - Mismo resultado con cualquier implementación.
+        """
+        board = Board()
+        board.inicializar_posiciones_estandar()
+        dados = Dice()
+        for dado1 in range(1, 7):
+            for dado2 in range(1, 7):
+                dados.set_dados_para_test(dado1, dado2)
+                for color in ("negro", "blanco"):
+                    self.assertEqual(
+                        self.tablero.obtener_movimientos_posibles(color, dados),
+                        board.obtener_movimientos_posibles(color, dados))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from Backgammon.Core.Board import Board
+from Backgammon.Persistence.EventLog import (aplanar_estado, desaplanar_estado, calcular_evento,
+                                             aplicar_evento, codificar_evento,
+                                             decodificar_evento)
+
+
+def _partida(board: Board, jugador: str = "negro") -> dict:
+    """Arma una partida con el formato que guarda PygameUI."""
+    return {
+        "board_state": board.obtener_estado_dict(),
+        "ui_state": {"current_player": jugador, "dice_rolls": [3, 1],
+                     "available_moves": [3, 1], "bar_pieces": {"negro": 0, "blanco": 0}},
+    }
+
+
+class TestEventLog(unittest.TestCase):
+    """Tests de los eventos de partida (diferencias entre estados)."""
+
+    def setUp(self):
+        """Crea un tablero con la posición inicial."""
+        self.board = Board()
+        self.board.inicializar_posiciones_estandar()
+
+    def test_aplanar_y_desaplanar(self):
+        """
+        Verifica que aplanar y desaplanar devuelven la misma partida.
+
+        SOLID: SRP - Solo traduce la forma del estado, no lo interpreta.
+        """
+        partida = _partida(self.board)
+        plano = aplanar_estado(partida)
+
+        self.assertEqual(plano["board_state.puntos.#"], 24)
+        self.assertEqual(plano["board_state.puntos.0"], ["negro", 2])
+        self.assertEqual(desaplanar_estado(plano), partida)
+        self.assertIsNot(desaplanar_estado(plano)["board_state"]["puntos"][0],
+                         plano["board_state.puntos.0"])
+
+    def test_evento_de_un_movimiento_es_pequenio(self):
+        """Mover una ficha genera un evento con solo los puntos y campos que cambiaron."""
+        anterior = aplanar_estado(_partida(self.board))
+        self.board.aplicar_movimiento("negro", 1, 4)
+        nuevo = aplanar_estado(_partida(self.board))
+        nuevo["ui_state.available_moves"] = [1]
+
+        evento = calcular_evento(anterior, nuevo)
+
+        self.assertEqual(set(evento["set"]), {"board_state.puntos.0", "board_state.puntos.3",
+                                              "ui_state.available_moves"})
+        self.assertEqual(evento["del"], [])
+        self.assertLess(len(codificar_evento(evento)), 80)
+
+    def test_aplicar_eventos_reconstruye_el_estado(self):
+        """
+        Aplicar los eventos en orden desde un estado vacío da el último estado.
+
+        SOLID: OCP - Claves nuevas o eliminadas se registran sin cambiar el formato.
+        """
+        estados = [_partida(self.board)]
+        self.board.aplicar_movimiento("negro", 1, 4)
+        estados.append(_partida(self.board, "blanco"))
+        sin_barra = _partida(self.board, "blanco")
+        del sin_barra["ui_state"]["bar_pieces"]
+        sin_barra["extra"] = 7
+        estados.append(sin_barra)
+
+        plano, anterior = {}, {}
+        for estado in estados:
+            actual = aplanar_estado(estado)
+            evento = decodificar_evento(codificar_evento(calcular_evento(anterior, actual)))
+            aplicar_evento(plano, evento)
+            anterior = actual
+            self.assertEqual(desaplanar_estado(plano), estado)
+
+
+if __name__ == "__main__":
+    unittest.main()
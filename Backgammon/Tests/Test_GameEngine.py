@@ -0,0 +1,164 @@
+import random
+import subprocess
+import sys
+import unittest
+from Backgammon.Core.AIPlayer import AIPlayer
+from Backgammon.Core.Board import Board
+from Backgammon.Core.GameEngine import (FASE_JUGAR, FASE_TERMINADA, FASE_TIRAR,
+                                        GameEngine)
+
+
+class _JugadorPrimeraJugada:
+    """Jugador de prueba que siempre elige la primera jugada legal."""
+
+    def __init__(self, color):
+        """Guarda el color del jugador."""
+        self.color = color
+
+    def elegir_jugada(self, board, dados):
+        """Devuelve la primera jugada legal."""
+        return board.obtener_jugadas_legales(self.color, dados)[0]
+
+
+def _final(ganador_fuera, perdedor_punto, perdedor_fuera=0):
+    """Arma un final con una ficha negra en el punto 24 y el resto fuera."""
+    tablero = Board()
+    tablero.colocar_ficha(24, "negro", 1)
+    for _ in range(ganador_fuera):
+        tablero.sacar_ficha("negro")
+    for _ in range(perdedor_fuera):
+        tablero.sacar_ficha("blanco")
+    if perdedor_punto == 0:
+        for _ in range(15 - perdedor_fuera):
+            tablero.enviar_a_barra("blanco")
+    else:
+        tablero.colocar_ficha(perdedor_punto, "blanco", 15 - perdedor_fuera)
+    return tablero
+
+
+class TestGameEngine(unittest.TestCase):
+    """Tests del motor de partida sin interfaz."""
+
+    def setUp(self):
+        """Crea un motor con la posición inicial y empieza negro."""
+        self.motor = GameEngine(turno="negro")
+
+    def test_no_importa_pygame(self):
+        """
+        Verifica que el motor no depende de pygame.
+
+        SOLID: DIP - El núcleo no depende de la interfaz gráfica.
+        """
+        codigo = ("import sys; import Backgammon.Core.GameEngine; "
+                  "print('pygame' in sys.modules)")
+        salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True,
+                                check=True)
+        self.assertEqual(salida.stdout.strip(), "False")
+
+    def test_fases_del_turno(self):
+        """
+        Verifica el ciclo tirar -> jugar -> tirar del rival.
+
+        SOLID: SRP - El motor solo maneja la máquina de estados.
+        """
+        self.assertEqual(self.motor.obtener_fase(), FASE_TIRAR)
+        with self.assertRaises(ValueError):
+            self.motor.obtener_jugadas_legales()
+
+        self.assertEqual(self.motor.tirar_dados(3, 1), (3, 1))
+        self.assertEqual(self.motor.obtener_fase(), FASE_JUGAR)
+        with self.assertRaises(ValueError):
+            self.motor.tirar_dados()
+
+        jugadas = self.motor.obtener_jugadas_legales()
+        self.assertIn([(17, 20), (19, 20)], jugadas)
+        self.motor.aplicar_jugada([(17, 20), (19, 20)])
+
+        self.assertEqual(self.motor.obtener_turno(), "blanco")
+        self.assertEqual(self.motor.obtener_fase(), FASE_TIRAR)
+        self.assertEqual(self.motor.obtener_tablero().obtener_estado_punto(20), ["negro", 2])
+        self.assertEqual(self.motor.obtener_turnos(), 1)
+
+    def test_jugadas_legales_es_una_copia(self):
+        """Modificar la lista devuelta no vuelve legal una jugada ilegal."""
+        self.motor.tirar_dados(6, 5)
+        jugadas = self.motor.obtener_jugadas_legales()
+        jugadas.append([(1, 2)])
+        jugadas[0].append((1, 2))
+        self.assertNotIn([(1, 2)], self.motor.obtener_jugadas_legales())
+        hash_antes = self.motor.obtener_tablero().obtener_hash()
+        with self.assertRaises(ValueError):
+            self.motor.aplicar_jugada([(1, 2)])
+        self.assertEqual(self.motor.obtener_tablero().obtener_hash(), hash_antes)
+        self.assertEqual(self.motor.obtener_jugadas_legales()[0], jugadas[0][:-1])
+
+    def test_jugada_ilegal(self):
+        """Una jugada que no está entre las legales lanza ValueError y no cambia nada."""
+        self.motor.tirar_dados(6, 5)
+        hash_antes = self.motor.obtener_tablero().obtener_hash()
+        with self.assertRaises(ValueError):
+            self.motor.aplicar_jugada([(1, 2)])
+        with self.assertRaises(ValueError):
+            self.motor.aplicar_jugada([])
+        self.assertEqual(self.motor.obtener_tablero().obtener_hash(), hash_antes)
+        self.assertEqual(self.motor.obtener_turno(), "negro")
+
+    def test_pasar_sin_jugadas(self):
+        """Sin jugadas legales solo se puede pasar con la jugada vacía."""
+        tablero = Board()
+        tablero.enviar_a_barra("negro")
+        for punto in range(1, 7):
+            tablero.colocar_ficha(punto, "blanco", 2)
+        tablero.colocar_ficha(10, "blanco", 3)
+        motor = GameEngine(tablero, turno="negro")
+
+        motor.tirar_dados(3, 5)
+        self.assertEqual(motor.obtener_jugadas_legales(), [])
+        with self.assertRaises(ValueError):
+            motor.aplicar_jugada([(0, 3)])
+        motor.aplicar_jugada([])
+        self.assertEqual(motor.obtener_turno(), "blanco")
+
+    def test_tipos_de_victoria(self):
+        """Verifica victoria simple, gammon y backgammon."""
+        casos = ((_final(14, 3, perdedor_fuera=1), "simple", 1),
+                 (_final(14, 10), "gammon", 2),
+                 (_final(14, 20), "backgammon", 3),
+                 (_final(14, 0), "backgammon", 3))
+        for tablero, tipo, puntos in casos:
+            motor = GameEngine(tablero, turno="negro")
+            motor.tirar_dados(2, 1)
+            motor.aplicar_jugada(motor.obtener_jugadas_legales()[0])
+            self.assertTrue(motor.termino())
+            self.assertEqual(motor.obtener_fase(), FASE_TERMINADA)
+            resultado = motor.obtener_resultado()
+            self.assertEqual((resultado["ganador"], resultado["tipo"], resultado["puntos"]),
+                             ("negro", tipo, puntos))
+            with self.assertRaises(ValueError):
+                motor.tirar_dados()
+
+    def test_partida_completa_determinista(self):
+        """
+        Una partida completa con la misma semilla da el mismo resultado.
+
+        SOLID: DIP - Los jugadores son cualquier objeto con elegir_jugada.
+        """
+        resultados = []
+        for _ in range(2):
+            motor = GameEngine(turno=None, generador=random.Random(11))
+            jugadores = {"negro": _JugadorPrimeraJugada("negro"),
+                         "blanco": AIPlayer("Bot", "blanco", profundidad_maxima=1, limite_tiempo=None)}
+            resultados.append(motor.jugar_partida(jugadores))
+        self.assertEqual(resultados[0], resultados[1])
+        self.assertIn(resultados[0]["ganador"], ("negro", "blanco"))
+        self.assertGreater(resultados[0]["turnos"], 0)
+        self.assertIsNone(GameEngine().obtener_resultado())
+
+    def test_turno_invalido(self):
+        """Un color inicial desconocido lanza ValueError."""
+        with self.assertRaises(ValueError):
+            GameEngine(turno="rojo")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from Backgammon.Core.Board import Board
+from Backgammon.Core.CompactBoard import CompactBoard
+from Backgammon.Core.Dice import Dice
+from Backgammon.Core.NeuralEvaluator import NeuralEvaluator, TAMANIO_ENTRADA, equidad
+
+
+def _espejar(board):
+    """Devuelve un tablero con los colores intercambiados y los puntos invertidos."""
+    espejo = Board()
+    for punto in range(1, 25):
+        estado = board.obtener_estado_punto(punto)
+        if estado is not None and estado[0] is not None and estado[1] > 0:
+            otro = "blanco" if estado[0] == "negro" else "negro"
+            espejo.colocar_ficha(25 - punto, otro, estado[1])
+    return espejo
+
+
+class TestNeuralEvaluator(unittest.TestCase):
+    """Tests del evaluador neuronal en lote."""
+
+    def setUp(self):
+        """Crea una red aleatoria reproducible y el tablero inicial."""
+        self.red = NeuralEvaluator.aleatorio(ocultas=16, semilla=7)
+        self.tablero = Board()
+        self.tablero.inicializar_posiciones_estandar()
+        self.dados = Dice()
+
+    def test_codificacion_td_gammon(self):
+        """
+        Verifica las 198 entradas de la posición inicial desde el punto de vista de negro.
+
+        SOLID: SRP - La codificación no depende de la red.
+        """
+        entradas = self.red.codificar([self.tablero], "negro")
+        self.assertEqual(entradas.shape, (1, TAMANIO_ENTRADA))
+        propias = entradas[0, :96].reshape(24, 4)
+        # Las 2 negras del punto 1 están a distancia 24 (última fila)
+        self.assertEqual(list(propias[23]), [1, 1, 0, 0])
+        # Las 5 negras del punto 19 están a distancia 6
+        self.assertEqual(list(propias[5]), [1, 1, 1, 1])
+        self.assertEqual(entradas[0, :192].sum(), entradas[0, 96:192].sum() * 2)
+        self.assertEqual(list(entradas[0, 192:]), [0, 0, 0, 0, 0, 1])
+
+    def test_codificacion_simetrica_por_color(self):
+        """La misma posición vista por cada color codifica igual que su espejo."""
+        self.tablero.aplicar_movimiento("negro", 1, 4)
+        espejo = _espejar(self.tablero)
+        np.testing.assert_array_equal(self.red.codificar([self.tablero], "negro"),
+                                      self.red.codificar([espejo], "blanco"))
+
+    def test_board_y_compact_board_codifican_igual(self):
+        """
+        Verifica que ambos tableros producen la misma matriz.
+
+        SOLID: LSP - La codificación funciona con cualquier implementación de Board.
+        """
+        compacto = CompactBoard()
+        compacto.inicializar_posiciones_estandar()
+        for tablero in (self.tablero, compacto):
+            tablero.enviar_a_barra("blanco")
+            tablero.sacar_ficha("negro")
+        np.testing.assert_array_equal(self.red.codificar([self.tablero], "blanco"),
+                                      self.red.codificar([compacto], "blanco"))
+
+    def test_lote_igual_a_evaluaciones_individuales(self):
+        """Evaluar en lote da lo mismo que evaluar cada tablero por separado."""
+        otro = self.tablero.copiar()
+        otro.aplicar_movimiento("negro", 12, 17)
+        lote = self.red.evaluar([self.tablero, otro], "negro")
+        self.assertEqual(lote.shape, (2, 3))
+        np.testing.assert_allclose(lote[1], self.red.evaluar([otro], "negro")[0])
+        self.assertTrue(np.all((lote > 0) & (lote < 1)))
+
+    def test_evaluar_jugadas_no_modifica_tablero(self):
+        """
+        Verifica que todas las jugadas de la tirada se evalúan en una llamada sin cambiar el tablero.
+
+        SOLID: SRP - Evaluar no aplica jugadas de forma permanente.
+        """
+        self.dados.set_dados_para_test(3, 1)
+        jugadas = self.tablero.obtener_jugadas_legales("negro", self.dados)
+        hash_antes = self.tablero.obtener_hash()
+
+        probabilidades = self.red.evaluar_jugadas(self.tablero, "negro", jugadas)
+
+        self.assertEqual(probabilidades.shape, (len(jugadas), 3))
+        self.assertEqual(self.tablero.obtener_hash(), hash_antes)
+        self.tablero.aplicar_jugada("negro", jugadas[-1])
+        np.testing.assert_allclose(probabilidades[-1], self.red.evaluar([self.tablero], "negro")[0])
+
+    def test_partida_terminada_tiene_resultado_exacto(self):
+        """Una posición ganada vale victoria segura, con gammon si el rival no sacó fichas."""
+        tablero = Board()
+        for _ in range(15):
+            tablero.sacar_ficha("negro")
+        tablero.colocar_ficha(5, "blanco", 15)
+        np.testing.assert_array_equal(self.red.evaluar([tablero], "negro")[0], [1, 1, 0])
+        np.testing.assert_array_equal(self.red.evaluar([tablero], "blanco")[0], [0, 0, 1])
+        self.assertEqual(equidad(np.array([1.0, 1.0, 0.0])), 2.0)
+
+    def test_sugerir_jugadas_ordenadas(self):
+        """Las sugerencias son jugadas legales ordenadas por equidad decreciente."""
+        self.dados.set_dados_para_test(6, 5)
+        sugerencias = self.red.sugerir_jugadas(self.tablero, "blanco", self.dados, cantidad=3)
+        self.assertEqual(len(sugerencias), 3)
+        legales = self.tablero.obtener_jugadas_legales("blanco", self.dados)
+        equidades = [valor for _, valor, _ in sugerencias]
+        self.assertEqual(equidades, sorted(equidades, reverse=True))
+        for jugada, _, _ in sugerencias:
+            self.assertIn(jugada, legales)
+
+    def test_guardar_y_cargar_npz(self):
+        """Los pesos guardados en .npz se cargan y dan las mismas salidas."""
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, "pesos.npz")
+            self.red.guardar(ruta)
+            cargada = NeuralEvaluator.cargar(ruta)
+        np.testing.assert_allclose(cargada.evaluar([self.tablero], "negro"),
+                                   self.red.evaluar([self.tablero], "negro"))
+
+    def test_gradientes_coinciden_con_diferencias_finitas(self):
+        """
+        Verifica los gradientes de la red contra diferencias finitas.
+
+        SOLID: SRP - La red calcula sus gradientes; el entrenamiento solo los usa.
+        """
+        entrada = np.random.default_rng(2).random(198)
+        salidas, gradientes = self.red.gradientes(entrada)
+        pesos = self.red.obtener_pesos()
+        for clave in ("W1", "b1", "W2", "b2"):
+            indice = np.unravel_index(2, pesos[clave].shape)
+            original = pesos[clave][indice]
+            pesos[clave][indice] = original + 1e-6
+            numerico = (self.red.evaluar_entradas(entrada[None])[0] - salidas) / 1e-6
+            pesos[clave][indice] = original
+            np.testing.assert_allclose(gradientes[clave][(slice(None),) + indice], numerico,
+                                       atol=1e-5)
+
+    def test_dimensiones_invalidas(self):
+        """Pesos con dimensiones incompatibles lanzan ValueError."""
+        with self.assertRaises(ValueError):
+            NeuralEvaluator(np.zeros((10, 4)), np.zeros(4), np.zeros((4, 3)), np.zeros(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import threading
 import unittest
 from unittest.mock import patch, Mock
 import pygame
@@ -9,6 +10,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from Backgammon.Interfaces.PygameUI import *
 from Backgammon.Core.Board import Board
 from Backgammon.Persistence.RedisManager import RedisManager
+from Backgammon.Persistence.SQLiteManager import SQLiteManager
 
 
 # --- CLASE BASE PARA TESTS DE LÓGICA Y DIBUJO ---
@@ -169,13 +171,13 @@ class TestPygameUI(unittest.TestCase):
         """
         self.assertTrue(hasattr(self.ui, '_PygameUI__get_point_screen_position'))
 
-    def test_metodo_draw_checker_stack_existe(self):
-        """Debe tener el método privado __draw_checker_stack.
+    def test_metodo_checker_stack_sprites_existe(self):
+        """Debe tener el método privado __checker_stack_sprites.
         
         Principio ISP: Confirma la existencia de un método en la
         interfaz interna de la clase.
         """
-        self.assertTrue(hasattr(self.ui, '_PygameUI__draw_checker_stack'))
+        self.assertTrue(hasattr(self.ui, '_PygameUI__checker_stack_sprites'))
 
     def test_inicializacion_con_dimensiones_default(self):
         """Debe inicializarse con dimensiones por defecto.
@@ -294,40 +296,58 @@ class TestPygameUI(unittest.TestCase):
         self.assertEqual(mock_polygon.call_count, 2)  # Relleno + borde
 
     @patch("pygame.draw.circle")
-    def test_draw_checker_stack_fichas_blancas(self, mock_circle):
-        """Debe dibujar stack de fichas blancas.
+    def test_checker_stack_sprites_fichas_blancas(self, mock_circle):
+        """Debe armar la pila de fichas blancas con el sprite del atlas.
         
-        Principio LSP: El método __draw_checker_stack se comporta
+        Principio LSP: El método __checker_stack_sprites se comporta
         consistentemente para diferentes colores (blanco).
         """
-        self.ui._PygameUI__screen__ = pygame.Surface((1600, 900))
-        self.ui._PygameUI__draw_checker_stack(400, 300, "blanco", 3, 6, 25)
-        # 3 fichas + 3 bordes = 6 llamadas
-        self.assertEqual(mock_circle.call_count, 6)
+        sprites = self.ui._PygameUI__checker_stack_sprites(400, 300, "blanco", 3, 6, 25)
+        # Sprites pre-renderizados: ningún círculo por frame
+        mock_circle.assert_not_called()
+        self.assertEqual(len(sprites), 3)
+        atlas = self.ui.__checker_sprites__.get("blanco", 25)
+        self.assertTrue(all(sprite is atlas for sprite, _ in sprites))
 
     @patch("pygame.draw.circle")
-    def test_draw_checker_stack_fichas_negras(self, mock_circle):
-        """Debe dibujar stack de fichas negras.
+    def test_checker_stack_sprites_fichas_negras(self, mock_circle):
+        """Debe armar la pila de fichas negras con el sprite del atlas.
         
-        Principio LSP: El método __draw_checker_stack se comporta
+        Principio LSP: El método __checker_stack_sprites se comporta
         consistentemente para diferentes colores (negro).
         """
-        self.ui._PygameUI__screen__ = pygame.Surface((1600, 900))
-        self.ui._PygameUI__draw_checker_stack(400, 300, "negro", 2, 19, 25)
-        # 2 fichas + 2 bordes = 4 llamadas
-        self.assertEqual(mock_circle.call_count, 4)
+        sprites = self.ui._PygameUI__checker_stack_sprites(400, 300, "negro", 2, 19, 25)
+        mock_circle.assert_not_called()
+        self.assertEqual(len(sprites), 2)
+        atlas = self.ui.__checker_sprites__.get("negro", 25)
+        self.assertTrue(all(sprite is atlas for sprite, _ in sprites))
 
     @patch("pygame.draw.circle")
-    def test_draw_checker_stack_limite_fichas_visibles(self, mock_circle):
-        """No debe dibujar más de 10 fichas visibles.
+    def test_checker_stack_sprites_limite_fichas_visibles(self, mock_circle):
+        """No debe armar más de 10 fichas visibles.
         
-        Principio LSP: El método __draw_checker_stack maneja
+        Principio LSP: El método __checker_stack_sprites maneja
         consistentemente un caso límite (más de 10 fichas).
         """
-        self.ui._PygameUI__screen__ = pygame.Surface((1600, 900))
-        self.ui._PygameUI__draw_checker_stack(400, 300, "blanco", 15, 13, 25)
-        # Máximo 10 fichas + 10 bordes = 20 llamadas
-        self.assertEqual(mock_circle.call_count, 20)
+        sprites = self.ui._PygameUI__checker_stack_sprites(400, 300, "blanco", 15, 13, 25)
+        mock_circle.assert_not_called()
+        self.assertEqual(len(sprites), 10)
+
+    @patch("pygame.draw.circle")
+    def test_draw_checkers_copia_todas_las_pilas_con_un_blits(self, mock_circle):
+        """Todas las pilas del tablero se copian del atlas con una sola llamada a blits.
+        
+        Principio SRP: __draw_checkers solo junta los sprites de cada pila y los copia.
+        """
+        self.ui.__screen__ = Mock()
+        self.ui._PygameUI__draw_checkers()
+        mock_circle.assert_not_called()
+        self.ui.__screen__.blits.assert_called_once()
+        sprites = self.ui.__screen__.blits.call_args[0][0]
+        # Posición inicial: 15 fichas por color, ninguna pila de más de 10
+        self.assertEqual(len(sprites), 30)
+        atlas = {self.ui.__checker_sprites__.get(color, 25) for color in ("negro", "blanco")}
+        self.assertEqual({sprite for sprite, _ in sprites}, atlas)
 
     @patch("pygame.draw.rect")
     def test_draw_backgammon_board_dibuja_elementos(self, mock_rect):
@@ -353,6 +373,26 @@ class TestPygameUI(unittest.TestCase):
         # 24 triángulos × 2 (relleno + borde) = 48 llamadas
         self.assertEqual(mock_polygon.call_count, 48)
 
+    def test_capa_estatica_se_dibuja_una_sola_vez(self):
+        """La capa estática del tablero se genera una vez y se regenera solo al cambiar el tamaño.
+
+        Principio SRP: __draw_backgammon_board solo copia la capa; los polígonos
+        se dibujan al construirla.
+        """
+        with patch("pygame.draw.polygon") as mock_polygon:
+            self.ui._PygameUI__draw_backgammon_board()
+            self.ui._PygameUI__draw_backgammon_board()
+            self.ui._PygameUI__draw()
+        self.assertEqual(mock_polygon.call_count, 48)
+
+        self.ui.__screen__ = pygame.Surface((1700, 950))
+        with patch("pygame.draw.polygon") as mock_polygon:
+            self.ui._PygameUI__draw_backgammon_board()
+        self.assertEqual(mock_polygon.call_count, 48)
+        self.assertEqual(self.ui.__static_layer__.get_size(), (1700, 950))
+        # El fondo de la capa se copia a la pantalla
+        self.assertEqual(self.ui.__screen__.get_at((5, 5))[:3], (139, 69, 19))
+
     def test_draw_checkers_no_falla_con_board_real(self):
         """El método draw_checkers debe funcionar con el board real.
         
@@ -459,22 +499,16 @@ class TestPygameUI(unittest.TestCase):
     def test_direccion_apilamiento_fichas(self):
         """Las fichas deben apilarse en la dirección correcta según el punto.
         
-        Principio LSP: Verifica que __draw_checker_stack se comporta
+        Principio LSP: Verifica que __checker_stack_sprites se comporta
         correctamente (apila hacia arriba/abajo) según la posición.
         """
-        self.ui._PygameUI__screen__ = pygame.Surface((1600, 900))
-
-        # Test para puntos que van hacia abajo (1-12)
-        try:
-            self.ui._PygameUI__draw_checker_stack(400, 200, "blanco", 3, 5, 25)
-        except Exception as e:
-            self.fail(f"Error apilando hacia abajo: {e}")
+        # Puntos que van hacia abajo (1-12)
+        sprites = self.ui._PygameUI__checker_stack_sprites(400, 200, "blanco", 3, 5, 25)
+        self.assertEqual([destino.centery for _, destino in sprites], [200, 230, 260])
 
-        # Test para puntos que van hacia arriba (13-24)
-        try:
-            self.ui._PygameUI__draw_checker_stack(400, 600, "negro", 3, 15, 25)
-        except Exception as e:
-            self.fail(f"Error apilando hacia arriba: {e}")
+        # Puntos que van hacia arriba (13-24)
+        sprites = self.ui._PygameUI__checker_stack_sprites(400, 600, "negro", 3, 15, 25)
+        self.assertEqual([destino.centery for _, destino in sprites], [600, 570, 540])
 
     def test_board_instancia_es_board(self):
         """La instancia interna debe ser de tipo Board.
@@ -795,13 +829,12 @@ class TestBearingOffFunctionality(unittest.TestCase):
         de determinar si el 'bearing off' está permitido (caso 'negro' válido).
         """
         # Limpiar tablero primero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
         
         # Colocar fichas solo en home
-        self.board.__puntos__[18] = ("negro", 5)  # punto 19
-        self.board.__puntos__[19] = ("negro", 5)  # punto 20
-        self.board.__puntos__[20] = ("negro", 5)  # punto 21
+        self.board.colocar_ficha(19, "negro", 5)  # punto 19
+        self.board.colocar_ficha(20, "negro", 5)  # punto 20
+        self.board.colocar_ficha(21, "negro", 5)  # punto 21
         
         result = self.bearing_off_validator.can_bear_off("negro")
         self.assertTrue(result)
@@ -813,11 +846,10 @@ class TestBearingOffFunctionality(unittest.TestCase):
         (caso 'negro' inválido).
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[18] = ("negro", 10)  # punto 19
-        self.board.__puntos__[12] = ("negro", 5)   # punto 13 (fuera de home)
+        self.board.colocar_ficha(19, "negro", 10)  # punto 19
+        self.board.colocar_ficha(13, "negro", 5)   # punto 13 (fuera de home)
         
         result = self.bearing_off_validator.can_bear_off("negro")
         self.assertFalse(result)
@@ -829,12 +861,11 @@ class TestBearingOffFunctionality(unittest.TestCase):
         (caso 'blanco' válido).
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[0] = ("blanco", 5)  # punto 1
-        self.board.__puntos__[1] = ("blanco", 5)  # punto 2
-        self.board.__puntos__[2] = ("blanco", 5)  # punto 3
+        self.board.colocar_ficha(1, "blanco", 5)  # punto 1
+        self.board.colocar_ficha(2, "blanco", 5)  # punto 2
+        self.board.colocar_ficha(3, "blanco", 5)  # punto 3
         
         result = self.bearing_off_validator.can_bear_off("blanco")
         self.assertTrue(result)
@@ -846,11 +877,10 @@ class TestBearingOffFunctionality(unittest.TestCase):
         (caso 'blanco' inválido).
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[0] = ("blanco", 10)  # punto 1
-        self.board.__puntos__[10] = ("blanco", 5)  # punto 11 (fuera de home)
+        self.board.colocar_ficha(1, "blanco", 10)  # punto 1
+        self.board.colocar_ficha(11, "blanco", 5)  # punto 11 (fuera de home)
         
         result = self.bearing_off_validator.can_bear_off("blanco")
         self.assertFalse(result)
@@ -864,10 +894,9 @@ class TestBearingOffFunctionality(unittest.TestCase):
         de validar un intento de 'bearing off' (caso dado exacto).
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[22] = ("negro", 1)  # punto 23
+        self.board.colocar_ficha(23, "negro", 1)  # punto 23
         
         is_valid, msg = self.bearing_off_validator.validate_bearing_off_move("negro", 23, 2)
         self.assertTrue(is_valid)
@@ -880,10 +909,9 @@ class TestBearingOffFunctionality(unittest.TestCase):
         (caso dado mayor, sin fichas más lejanas).
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[22] = ("negro", 1)  # punto 23 (distancia 2)
+        self.board.colocar_ficha(23, "negro", 1)  # punto 23 (distancia 2)
         
         is_valid, msg = self.bearing_off_validator.validate_bearing_off_move("negro", 23, 5)
         self.assertTrue(is_valid)
@@ -895,11 +923,10 @@ class TestBearingOffFunctionality(unittest.TestCase):
         (caso dado mayor, CON fichas más lejanas).
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[22] = ("negro", 1)  # punto 23 (distancia 2)
-        self.board.__puntos__[20] = ("negro", 1)  # punto 21 (más alejado)
+        self.board.colocar_ficha(23, "negro", 1)  # punto 23 (distancia 2)
+        self.board.colocar_ficha(21, "negro", 1)  # punto 21 (más alejado)
         
         is_valid, msg = self.bearing_off_validator.validate_bearing_off_move("negro", 23, 5)
         self.assertFalse(is_valid)
@@ -912,10 +939,9 @@ class TestBearingOffFunctionality(unittest.TestCase):
         (caso 'blanco', dado exacto).
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[2] = ("blanco", 1)  # punto 3
+        self.board.colocar_ficha(3, "blanco", 1)  # punto 3
         
         is_valid, msg = self.bearing_off_validator.validate_bearing_off_move("blanco", 3, 3)
         self.assertTrue(is_valid)
@@ -928,10 +954,9 @@ class TestBearingOffFunctionality(unittest.TestCase):
         (caso 'blanco', dado mayor, sin fichas lejanas).
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[2] = ("blanco", 1)  # punto 3 (distancia 3)
+        self.board.colocar_ficha(3, "blanco", 1)  # punto 3 (distancia 3)
         
         is_valid, msg = self.bearing_off_validator.validate_bearing_off_move("blanco", 3, 6)
         self.assertTrue(is_valid)
@@ -943,10 +968,9 @@ class TestBearingOffFunctionality(unittest.TestCase):
         (caso ficha fuera de 'home').
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[12] = ("negro", 1)  # punto 13 (no home)
+        self.board.colocar_ficha(13, "negro", 1)  # punto 13 (no home)
         
         is_valid, msg = self.bearing_off_validator.validate_bearing_off_move("negro", 13, 2)
         self.assertFalse(is_valid)
@@ -959,10 +983,9 @@ class TestBearingOffFunctionality(unittest.TestCase):
         (caso dado insuficiente).
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[18] = ("negro", 1)  # punto 19 (distancia 6)
+        self.board.colocar_ficha(19, "negro", 1)  # punto 19 (distancia 6)
         
         is_valid, msg = self.bearing_off_validator.validate_bearing_off_move("negro", 19, 3)
         self.assertFalse(is_valid)
@@ -977,11 +1000,10 @@ class TestBearingOffFunctionality(unittest.TestCase):
         de BearingOffValidator, asegurando su lógica interna.
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[22] = ("negro", 1)  # punto 23
-        self.board.__puntos__[19] = ("negro", 1)  # punto 20 (más alejado)
+        self.board.colocar_ficha(23, "negro", 1)  # punto 23
+        self.board.colocar_ficha(20, "negro", 1)  # punto 20 (más alejado)
         
         result = self.bearing_off_validator._has_pieces_in_higher_positions("negro", 23)
         self.assertTrue(result)
@@ -993,10 +1015,9 @@ class TestBearingOffFunctionality(unittest.TestCase):
         (caso negativo).
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[18] = ("negro", 1)  # punto 19 (la más alejada)
+        self.board.colocar_ficha(19, "negro", 1)  # punto 19 (la más alejada)
         
         result = self.bearing_off_validator._has_pieces_in_higher_positions("negro", 19)
         self.assertFalse(result)
@@ -1008,11 +1029,10 @@ class TestBearingOffFunctionality(unittest.TestCase):
         (caso 'blanco', positivo).
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[2] = ("blanco", 1)  # punto 3
-        self.board.__puntos__[4] = ("blanco", 1)  # punto 5 (más alejado)
+        self.board.colocar_ficha(3, "blanco", 1)  # punto 3
+        self.board.colocar_ficha(5, "blanco", 1)  # punto 5 (más alejado)
         
         result = self.bearing_off_validator._has_pieces_in_higher_positions("blanco", 3)
         self.assertTrue(result)
@@ -1024,10 +1044,9 @@ class TestBearingOffFunctionality(unittest.TestCase):
         (caso 'blanco', negativo).
         """
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
+        self.board._vaciar_tablero()
             
-        self.board.__puntos__[5] = ("blanco", 1)  # punto 6 (la más alejada)
+        self.board.colocar_ficha(6, "blanco", 1)  # punto 6 (la más alejada)
         
         result = self.bearing_off_validator._has_pieces_in_higher_positions("blanco", 6)
         self.assertFalse(result)
@@ -1136,9 +1155,8 @@ class TestBearingOffFunctionality(unittest.TestCase):
         self.ui.__available_moves__ = [2, 5]
         
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
-        self.board.__puntos__[22] = ("negro", 1)  # punto 23
+        self.board._vaciar_tablero()
+        self.board.colocar_ficha(23, "negro", 1)  # punto 23
         
         result = self.ui._PygameUI__has_valid_bearing_off_moves()
         self.assertTrue(result)
@@ -1153,9 +1171,8 @@ class TestBearingOffFunctionality(unittest.TestCase):
         self.ui.__available_moves__ = [1, 2]
         
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
-        self.board.__puntos__[18] = ("negro", 1)  # punto 19 (necesita dado 6)
+        self.board._vaciar_tablero()
+        self.board.colocar_ficha(19, "negro", 1)  # punto 19 (necesita dado 6)
         
         result = self.ui._PygameUI__has_valid_bearing_off_moves()
         self.assertFalse(result)
@@ -1280,10 +1297,9 @@ class TestBearingOffFunctionality(unittest.TestCase):
         self.ui.__available_moves__ = [2]
         
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
-        self.board.__puntos__[22] = ("negro", 1)  # punto 23
-        self.board.__puntos__[12] = ("negro", 1)  # punto 13 (fuera)
+        self.board._vaciar_tablero()
+        self.board.colocar_ficha(23, "negro", 1)  # punto 23
+        self.board.colocar_ficha(13, "negro", 1)  # punto 13 (fuera)
         
         self.ui._PygameUI__attempt_bearing_off(23, 25)
         
@@ -1302,9 +1318,8 @@ class TestBearingOffFunctionality(unittest.TestCase):
         self.ui.__game_state_manager__.change_state('AWAITING_PIECE_SELECTION')
         
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
-        self.board.__puntos__[22] = ("negro", 1)  # punto 23
+        self.board._vaciar_tablero()
+        self.board.colocar_ficha(23, "negro", 1)  # punto 23
         
         self.ui._PygameUI__attempt_piece_selection(23)
         
@@ -1322,9 +1337,8 @@ class TestBearingOffFunctionality(unittest.TestCase):
         self.ui.__game_state_manager__.change_state('AWAITING_PIECE_SELECTION')
         
         # Limpiar tablero
-        for i in range(24):
-            self.board.__puntos__[i] = (None, 0)
-        self.board.__puntos__[18] = ("negro", 1)  # punto 19
+        self.board._vaciar_tablero()
+        self.board.colocar_ficha(19, "negro", 1)  # punto 19
         
         self.ui._PygameUI__attempt_piece_selection(19)
         
@@ -1502,9 +1516,8 @@ class TestMovementValidator(unittest.TestCase):
         self.bar_manager = self.ui.__bar_manager__
         self.validator = self.ui.__movement_validator__
 
-        # **LA SOLUCIÓN CLAVE**: Accedemos al atributo __puntos__ directamente
-        # para modificar la lista interna del tablero.
-        self.board.__puntos__[:] = [(None, 0)] * 24
+        # Vaciamos el tablero con su propia API para que mantenga sus contadores.
+        self.board._vaciar_tablero()
         self.bar_manager.bar = {"blanco": 0, "negro": 0}
 
     def test_has_no_valid_move_all_blocked(self):
@@ -1513,10 +1526,10 @@ class TestMovementValidator(unittest.TestCase):
         Principio SRP: Prueba la lógica central de MovementValidator en un
         escenario donde no hay movimientos posibles.
         """
-        # Colocamos las fichas directamente en la lista interna __puntos__.
-        self.board.__puntos__[0] = ("negro", 1)
-        self.board.__puntos__[3] = ("blanco", 2)
-        self.board.__puntos__[5] = ("blanco", 2)
+        # Colocamos las fichas con la API del tablero.
+        self.board.colocar_ficha(1, "negro", 1)
+        self.board.colocar_ficha(4, "blanco", 2)
+        self.board.colocar_ficha(6, "blanco", 2)
         
         # Ahora el test pasará porque el validador verá el tablero modificado
         # correctamente y no encontrará movimientos válidos.
@@ -2692,8 +2705,9 @@ class TestPygameUICoverageExtension(unittest.TestCase):
 
         self.ui._PygameUI__draw_bar_pieces()
 
-        # 2 fichas + 2 bordes = 4 círculos
-        self.assertEqual(mock_circle.call_count, 4)
+        # 2 sprites, sin dibujar círculos
+        mock_circle.assert_not_called()
+        self.assertEqual(self.ui.__screen__.get_at((800, 100))[:3], self.ui.__checker_black__)
 
     @patch("pygame.draw.circle")
     def test_draw_bar_pieces_blanco(self, mock_circle):
@@ -2707,8 +2721,9 @@ class TestPygameUICoverageExtension(unittest.TestCase):
 
         self.ui._PygameUI__draw_bar_pieces()
 
-        # 1 ficha + 1 borde = 2 círculos
-        self.assertEqual(mock_circle.call_count, 2)
+        # 1 sprite, sin dibujar círculos
+        mock_circle.assert_not_called()
+        self.assertEqual(self.ui.__screen__.get_at((800, 800))[:3], self.ui.__checker_white__)
 
     @patch("pygame.draw.circle")
     def test_draw_bar_pieces_more_than_8_shows_count(self, mock_circle):
@@ -2723,8 +2738,12 @@ class TestPygameUICoverageExtension(unittest.TestCase):
 
         self.ui._PygameUI__draw_bar_pieces()
 
-        # Máximo 8 fichas visibles + 8 bordes = 16 círculos
-        self.assertEqual(mock_circle.call_count, 16)
+        # Máximo 8 sprites visibles + el contador, en una sola llamada a blits
+        mock_circle.assert_not_called()
+        self.ui.__screen__ = Mock()
+        self.ui._PygameUI__draw_bar_pieces()
+        self.ui.__screen__.blits.assert_called_once()
+        self.assertEqual(len(self.ui.__screen__.blits.call_args[0][0]), 9)
 
     def test_draw_bearing_off_zones_not_active(self):
         """Test que zonas de bearing off no se dibujan si no puede sacar.
@@ -2834,5 +2853,475 @@ class TestPygameUICoverageExtension(unittest.TestCase):
         self.assertGreater(mock_rect.call_count, 2)
 
 
+class TestAIOpponent(unittest.TestCase):
+    """Pruebas del oponente automático (AIPlayer) manejado desde __update.
+    
+    Principios SOLID verificados:
+        - DIP: La UI usa AIPlayer.elegir_jugada sin conocer la búsqueda.
+        - SRP: __update solo avanza el turno automático.
+    """
+
+    def setUp(self):
+        """Crea la UI con un bot blanco de profundidad 1 y sin Redis real."""
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.init()
+        with patch('pygame.display.set_mode', return_value=pygame.Surface((1600, 900))), \
+             patch('pygame.font.Font'), \
+             patch('Backgammon.Interfaces.PygameUI.crear_almacen'):
+            self.ui = PygameUI(ai_player=AIPlayer("Bot", "blanco", profundidad_maxima=1))
+        self.board = self.ui.__board__
+
+    def test_ai_juega_su_turno_completo(self):
+        """El bot tira, mueve todos los dados y devuelve el turno a negro."""
+        self.ui.__current_player__ = "blanco"
+        self.ui.__game_state_manager__.change_state('AWAITING_ROLL')
+        pips_antes = self.board.obtener_pips("blanco")
+
+        for _ in range(3):
+            self.ui._PygameUI__update()
+
+        dado1, dado2 = self.ui.__dice__.obtener_valores()
+        total = 4 * dado1 if dado1 == dado2 else dado1 + dado2
+        self.assertEqual(self.ui.__current_player__, "negro")
+        self.assertEqual(self.ui.__game_state_manager__.get_current_state(), 'AWAITING_ROLL')
+        self.assertEqual(pips_antes - self.board.obtener_pips("blanco"), total)
+        self.assertIn("IA (blanco)", self.ui.__message__)
+
+    def test_ai_no_juega_el_turno_humano(self):
+        """Con el turno de negro, __update no cambia nada."""
+        self.ui.__current_player__ = "negro"
+        self.ui.__game_state_manager__.change_state('AWAITING_ROLL')
+        antes = self.board.obtener_estado_dict()
+
+        self.ui._PygameUI__update()
+
+        self.assertEqual(self.board.obtener_estado_dict(), antes)
+        self.assertEqual(self.ui.__game_state_manager__.get_current_state(), 'AWAITING_ROLL')
+
+    def test_ai_considera_la_barra_de_la_ui(self):
+        """Con una ficha blanca en la barra de la UI, el bot entra primero desde la barra."""
+        self.board.remover_ficha(24, 1)
+        self.ui.__bar_manager__.add_piece_to_bar("blanco")
+        self.ui.__current_player__ = "blanco"
+        self.ui.__game_state_manager__.change_state('AWAITING_ROLL')
+        dados = self.ui.__dice__
+
+        # Tirada fija: con 6-6 la entrada estaría bloqueada por el punto 19 de negro
+        with patch.object(dados, 'tirar', side_effect=lambda: dados.set_dados_para_test(3, 1)):
+            for _ in range(3):
+                self.ui._PygameUI__update()
+
+        self.assertEqual(self.ui.__bar_manager__.get_pieces_count("blanco"), 0)
+        self.assertEqual(self.ui.__current_player__, "negro")
+
+    def test_ai_jugada_que_no_se_puede_aplicar_se_informa(self):
+        """
+        Si un paso de la jugada elegida no se puede aplicar, se informa y el
+        turno no se termina descartando los dados; tampoco se reintenta cada frame.
+        """
+        self.ui.__current_player__ = "blanco"
+        self.ui.__game_state_manager__.change_state('AWAITING_PIECE_SELECTION')
+        self.ui.__dice__.set_dados_para_test(3, 1)
+        self.ui.__available_moves__ = [3, 1]
+
+        with patch.object(self.ui.__ai_player__, 'elegir_jugada',
+                          return_value=[(24, 21), (24, 20)]) as mock_elegir:
+            self.ui._PygameUI__update()
+            self.ui._PygameUI__update()
+
+        mock_elegir.assert_called_once()
+        self.assertEqual(self.ui.__current_player__, "blanco")
+        self.assertEqual(self.ui.__available_moves__, [1])
+        self.assertIn("no se pudo aplicar 24/20", self.ui.__message__)
+        self.assertTrue(self.ui._PygameUI__is_idle())
+
+        self.ui._PygameUI__end_turn()
+        self.assertFalse(self.ui.__ai_desync__)
+    def test_main_acepta_las_opciones_de_la_cli(self):
+        """main usa argparse: --ia y --pesos como en la CLI; las combinaciones inválidas son errores de uso."""
+        from Backgammon.Interfaces import PygameUI as modulo
+        with patch.object(modulo, 'PygameUI') as mock_ui, \
+             patch('Backgammon.Interfaces.Opciones.NeuralEvaluator.cargar') as mock_cargar, \
+             patch('sys.argv', ["pygame_ui", "--ia", "--pesos", "pesos.npz"]):
+            modulo.main()
+        mock_cargar.assert_called_once_with("pesos.npz")
+        self.assertIsInstance(mock_ui.call_args.kwargs["ai_player"], AIPlayer)
+        mock_ui.return_value.run.assert_called_once()
+
+        for argumentos in (["--pesos", "pesos.npz"], ["--rapido"]):
+            with self.subTest(argumentos=argumentos), \
+                 patch.object(modulo, 'PygameUI') as mock_ui, \
+                 patch('sys.argv', ["pygame_ui"] + argumentos), \
+                 patch('sys.stderr'), \
+                 self.assertRaises(SystemExit) as salida:
+                modulo.main()
+            self.assertEqual(salida.exception.code, 2)
+            mock_ui.assert_not_called()
+
+
+class TestDirtyRendering(unittest.TestCase):
+    """Pruebas del redibujado por regiones y de la espera sin actividad.
+
+    Principios SOLID verificados:
+        - SRP: __render_frame decide qué regiones actualizar; el dibujo sigue en __draw_*.
+    """
+
+    def setUp(self):
+        """Crea una UI sin ventana real ni Redis."""
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.init()
+        with patch('pygame.display.set_mode', return_value=pygame.Surface((1600, 900))), \
+             patch('Backgammon.Interfaces.PygameUI.crear_almacen'):
+            self.ui = PygameUI()
+        self.ui.__current_player__ = "negro"
+        self.ui.__game_state_manager__.change_state('AWAITING_ROLL')
+
+    def test_sin_cambios_no_redibuja(self):
+        """El primer frame es completo; si nada cambia no se dibuja ni actualiza la ventana."""
+        with patch('pygame.display.flip') as mock_flip, \
+             patch('pygame.display.update') as mock_update:
+            primero = self.ui._PygameUI__render_frame()
+            with patch.object(self.ui, '_PygameUI__draw_frame') as mock_draw:
+                segundo = self.ui._PygameUI__render_frame()
+        self.assertEqual(primero, [pygame.Rect(0, 0, 1600, 900)])
+        mock_flip.assert_called_once()
+        self.assertEqual(segundo, [])
+        mock_draw.assert_not_called()
+        mock_update.assert_not_called()
+
+    def test_solo_actualiza_regiones_cambiadas(self):
+        """Un mensaje nuevo actualiza solo la franja superior; mover una ficha, el tablero."""
+        with patch('pygame.display.flip'), patch('pygame.display.update') as mock_update:
+            self.ui._PygameUI__render_frame()
+            self.ui.__message__ = "Otro mensaje"
+            regiones = self.ui._PygameUI__render_frame()
+            self.assertEqual(regiones, [pygame.Rect(0, 0, 1600, 60)])
+            mock_update.assert_called_once_with(regiones)
+
+            self.ui.__board__.aplicar_movimiento("negro", 1, 4)
+            regiones = self.ui._PygameUI__render_frame()
+        self.assertEqual(regiones, [pygame.Rect(50, 50, 1500, 800)])
+        # El recorte se restablece después de dibujar
+        self.assertEqual(self.ui.__screen__.get_clip(), self.ui.__screen__.get_rect())
+
+    def test_zona_de_bearing_off_se_anima(self):
+        """Con la zona de bearing off visible se redibuja cada frame y el bucle no espera."""
+        self.ui.__game_state_manager__.change_state('AWAITING_PIECE_SELECTION')
+        self.assertTrue(self.ui._PygameUI__is_idle())
+        with patch.object(self.ui.__bearing_off_validator__, 'can_bear_off', return_value=True), \
+             patch('pygame.display.flip'), patch('pygame.display.update'):
+            self.assertFalse(self.ui._PygameUI__is_idle())
+            self.ui._PygameUI__render_frame()
+            regiones = self.ui._PygameUI__render_frame()
+        self.assertEqual(regiones, [pygame.Rect(50, 460, 710, 380)])
+
+    def test_bucle_inactivo_espera_eventos(self):
+        """Sin animación el bucle se bloquea en pygame.event.wait con límite de tiempo."""
+        salir = pygame.event.Event(pygame.QUIT)
+        with patch('pygame.event.wait', return_value=salir) as mock_wait, \
+             patch('pygame.event.get', return_value=[]), \
+             patch('pygame.display.flip'), patch('pygame.quit'):
+            with self.assertRaises(SystemExit):
+                self.ui.run()
+        mock_wait.assert_called_once_with(IDLE_WAIT_MS)
+
+
+class TestStorageWorker(unittest.TestCase):
+    """Pruebas del guardado y la carga en segundo plano.
+
+    Principios SOLID verificados:
+        - SRP: StorageWorker solo ejecuta la operación y publica el resultado.
+        - DIP: La UI aplica el resultado sin saber en qué hilo se obtuvo.
+    """
+
+    def setUp(self):
+        """Crea una UI sin ventana real y con un almacenamiento simulado."""
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.init()
+        with patch('pygame.display.set_mode', return_value=pygame.Surface((1600, 900))), \
+             patch('Backgammon.Interfaces.PygameUI.crear_almacen') as mock_manager:
+            self.ui = PygameUI()
+        self.redis = mock_manager.return_value
+        pygame.event.clear()
+
+    def _esperar_resultado(self):
+        """Espera el STORAGE_EVENT publicado por el hilo y lo procesa como el bucle."""
+        event = pygame.event.wait(2000)
+        self.assertEqual(event.type, STORAGE_EVENT)
+        with patch('pygame.event.get', return_value=[]):
+            self.ui._PygameUI__handle_events([event])
+        return event
+
+    def test_guardar_no_bloquea_y_publica_evento(self):
+        """El guardado corre en otro hilo; mientras tanto se muestra el indicador."""
+        liberar = threading.Event()
+        hilos = []
+
+        def guardar_lento(slot_id, estado, sobrescribir):
+            hilos.append(threading.current_thread())
+            liberar.wait(2)
+            return True, f"Partida guardada en '{slot_id}'."
+        self.redis.guardar_partida.side_effect = guardar_lento
+
+        self.ui._PygameUI__save_game("slot_test")
+        self.assertEqual(self.ui.__storage_worker__.get_pending_operation(), "save")
+        self.assertIn("Guardando", self.ui.__message__)
+        # Una segunda operación se rechaza mientras la primera sigue en curso
+        self.ui._PygameUI__load_game("slot_test")
+        self.redis.cargar_partida.assert_not_called()
+
+        liberar.set()
+        event = self._esperar_resultado()
+        self.assertEqual((event.operation, event.slot_id), ("save", "slot_test"))
+        self.assertIsNot(hilos[0], threading.current_thread())
+        self.assertEqual(self.ui.__message__, "Partida guardada en 'slot_test'.")
+        self.assertIsNone(self.ui.__storage_worker__.get_pending_operation())
+
+    def test_conflicto_al_guardar_pide_confirmar(self):
+        """
+        Un conflicto de versión se informa; la siguiente G sobrescribe y cargar cancela.
+
+        SOLID: SRP - La UI decide qué hacer con el conflicto; el almacenamiento solo lo detecta.
+        """
+        self.redis.guardar_partida.side_effect = [
+            (False, "Conflicto al guardar partida en 'slot_test': otro proceso guardó la versión 2 "
+                    "(se esperaba la 0)."),
+            (True, "Partida guardada en 'slot_test'."),
+            (False, "Conflicto al guardar partida en 'slot_test': otro proceso guardó la versión 4 "
+                    "(se esperaba la 3)."),
+            (True, "Partida guardada en 'slot_test'.")]
+        self.redis.cargar_partida.return_value = (None, "No se encontró partida guardada.")
+
+        self.ui._PygameUI__save_game("slot_test")
+        self._esperar_resultado()
+        self.assertIn("G otra vez para sobrescribir", self.ui.__message__)
+        self.ui._PygameUI__save_game("slot_test")
+        self._esperar_resultado()
+        self.assertEqual(self.redis.guardar_partida.call_args_list[0].args[2:], (False,))
+        self.assertEqual(self.redis.guardar_partida.call_args_list[1].args[2:], (True,))
+
+        # Después de cargar ya no se sobrescribe sin un conflicto nuevo
+        self.ui._PygameUI__save_game("slot_test")
+        self._esperar_resultado()
+        self.ui._PygameUI__load_game("slot_test")
+        self._esperar_resultado()
+        self.ui._PygameUI__save_game("slot_test")
+        self._esperar_resultado()
+        self.assertEqual(self.redis.guardar_partida.call_args_list[3].args[2:], (False,))
+
+    def test_cargar_aplica_el_estado_al_recibir_el_evento(self):
+        """El estado cargado se aplica en el hilo principal al procesar el evento."""
+        board = Board()
+        board.colocar_ficha(5, "negro", 3)
+        estado = {"board_state": board.obtener_estado_dict(),
+                  "ui_state": {"current_player": "blanco", "dice_rolls": [3, 4],
+                               "available_moves": [3, 4], "bar_pieces": {"negro": 1},
+                               "game_state": "AWAITING_PIECE_SELECTION"}}
+        self.redis.cargar_partida.return_value = (estado, "Partida cargada desde 'slot_test'.")
+
+        self.ui._PygameUI__load_game("slot_test")
+        self._esperar_resultado()
+
+        self.assertEqual(self.ui.__current_player__, "blanco")
+        self.assertEqual(self.ui.__available_moves__, [3, 4])
+        self.assertEqual(self.ui.__board__.obtener_estado_punto(5), ["negro", 3])
+        self.assertEqual(self.ui.__bar_manager__.get_pieces_count("negro"), 1)
+        self.assertEqual(self.ui.__game_state_manager__.get_current_state(),
+                         'AWAITING_PIECE_SELECTION')
+
+    def test_error_en_el_hilo_se_informa(self):
+        """Una excepción del almacenamiento llega como mensaje y no deja la UI esperando."""
+        self.redis.cargar_partida.side_effect = ConnectionError("sin red")
+
+        self.ui._PygameUI__load_game("slot_test")
+        self._esperar_resultado()
+
+        self.assertIn("sin red", self.ui.__message__)
+        self.assertIsNone(self.ui.__storage_worker__.get_pending_operation())
+
+    def test_jugada_marca_el_guardado_automatico(self):
+        """Cada jugada válida marca el slot de autoguardado; una inválida no."""
+        self.ui.__game_state_manager__.change_state('AWAITING_PIECE_SELECTION')
+        self.ui.__current_player__ = "negro"
+        self.ui.__dice_rolls__ = [1, 2]
+        self.ui.__available_moves__ = [1, 2]
+        self.addCleanup(self.ui.__autosave__.detener)
+
+        self.ui._PygameUI__attempt_move(1, 10)
+        self.assertEqual(self.ui.__autosave__.obtener_estadisticas()["marcas"], 0)
+        self.ui._PygameUI__attempt_move(1, 2)
+        self.ui._PygameUI__attempt_move(1, 3)
+        self.assertEqual(self.ui.__autosave__.obtener_estadisticas()["marcas"], 2)
+
+        self.redis.guardar_partidas.return_value = {
+            "autoguardado": (True, "Partida guardada en 'autoguardado'.")}
+        self.ui.__autosave__.vaciar()
+        self.redis.guardar_partidas.assert_called_once()
+        lote = self.redis.guardar_partidas.call_args[0][0]
+        self.assertEqual(list(lote), ["autoguardado"])
+        self.assertEqual(lote["autoguardado"]["ui_state"]["current_player"], "blanco")
+
+    def test_resultado_del_autoguardado_llega_como_evento(self):
+        """
+        Los fallos y conflictos del guardado automático se muestran; un conflicto
+        detiene el autoguardado del slot en lugar de sobrescribirlo.
+
+        SOLID: SRP - GuardadoDiferido informa; la UI solo muestra el resultado.
+        """
+        self.addCleanup(self.ui.__autosave__.detener)
+        self.ui.__message__ = ""
+        self.redis.guardar_partidas.return_value = {
+            "autoguardado": (True, "Partida guardada en 'autoguardado'.")}
+        self.ui.__autosave__.marcar("autoguardado", {})
+        self.ui.__autosave__.vaciar()
+        self.assertEqual(self._esperar_resultado().operation, "autosave")
+        self.assertEqual(self.ui.__message__, "")
+
+        self.redis.guardar_partidas.return_value = {"autoguardado": (
+            False, "Conflicto al guardar partida en 'autoguardado': otro proceso guardó "
+                   "la versión 3 (se esperaba la 2).")}
+        self.ui.__autosave__.marcar("autoguardado", {})
+        self.ui.__autosave__.vaciar()
+        self._esperar_resultado()
+        self.assertIn("Autoguardado detenido en 'autoguardado'", self.ui.__message__)
+        self.assertTrue(self.ui.__autosave__.esta_en_conflicto("autoguardado"))
+
+        self.redis.guardar_partidas.return_value = {"otro": (False, "Error de conexión")}
+        self.ui.__autosave__.marcar("otro", {})
+        self.ui.__autosave__.vaciar()
+        self._esperar_resultado()
+        self.assertEqual(self.ui.__message__, "Falló el autoguardado: Error de conexión")
+
+    def test_almacenamiento_local_inyectado(self):
+        """Con un SQLiteManager inyectado se guarda y carga sin Redis."""
+        with patch('pygame.display.set_mode', return_value=pygame.Surface((1600, 900))), \
+             patch('Backgammon.Interfaces.PygameUI.crear_almacen') as mock_crear:
+            ui = PygameUI(storage=SQLiteManager(":memory:"))
+        mock_crear.assert_not_called()
+        ui.__current_player__ = "blanco"
+
+        ui._PygameUI__save_game("slot_local")
+        event = pygame.event.wait(2000)
+        self.assertEqual(event.result, (True, "Partida guardada en 'slot_local'."))
+        ui.__current_player__ = "negro"
+        ui._PygameUI__load_game("slot_local")
+        event = pygame.event.wait(2000)
+        with patch('pygame.event.get', return_value=[]):
+            ui._PygameUI__handle_events([event])
+        self.assertEqual(ui.__current_player__, "blanco")
+
+
+class TestCheckerSpriteAtlas(unittest.TestCase):
+    """Pruebas de los sprites de fichas pre-renderizados.
+
+    Principios SOLID verificados:
+        - SRP: CheckerSpriteAtlas solo construye y entrega sprites.
+        - OCP: El estilo (antialias, resaltado) no cambia cómo se dibujan las pilas.
+    """
+
+    def setUp(self):
+        """Inicializa pygame sin pantalla."""
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.init()
+        self.colors = {"negro": (40, 40, 40), "blanco": (240, 240, 240)}
+
+    def test_sprites_se_construyen_al_inicio(self):
+        """Todos los colores, radios y estados se dibujan una vez al crear el atlas."""
+        with patch('pygame.draw.circle', wraps=pygame.draw.circle) as mock_circle:
+            atlas = CheckerSpriteAtlas(self.colors, (0, 0, 0), (255, 215, 0), radii=(20, 25),
+                                       antialias=False)
+            sprite = atlas.get("negro", 25)
+            self.assertIs(atlas.get("negro", 25), sprite)
+        # 2 colores x 2 radios x 2 estados, con relleno + borde
+        self.assertEqual(mock_circle.call_count, 16)
+        self.assertEqual(sprite.get_size(), (52, 52))
+        self.assertEqual(sprite.get_at((26, 26))[:3], (40, 40, 40))
+        self.assertEqual(sprite.get_at((0, 0))[3], 0)
+
+    def test_resaltado_y_antialias(self):
+        """La ficha resaltada tiene otro borde; con antialias no se usa pygame.draw."""
+        with patch('pygame.draw.circle') as mock_circle:
+            atlas = CheckerSpriteAtlas(self.colors, (0, 0, 0), (255, 215, 0))
+        mock_circle.assert_not_called()
+        normal = atlas.get("blanco", 25)
+        resaltada = atlas.get("blanco", 25, highlighted=True)
+        self.assertEqual(resaltada.get_at((26, 2))[:3], (255, 215, 0))
+        self.assertEqual(normal.get_at((26, 26))[:3], (240, 240, 240))
+        # Un radio no pre-renderizado se construye al primer uso
+        self.assertEqual(atlas.get("blanco", 10).get_size(), (22, 22))
+
+    def test_pila_del_punto_seleccionado(self):
+        """La ficha superior del punto seleccionado usa el sprite resaltado."""
+        with patch('pygame.display.set_mode', return_value=pygame.Surface((1600, 900))), \
+             patch('Backgammon.Interfaces.PygameUI.crear_almacen'):
+            ui = PygameUI()
+        ui.__selected_point__ = 12
+        sprites = ui._PygameUI__checker_stack_sprites(400, 300, "negro", 5, 12, 25)
+        self.assertEqual(len(sprites), 5)
+        self.assertIs(sprites[-1][0], ui.__checker_sprites__.get("negro", 25, highlighted=True))
+        self.assertIs(sprites[0][0], ui.__checker_sprites__.get("negro", 25))
+        self.assertEqual(sprites[0][1].center, (400, 300))
+
+
+class TestTextCache(unittest.TestCase):
+    """Pruebas del registro de fuentes y la caché LRU de textos.
+
+    Principios SOLID verificados:
+        - SRP: TextCache solo crea fuentes y guarda textos renderizados.
+        - DIP: Los métodos de dibujo usan la caché sin crear fuentes.
+    """
+
+    def setUp(self):
+        """Inicializa pygame sin pantalla y crea una caché chica."""
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.init()
+        self.cache = TextCache(max_entries=2)
+
+    def test_fuente_se_crea_una_vez_por_tamanio(self):
+        """Cada tamaño crea su fuente una sola vez."""
+        with patch('pygame.font.Font', wraps=pygame.font.Font) as mock_font:
+            self.cache.render("hola", 30, (255, 255, 255))
+            self.cache.render("chau", 30, (255, 255, 255))
+            self.cache.get_font(30)
+            self.cache.render("hola", 20, (255, 255, 255))
+        self.assertEqual(mock_font.call_count, 2)
+        self.assertEqual(self.cache.get_stats()["fonts"], 2)
+
+    def test_mismo_texto_reutiliza_superficie(self):
+        """La misma clave (texto, tamaño, color) devuelve la misma superficie."""
+        primera = self.cache.render("hola", 30, (255, 255, 255))
+        self.assertIs(self.cache.render("hola", 30, [255, 255, 255]), primera)
+        self.assertIsNot(self.cache.render("hola", 30, (0, 0, 0)), primera)
+        self.assertEqual(self.cache.get_stats()["hits"], 1)
+
+    def test_descarta_el_menos_usado(self):
+        """Al superar el máximo se descarta el texto usado hace más tiempo."""
+        uno = self.cache.render("uno", 30, (0, 0, 0))
+        self.cache.render("dos", 30, (0, 0, 0))
+        self.cache.render("uno", 30, (0, 0, 0))
+        self.cache.render("tres", 30, (0, 0, 0))
+
+        self.assertEqual(self.cache.get_stats()["entries"], 2)
+        self.assertIs(self.cache.render("uno", 30, (0, 0, 0)), uno)
+        misses = self.cache.get_stats()["misses"]
+        self.cache.render("dos", 30, (0, 0, 0))
+        self.assertEqual(self.cache.get_stats()["misses"], misses + 1)
+
+    def test_draw_no_crea_fuentes_por_frame(self):
+        """Dibujar varios frames no crea fuentes ni vuelve a renderizar el mensaje."""
+        with patch('pygame.display.set_mode', return_value=pygame.Surface((1600, 900))), \
+             patch('Backgammon.Interfaces.PygameUI.crear_almacen'):
+            ui = PygameUI()
+        ui.__available_moves__ = [3, 5]
+        ui.__bar_manager__.load_status_dict({"negro": 9, "blanco": 0})
+        with patch('pygame.display.flip'):
+            ui._PygameUI__draw()
+            with patch('pygame.font.Font') as mock_font:
+                for _ in range(3):
+                    ui._PygameUI__draw()
+        mock_font.assert_not_called()
+        self.assertEqual(ui.__text_cache__.get_stats()["misses"], 3)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
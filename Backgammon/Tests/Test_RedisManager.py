@@ -1,7 +1,14 @@
 # En un nuevo archivo: Tests/Test_RedisManager.py
+import itertools
+import json
+import time
 import unittest
+from unittest.mock import Mock, patch
 import fakeredis
-from Backgammon.Persistence.RedisManager import RedisManager
+import redis
+from Backgammon.Core.Board import Board
+from Backgammon.Persistence.RedisManager import RedisManager, clasificar_partida, obtener_pool
+from Backgammon.Persistence.Storage import es_conflicto
 
 class TestRedisManager(unittest.TestCase):
 
@@ -45,4 +52,538 @@ class TestRedisManager(unittest.TestCase):
         estado_cargado, msg_c = self.redis_manager.cargar_partida("slot_fantasma")
         
         self.assertIsNone(estado_cargado)
-        self.assertIn("No se encontró", msg_c)
\ No newline at end of file
+        self.assertIn("No se encontró", msg_c)
+
+class TestRedisManagerConexionPerezosa(unittest.TestCase):
+    """Tests de la conexión perezosa, el pool compartido y la reconexión."""
+
+    def test_no_conecta_al_construir(self):
+        """Crear el manager no abre conexiones; el primer uso sí."""
+        with patch('Backgammon.Persistence.RedisManager.redis.Redis') as mock_redis:
+            manager = RedisManager()
+            mock_redis.assert_not_called()
+            self.assertFalse(manager.esta_conectado())
+
+            mock_redis.return_value.hgetall.return_value = {}
+            mock_redis.return_value.lrange.return_value = []
+            mock_redis.return_value.get.return_value = None
+            manager.cargar_partida("slot1")
+            mock_redis.assert_called_once()
+            self.assertTrue(manager.esta_conectado())
+
+    def test_pool_compartido(self):
+        """La misma configuración reutiliza el mismo ConnectionPool."""
+        pool = obtener_pool("localhost", 6379, max_conexiones=4)
+        self.assertIs(obtener_pool("localhost", 6379, max_conexiones=4), pool)
+        self.assertIsNot(obtener_pool("localhost", 6379, max_conexiones=5), pool)
+        self.assertEqual(pool.max_connections, 4)
+
+    def test_reconecta_en_segundo_plano(self):
+        """Tras un fallo los pedidos no esperan a la red y un hilo reconecta solo."""
+        servidor = fakeredis.FakeStrictRedis()
+        with patch.object(RedisManager, '_RedisManager__crear_cliente',
+                          side_effect=[redis.exceptions.ConnectionError("caído"),
+                                       redis.exceptions.ConnectionError("caído"),
+                                       servidor]) as mock_crear:
+            manager = RedisManager(reintento_segundos=0.01)
+            exito, mensaje = manager.guardar_partida("slot1", {"a": 1})
+            self.assertFalse(exito)
+            self.assertIn("No hay conexión", mensaje)
+
+            limite = time.time() + 2
+            while not manager.esta_conectado() and time.time() < limite:
+                time.sleep(0.01)
+        self.assertTrue(manager.esta_conectado())
+        self.assertEqual(mock_crear.call_count, 3)
+        self.assertTrue(manager.guardar_partida("slot1", {"a": 1})[0])
+
+    def test_error_de_conexion_en_uso_descarta_el_cliente(self):
+        """Si Redis se cae en medio de un pedido, el cliente se descarta y se reintenta."""
+        cliente = Mock()
+        cliente.pipeline.return_value.execute.side_effect = redis.exceptions.ConnectionError("caído")
+        manager = RedisManager(client=cliente, reintento_segundos=60)
+
+        estado, mensaje = manager.cargar_partida("slot1")
+
+        self.assertIsNone(estado)
+        self.assertIn("sin conexión", mensaje)
+        self.assertFalse(manager.esta_conectado())
+
+
+class TestRedisManagerRegistroDeEventos(unittest.TestCase):
+    """Tests del registro de eventos con snapshots periódicos (fakeredis)."""
+
+    def setUp(self):
+        """Crea un servidor falso y una secuencia de estados de una partida real."""
+        self.servidor = fakeredis.FakeStrictRedis()
+        self.manager = RedisManager(client=self.servidor, snapshot_cada=10)
+        board = Board()
+        board.inicializar_posiciones_estandar()
+        self.estados = []
+        jugadas = [("negro", 17, 18), ("blanco", 8, 7), ("negro", 18, 17), ("blanco", 7, 8)]
+        for numero in range(25):
+            color, origen, destino = jugadas[numero % 4]
+            board.mover_ficha(origen, destino, color)
+            # Copia profunda: obtener_estado_dict comparte las listas del tablero
+            self.estados.append(json.loads(json.dumps({
+                "board_state": board.obtener_estado_dict(),
+                "ui_state": {"current_player": color, "dice_rolls": [1, 2],
+                             "available_moves": [numero % 3], "selected_point": None}})))
+
+    def test_guardar_agrega_eventos_y_snapshots(self):
+        """
+        Cada guardado es un evento pequeño; cada 10 eventos hay un snapshot.
+
+        SOLID: SRP - El manager solo persiste; el estado lo arma la UI.
+        """
+        for estado in self.estados:
+            self.assertTrue(self.manager.guardar_partida("p1", estado)[0])
+
+        eventos = self.servidor.lrange("p1:eventos", 0, -1)
+        self.assertEqual(len(eventos), 25)
+        self.assertTrue(all(len(evento) < 100 for evento in eventos[1:]))
+        self.assertEqual(int(self.servidor.hget("p1:snapshot", "indice")), 20)
+        self.assertFalse(self.servidor.exists("p1"))
+
+    def test_cargar_usa_snapshot_y_cola_de_eventos(self):
+        """Un manager nuevo reconstruye el último estado leyendo solo los eventos posteriores."""
+        for estado in self.estados:
+            self.manager.guardar_partida("p1", estado)
+
+        # Los eventos anteriores al snapshot no se leen: se pueden corromper
+        for indice in range(20):
+            self.servidor.lset("p1:eventos", indice, b"corrupto")
+        otro = RedisManager(client=self.servidor)
+        cargada, mensaje = otro.cargar_partida("p1")
+
+        self.assertEqual(cargada, self.estados[-1])
+        self.assertIn("cargada", mensaje)
+
+        # Guardar después de cargar sigue el mismo registro
+        self.assertTrue(otro.guardar_partida("p1", self.estados[0])[0])
+        self.assertEqual(self.manager.cargar_partida("p1")[0], self.estados[0])
+        self.assertEqual(self.servidor.llen("p1:eventos"), 26)
+
+    def test_historial_para_repeticion(self):
+        """El historial reproduce cada estado guardado en orden."""
+        for estado in self.estados[:12]:
+            self.manager.guardar_partida("p1", estado)
+
+        historial, _ = self.manager.obtener_historial("p1")
+
+        self.assertEqual(historial, self.estados[:12])
+
+
+class TestRedisManagerEnLote(unittest.TestCase):
+    """Tests de guardado y carga de muchas partidas con pipelines (fakeredis)."""
+
+    def setUp(self):
+        """Crea un servidor falso y 1.000 partidas distintas."""
+        self.servidor = fakeredis.FakeStrictRedis()
+        self.manager = RedisManager(client=self.servidor, snapshot_cada=2)
+        self.estados = {f"mesa{numero}": {"board_state": {"puntos": [["negro", numero % 15 + 1]]},
+                                          "ui_state": {"current_player": "negro"}}
+                        for numero in range(1000)}
+
+    def _contar_viajes(self):
+        """Cuenta los pipelines ejecutados y los comandos sueltos enviados a Redis."""
+        original = redis.client.Pipeline.execute
+        return (patch.object(redis.client.Pipeline, 'execute', autospec=True,
+                             side_effect=original),
+                patch.object(self.servidor, 'execute_command',
+                             wraps=self.servidor.execute_command))
+
+    def test_guardar_mil_partidas_en_pocos_viajes(self):
+        """
+        Guardar 1.000 partidas nuevas usa cuatro pipelines; volver a guardarlas, dos
+        (versiones y transacción).
+
+        SOLID: SRP - El lote reutiliza la misma lógica de eventos que una partida.
+        """
+        parche_pipeline, parche_comandos = self._contar_viajes()
+        with parche_pipeline as mock_execute, parche_comandos as mock_comando:
+            resultados = self.manager.guardar_partidas(self.estados)
+            self.assertEqual(mock_execute.call_count, 4)
+            self.manager.guardar_partidas(self.estados)
+            self.assertEqual(mock_execute.call_count, 6)
+        mock_comando.assert_not_called()
+
+        self.assertEqual(list(resultados), list(self.estados))
+        self.assertTrue(all(exito for exito, _ in resultados.values()))
+        self.assertEqual(self.servidor.llen("mesa7:eventos"), 2)
+        self.assertTrue(self.servidor.exists("mesa7:snapshot"))
+
+    def test_cargar_mil_partidas_en_pocos_viajes(self):
+        """Cargar 1.000 partidas usa dos pipelines y un MGET para el formato anterior."""
+        self.manager.guardar_partidas(self.estados)
+        self.servidor.set("antigua", json.dumps(self.estados["mesa3"]))
+        slots = list(self.estados) + ["antigua", "fantasma"]
+
+        otro = RedisManager(client=self.servidor)
+        parche_pipeline, parche_comandos = self._contar_viajes()
+        with parche_pipeline as mock_execute, parche_comandos as mock_comando:
+            resultados = otro.cargar_partidas(slots)
+        self.assertEqual(mock_execute.call_count, 2)
+        self.assertEqual(mock_comando.call_count, 1)   # MGET
+
+        self.assertEqual(resultados["mesa42"][0], self.estados["mesa42"])
+        self.assertEqual(resultados["antigua"][0], self.estados["mesa3"])
+        self.assertIsNone(resultados["fantasma"][0])
+        self.assertIn("No se encontró", resultados["fantasma"][1])
+
+    def test_resultado_por_partida(self):
+        """
+        Una partida que falla no impide guardar ni cargar las demás.
+
+        SOLID: SRP - Cada partida informa su propio resultado.
+        """
+        resultados = self.manager.guardar_partidas({"buena": self.estados["mesa1"],
+                                                    "mala": {"ui_state": {"x": object()}}})
+        self.assertTrue(resultados["buena"][0])
+        self.assertFalse(resultados["mala"][0])
+        self.assertIn("no serializable", resultados["mala"][1])
+
+        self.servidor.rpush("rota:eventos", b"{no es json")
+        cargadas = RedisManager(client=self.servidor).cargar_partidas(["buena", "rota"])
+        self.assertEqual(cargadas["buena"][0], self.estados["mesa1"])
+        self.assertIsNone(cargadas["rota"][0])
+        self.assertIn("JSON corrupto", cargadas["rota"][1])
+
+
+class TestRedisManagerIndice(unittest.TestCase):
+    """Tests del índice de partidas guardadas y su listado paginado (fakeredis)."""
+
+    def setUp(self):
+        """Guarda 25 partidas, una por vez y con horas crecientes."""
+        self.servidor = fakeredis.FakeStrictRedis()
+        self.manager = RedisManager(client=self.servidor)
+        board = Board()
+        board.inicializar_posiciones_estandar()
+        self.estado = {"board_state": board.obtener_estado_dict(),
+                       "ui_state": {"current_player": "blanco", "jugador_negro": "Ana",
+                                    "jugador_blanco": "Beto"}}
+        with patch('time.time', side_effect=itertools.count(1000)):
+            for numero in range(25):
+                self.manager.guardar_partida(f"mesa{numero}", self.estado)
+            self.manager.guardar_partida("mesa3", self.estado)
+
+    def test_listado_paginado_sin_keys(self):
+        """
+        Las páginas salen del sorted set, de la más reciente a la más antigua, sin KEYS ni SCAN.
+
+        SOLID: SRP - El índice se mantiene en la misma transacción que el guardado.
+        """
+        original = redis.client.Pipeline.pipeline_execute_command
+        with patch.object(self.servidor, 'execute_command',
+                          wraps=self.servidor.execute_command) as mock_comando, \
+                patch.object(redis.client.Pipeline, 'pipeline_execute_command', autospec=True,
+                             side_effect=original) as mock_pipeline:
+            pagina, cursor, mensaje = self.manager.listar_partidas(0, 10)
+            slots = [partida["slot"] for partida in pagina]
+            while cursor is not None:
+                pagina, cursor, _ = self.manager.listar_partidas(cursor, 10)
+                slots += [partida["slot"] for partida in pagina]
+        self.assertEqual(mock_comando.call_count, 0)
+        comandos = {llamada.args[1].upper() for llamada in mock_pipeline.call_args_list}
+        self.assertEqual(comandos, {"ZREVRANGEBYSCORE", "ZSCORE", "ZREVRANK", "ZCOUNT", "HGETALL"})
+        self.assertEqual(mensaje, "10 partidas guardadas.")
+        self.assertEqual(len(slots), 25)
+        self.assertEqual(slots[:3], ["mesa3", "mesa24", "mesa23"])
+        self.assertEqual(slots[-1], "mesa0")
+
+    def test_cursor_estable_ante_guardados(self):
+        """
+        El cursor es (guardada, slot) de la última partida listada: guardar
+        entre páginas no repite ni saltea las demás, y las empatadas de un
+        mismo lote siguen por slot aunque la del cursor se vuelva a guardar.
+        """
+        with patch('time.time', return_value=500):
+            self.manager.guardar_partidas({f"lote{numero}": self.estado for numero in range(5)})
+        pagina, cursor, _ = self.manager.listar_partidas(0, 26)
+        self.assertEqual(cursor, (500.0, "lote4"))
+
+        pagina, cursor, _ = self.manager.listar_partidas(cursor, 2)
+        self.assertEqual([partida["slot"] for partida in pagina], ["lote3", "lote2"])
+        self.assertEqual(cursor, (500.0, "lote2"))
+        with patch('time.time', return_value=3000):
+            self.manager.guardar_partida("nueva", self.estado)
+            self.manager.guardar_partida("lote2", self.estado)
+        pagina, cursor, _ = self.manager.listar_partidas(cursor, 2)
+        self.assertEqual([partida["slot"] for partida in pagina], ["lote1", "lote0"])
+        self.assertIsNone(cursor)
+
+        for invalido in (3, (500.0,), "lote1"):
+            with self.assertRaises(ValueError):
+                self.manager.listar_partidas(invalido, 2)
+
+    def test_metadatos(self):
+        """Cada partida lista jugadores, turno, número de jugada, pips y hora de guardado."""
+        pagina, _, _ = self.manager.listar_partidas(0, 2)
+        # fakeredis también consulta la hora: solo se compara el orden
+        self.assertGreater(pagina[0].pop("guardada"), pagina[1]["guardada"])
+        self.assertEqual(pagina[:1], [{"slot": "mesa3", "jugada": 2, "version": 2, "clase": "manual",
+                                   "jugador_negro": "Ana", "jugador_blanco": "Beto",
+                                   "turno": "blanco", "pips_negro": 167, "pips_blanco": 167}])
+        with self.assertRaises(ValueError):
+            self.manager.listar_partidas(0, 0)
+
+
+class TestRedisManagerRetencion(unittest.TestCase):
+    """Tests de la retención por clase, la compactación y el reporte de memoria (fakeredis)."""
+
+    def setUp(self):
+        """Crea un servidor falso y una partida de 13 jugadas que termina con 15 fichas en casa."""
+        self.servidor = fakeredis.FakeStrictRedis()
+        self.manager = RedisManager(client=self.servidor, snapshot_cada=5,
+                                    retencion={"autoguardado": 60})
+        self.estados = [{"board_state": {"puntos": [["negro", 15 - numero]], "casa": {"negro": numero}},
+                         "ui_state": {"current_player": "negro", "game_state": "PLAYING"}}
+                        for numero in range(12)]
+        self.estados.append({"board_state": {"puntos": [None], "casa": {"negro": 15}},
+                             "ui_state": {"current_player": "negro", "game_state": "GAME_OVER"}})
+
+    def test_clasificar_partida(self):
+        """Terminada si hay 15 fichas en casa o GAME_OVER; si no, según el slot."""
+        self.assertEqual(clasificar_partida("autoguardado", self.estados[0]), "autoguardado")
+        self.assertEqual(clasificar_partida("mesa", self.estados[0]), "manual")
+        self.assertEqual(clasificar_partida("autoguardado", self.estados[-1]), "finalizada")
+        self.assertEqual(clasificar_partida("mesa", {"ui_state": {"home_pieces": {"blanco": 15}}}),
+                         "finalizada")
+        with self.assertRaises(ValueError):
+            RedisManager(client=self.servidor, retencion={"eterna": 10})
+        with self.assertRaises(ValueError):
+            RedisManager(client=self.servidor, retencion={"manual": 0})
+
+    def test_ttl_por_clase(self):
+        """
+        Cada guardado renueva el vencimiento de todas las claves según la clase.
+
+        SOLID: OCP - La retención se configura sin tocar el guardado.
+        """
+        self.manager.guardar_partida("autoguardado", self.estados[0])
+        self.manager.guardar_partida("mesa", self.estados[0])
+        self.assertTrue(0 < self.servidor.ttl("autoguardado:eventos") <= 60)
+        self.assertTrue(0 < self.servidor.ttl("autoguardado:meta") <= 60)
+        self.assertEqual(self.servidor.ttl("mesa:eventos"), -1)
+
+        # Al terminar, la partida pasa a la retención de las finalizadas
+        self.manager.guardar_partida("mesa", self.estados[-1])
+        self.assertGreater(self.servidor.ttl("mesa:eventos"), 60)
+        self.assertEqual(self.servidor.hget("mesa:meta", "clase"), b"finalizada")
+
+    def test_listado_omite_vencidas_y_compactar_las_quita(self):
+        """Una partida vencida no aparece en el listado y la compactación la saca del índice."""
+        self.manager.guardar_partida("vieja", self.estados[0])
+        self.manager.guardar_partida("nueva", self.estados[0])
+        self.servidor.delete(*[f"vieja:{sufijo}" for sufijo in ("eventos", "snapshot", "meta")])
+
+        pagina, _, _ = self.manager.listar_partidas()
+        self.assertEqual([partida["slot"] for partida in pagina], ["nueva"])
+        self.assertEqual(self.manager.compactar_finalizadas(),
+                         (0, "0 partidas compactadas, 1 vencidas quitadas del índice."))
+        self.assertEqual(self.servidor.zrange("partidas:indice", 0, -1), [b"nueva"])
+
+    def test_compactar_finalizadas(self):
+        """
+        Compactar deja un snapshot y los eventos comprimidos; cargar e historial no cambian.
+
+        SOLID: SRP - La compactación no cambia el contrato de carga.
+        """
+        for estado in self.estados:
+            self.manager.guardar_partida("final", estado)
+        for estado in self.estados[:3]:
+            self.manager.guardar_partida("en_curso", estado)
+
+        compactadas, mensaje = self.manager.compactar_finalizadas(lote=1)
+        self.assertEqual(compactadas, 1)
+        self.assertIn("1 partidas compactadas", mensaje)
+        self.assertFalse(self.servidor.exists("final:eventos"))
+        self.assertEqual(int(self.servidor.hget("final:archivo", "cantidad")), 13)
+        self.assertTrue(self.servidor.exists("en_curso:eventos"))
+        self.assertEqual(self.manager.compactar_finalizadas()[0], 0)
+
+        otro = RedisManager(client=self.servidor)
+        self.assertEqual(otro.cargar_partida("final")[0], self.estados[-1])
+        self.assertEqual(otro.obtener_historial("final")[0], self.estados)
+        pagina, _, _ = otro.listar_partidas()
+        self.assertEqual({partida["slot"]: partida["clase"] for partida in pagina},
+                         {"final": "finalizada", "en_curso": "manual"})
+
+    def test_guardar_con_registro_desactualizado(self):
+        """
+        Si otro proceso compactó o las claves vencieron, el guardado escribe un snapshot nuevo.
+
+        SOLID: LSP - Cargar devuelve lo último guardado aunque el registro en memoria sea viejo.
+        """
+        for estado in self.estados:
+            self.manager.guardar_partida("final", estado)
+        RedisManager(client=self.servidor).compactar_finalizadas()
+        for estado in self.estados[:7]:
+            self.assertTrue(self.manager.guardar_partida("final", estado)[0])
+        self.assertEqual(RedisManager(client=self.servidor).cargar_partida("final")[0],
+                         self.estados[6])
+
+        # Al vencer, la versión vuelve a 0: hay conflicto hasta que se vuelve a cargar
+        self.servidor.delete(*[f"final:{sufijo}"
+                               for sufijo in ("eventos", "snapshot", "meta", "archivo")])
+        self.assertTrue(es_conflicto(self.manager.guardar_partida("final", self.estados[8])))
+        self.assertTrue(es_conflicto(self.manager.guardar_partida("final", self.estados[8])))
+        self.assertIsNone(self.manager.cargar_partida("final")[0])
+        self.assertTrue(self.manager.guardar_partida("final", self.estados[8])[0])
+        self.assertEqual(RedisManager(client=self.servidor).cargar_partida("final")[0],
+                         self.estados[8])
+
+    def test_reporte_memoria(self):
+        """
+        El reporte suma los bytes de cada clase y del índice, con DUMP si no hay MEMORY USAGE.
+
+        SOLID: SRP - Medir no modifica ninguna partida.
+        """
+        for estado in self.estados:
+            self.manager.guardar_partida("final", estado)
+        self.manager.guardar_partida("autoguardado", self.estados[0])
+
+        reporte, mensaje = self.manager.reporte_memoria(lote=1)
+        self.assertEqual(reporte["finalizada"]["partidas"], 1)
+        self.assertEqual(reporte["autoguardado"]["partidas"], 1)
+        self.assertEqual(reporte["manual"], {"partidas": 0, "bytes": 0})
+        self.assertEqual(reporte["indice"]["partidas"], 2)
+        self.assertGreater(reporte["finalizada"]["bytes"], reporte["autoguardado"]["bytes"])
+        self.assertIn(f"{sum(clase['bytes'] for clase in reporte.values())} bytes", mensaje)
+
+        antes = reporte["finalizada"]["bytes"]
+        self.manager.compactar_finalizadas()
+        self.assertLess(self.manager.reporte_memoria()[0]["finalizada"]["bytes"], antes)
+
+
+class TestRedisManagerVersiones(unittest.TestCase):
+    """Tests de los guardados condicionales por versión entre varios procesos (fakeredis)."""
+
+    def setUp(self):
+        """Dos managers (dos procesos) que comparten el mismo servidor."""
+        self.servidor = fakeredis.FakeStrictRedis()
+        self.primero = RedisManager(client=self.servidor)
+        self.segundo = RedisManager(client=self.servidor)
+        self.estados = [{"board_state": {"puntos": [["negro", numero]]},
+                         "ui_state": {"current_player": "negro"}} for numero in range(1, 5)]
+
+    def test_conflicto_y_reintento(self):
+        """
+        El segundo guardado sobre una versión vieja no pisa nada; después de cargar, se guarda.
+
+        SOLID: SRP - El manager detecta el conflicto; decidir cómo resolverlo es del llamador.
+        """
+        self.primero.guardar_partida("mesa", self.estados[0])
+        self.segundo.cargar_partida("mesa")
+        self.assertTrue(self.primero.guardar_partida("mesa", self.estados[1])[0])
+
+        resultado = self.segundo.guardar_partida("mesa", self.estados[2])
+        self.assertTrue(es_conflicto(resultado))
+        self.assertIn("versión 2 (se esperaba la 1)", resultado[1])
+        self.assertEqual(RedisManager(client=self.servidor).cargar_partida("mesa")[0],
+                         self.estados[1])
+
+        self.assertEqual(self.segundo.cargar_partida("mesa")[0], self.estados[1])
+        self.assertTrue(self.segundo.guardar_partida("mesa", self.estados[2])[0])
+        self.assertEqual(int(self.servidor.hget("mesa:meta", "version")), 3)
+        self.assertFalse(es_conflicto((False, "Error: No hay conexión a Redis.")))
+
+    def test_guardar_sin_cargar_y_reintento_sin_recargar(self):
+        """
+        Guardar sobre una partida existente que nunca se cargó es un conflicto, y
+        reintentar sin cargar también: solo cargar (o sobrescribir) lo resuelve.
+
+        SOLID: SRP - La versión esperada la cambian solo cargar y guardar con éxito.
+        """
+        self.assertTrue(self.primero.guardar_partida("mesa", self.estados[0])[0])
+        self.assertTrue(es_conflicto(self.segundo.guardar_partida("mesa", self.estados[1])))
+        self.assertTrue(self.primero.guardar_partida("mesa", self.estados[2])[0])
+
+        self.segundo.cargar_partida("mesa")
+        self.assertTrue(self.segundo.guardar_partida("mesa", self.estados[3])[0])
+        self.assertTrue(es_conflicto(self.primero.guardar_partida("mesa", self.estados[0])))
+        self.assertTrue(es_conflicto(self.primero.guardar_partida("mesa", self.estados[0])))
+        self.assertEqual(RedisManager(client=self.servidor).cargar_partida("mesa")[0],
+                         self.estados[3])
+
+        self.assertTrue(self.primero.guardar_partida("mesa", self.estados[1], sobrescribir=True)[0])
+        self.assertEqual(RedisManager(client=self.servidor).cargar_partida("mesa")[0],
+                         self.estados[1])
+        self.assertTrue(self.primero.guardar_partida("mesa", self.estados[2])[0])
+
+    def test_conflicto_por_partida_en_lote(self):
+        """En un lote, solo la partida en conflicto queda sin guardar."""
+        self.primero.guardar_partidas({"mesa1": self.estados[0], "mesa2": self.estados[0]})
+        self.segundo.cargar_partida("mesa2")
+        self.segundo.guardar_partida("mesa2", self.estados[1])
+
+        resultados = self.primero.guardar_partidas({"mesa1": self.estados[2],
+                                                    "mesa2": self.estados[2]})
+        self.assertTrue(resultados["mesa1"][0])
+        self.assertTrue(es_conflicto(resultados["mesa2"]))
+        cargadas = RedisManager(client=self.servidor).cargar_partidas(["mesa1", "mesa2"])
+        self.assertEqual(cargadas["mesa1"][0], self.estados[2])
+        self.assertEqual(cargadas["mesa2"][0], self.estados[1])
+
+    def test_escritura_entre_watch_y_exec(self):
+        """Si otro proceso guarda después del WATCH, la transacción se repite y esa partida queda en conflicto."""
+        self.primero.guardar_partidas({"mesa1": self.estados[0], "mesa2": self.estados[0]})
+        self.segundo.cargar_partidas(["mesa1", "mesa2"])
+        original = RedisManager._separar_conflictos
+        llamadas = []
+
+        def guardar_en_el_medio(manager, *args):
+            if manager is self.primero:
+                llamadas.append(args)
+            if len(llamadas) == 1 and manager is self.primero:
+                self.segundo.guardar_partida("mesa2", self.estados[3])
+            return original(manager, *args)
+
+        with patch.object(RedisManager, '_separar_conflictos', autospec=True,
+                          side_effect=guardar_en_el_medio):
+            resultados = self.primero.guardar_partidas({"mesa1": self.estados[1],
+                                                        "mesa2": self.estados[1]})
+        self.assertEqual(len(llamadas), 2)
+        self.assertTrue(resultados["mesa1"][0])
+        self.assertTrue(es_conflicto(resultados["mesa2"]))
+        self.assertEqual(RedisManager(client=self.servidor).cargar_partida("mesa2")[0],
+                         self.estados[3])
+
+    def test_registro_olvidado_durante_el_guardado(self):
+        """
+        Si otro hilo (el autoguardado, un StorageWorker) descarta el registro de
+        una partida mientras el guardado lee las demás, el guardado sigue con el
+        que copió al empezar en lugar de fallar con KeyError.
+        """
+        self.primero.guardar_partida("mesa", self.estados[0])
+        original = self.primero._RedisManager__leer_registros
+
+        def olvidar_en_el_medio(cliente, slots):
+            self.primero._olvidar_registros(["mesa"])
+            return original(cliente, slots)
+
+        with patch.object(self.primero, '_RedisManager__leer_registros',
+                          side_effect=olvidar_en_el_medio):
+            resultados = self.primero.guardar_partidas({"mesa": self.estados[1],
+                                                        "nueva": self.estados[1]})
+        self.assertEqual(resultados, {"mesa": (True, "Partida guardada en 'mesa'."),
+                                      "nueva": (True, "Partida guardada en 'nueva'.")})
+        self.assertEqual(RedisManager(client=self.servidor).cargar_partida("mesa")[0],
+                         self.estados[1])
+
+    def test_conflicto_persistente(self):
+        """Si la transacción aborta en todos los intentos, todo el lote es conflicto."""
+        self.primero.guardar_partida("mesa", self.estados[0])
+        original = RedisManager._separar_conflictos
+
+        def tocar_metadatos(manager, *args):
+            # Como la compactación: cambia los metadatos sin cambiar la versión
+            self.servidor.hset("mesa:meta", "compactada", 0)
+            return original(manager, *args)
+
+        with patch.object(RedisManager, '_separar_conflictos', autospec=True,
+                          side_effect=tocar_metadatos):
+            exito, mensaje = self.primero.guardar_partida("mesa", self.estados[2])
+        self.assertTrue(es_conflicto((exito, mensaje)))
+        self.assertIn("5 veces", mensaje)
+        self.assertEqual(self.primero.cargar_partida("mesa")[0], self.estados[0])
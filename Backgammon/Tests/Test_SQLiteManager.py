@@ -0,0 +1,124 @@
+import itertools
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+from Backgammon.Core.Board import Board
+from Backgammon.Persistence.SQLiteManager import SQLiteManager
+
+
+class TestSQLiteManager(unittest.TestCase):
+    """Tests del almacenamiento en SQLite."""
+
+    def setUp(self):
+        """Crea un manager sobre una base temporal."""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+        self.ruta = os.path.join(self.directorio.name, "partidas.db")
+        self.manager = SQLiteManager(self.ruta)
+        self.addCleanup(self.manager.cerrar)
+        board = Board()
+        board.inicializar_posiciones_estandar()
+        self.estado = {"board_state": board.obtener_estado_dict(),
+                       "ui_state": {"current_player": "negro"}}
+
+    def test_guardar_y_cargar(self):
+        """
+        Una partida guardada se carga igual, también desde otro manager.
+
+        SOLID: LSP - Mismos mensajes que RedisManager.
+        """
+        self.assertEqual(self.manager.guardar_partida("slot1", self.estado),
+                         (True, "Partida guardada en 'slot1'."))
+        self.assertEqual(self.manager.cargar_partida("slot1"),
+                         (self.estado, "Partida cargada desde 'slot1'."))
+        otro = SQLiteManager(self.ruta)
+        self.addCleanup(otro.cerrar)
+        self.assertEqual(otro.cargar_partida("slot1")[0], self.estado)
+        self.assertEqual(otro.cargar_partida("vacio"),
+                         (None, "No se encontró partida guardada en 'vacio'."))
+
+    def test_lote_en_una_transaccion(self):
+        """Guardar 1.000 partidas hace un solo commit y se cargan todas juntas."""
+        estados = {f"mesa{numero}": {"ui_state": {"turno": numero}} for numero in range(1000)}
+        estados["mala"] = {"ui_state": {"x": object()}}
+        sentencias = []
+        conectar = sqlite3.connect
+
+        def conectar_con_traza(*args, **kwargs):
+            conexion = conectar(*args, **kwargs)
+            conexion.set_trace_callback(sentencias.append)
+            return conexion
+
+        with patch("sqlite3.connect", side_effect=conectar_con_traza):
+            resultados = self.manager.guardar_partidas(estados)
+        self.assertEqual(sum(sentencia.startswith("COMMIT") for sentencia in sentencias), 1)
+        self.assertFalse(resultados["mala"][0])
+        self.assertIn("no serializable", resultados["mala"][1])
+        self.assertEqual(sum(exito for exito, _ in resultados.values()), 1000)
+
+        cargadas = self.manager.cargar_partidas(list(estados))
+        self.assertEqual(list(cargadas), list(estados))
+        self.assertEqual(cargadas["mesa999"][0], estados["mesa999"])
+        self.assertIsNone(cargadas["mala"][0])
+
+    def test_datos_corruptos(self):
+        """Una fila corrupta informa el error sin afectar a las demás."""
+        self.manager.guardar_partidas({"buena": self.estado, "rota": self.estado})
+        with sqlite3.connect(self.ruta) as conexion:
+            conexion.execute("UPDATE partidas SET datos = ? WHERE slot = 'rota'", (b"{no es json",))
+        cargadas = self.manager.cargar_partidas(["buena", "rota"])
+        self.assertEqual(cargadas["buena"][0], self.estado)
+        self.assertIsNone(cargadas["rota"][0])
+        self.assertIn("JSON corrupto", cargadas["rota"][1])
+
+    def test_listado_paginado(self):
+        """Las partidas se listan por fecha de guardado, con sus metadatos y número de jugada."""
+        with patch('time.time', side_effect=itertools.count(1000)):
+            for numero in range(5):
+                self.manager.guardar_partida(f"mesa{numero}", self.estado)
+            self.manager.guardar_partida("mesa1", self.estado)
+
+        pagina, cursor, _ = self.manager.listar_partidas(0, 3)
+        self.assertEqual([partida["slot"] for partida in pagina], ["mesa1", "mesa4", "mesa3"])
+        self.assertEqual(pagina[0]["jugada"], 2)
+        self.assertEqual(pagina[0]["guardada"], 1005)
+        self.assertEqual(pagina[0]["pips_negro"], 167)
+        pagina, cursor, _ = self.manager.listar_partidas(cursor, 3)
+        self.assertEqual([partida["slot"] for partida in pagina], ["mesa2", "mesa0"])
+        self.assertIsNone(cursor)
+
+    def test_cursor_estable_ante_guardados(self):
+        """
+        El cursor sigue desde la última partida listada: guardar entre páginas
+        no repite ni saltea las demás, y los empates de fecha se ordenan por slot.
+        """
+        with patch('time.time', return_value=1000):
+            self.manager.guardar_partidas({f"mesa{numero}": self.estado for numero in range(4)})
+        pagina, cursor, _ = self.manager.listar_partidas(0, 2)
+        self.assertEqual([partida["slot"] for partida in pagina], ["mesa0", "mesa1"])
+        self.assertEqual(cursor, (1000, "mesa1"))
+
+        with patch('time.time', return_value=2000):
+            self.manager.guardar_partida("nueva", self.estado)
+        pagina, cursor, _ = self.manager.listar_partidas(cursor, 2)
+        self.assertEqual([partida["slot"] for partida in pagina], ["mesa2", "mesa3"])
+        self.assertIsNone(cursor)
+        with self.assertRaises(ValueError):
+            self.manager.listar_partidas(3, 2)
+
+    def test_base_de_la_version_anterior(self):
+        """Una base creada sin las columnas del listado se actualiza al abrirla."""
+        with sqlite3.connect(self.ruta) as conexion:
+            conexion.execute("CREATE TABLE partidas (slot TEXT PRIMARY KEY, "
+                             "datos BLOB NOT NULL, guardada REAL NOT NULL)")
+            conexion.execute("INSERT INTO partidas VALUES ('vieja', ?, 1)", (b'{"ui_state": {}}',))
+        self.assertEqual(self.manager.cargar_partida("vieja")[0], {"ui_state": {}})
+        self.manager.guardar_partida("nueva", self.estado)
+        pagina, _, _ = self.manager.listar_partidas()
+        self.assertEqual([partida["slot"] for partida in pagina], ["nueva", "vieja"])
+
+
+if __name__ == "__main__":
+    unittest.main()
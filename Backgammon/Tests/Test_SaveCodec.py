@@ -0,0 +1,123 @@
+import json
+import unittest
+import fakeredis
+from Backgammon.Core.Board import Board
+from Backgammon.Persistence.RedisManager import RedisManager
+from Backgammon.Persistence.SaveCodec import (MAGIA, codificar_partida, decodificar_partida,
+                                              deserializar_partida, es_binario,
+                                              serializar_partida)
+
+
+def _partida_de_ejemplo() -> dict:
+    """Arma una partida con el formato que guarda PygameUI."""
+    board = Board()
+    board.inicializar_posiciones_estandar()
+    board.aplicar_movimiento("negro", 1, 4)
+    return {
+        "board_state": board.obtener_estado_dict(),
+        "ui_state": {
+            "current_player": "negro",
+            "dice_rolls": [3, 5],
+            "available_moves": [5],
+            "is_doubles_roll": False,
+            "selected_point": None,
+            "game_state": "AWAITING_PIECE_SELECTION",
+            "home_pieces": {"negro": 0, "blanco": 2},
+            "bar_pieces": {"negro": 1, "blanco": 0},
+        },
+    }
+
+
+class TestSaveCodec(unittest.TestCase):
+    """Tests del formato binario versionado de partidas."""
+
+    def test_ida_y_vuelta_compacta(self):
+        """
+        Verifica que una partida se codifica en menos de 50 bytes y se recupera igual.
+
+        SOLID: SRP - El códec solo traduce entre diccionario y bytes.
+        """
+        partida = _partida_de_ejemplo()
+        datos = codificar_partida(partida)
+
+        self.assertTrue(datos.startswith(MAGIA))
+        self.assertLess(len(datos), 50)
+        self.assertLess(len(datos), len(json.dumps(partida)) // 5)
+        self.assertEqual(json.loads(json.dumps(decodificar_partida(datos))),
+                         json.loads(json.dumps(partida)))
+
+    def test_barra_y_casa_del_tablero(self):
+        """Los contadores de barra y casa del tablero se guardan en sus casillas."""
+        partida = _partida_de_ejemplo()
+        partida["board_state"]["barra"] = {"blanco": 2}
+        partida["board_state"]["casa"] = {"negro": 4}
+        partida["ui_state"]["selected_point"] = 0
+        partida["ui_state"]["dice_rolls"] = [6, 6]
+        partida["ui_state"]["available_moves"] = [6, 6, 6, 6]
+
+        recuperada = decodificar_partida(codificar_partida(partida))
+
+        self.assertEqual(recuperada["board_state"]["barra"], {"blanco": 2})
+        self.assertEqual(recuperada["board_state"]["casa"], {"negro": 4})
+        self.assertEqual(recuperada["ui_state"]["selected_point"], 0)
+        self.assertEqual(recuperada["ui_state"]["available_moves"], [6, 6, 6, 6])
+
+    def test_estado_no_representable_usa_json(self):
+        """
+        Con claves o valores desconocidos el binario falla y se guarda como JSON.
+
+        SOLID: OCP - Estados nuevos siguen guardándose sin cambiar el códec.
+        """
+        partida = _partida_de_ejemplo()
+        partida["ui_state"]["game_state"] = "ESTADO_NUEVO"
+        with self.assertRaises(ValueError):
+            codificar_partida(partida)
+
+        datos = serializar_partida(partida)
+        self.assertFalse(es_binario(datos))
+        self.assertEqual(deserializar_partida(datos), partida)
+        self.assertFalse(es_binario(serializar_partida(_partida_de_ejemplo(), "json")))
+
+        # Representable pero no exacto (barra de la UI sin la clave "blanco")
+        partida = _partida_de_ejemplo()
+        partida["ui_state"]["bar_pieces"] = {"negro": 1}
+        self.assertFalse(es_binario(serializar_partida(partida)))
+        self.assertTrue(es_binario(serializar_partida(_partida_de_ejemplo())))
+
+    def test_version_o_datos_invalidos(self):
+        """Una versión desconocida o datos truncados lanzan ValueError."""
+        datos = bytearray(codificar_partida(_partida_de_ejemplo()))
+        with self.assertRaises(ValueError):
+            decodificar_partida(bytes(datos[:20]))
+        with self.assertRaises(ValueError):
+            decodificar_partida(bytes(datos[:-2]))
+        datos[len(MAGIA)] = 99
+        with self.assertRaises(ValueError):
+            decodificar_partida(bytes(datos))
+
+    def test_redis_detecta_el_formato_al_cargar(self):
+        """
+        RedisManager guarda snapshots en binario y carga binario y JSON antiguos.
+
+        SOLID: DIP - La UI recibe el mismo diccionario sin importar el formato.
+        """
+        servidor = fakeredis.FakeStrictRedis()
+        manager = RedisManager(client=servidor, snapshot_cada=1)
+        partida = _partida_de_ejemplo()
+
+        self.assertTrue(manager.guardar_partida("binaria", partida)[0])
+        self.assertTrue(es_binario(servidor.hget("binaria:snapshot", "estado")))
+        servidor.set("antigua", json.dumps(partida))
+        servidor.set("antigua_binaria", codificar_partida(partida))
+
+        for slot in ("binaria", "antigua", "antigua_binaria"):
+            cargada, _ = RedisManager(client=servidor).cargar_partida(slot)
+            self.assertEqual(cargada, partida)
+
+        servidor.set("rota", MAGIA + b"\x01\x00")
+        cargada, mensaje = manager.cargar_partida("rota")
+        self.assertIsNone(cargada)
+        self.assertIn("corrupt", mensaje)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from Backgammon.Persistence.ArchivoManager import ArchivoManager
+from Backgammon.Persistence.RedisManager import RedisManager
+from Backgammon.Persistence.SQLiteManager import SQLiteManager
+from Backgammon.Persistence.Storage import (AlmacenPartidas, crear_almacen, es_conflicto,
+                                            mensaje_conflicto)
+
+
+class TestCrearAlmacen(unittest.TestCase):
+    """Tests de la elección del backend por configuración."""
+
+    def setUp(self):
+        """Crea un directorio temporal para las rutas de los backends locales."""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+
+    def test_backends_por_configuracion(self):
+        """
+        Cada configuración crea su backend, todos con la misma interfaz.
+
+        SOLID: DIP - Quien guarda solo conoce AlmacenPartidas.
+        """
+        ruta_db = os.path.join(self.directorio.name, "p.db")
+        ruta_log = os.path.join(self.directorio.name, "p.log")
+        self.assertIsInstance(crear_almacen("redis"), RedisManager)
+        self.assertIsInstance(crear_almacen(f"sqlite:{ruta_db}"), SQLiteManager)
+        self.assertIsInstance(crear_almacen(f"archivo:{ruta_log}"), ArchivoManager)
+        for almacen in (crear_almacen("redis"), crear_almacen(f"sqlite:{ruta_db}"),
+                        crear_almacen(f"archivo:{ruta_log}")):
+            self.assertIsInstance(almacen, AlmacenPartidas)
+        # Crear un backend no abre archivos ni conexiones
+        self.assertEqual(os.listdir(self.directorio.name), [])
+
+    def test_variable_de_entorno_y_error(self):
+        """Sin configuración se usa BACKGAMMON_ALMACEN; un backend desconocido es un error."""
+        ruta = os.path.join(self.directorio.name, "p.db")
+        with patch.dict(os.environ, {"BACKGAMMON_ALMACEN": f"sqlite:{ruta}"}):
+            self.assertIsInstance(crear_almacen(), SQLiteManager)
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsInstance(crear_almacen(), RedisManager)
+        with self.assertRaises(ValueError):
+            crear_almacen("mongo")
+
+
+
+class TestConflicto(unittest.TestCase):
+    """Tests de los resultados de conflicto de versión."""
+
+    def test_es_conflicto(self):
+        """Solo un guardado rechazado con el mensaje de conflicto es un conflicto."""
+        mensaje = mensaje_conflicto("mesa", 4, 3)
+        self.assertIn("versión 4 (se esperaba la 3)", mensaje)
+        self.assertTrue(es_conflicto((False, mensaje)))
+        self.assertFalse(es_conflicto((False, "Error al guardar partida: disco lleno")))
+        self.assertFalse(es_conflicto((True, "Partida guardada en 'mesa'.")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import random
+import tempfile
+import unittest
+import numpy as np
+from Backgammon.Core.NeuralEvaluator import NeuralEvaluator
+from Backgammon.Training.TDTrainer import TDTrainer, _entrenar_lote, jugar_partida_td
+
+
+class TestTDTrainer(unittest.TestCase):
+    """Tests del entrenamiento TD(λ) por autojuego."""
+
+    def setUp(self):
+        """Crea una red chica y reproducible."""
+        self.red = NeuralEvaluator.aleatorio(ocultas=8, semilla=1)
+
+    def test_partida_termina_y_actualiza_pesos(self):
+        """Una partida de autojuego tiene ganador y modifica los pesos."""
+        antes = self.red.obtener_pesos()["W1"].copy()
+        random.seed(5)
+        ganador, turnos = jugar_partida_td(self.red, 0.1, 0.7)
+        self.assertIn(ganador, ("negro", "blanco"))
+        self.assertGreater(turnos, 0)
+        self.assertFalse(np.array_equal(antes, self.red.obtener_pesos()["W1"]))
+
+    def test_entrenamiento_reproducible(self):
+        """Con la misma semilla y un proceso se obtienen los mismos pesos."""
+        otra = NeuralEvaluator.aleatorio(ocultas=8, semilla=1)
+        TDTrainer(self.red, procesos=1, partidas_por_lote=2, semilla=9).entrenar(2)
+        TDTrainer(otra, procesos=1, partidas_por_lote=2, semilla=9).entrenar(2)
+        np.testing.assert_array_equal(self.red.obtener_pesos()["W2"], otra.obtener_pesos()["W2"])
+
+    def test_lote_usa_su_propio_generador(self):
+        """Cada lote juega con random.Random(semilla) y no toca el generador global."""
+        tarea = (self.red.obtener_pesos(), 2, 0.1, 0.7, 9)
+        random.seed(3)
+        estado = random.getstate()
+        cambios, _, turnos = _entrenar_lote(tarea)
+        self.assertEqual(random.getstate(), estado)
+
+        otros, _, otros_turnos = _entrenar_lote(tarea)
+        self.assertEqual(turnos, otros_turnos)
+        np.testing.assert_array_equal(cambios["W1"], otros["W1"])
+
+    def test_entrenar_en_varios_procesos_con_checkpoints(self):
+        """
+        Verifica el reparto en procesos, el reporte de rendimiento y los checkpoints.
+
+        SOLID: SRP - El entrenador coordina; cada proceso juega sus partidas.
+        """
+        mensajes = []
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, "pesos.npz")
+            entrenador = TDTrainer(self.red, procesos=2, partidas_por_lote=1, ruta_checkpoint=ruta,
+                                   partidas_por_checkpoint=2, semilla=4)
+            estadisticas = entrenador.entrenar(3, informar=mensajes.append)
+            cargada = NeuralEvaluator.cargar(ruta)
+
+        self.assertEqual(estadisticas["partidas"], 3)
+        self.assertEqual(estadisticas["checkpoints"], 2)
+        self.assertGreater(estadisticas["partidas_por_segundo_por_nucleo"], 0)
+        self.assertEqual(len(mensajes), 2)
+        self.assertIn("partidas/s/núcleo", mensajes[-1])
+        np.testing.assert_array_equal(cargada.obtener_pesos()["W1"], self.red.obtener_pesos()["W1"])
+
+    def test_parametros_invalidos(self):
+        """Procesos o lotes menores que 1 lanzan ValueError."""
+        with self.assertRaises(ValueError):
+            TDTrainer(self.red, procesos=0)
+        with self.assertRaises(ValueError):
+            TDTrainer(self.red, partidas_por_lote=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import unittest
+from Backgammon.Core.AIPlayer import AIPlayer
+from Backgammon.Core.NeuralEvaluator import NeuralEvaluator
+from Backgammon.Training.Tournament import (JugadorAzar, Tournament, crear_jugador,
+                                            intervalo_wilson, jugar_partida_torneo)
+
+
+def _sin_tiempos(resultado):
+    """Quita los tiempos, que dependen de la máquina."""
+    return {clave: valor for clave, valor in resultado.items() if not clave.startswith("segundos")}
+
+
+class TestTournament(unittest.TestCase):
+    """Tests del torneo entre jugadores automáticos."""
+
+    def test_crear_jugador(self):
+        """
+        Verifica los formatos de especificación de jugadores.
+
+        SOLID: OCP - Cada tipo de jugador se agrega en crear_jugador.
+        """
+        self.assertIsInstance(crear_jugador("azar", "negro", 1), JugadorAzar)
+        self.assertIsInstance(crear_jugador("ia:2", "blanco", 1), AIPlayer)
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, "pesos.npz")
+            NeuralEvaluator.aleatorio(ocultas=4, semilla=0).guardar(ruta)
+            self.assertIsInstance(crear_jugador(f"red:{ruta}", "negro", 1), AIPlayer)
+        for invalida in ("experto", "azar:3", "red"):
+            with self.assertRaises(ValueError):
+                crear_jugador(invalida, "negro", 1)
+
+    def test_intervalo_wilson(self):
+        """El intervalo de Wilson contiene la proporción y queda dentro de [0, 1]."""
+        self.assertEqual(intervalo_wilson(0, 0), (0.0, 1.0))
+        inferior, superior = intervalo_wilson(50, 100)
+        self.assertAlmostEqual(inferior + superior, 1.0)
+        self.assertAlmostEqual(inferior, 0.4038, places=3)
+        inferior, superior = intervalo_wilson(10, 10)
+        self.assertGreater(inferior, 0.6)
+        self.assertAlmostEqual(superior, 1.0)
+
+    def test_partida_determinista_por_semilla(self):
+        """
+        La misma semilla reproduce la misma partida; A cambia de color en partidas impares.
+
+        SOLID: SRP - La partida depende solo de su tarea.
+        """
+        primera = jugar_partida_torneo((1, "ia:1", "azar", 42))
+        segunda = jugar_partida_torneo((1, "ia:1", "azar", 42))
+        self.assertEqual(_sin_tiempos(primera), _sin_tiempos(segunda))
+        self.assertEqual(primera["color_a"], "blanco")
+        self.assertIn(primera["tipo"], ("simple", "gammon", "backgammon"))
+
+    def test_torneo_en_procesos_escribe_jsonl(self):
+        """
+        Verifica el torneo en varios procesos, el archivo JSON lines y el resumen.
+
+        SOLID: SRP - El torneo solo reparte partidas y agrega resultados.
+        """
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, "torneo.jsonl")
+            resumen = Tournament("ia:1", "azar", procesos=2, semilla=7).jugar(4, ruta)
+            with open(ruta, encoding="utf-8") as archivo:
+                lineas = [json.loads(linea) for linea in archivo]
+
+        self.assertEqual([linea["indice"] for linea in lineas], [0, 1, 2, 3])
+        self.assertEqual([linea["semilla"] for linea in lineas], [7, 8, 9, 10])
+        self.assertEqual(resumen, {**Tournament.resumir(lineas), "segundos": resumen["segundos"]})
+        self.assertEqual(resumen["partidas"], 4)
+        inferior, superior = resumen["intervalo_a"]
+        self.assertLessEqual(inferior, resumen["porcentaje_a"])
+        self.assertGreaterEqual(superior, resumen["porcentaje_a"])
+        self.assertEqual(_sin_tiempos(lineas[2]), _sin_tiempos(jugar_partida_torneo((2, "ia:1", "azar", 9))))
+
+    def test_parametros_invalidos(self):
+        """Procesos menores que 1 o jugadores desconocidos lanzan ValueError."""
+        with self.assertRaises(ValueError):
+            Tournament("ia", "azar", procesos=0)
+        with self.assertRaises(ValueError):
+            Tournament("ia", "humano", procesos=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,266 @@
+"""Entrenamiento TD(λ) por autojuego del NeuralEvaluator, repartido entre procesos."""
+import argparse
+import multiprocessing
+import os
+import random
+import time
+import numpy as np
+from Backgammon.Core.CompactBoard import CompactBoard
+from Backgammon.Core.Dice import Dice
+from Backgammon.Core.NeuralEvaluator import NeuralEvaluator, OCULTAS_POR_DEFECTO, equidad
+
+COLORES = ("negro", "blanco")
+
+
+def _rival(color: str) -> str:
+    """Devuelve el color del oponente."""
+    return "blanco" if color == "negro" else "negro"
+
+
+def jugar_partida_td(evaluador: NeuralEvaluator, alfa: float, lambda_: float,
+                     generador: random.Random | None = None) -> tuple[str, int]:
+    """
+    Juega una partida de autojuego y actualiza los pesos del evaluador en línea con TD(λ).
+
+    Cada color elige la jugada de mayor equidad según la red. Las posiciones se evalúan
+    desde el punto de vista del jugador que acaba de mover, así que cada color tiene su
+    propia cadena de trazas de elegibilidad: el objetivo de una posición es la siguiente
+    posición del mismo color, y al final el resultado real de la partida.
+
+    Args:
+        evaluador (NeuralEvaluator): Red a entrenar (se modifica en el lugar).
+        alfa (float): Tasa de aprendizaje.
+        lambda_ (float): Decaimiento de las trazas de elegibilidad.
+        generador (random.Random | None): Generador para el color inicial y las
+            tiradas (None = el módulo random, como Dice).
+
+    Returns:
+        tuple[str, int]: Color ganador y cantidad de turnos jugados.
+    """
+    pesos = evaluador.obtener_pesos()
+    board = CompactBoard()
+    board.inicializar_posiciones_estandar()
+    dados = Dice()
+    trazas = {color: None for color in COLORES}
+    anteriores = {color: None for color in COLORES}
+    azar = generador or random
+    color = azar.choice(COLORES)
+    turnos = 0
+
+    while True:
+        turnos += 1
+        dados.set_dados_para_test(azar.randint(1, 6), azar.randint(1, 6))
+        jugadas = board.obtener_jugadas_legales(color, dados)
+        if jugadas:
+            equidades = equidad(evaluador.evaluar_jugadas(board, color, jugadas))
+            board.aplicar_jugada(color, jugadas[int(np.argmax(equidades))])
+            if board.ha_ganado(color):
+                break
+            entrada = evaluador.codificar_posiciones(evaluador.posiciones_de(board), color)[0]
+            salidas, gradientes = evaluador.gradientes(entrada)
+            if anteriores[color] is not None:
+                _aplicar_td(pesos, trazas[color], salidas - anteriores[color], alfa)
+                for clave, gradiente in gradientes.items():
+                    trazas[color][clave] *= lambda_
+                    trazas[color][clave] += gradiente
+            else:
+                trazas[color] = gradientes
+            anteriores[color] = salidas
+        color = _rival(color)
+
+    # Resultado real desde el punto de vista de cada color
+    gammon = board.get_casa().get(_rival(color), 0) == 0
+    resultados = {color: np.array([1.0, float(gammon), 0.0]),
+                  _rival(color): np.array([0.0, 0.0, float(gammon)])}
+    for jugador in COLORES:
+        if anteriores[jugador] is not None:
+            _aplicar_td(pesos, trazas[jugador], resultados[jugador] - anteriores[jugador], alfa)
+    return color, turnos
+
+
+def _aplicar_td(pesos: dict, trazas: dict, error: np.ndarray, alfa: float) -> None:
+    """Suma a cada peso alfa * Σ_k error_k * traza_k (en el lugar)."""
+    for clave, traza in trazas.items():
+        pesos[clave] += alfa * np.tensordot(error, traza, axes=1)
+
+
+def _entrenar_lote(tarea: tuple) -> tuple[dict, int, int]:
+    """
+    Trabajo de un proceso: juega varias partidas sobre una copia de los pesos.
+    Usa su propio random.Random(semilla), como Tournament, así no toca el
+    generador global del proceso (que con procesos=1 es el del llamador).
+
+    Args:
+        tarea (tuple): (pesos, partidas, alfa, lambda_, semilla).
+
+    Returns:
+        tuple[dict, int, int]: Cambio de cada peso, partidas y turnos jugados.
+    """
+    pesos, partidas, alfa, lambda_, semilla = tarea
+    generador = random.Random(semilla)
+    evaluador = NeuralEvaluator(pesos["W1"], pesos["b1"], pesos["W2"], pesos["b2"])
+    turnos = 0
+    for _ in range(partidas):
+        turnos += jugar_partida_td(evaluador, alfa, lambda_, generador)[1]
+    finales = evaluador.obtener_pesos()
+    return {clave: finales[clave] - pesos[clave] for clave in pesos}, partidas, turnos
+
+
+class TDTrainer:
+    """
+    Entrena un NeuralEvaluator con TD(λ) por autojuego usando varios procesos.
+
+    En cada ronda, cada proceso juega un lote de partidas con una copia de los
+    pesos actuales; al terminar se promedian los cambios de todos los procesos
+    y se aplican a la red. Cada cierta cantidad de partidas se guarda un
+    checkpoint .npz.
+
+    PRINCIPIOS SOLID:
+    - SRP: Solo coordina procesos, promedia cambios y guarda checkpoints;
+      el aprendizaje de una partida está en jugar_partida_td.
+    - DIP: Recibe el evaluador desde afuera.
+    """
+
+    def __init__(self, evaluador: NeuralEvaluator, procesos: int | None = None,
+                 alfa: float = 0.1, lambda_: float = 0.7, partidas_por_lote: int = 25,
+                 ruta_checkpoint: str | None = None, partidas_por_checkpoint: int = 1000,
+                 semilla: int | None = None):
+        """
+        Inicializa el entrenador.
+
+        Args:
+            evaluador (NeuralEvaluator): Red a entrenar (se modifica en el lugar).
+            procesos (int | None): Procesos a usar (None = todos los núcleos).
+            alfa (float): Tasa de aprendizaje.
+            lambda_ (float): Decaimiento de las trazas de elegibilidad.
+            partidas_por_lote (int): Partidas que juega cada proceso por ronda.
+            ruta_checkpoint (str | None): Archivo .npz de checkpoints (None = no guardar).
+            partidas_por_checkpoint (int): Partidas entre checkpoints.
+            semilla (int | None): Semilla para reproducir el entrenamiento.
+
+        Raises:
+            ValueError: Si procesos o partidas_por_lote son menores que 1.
+        """
+        procesos = procesos if procesos is not None else (os.cpu_count() or 1)
+        if procesos < 1 or partidas_por_lote < 1:
+            raise ValueError("Los procesos y las partidas por lote deben ser al menos 1.")
+        self.__evaluador__ = evaluador
+        self.__procesos__ = procesos
+        self.__alfa__ = alfa
+        self.__lambda__ = lambda_
+        self.__partidas_por_lote__ = partidas_por_lote
+        self.__ruta_checkpoint__ = ruta_checkpoint
+        self.__partidas_por_checkpoint__ = partidas_por_checkpoint
+        self.__generador__ = np.random.default_rng(semilla)
+
+    def entrenar(self, partidas: int, informar=None) -> dict:
+        """
+        Juega 'partidas' partidas de autojuego y actualiza la red.
+
+        Args:
+            partidas (int): Total de partidas a jugar.
+            informar (callable | None): Recibe un texto de progreso por ronda (por ejemplo print).
+
+        Returns:
+            dict: partidas, turnos, segundos, partidas_por_segundo_por_nucleo y checkpoints.
+        """
+        estadisticas = {"partidas": 0, "turnos": 0, "segundos": 0.0,
+                        "partidas_por_segundo_por_nucleo": 0.0, "checkpoints": 0}
+        inicio = time.perf_counter()
+        desde_checkpoint = 0
+        pool = multiprocessing.Pool(self.__procesos__) if self.__procesos__ > 1 else None
+        try:
+            while estadisticas["partidas"] < partidas:
+                tareas = self._repartir(partidas - estadisticas["partidas"])
+                resultados = pool.map(_entrenar_lote, tareas) if pool else list(map(_entrenar_lote, tareas))
+                self._aplicar_promedio([cambios for cambios, _, _ in resultados])
+
+                jugadas_ronda = sum(cantidad for _, cantidad, _ in resultados)
+                estadisticas["partidas"] += jugadas_ronda
+                estadisticas["turnos"] += sum(turnos for _, _, turnos in resultados)
+                estadisticas["segundos"] = time.perf_counter() - inicio
+                estadisticas["partidas_por_segundo_por_nucleo"] = (
+                    estadisticas["partidas"] / estadisticas["segundos"] / self.__procesos__)
+                desde_checkpoint += jugadas_ronda
+                if desde_checkpoint >= self.__partidas_por_checkpoint__:
+                    self.guardar_checkpoint()
+                    estadisticas["checkpoints"] += 1
+                    desde_checkpoint = 0
+                if informar is not None:
+                    informar(f"{estadisticas['partidas']}/{partidas} partidas | "
+                             f"{estadisticas['partidas_por_segundo_por_nucleo']:.2f} "
+                             f"partidas/s/núcleo ({self.__procesos__} procesos)")
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        if desde_checkpoint > 0:
+            self.guardar_checkpoint()
+            estadisticas["checkpoints"] += 1
+        return estadisticas
+
+    def guardar_checkpoint(self) -> None:
+        """
+        Guarda los pesos actuales en la ruta de checkpoint (escritura atómica).
+        No hace nada si no hay ruta configurada.
+        """
+        if self.__ruta_checkpoint__ is None:
+            return
+        temporal = self.__ruta_checkpoint__ + ".tmp.npz"
+        self.__evaluador__.guardar(temporal)
+        os.replace(temporal, self.__ruta_checkpoint__)
+
+    def _repartir(self, restantes: int) -> list[tuple]:
+        """Arma las tareas de una ronda: un lote por proceso, sin pasarse del total."""
+        pesos = {clave: valor.copy() for clave, valor in self.__evaluador__.obtener_pesos().items()}
+        tareas = []
+        for _ in range(self.__procesos__):
+            cantidad = min(self.__partidas_por_lote__, restantes)
+            if cantidad <= 0:
+                break
+            restantes -= cantidad
+            semilla = int(self.__generador__.integers(2**32))
+            tareas.append((pesos, cantidad, self.__alfa__, self.__lambda__, semilla))
+        return tareas
+
+    def _aplicar_promedio(self, cambios: list[dict]) -> None:
+        """Suma a la red el promedio de los cambios de todos los procesos."""
+        pesos = self.__evaluador__.obtener_pesos()
+        for clave, valor in pesos.items():
+            valor += sum(cambio[clave] for cambio in cambios) / len(cambios)
+
+
+def main() -> None:
+    """
+    Punto de entrada del entrenamiento por línea de comandos.
+
+    Ejemplo:
+        python3 -m Backgammon.Training.TDTrainer --partidas 100000 --salida pesos.npz
+    """
+    parser = argparse.ArgumentParser(description="Entrena el evaluador neuronal con TD(λ) por autojuego.")
+    parser.add_argument("--partidas", type=int, default=10_000, help="Total de partidas a jugar.")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos (por defecto, todos los núcleos).")
+    parser.add_argument("--ocultas", type=int, default=OCULTAS_POR_DEFECTO, help="Unidades ocultas de una red nueva.")
+    parser.add_argument("--alfa", type=float, default=0.1, help="Tasa de aprendizaje.")
+    parser.add_argument("--lambda", dest="lambda_", type=float, default=0.7, help="Decaimiento de las trazas.")
+    parser.add_argument("--lote", type=int, default=25, help="Partidas por proceso y por ronda.")
+    parser.add_argument("--cada", type=int, default=1000, help="Partidas entre checkpoints.")
+    parser.add_argument("--salida", default="pesos.npz", help="Archivo .npz de pesos (se continúa si existe).")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla para reproducir el entrenamiento.")
+    argumentos = parser.parse_args()
+
+    if os.path.exists(argumentos.salida):
+        evaluador = NeuralEvaluator.cargar(argumentos.salida)
+    else:
+        evaluador = NeuralEvaluator.aleatorio(argumentos.ocultas, argumentos.semilla)
+    entrenador = TDTrainer(evaluador, argumentos.procesos, argumentos.alfa, argumentos.lambda_,
+                           argumentos.lote, argumentos.salida, argumentos.cada, argumentos.semilla)
+    estadisticas = entrenador.entrenar(argumentos.partidas, informar=print)
+    print(f"✅ {estadisticas['partidas']} partidas en {estadisticas['segundos']:.1f} s "
+          f"({estadisticas['partidas_por_segundo_por_nucleo']:.2f} partidas/s/núcleo). "
+          f"Pesos guardados en {argumentos.salida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""Torneo entre dos jugadores automáticos en varios procesos, con resultados en JSON lines."""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import time
+from Backgammon.Core.AIPlayer import AIPlayer
+from Backgammon.Core.GameEngine import GameEngine
+from Backgammon.Core.NeuralEvaluator import NeuralEvaluator
+
+# Valor z del intervalo de confianza del 95 %
+Z_95 = 1.959963984540054
+
+# Evaluadores ya cargados en este proceso (se reutilizan entre partidas)
+_EVALUADORES = {}
+
+
+class JugadorAzar:
+    """
+    Jugador que elige una jugada legal al azar (referencia para comparar bots).
+
+    PRINCIPIOS SOLID:
+    - LSP: Cumple el mismo contrato elegir_jugada(board, dados) que AIPlayer.
+    """
+
+    def __init__(self, color: str, generador: random.Random):
+        """
+        Args:
+            color (str): Color de sus fichas.
+            generador (random.Random): Generador con semilla.
+        """
+        self.__color__ = color
+        self.__generador__ = generador
+
+    def elegir_jugada(self, board, dados) -> list[tuple[int, int]]:
+        """Devuelve una jugada legal al azar ([] si no hay)."""
+        jugadas = board.obtener_jugadas_legales(self.__color__, dados)
+        return self.__generador__.choice(jugadas) if jugadas else []
+
+
+def crear_jugador(especificacion: str, color: str, semilla: int):
+    """
+    Crea un jugador a partir de su especificación de texto.
+
+    Formatos:
+        - "azar": jugada legal al azar.
+        - "ia" o "ia:<profundidad>": AIPlayer con la evaluación heurística.
+        - "red:<archivo.npz>" o "red:<archivo.npz>:<profundidad>": AIPlayer con NeuralEvaluator.
+
+    La búsqueda no usa límite de tiempo, así la partida solo depende de la semilla.
+
+    Args:
+        especificacion (str): Especificación del jugador.
+        color (str): Color de sus fichas.
+        semilla (int): Semilla de la partida.
+
+    Returns:
+        Objeto con elegir_jugada(board, dados).
+
+    Raises:
+        ValueError: Si la especificación no es válida.
+    """
+    tipo, _, resto = especificacion.partition(":")
+    if tipo == "azar" and not resto:
+        return JugadorAzar(color, random.Random(semilla))
+    if tipo == "ia":
+        profundidad = int(resto) if resto else 1
+        return AIPlayer(especificacion, color, profundidad_maxima=profundidad, limite_tiempo=None)
+    if tipo == "red" and resto:
+        ruta, _, profundidad = resto.partition(":")
+        if ruta not in _EVALUADORES:
+            _EVALUADORES[ruta] = NeuralEvaluator.cargar(ruta)
+        return AIPlayer(especificacion, color, profundidad_maxima=int(profundidad or 1),
+                        limite_tiempo=None, evaluador=_EVALUADORES[ruta])
+    raise ValueError(f"Jugador desconocido: '{especificacion}'.")
+
+
+def jugar_partida_torneo(tarea: tuple) -> dict:
+    """
+    Juega una partida del torneo. En las partidas pares A juega con negras y en las impares con blancas.
+
+    Args:
+        tarea (tuple): (indice, especificacion_a, especificacion_b, semilla).
+
+    Returns:
+        dict: indice, semilla, ganador ('A' o 'B'), color_a, tipo, puntos, turnos y
+        segundos promedio por jugada de cada jugador.
+    """
+    indice, especificacion_a, especificacion_b, semilla = tarea
+    color_a = "negro" if indice % 2 == 0 else "blanco"
+    color_b = "blanco" if color_a == "negro" else "negro"
+    jugadores = {color_a: crear_jugador(especificacion_a, color_a, semilla),
+                 color_b: crear_jugador(especificacion_b, color_b, semilla + 1)}
+    motor = GameEngine(turno=None, generador=random.Random(semilla))
+    tiempos = {color_a: 0.0, color_b: 0.0}
+    decisiones = {color_a: 0, color_b: 0}
+
+    while not motor.termino():
+        color = motor.obtener_turno()
+        motor.tirar_dados()
+        jugada = []
+        if motor.obtener_jugadas_legales():
+            inicio = time.perf_counter()
+            jugada = jugadores[color].elegir_jugada(motor.obtener_tablero(), motor.obtener_dados())
+            tiempos[color] += time.perf_counter() - inicio
+            decisiones[color] += 1
+        motor.aplicar_jugada(jugada)
+
+    resultado = motor.obtener_resultado()
+    return {"indice": indice, "semilla": semilla,
+            "ganador": "A" if resultado["ganador"] == color_a else "B",
+            "color_a": color_a, "tipo": resultado["tipo"], "puntos": resultado["puntos"],
+            "turnos": resultado["turnos"],
+            "segundos_por_jugada_a": tiempos[color_a] / max(decisiones[color_a], 1),
+            "segundos_por_jugada_b": tiempos[color_b] / max(decisiones[color_b], 1)}
+
+
+def intervalo_wilson(exitos: int, total: int, z: float = Z_95) -> tuple[float, float]:
+    """
+    Intervalo de confianza de Wilson para una proporción.
+
+    Args:
+        exitos (int): Cantidad de éxitos.
+        total (int): Cantidad de ensayos.
+        z (float): Valor z del nivel de confianza.
+
+    Returns:
+        tuple[float, float]: Límites inferior y superior (0, 1 si no hay ensayos).
+    """
+    if total == 0:
+        return 0.0, 1.0
+    proporcion = exitos / total
+    denominador = 1 + z * z / total
+    centro = (proporcion + z * z / (2 * total)) / denominador
+    margen = z * math.sqrt(proporcion * (1 - proporcion) / total + z * z / (4 * total * total)) / denominador
+    return max(0.0, centro - margen), min(1.0, centro + margen)
+
+
+class Tournament:
+    """
+    Torneo de N partidas entre dos jugadores configurables, repartido en procesos.
+
+    Cada partida usa la semilla semilla_base + indice, así el torneo se puede repetir
+    exactamente. Los resultados se escriben en un archivo JSON lines a medida que
+    llegan y al final se resumen con porcentajes de victoria e intervalos de confianza.
+
+    PRINCIPIOS SOLID:
+    - SRP: Solo reparte partidas y agrega resultados; cada partida la juega GameEngine.
+    - OCP: Se agregan tipos de jugador en crear_jugador sin tocar el torneo.
+    """
+
+    def __init__(self, jugador_a: str, jugador_b: str, procesos: int | None = None,
+                 semilla: int = 0):
+        """
+        Inicializa el torneo.
+
+        Args:
+            jugador_a (str): Especificación del jugador A (ver crear_jugador).
+            jugador_b (str): Especificación del jugador B.
+            procesos (int | None): Procesos a usar (None = todos los núcleos).
+            semilla (int): Semilla base; la partida i usa semilla + i.
+
+        Raises:
+            ValueError: Si procesos es menor que 1 o algún jugador no es válido.
+        """
+        procesos = procesos if procesos is not None else (os.cpu_count() or 1)
+        if procesos < 1:
+            raise ValueError("Los procesos deben ser al menos 1.")
+        crear_jugador(jugador_a, "negro", semilla)
+        crear_jugador(jugador_b, "blanco", semilla)
+        self.__jugador_a__ = jugador_a
+        self.__jugador_b__ = jugador_b
+        self.__procesos__ = procesos
+        self.__semilla__ = semilla
+
+    def jugar(self, partidas: int, ruta_resultados: str | None = None) -> dict:
+        """
+        Juega el torneo y escribe cada resultado como una línea JSON.
+
+        Args:
+            partidas (int): Cantidad de partidas.
+            ruta_resultados (str | None): Archivo .jsonl de salida (None = no escribir).
+
+        Returns:
+            dict: Resumen del torneo (ver resumir).
+        """
+        tareas = [(indice, self.__jugador_a__, self.__jugador_b__, self.__semilla__ + indice)
+                  for indice in range(partidas)]
+        resultados = []
+        inicio = time.perf_counter()
+        archivo = open(ruta_resultados, "w", encoding="utf-8") if ruta_resultados else None
+        pool = multiprocessing.Pool(self.__procesos__) if self.__procesos__ > 1 else None
+        try:
+            iterador = (pool.imap(jugar_partida_torneo, tareas, chunksize=max(1, partidas // (self.__procesos__ * 8)))
+                        if pool else map(jugar_partida_torneo, tareas))
+            for resultado in iterador:
+                resultados.append(resultado)
+                if archivo is not None:
+                    archivo.write(json.dumps(resultado) + "\n")
+                    archivo.flush()
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            if archivo is not None:
+                archivo.close()
+
+        resumen = self.resumir(resultados)
+        resumen["segundos"] = time.perf_counter() - inicio
+        return resumen
+
+    @staticmethod
+    def resumir(resultados: list[dict]) -> dict:
+        """
+        Agrega los resultados del torneo desde el punto de vista del jugador A.
+
+        Args:
+            resultados (list[dict]): Resultados de jugar_partida_torneo.
+
+        Returns:
+            dict: partidas, victorias_a, porcentaje_a, intervalo_a (Wilson 95 %),
+            puntos_por_partida_a con su intervalo (normal 95 %), gammons, backgammons
+            y segundos promedio por jugada de cada jugador.
+        """
+        total = len(resultados)
+        victorias = sum(1 for resultado in resultados if resultado["ganador"] == "A")
+        puntos = [resultado["puntos"] if resultado["ganador"] == "A" else -resultado["puntos"]
+                  for resultado in resultados]
+        media = sum(puntos) / total if total else 0.0
+        varianza = sum((valor - media) ** 2 for valor in puntos) / (total - 1) if total > 1 else 0.0
+        margen = Z_95 * math.sqrt(varianza / total) if total else 0.0
+        return {
+            "partidas": total,
+            "victorias_a": victorias,
+            "porcentaje_a": victorias / total if total else 0.0,
+            "intervalo_a": intervalo_wilson(victorias, total),
+            "puntos_por_partida_a": media,
+            "intervalo_puntos_a": (media - margen, media + margen),
+            "gammons": sum(1 for resultado in resultados if resultado["tipo"] == "gammon"),
+            "backgammons": sum(1 for resultado in resultados if resultado["tipo"] == "backgammon"),
+            "segundos_por_jugada_a": (sum(r["segundos_por_jugada_a"] for r in resultados) / total
+                                      if total else 0.0),
+            "segundos_por_jugada_b": (sum(r["segundos_por_jugada_b"] for r in resultados) / total
+                                      if total else 0.0),
+        }
+
+
+def main() -> None:
+    """
+    Punto de entrada del torneo por línea de comandos.
+
+    Ejemplo:
+        python3 -m Backgammon.Training.Tournament --a red:pesos.npz --b ia:1 --partidas 10000
+    """
+    parser = argparse.ArgumentParser(description="Torneo entre dos jugadores automáticos.")
+    parser.add_argument("--a", default="ia:1", help="Jugador A: azar, ia[:prof] o red:archivo.npz[:prof].")
+    parser.add_argument("--b", default="azar", help="Jugador B (mismo formato que --a).")
+    parser.add_argument("--partidas", type=int, default=1000, help="Cantidad de partidas.")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos (por defecto, todos los núcleos).")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla base (la partida i usa semilla + i).")
+    parser.add_argument("--salida", default="torneo.jsonl", help="Archivo JSON lines con cada resultado.")
+    argumentos = parser.parse_args()
+
+    torneo = Tournament(argumentos.a, argumentos.b, argumentos.procesos, argumentos.semilla)
+    resumen = torneo.jugar(argumentos.partidas, argumentos.salida)
+    inferior, superior = resumen["intervalo_a"]
+    puntos_inferior, puntos_superior = resumen["intervalo_puntos_a"]
+    print(f"🏆 {argumentos.a} vs {argumentos.b}: {resumen['partidas']} partidas en {resumen['segundos']:.1f} s")
+    print(f"   Victorias A: {resumen['victorias_a']} ({resumen['porcentaje_a']:.1%}, "
+          f"IC 95 %: {inferior:.1%} - {superior:.1%})")
+    print(f"   Puntos por partida A: {resumen['puntos_por_partida_a']:+.3f} "
+          f"(IC 95 %: {puntos_inferior:+.3f} a {puntos_superior:+.3f})")
+    print(f"   Gammons: {resumen['gammons']} | Backgammons: {resumen['backgammons']}")
+    print(f"   Segundos por jugada: A {resumen['segundos_por_jugada_a']:.4f} | "
+          f"B {resumen['segundos_por_jugada_b']:.4f}")
+    print(f"   Resultados en {argumentos.salida}")
+
+
+if __name__ == "__main__":
+    main()
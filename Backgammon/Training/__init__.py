@@ -0,0 +1 @@
+"""Módulo de entrenamiento de evaluadores por autojuego."""